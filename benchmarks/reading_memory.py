@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+SensorReading Memory Footprint Benchmark
+
+Measures the memory held per reading when many readings are kept alive,
+comparing the slotted SensorReading with the former dataclass layout
+(reproduced below as LegacyReading). Decode rate, attribute reads and
+to_dict() are timed as well, since consumers read every reading.
+
+Register blocks are unpacked from raw bytes the way a Modbus response
+is, so values above 256 are fresh int objects as they are in practice.
+
+Usage:
+    python benchmarks/reading_memory.py [--count 100000]
+"""
+
+import argparse
+import struct
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.sensor_decoder import SensorDecoder, SensorStatus
+
+
+@dataclass
+class LegacyReading:
+    """The SensorReading dataclass as it was before the slotted layout."""
+    unit_id: int
+    timestamp: datetime
+    status: SensorStatus
+    status_raw: int
+    bdc_states: int
+    distance_raw: int
+    signal_quality: int
+    connected: bool = True
+    valid: bool = True
+    host: Optional[str] = None
+    distance_mm: Optional[int] = field(default=None, init=False)
+
+    def __post_init__(self):
+        if self.distance_raw == 0:
+            self.connected = False
+        elif self.distance_raw == 65535:
+            self.connected = True
+        else:
+            self.connected = True
+            self.distance_mm = self.distance_raw
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'unit_id': self.unit_id,
+            'timestamp': self.timestamp.isoformat(),
+            'status': self.status.name,
+            'status_raw': self.status_raw,
+            'bdc_states': self.bdc_states,
+            'distance_mm': self.distance_mm,
+            'distance_raw': self.distance_raw,
+            'signal_quality': self.signal_quality,
+            'connected': self.connected,
+            'valid': self.valid
+        }
+
+
+def make_blocks(count: int) -> List[List[int]]:
+    """Register blocks unpacked from wire-format bytes."""
+    frame = struct.Struct('>4H')
+    return [list(frame.unpack(frame.pack(303, 0, 500 + i % 3000, 40 + i % 20)))
+            for i in range(count)]
+
+
+def legacy_decode(unit_id: int, registers: List[int]) -> LegacyReading:
+    """Decode the way the former decode_registers did."""
+    status_raw = registers[0]
+    return LegacyReading(unit_id, datetime.now(),
+                         SensorStatus(status_raw) if status_raw in (303, 271, 0) else
+                         SensorStatus.UNKNOWN,
+                         status_raw, registers[1], registers[2], registers[3])
+
+
+def bytes_per_reading(decode: Callable, count: int) -> float:
+    """Traced bytes held per reading by a list of decoded readings."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    blocks = make_blocks(count)
+    readings = [decode(1 + i % 8, blocks[i]) for i in range(count)]
+    # Drop the register lists so only the values the readings retain count
+    del blocks
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del readings
+    return held / count
+
+
+def decode_rate(decode: Callable, count: int) -> float:
+    """Readings decoded per second."""
+    blocks = make_blocks(count)
+    start = time.perf_counter()
+    for i in range(count):
+        decode(1 + i % 8, blocks[i])
+    return count / (time.perf_counter() - start)
+
+
+def ns_per_call(operation: Callable, readings: List, repeat: int = 5) -> float:
+    """Best time per reading, in nanoseconds, of applying operation to every reading."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for reading in readings:
+            operation(reading)
+        best = min(best, (time.perf_counter_ns() - start) / len(readings))
+    return best
+
+
+def read_fields(reading) -> tuple:
+    """The fields a monitoring loop typically reads."""
+    return (reading.unit_id, reading.status, reading.distance_mm,
+            reading.signal_quality, reading.connected)
+
+
+ACCESS_TIMINGS = (
+    ('5 attribute reads', read_fields),
+    ('.status', lambda r: r.status),
+    ('.timestamp', lambda r: r.timestamp),
+    ('to_dict()', lambda r: r.to_dict()),
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--count', type=int, default=100_000, help='Readings to create')
+    args = parser.parse_args()
+
+    decoder = SensorDecoder()
+    legacy = bytes_per_reading(legacy_decode, args.count)
+    slotted = bytes_per_reading(decoder.decode_registers, args.count)
+
+    print(f"Readings:           {args.count}")
+    print(f"Legacy dataclass:   {legacy:7.1f} bytes/reading, "
+          f"{decode_rate(legacy_decode, args.count):,.0f} readings/s")
+    print(f"Slotted reading:    {slotted:7.1f} bytes/reading, "
+          f"{decode_rate(decoder.decode_registers, args.count):,.0f} readings/s")
+    print(f"Reduction:          {legacy / slotted:.2f}x")
+
+    blocks = make_blocks(min(args.count, 10_000))
+    legacy_readings = [legacy_decode(1, block) for block in blocks]
+    slotted_readings = [decoder.decode_registers(1, block) for block in blocks]
+    print()
+    print(f"{'Per reading':20s} {'legacy':>10s} {'slotted':>10s}")
+    for name, operation in ACCESS_TIMINGS:
+        print(f"{name:20s} {ns_per_call(operation, legacy_readings):8.0f}ns "
+              f"{ns_per_call(operation, slotted_readings):8.0f}ns")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
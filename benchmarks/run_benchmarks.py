@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Acquisition Pipeline Benchmark Runner
+
+Runs the benchmark stages (see stages.py) against a local simulated DXM
+and writes the results, with p50/p95/p99 for every measurement, as JSON.
+Comparing against a previous results file shows regressions.
+
+Stages:
+    decoder   decode_registers / validate_reading / analyze_register_pattern throughput
+    single    DXMClient.read_sensor latency
+    readcpu   client CPU per read, pymodbus versus the fast path
+    cycle     read_multiple_sensors cycle time versus unit count
+    monitor   monitor_sensors start jitter
+    startup   CLI import time and "dxm --help" wall time
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --quick --baseline results.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pymodbus
+
+import dxm_toolkit
+from benchmarks import stages
+
+STAGES = ('decoder', 'single', 'readcpu', 'cycle', 'monitor', 'startup')
+
+# Percentiles compared against a baseline (lower is better for all of them)
+COMPARED = ('p50', 'p95', 'p99')
+
+
+def run_stages(names: List[str], args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the selected stages and collect their results."""
+    scale = 0.1 if args.quick else 1.0
+    latency = args.latency_ms / 1000
+    jitter = args.jitter_ms / 1000
+    results = {}
+
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        start = time.perf_counter()
+        if name == 'decoder':
+            results[name] = stages.bench_decoder(ops=int(100_000 * scale))
+        elif name == 'single':
+            results[name] = stages.bench_single_read(int(1000 * scale), latency, jitter)
+        elif name == 'readcpu':
+            results[name] = stages.bench_read_cpu(int(2000 * scale), latency, jitter)
+        elif name == 'cycle':
+            results[name] = stages.bench_cycle_time(args.units, int(200 * scale), latency,
+                                                    jitter, args.pipeline_depth)
+        elif name == 'monitor':
+            results[name] = stages.bench_monitor_jitter(max(args.units), args.interval,
+                                                        10.0 * scale, latency, jitter)
+        elif name == 'startup':
+            results[name] = stages.bench_startup(max(3, int(20 * scale)))
+        results[name]['stage_seconds'] = time.perf_counter() - start
+
+    return results
+
+
+def metadata(args: argparse.Namespace) -> Dict[str, Any]:
+    """Environment and settings of this run."""
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'toolkit_version': dxm_toolkit.__version__,
+        'pymodbus_version': pymodbus.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'settings': {
+            'quick': args.quick,
+            'latency_ms': args.latency_ms,
+            'jitter_ms': args.jitter_ms,
+            'units': args.units,
+            'pipeline_depth': args.pipeline_depth,
+            'interval': args.interval,
+        },
+    }
+
+
+def summaries(results: Dict[str, Any], path: str = '') -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (dotted path, summary) for every percentile summary in a result tree."""
+    for key, value in results.items():
+        if isinstance(value, dict):
+            name = f"{path}.{key}" if path else key
+            if 'p50' in value:
+                yield name, value
+            else:
+                yield from summaries(value, name)
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float) -> List[str]:
+    """
+    Print percentile changes against a baseline run.
+
+    Args:
+        current: Stage results of this run
+        baseline: Stage results of the earlier run
+        threshold: Percent slowdown reported as a regression
+
+    Returns:
+        Names of the measurements that regressed
+    """
+    old = dict(summaries(baseline))
+    regressions = []
+    print(f"\n{'measurement':<48} " + " ".join(f"{q:>9}" for q in COMPARED))
+    for name, summary in summaries(current):
+        if name not in old:
+            continue
+        changes = []
+        for q in COMPARED:
+            before = old[name].get(q) or 0.0
+            changes.append((summary[q] - before) / before * 100 if before else 0.0)
+        flag = ' REGRESSION' if max(changes) > threshold else ''
+        if flag:
+            regressions.append(name)
+        print(f"{name:<48} " + " ".join(f"{c:+8.1f}%" for c in changes) + flag)
+    return regressions
+
+
+def print_summary(results: Dict[str, Any]) -> None:
+    """Print one line per measurement."""
+    for name, summary in summaries(results):
+        extra = f"  {summary['ops_per_s']:,.0f} ops/s" if 'ops_per_s' in summary else ''
+        print(f"{name:<48} p50 {summary['p50']:10.3f}  p95 {summary['p95']:10.3f}  "
+              f"p99 {summary['p99']:10.3f} {summary['unit']}{extra}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help=f"Comma-separated stages to run (default: all of {','.join(STAGES)})")
+    parser.add_argument('--output', help='Write JSON results to this file')
+    parser.add_argument('--baseline', help='Compare against an earlier JSON results file')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='Percent slowdown reported as a regression (default 10)')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='Exit with status 1 if any measurement regressed')
+    parser.add_argument('--quick', action='store_true', help='Run 10%% of the iterations')
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help='Simulated DXM response latency')
+    parser.add_argument('--jitter-ms', type=float, default=0.0,
+                        help='Simulated extra random latency')
+    parser.add_argument('--units', type=lambda s: [int(u) for u in s.split(',')],
+                        default=[1, 2, 4, 8, 16], help='Unit counts for the cycle stage')
+    parser.add_argument('--pipeline-depth', type=int, default=1,
+                        help='DXMClient pipeline depth for the cycle stage')
+    parser.add_argument('--interval', type=float, default=0.05,
+                        help='Monitoring interval for the monitor stage (seconds)')
+    args = parser.parse_args()
+
+    names = [s.strip() for s in args.stages.split(',') if s.strip()]
+    unknown = set(names) - set(STAGES)
+    if unknown:
+        parser.error(f"Unknown stages: {sorted(unknown)}")
+
+    report = {'meta': metadata(args), 'stages': run_stages(names, args)}
+
+    print_summary(report['stages'])
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(report['stages'], baseline.get('stages', {}), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} measurement(s) regressed by more than {args.threshold}%")
+            if args.fail_on_regression:
+                return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Acquisition Pipeline Benchmark Stages
+
+Each stage measures one part of the hot path and returns a dictionary of
+results with latency percentiles. Network stages run against a local
+DXMSimulator, so numbers are comparable between machines and releases
+without hardware. run_benchmarks.py runs the stages and writes the JSON.
+"""
+
+import math
+import struct
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.dxm_client import DXMClient
+from dxm_toolkit.sensor_decoder import SensorDecoder
+from dxm_toolkit.simulator import DXMSimulator, UnitProfile
+
+
+def percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """
+    Nearest-rank percentile of pre-sorted samples.
+
+    Args:
+        sorted_samples: Samples in ascending order
+        q: Percentile in [0, 100]
+
+    Returns:
+        The sample at that rank (0.0 for no samples)
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples: Sequence[float], unit: str) -> Dict[str, Any]:
+    """
+    Summarize samples as count, mean, p50/p95/p99 and max.
+
+    Args:
+        samples: Measured values
+        unit: Unit of the values (recorded in the result)
+
+    Returns:
+        Summary dictionary
+    """
+    ordered = sorted(samples)
+    return {
+        'unit': unit,
+        'count': len(ordered),
+        'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+        'p50': percentile(ordered, 50),
+        'p95': percentile(ordered, 95),
+        'p99': percentile(ordered, 99),
+        'max': ordered[-1] if ordered else 0.0,
+    }
+
+
+def make_blocks(count: int) -> List[List[int]]:
+    """Register blocks unpacked from wire-format bytes, like Modbus responses."""
+    frame = struct.Struct('>4H')
+    return [list(frame.unpack(frame.pack(303 if i % 10 else 271, 0,
+                                         500 + i % 3000 if i % 10 else 65535, 40 + i % 20)))
+            for i in range(count)]
+
+
+def time_per_op(func: Callable[[int], Any], ops: int, chunk: int) -> Dict[str, Any]:
+    """
+    Time ``func(i)`` for i in range(ops), sampled per chunk of calls.
+
+    Educational Note:
+    A single decode takes well under the resolution that makes individual
+    timings trustworthy, so calls are timed in chunks and each chunk gives
+    one per-operation sample. Percentiles over the chunks show how stable
+    the throughput is.
+
+    Returns:
+        Summary in ns per operation, plus ops_per_s
+    """
+    samples = []
+    total = 0.0
+    for start in range(0, ops, chunk):
+        end = min(start + chunk, ops)
+        t0 = time.perf_counter_ns()
+        for i in range(start, end):
+            func(i)
+        elapsed = time.perf_counter_ns() - t0
+        samples.append(elapsed / (end - start))
+        total += elapsed
+    result = summarize(samples, 'ns/op')
+    result['ops_per_s'] = ops / (total / 1e9) if total else 0.0
+    return result
+
+
+def bench_decoder(ops: int = 100_000, window: int = 100) -> Dict[str, Any]:
+    """
+    Decoder throughput: decode_registers, validate_reading and
+    analyze_register_pattern (over windows of ``window`` readings).
+    """
+    decoder = SensorDecoder()
+    blocks = make_blocks(ops)
+    readings = [decoder.decode_registers(1 + i % 8, b) for i, b in enumerate(blocks)]
+    windows = [readings[i:i + window] for i in range(0, ops - window + 1, window)]
+
+    return {
+        'decode_registers': time_per_op(
+            lambda i: decoder.decode_registers(1 + i % 8, blocks[i]), ops, 1000),
+        'validate_reading': time_per_op(
+            lambda i: decoder.validate_reading(readings[i]), ops, 1000),
+        'analyze_register_pattern': dict(
+            time_per_op(lambda i: decoder.analyze_register_pattern(windows[i]),
+                         len(windows), 10),
+            window=window),
+    }
+
+
+def _simulator(unit_count: int, latency: float, jitter: float) -> DXMSimulator:
+    units = [UnitProfile(unit_id, waveform='sine', phase=unit_id)
+             for unit_id in range(1, unit_count + 1)]
+    return DXMSimulator(units, port=0, latency=latency, jitter=jitter, seed=1)
+
+
+def bench_single_read(reads: int = 500, latency: float = 0.0,
+                      jitter: float = 0.0) -> Dict[str, Any]:
+    """Latency of DXMClient.read_sensor against the simulator."""
+    with _simulator(1, latency, jitter).running() as sim:
+        with DXMClient("127.0.0.1", port=sim.port) as client:
+            client.read_sensor(1)   # warm up
+            samples = []
+            for _ in range(reads):
+                t0 = time.perf_counter()
+                client.read_sensor(1)
+                samples.append((time.perf_counter() - t0) * 1000)
+    return dict(summarize(samples, 'ms'), simulated_latency_ms=latency * 1000)
+
+
+def bench_cycle_time(unit_counts: Sequence[int] = (1, 2, 4, 8, 16), cycles: int = 100,
+                     latency: float = 0.0, jitter: float = 0.0,
+                     pipeline_depth: int = 1) -> Dict[str, Any]:
+    """read_multiple_sensors cycle time for each number of units."""
+    results = {}
+    with _simulator(max(unit_counts), latency, jitter).running() as sim:
+        with DXMClient("127.0.0.1", port=sim.port, pipeline_depth=pipeline_depth) as client:
+            for count in unit_counts:
+                unit_ids = list(range(1, count + 1))
+                client.read_multiple_sensors(unit_ids)   # warm up
+                samples = []
+                for _ in range(cycles):
+                    t0 = time.perf_counter()
+                    readings = client.read_multiple_sensors(unit_ids)
+                    samples.append((time.perf_counter() - t0) * 1000)
+                    if any(r is None for r in readings.values()):
+                        raise RuntimeError(f"Failed reads in a {count}-unit cycle")
+                results[str(count)] = summarize(samples, 'ms')
+    return {
+        'pipeline_depth': pipeline_depth,
+        'simulated_latency_ms': latency * 1000,
+        'units': results,
+    }
+
+
+def bench_monitor_jitter(unit_count: int = 8, interval: float = 0.05, duration: float = 5.0,
+                         latency: float = 0.0, jitter: float = 0.0) -> Dict[str, Any]:
+    """Start jitter of monitor_sensors cycles."""
+    samples = []
+    with _simulator(unit_count, latency, jitter).running() as sim:
+        with DXMClient("127.0.0.1", port=sim.port) as client:
+            for _ in client.monitor_sensors(list(range(1, unit_count + 1)), interval, duration):
+                samples.append(client.last_cycle_timing.jitter_ms)
+            stats = client.get_monitor_stats()
+    return dict(summarize(samples, 'ms'), interval_s=interval, units=unit_count,
+                missed_deadlines=stats['missed_deadlines'], overruns=stats['overruns'])
+
+
+def bench_read_cpu(reads: int = 2000, latency: float = 0.0,
+                   jitter: float = 0.0) -> Dict[str, Any]:
+    """
+    Client CPU time per read_sensor_registers call, pymodbus versus the
+    preassembled-frame fast path.
+
+    CPU time is measured with the calling thread's clock, so the simulator
+    (on its own thread) is not counted; it is what limits how many
+    controllers one core can poll.
+    """
+    results: Dict[str, Any] = {}
+    with _simulator(1, latency, jitter).running() as sim:
+        for name, fast_path in (('pymodbus', False), ('fast_path', True)):
+            with DXMClient("127.0.0.1", port=sim.port, fast_path=fast_path) as client:
+                for _ in range(50):   # warm up
+                    client.read_sensor_registers(1)
+                cpu_us, wall_ms = [], []
+                for _ in range(reads):
+                    c0, t0 = time.thread_time_ns(), time.perf_counter()
+                    client.read_sensor_registers(1)
+                    wall_ms.append((time.perf_counter() - t0) * 1000)
+                    cpu_us.append((time.thread_time_ns() - c0) / 1000)
+                if client.fast_path_fallbacks:
+                    raise RuntimeError("Fast path fell back to pymodbus")
+            results[name] = {'cpu': summarize(cpu_us, 'us'), 'latency': summarize(wall_ms, 'ms')}
+
+    before = results['pymodbus']['cpu']['p50']
+    after = results['fast_path']['cpu']['p50']
+    results['cpu_saved_pct'] = (before - after) / before * 100 if before else 0.0
+    return results
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """
+    Cumulative import time of every module loaded by importing one module.
+
+    Runs ``python -X importtime`` in a fresh interpreter, so nothing is
+    cached from the current process.
+
+    Returns:
+        Dictionary mapping module names to cumulative microseconds
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True,
+                            cwd=str(Path(__file__).parent.parent))
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def bench_startup(runs: int = 10) -> Dict[str, Any]:
+    """Import time of the CLI and wall time of "dxm --help" in fresh interpreters."""
+    imports = [import_times('dxm_toolkit.cli')['dxm_toolkit.cli'] / 1000 for _ in range(runs)]
+    help_ms = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'dxm_toolkit.cli', '--help'],
+                       capture_output=True, check=True, cwd=str(Path(__file__).parent.parent))
+        help_ms.append((time.perf_counter() - start) * 1000)
+    return {'import_cli': summarize(imports, 'ms'), 'help': summarize(help_ms, 'ms')}
@@ -5,7 +5,14 @@ Toolkit for Banner DXM wireless controllers and radar sensors via Modbus TCP.
 
 Components:
 - DXMClient: Modbus TCP client for DXM communication
+- AsyncDXMClient: asyncio client with concurrent per-unit reads
+- FleetPoller: Polls an inventory of DXM controllers in one process
+- ShardedPoller: Spreads fleet polling over worker processes
+- MetricsExporter: Serves live readings and client health to Prometheus
 - SensorDecoder: Interprets register data into sensor readings
+- ReadingStatistics: Streaming per-unit statistics with O(1) updates
+- QuantileSketch: Bounded-memory p50/p95/p99 estimates
+- DeadbandFilter: Change-only emission of readings
 - CLI: Command-line interface
 - Utils: Helper functions for formatting and validation
 """
@@ -14,16 +21,125 @@ __version__ = "1.0.0"
 __author__ = "Industrial Automation Engineer"
 __email__ = "engineer@example.com"
 
-# Import main classes for easy access
-from .dxm_client import DXMClient
-from .sensor_decoder import SensorDecoder, SensorReading, SensorStatus
-from .utils import format_distance, format_signal_quality, validate_ip_address
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> submodule that defines it. Submodules are imported on
+# first attribute access, so "import dxm_toolkit" (and the CLI) does not
+# pay for pymodbus, asyncio, http.server and friends up front.
+_LAZY_IMPORTS = {
+    "DXMClient": "dxm_client",
+    "DXMConnectionError": "exceptions",
+    "DXMCommunicationError": "exceptions",
+    "DXMUnitUnavailableError": "exceptions",
+    "AdaptivePollPolicy": "adaptive",
+    "AsyncDXMClient": "async_client",
+    "ReadingBatch": "batch",
+    "BreakerState": "circuit_breaker",
+    "CircuitBreaker": "circuit_breaker",
+    "Deadband": "deadband",
+    "DeadbandFilter": "deadband",
+    "DiscoveryCache": "discovery_cache",
+    "MetricsExporter": "exporter",
+    "FleetPoller": "fleet",
+    "HostSpec": "fleet",
+    "ShardedPoller": "sharding",
+    "SharedReadingRing": "sharding",
+    "load_inventory": "fleet",
+    "ReadingHistory": "history",
+    "ReadPlanner": "read_planner",
+    "RecordingReader": "recording",
+    "RecordingWriter": "recording",
+    "RecordingReplayer": "replay",
+    "DeadlineScheduler": "scheduler",
+    "OverrunPolicy": "scheduler",
+    "SensorDecoder": "sensor_decoder",
+    "SensorReading": "sensor_decoder",
+    "SensorStatus": "sensor_decoder",
+    "QuantileSketch": "quantiles",
+    "WindowedQuantiles": "quantiles",
+    "ReadingStatistics": "unit_stats",
+    "UnitStatistics": "unit_stats",
+    "DXMSimulator": "simulator",
+    "UnitProfile": "simulator",
+    "format_distance": "utils",
+    "format_signal_quality": "utils",
+    "validate_ip_address": "utils",
+}
+
+if TYPE_CHECKING:
+    from .dxm_client import DXMClient
+    from .exceptions import DXMConnectionError, DXMCommunicationError, DXMUnitUnavailableError
+    from .adaptive import AdaptivePollPolicy
+    from .async_client import AsyncDXMClient
+    from .batch import ReadingBatch
+    from .circuit_breaker import BreakerState, CircuitBreaker
+    from .deadband import Deadband, DeadbandFilter
+    from .discovery_cache import DiscoveryCache
+    from .exporter import MetricsExporter
+    from .fleet import FleetPoller, HostSpec, load_inventory
+    from .sharding import ShardedPoller, SharedReadingRing
+    from .history import ReadingHistory
+    from .read_planner import ReadPlanner
+    from .recording import RecordingReader, RecordingWriter
+    from .replay import RecordingReplayer
+    from .scheduler import DeadlineScheduler, OverrunPolicy
+    from .sensor_decoder import SensorDecoder, SensorReading, SensorStatus
+    from .simulator import DXMSimulator, UnitProfile
+    from .quantiles import QuantileSketch, WindowedQuantiles
+    from .unit_stats import ReadingStatistics, UnitStatistics
+    from .utils import format_distance, format_signal_quality, validate_ip_address
+
+
+def __getattr__(name):
+    """Import the submodule that defines a public name on first use (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "DXMClient",
+    "DXMConnectionError",
+    "DXMCommunicationError",
+    "DXMUnitUnavailableError",
+    "AsyncDXMClient",
+    "FleetPoller",
+    "HostSpec",
+    "load_inventory",
+    "ShardedPoller",
+    "SharedReadingRing",
+    "ReadingHistory",
+    "ReadingBatch",
+    "CircuitBreaker",
+    "BreakerState",
+    "DiscoveryCache",
+    "Deadband",
+    "DeadbandFilter",
+    "MetricsExporter",
+    "ReadPlanner",
+    "RecordingReader",
+    "RecordingWriter",
+    "RecordingReplayer",
+    "DeadlineScheduler",
+    "AdaptivePollPolicy",
+    "OverrunPolicy",
     "SensorDecoder",
     "SensorReading",
     "SensorStatus",
+    "QuantileSketch",
+    "WindowedQuantiles",
+    "ReadingStatistics",
+    "UnitStatistics",
+    "DXMSimulator",
+    "UnitProfile",
     "format_distance",
     "format_signal_quality",
     "validate_ip_address"
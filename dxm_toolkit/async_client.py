@@ -0,0 +1,589 @@
+#!/usr/bin/env python3
+"""
+Asynchronous DXM Client for Modbus TCP Communication
+
+asyncio counterpart of DXMClient. It exposes the same read/discover/monitor
+API, but issues the per-unit FC03 reads concurrently so that a polling cycle
+costs roughly one network round trip instead of one per unit.
+
+Educational Focus:
+- asyncio-based industrial networking
+- Bounded concurrency with semaphores
+- Connection pooling for a single Modbus TCP server
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import List, Optional, Dict, Any, AsyncIterator, Iterable, Union
+
+try:
+    from pymodbus.client import AsyncModbusTcpClient
+    from pymodbus.exceptions import ModbusException
+except ImportError:
+    raise ImportError("pymodbus library is required. Install with: pip install pymodbus>=3.0.0")
+
+from .exceptions import DXMConnectionError, DXMCommunicationError
+from .adaptive import AdaptivePollPolicy
+from .discovery_cache import DiscoveryCache
+from .history import ReadingHistory
+from .scheduler import CycleTiming, DeadlineScheduler, OverrunPolicy
+from .sensor_decoder import SensorDecoder, SensorReading
+from .utils import validate_ip_address, validate_unit_id
+
+# Every unit ID a Modbus TCP gateway can address
+ALL_UNIT_IDS = range(1, 248)
+
+
+class AsyncDXMClient:
+    """
+    asyncio client class for DXM Modbus TCP communication.
+
+    Educational Note:
+    A blocking client has to wait for each unit's response before it can
+    ask the next unit, so cycle time grows linearly with the number of
+    units. This client keeps up to ``max_in_flight`` requests outstanding
+    at once. Each outstanding request runs on its own pooled Modbus TCP
+    session, because most Modbus clients (and many gateways) process a
+    single session strictly one transaction at a time.
+
+    Key Concepts Demonstrated:
+    - Concurrent register reads with asyncio.gather
+    - Semaphore-bounded in-flight requests
+    - Lazily grown session pool
+    """
+
+    def __init__(self,
+                 host: str = "192.168.0.1",
+                 port: int = 502,
+                 timeout: float = 5.0,
+                 retry_attempts: int = 3,
+                 max_in_flight: int = 8,
+                 debug: bool = False):
+        """
+        Initialize asynchronous DXM Modbus TCP client.
+
+        Args:
+            host: DXM controller IP address
+            port: Modbus TCP port (standard is 502)
+            timeout: Request timeout in seconds
+            retry_attempts: Number of retry attempts for failed operations
+            max_in_flight: Maximum number of concurrent requests (and sessions)
+            debug: Enable detailed logging for troubleshooting
+
+        Raises:
+            ValueError: If invalid IP address or in-flight limit provided
+        """
+        if not validate_ip_address(host):
+            raise ValueError(f"Invalid IP address: {host}")
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        self.max_in_flight = max_in_flight
+
+        # Configure logging
+        self.logger = logging.getLogger(__name__)
+        if debug:
+            self.logger.setLevel(logging.DEBUG)
+
+        # Initialize sensor decoder
+        self._decoder = SensorDecoder()
+
+        # Session pool. The semaphore is created in connect() so that it
+        # belongs to the running event loop.
+        self._sessions: List[AsyncModbusTcpClient] = []
+        self._idle_sessions: List[AsyncModbusTcpClient] = []
+        self._in_flight: Optional[asyncio.Semaphore] = None
+
+        # Scheduler of the current or last monitoring run
+        self._scheduler: Optional[DeadlineScheduler] = None
+
+        # Bounded reading history of the current or last monitoring run
+        # (None unless monitoring was started with history_cycles > 0)
+        self.history: Optional[ReadingHistory] = None
+
+        # Connection state tracking
+        self._connected = False
+        self._last_error = None
+
+    async def __aenter__(self):
+        """Async context manager entry - establish connection."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - clean up connection."""
+        await self.disconnect()
+
+    @property
+    def connected(self) -> bool:
+        """Check if client is currently connected."""
+        return self._connected and any(s.connected for s in self._sessions)
+
+    @property
+    def last_error(self) -> Optional[str]:
+        """Get the last error message encountered."""
+        return self._last_error
+
+    def _create_session(self) -> AsyncModbusTcpClient:
+        """Create an unconnected pymodbus session for the pool."""
+        return AsyncModbusTcpClient(
+            self.host,
+            port=self.port,
+            timeout=self.timeout,
+            retries=1,  # Internal pymodbus retries (we handle our own)
+        )
+
+    async def _open_session(self) -> AsyncModbusTcpClient:
+        """Open an additional pooled session to the DXM."""
+        session = self._create_session()
+        if not await session.connect():
+            raise DXMConnectionError("Failed to establish TCP connection")
+        self._sessions.append(session)
+        self.logger.debug(f"Opened Modbus session {len(self._sessions)}/{self.max_in_flight}")
+        return session
+
+    def _close_session(self, session: AsyncModbusTcpClient) -> None:
+        """Close a pooled session and drop it from the pool."""
+        try:
+            session.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing session: {e}")
+        if session in self._sessions:
+            self._sessions.remove(session)
+        if session in self._idle_sessions:
+            self._idle_sessions.remove(session)
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncModbusTcpClient]:
+        """
+        Borrow a session for one request.
+
+        Educational Note:
+        The semaphore bounds the number of outstanding requests. Inside it
+        there is always either an idle session or room to open a new one,
+        so the pool grows only as far as the actual concurrency demands.
+        """
+        if self._in_flight is None:
+            raise DXMConnectionError("Not connected to DXM")
+
+        async with self._in_flight:
+            if self._idle_sessions:
+                session = self._idle_sessions.pop()
+            else:
+                session = await self._open_session()
+
+            try:
+                yield session
+            finally:
+                if session.connected:
+                    self._idle_sessions.append(session)
+                else:
+                    self._close_session(session)
+
+    async def connect(self) -> bool:
+        """
+        Establish connection to DXM controller.
+
+        Opens the first pooled session and verifies Modbus communication
+        with a test read. Further sessions are opened on demand.
+
+        Returns:
+            bool: True if connection successful
+
+        Raises:
+            DXMConnectionError: If connection fails
+        """
+        try:
+            self.logger.info(f"Connecting to DXM at {self.host}:{self.port}")
+            self._in_flight = asyncio.Semaphore(self.max_in_flight)
+
+            session = await self._open_session()
+
+            # Verify Modbus communication with a test read
+            test_result = await session.read_holding_registers(0, 1, slave=1)
+            if test_result.isError():
+                raise DXMConnectionError(f"Modbus communication test failed: {test_result}")
+
+            self._idle_sessions.append(session)
+            self._connected = True
+            self._last_error = None
+            self.logger.info("Successfully connected to DXM")
+            return True
+
+        except Exception as e:
+            for session in list(self._sessions):
+                self._close_session(session)
+            self._connected = False
+            self._last_error = str(e)
+            self.logger.error(f"Connection failed: {e}")
+            raise DXMConnectionError(f"Failed to connect to DXM: {e}")
+
+    async def disconnect(self) -> None:
+        """Close every pooled session to the DXM controller."""
+        for session in list(self._sessions):
+            self._close_session(session)
+        if self._connected:
+            self.logger.info("Disconnected from DXM")
+        self._connected = False
+
+    async def read_sensor_registers(self, unit_id: int, register_count: int = 4) -> List[int]:
+        """
+        Read holding registers from a specific sensor unit.
+
+        Args:
+            unit_id: Modbus unit ID (1-247)
+            register_count: Number of registers to read
+
+        Returns:
+            List of register values
+
+        Raises:
+            DXMCommunicationError: If read operation fails
+        """
+        if not validate_unit_id(unit_id):
+            raise ValueError(f"Invalid unit ID: {unit_id}")
+
+        if not self._connected:
+            raise DXMConnectionError("Not connected to DXM")
+
+        for attempt in range(self.retry_attempts):
+            try:
+                self.logger.debug(f"Reading {register_count} registers from unit {unit_id}")
+
+                async with self._session() as session:
+                    result = await session.read_holding_registers(
+                        0,
+                        register_count,
+                        slave=unit_id
+                    )
+
+                if result.isError():
+                    error_msg = f"Modbus error reading unit {unit_id}: {result}"
+                    self.logger.warning(error_msg)
+                    if attempt == self.retry_attempts - 1:
+                        raise DXMCommunicationError(error_msg)
+                    continue
+
+                registers = result.registers
+                self.logger.debug(f"Successfully read registers: {registers}")
+                return registers
+
+            except DXMCommunicationError:
+                raise
+
+            except ModbusException as e:
+                error_msg = f"Modbus exception on attempt {attempt + 1}: {e}"
+                self.logger.warning(error_msg)
+                if attempt == self.retry_attempts - 1:
+                    raise DXMCommunicationError(error_msg)
+
+            except Exception as e:
+                error_msg = f"Unexpected error on attempt {attempt + 1}: {e}"
+                self.logger.error(error_msg)
+                if attempt == self.retry_attempts - 1:
+                    raise DXMCommunicationError(error_msg)
+
+            # Brief delay before retry (does not block other units)
+            if attempt < self.retry_attempts - 1:
+                await asyncio.sleep(0.1)
+
+        raise DXMCommunicationError(f"Failed to read registers after {self.retry_attempts} attempts")
+
+    async def read_sensor(self, unit_id: int) -> SensorReading:
+        """
+        Read complete sensor data and decode into structured format.
+
+        Args:
+            unit_id: Modbus unit ID of the sensor
+
+        Returns:
+            SensorReading object with decoded sensor data
+
+        Raises:
+            DXMCommunicationError: If communication fails
+        """
+        try:
+            registers = await self.read_sensor_registers(unit_id)
+            reading = self._decoder.decode_registers(unit_id, registers)
+
+            self.logger.debug(f"Decoded reading for unit {unit_id}: {reading}")
+            return reading
+
+        except Exception as e:
+            self.logger.error(f"Failed to read sensor {unit_id}: {e}")
+            raise
+
+    async def _probe_unit(self, unit_id: int) -> bool:
+        """Probe a single unit ID with a minimal one-register read."""
+        try:
+            async with self._session() as session:
+                result = await session.read_holding_registers(0, 1, slave=unit_id)
+            if not result.isError():
+                self.logger.info(f"Found sensor at unit ID {unit_id}")
+                return True
+            self.logger.debug(f"No response from unit ID {unit_id}")
+        except Exception as e:
+            self.logger.debug(f"Error scanning unit ID {unit_id}: {e}")
+        return False
+
+    async def discover_sensors(self, max_units: int = 8,
+                               cache: Optional[DiscoveryCache] = None,
+                               rediscover: bool = False) -> List[int]:
+        """
+        Discover connected sensors by probing unit IDs concurrently.
+
+        With a cache, the units found by an earlier scan are probed first
+        and the full scan is skipped if they all answer (see
+        DXMClient.discover_sensors).
+
+        Args:
+            max_units: Maximum number of unit IDs to scan
+            cache: Optional DiscoveryCache to consult and update
+            rediscover: Ignore cached results and always scan
+
+        Returns:
+            Sorted list of responding unit IDs
+
+        Raises:
+            DXMConnectionError: If not connected
+        """
+        if not self._connected:
+            raise DXMConnectionError("Not connected to DXM")
+
+        if cache is not None and not rediscover:
+            cached = cache.lookup(self.host, self.port, max_units)
+            if cached is not None:
+                found = await asyncio.gather(*(self._probe_unit(u) for u in cached))
+                if all(found):
+                    self.logger.info(f"Using cached discovery for {self.host}: {cached}")
+                    return cached
+                self.logger.info(f"Cached units of {self.host} changed, rescanning")
+
+        self.logger.info(f"Scanning for sensors (units 1-{max_units})")
+
+        unit_ids = list(range(1, max_units + 1))
+        found = await asyncio.gather(*(self._probe_unit(u) for u in unit_ids))
+        discovered_units = [u for u, ok in zip(unit_ids, found) if ok]
+
+        self.logger.info(f"Discovery complete. Found {len(discovered_units)} sensors: {discovered_units}")
+        if cache is not None and discovered_units:
+            cache.store(self.host, self.port, max_units, discovered_units)
+        return discovered_units
+
+    async def scan_units(self, unit_ids: Optional[Iterable[int]] = None,
+                         probe_timeout: float = 0.25,
+                         concurrency: int = 16) -> Dict[int, float]:
+        """
+        Sweep many unit IDs in parallel with short probe timeouts.
+
+        Educational Note:
+        discover_sensors waits up to the full request timeout for every
+        absent unit. A sweep of all 247 IDs instead runs ``concurrency``
+        workers, each on its own short-timeout session, pulling unit IDs
+        from a shared queue. An absent unit costs at most ``probe_timeout``
+        of one worker, so the sweep takes roughly
+        ``len(unit_ids) / concurrency * probe_timeout`` in the worst case.
+        The probe sessions are separate from the request pool and do not
+        require connect().
+
+        Args:
+            unit_ids: Unit IDs to probe (default: all of 1-247)
+            probe_timeout: Seconds to wait for each probe response
+            concurrency: Number of parallel probe sessions
+
+        Returns:
+            Dictionary mapping responding unit IDs (ascending) to their
+            probe latency in milliseconds
+
+        Raises:
+            ValueError: If a unit ID, the timeout or the concurrency is invalid
+            DXMConnectionError: If no probe session could be opened
+        """
+        ids = sorted(set(ALL_UNIT_IDS if unit_ids is None else unit_ids))
+        for unit_id in ids:
+            if not validate_unit_id(unit_id):
+                raise ValueError(f"Invalid unit ID: {unit_id}")
+        if probe_timeout <= 0:
+            raise ValueError(f"probe_timeout must be positive, got {probe_timeout}")
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        self.logger.info(f"Sweeping {len(ids)} unit IDs ({concurrency} parallel probes, "
+                         f"{probe_timeout}s timeout)")
+
+        pending = deque(ids)
+        latencies: Dict[int, float] = {}
+        errors: List[str] = []
+
+        def probe_session() -> AsyncModbusTcpClient:
+            return AsyncModbusTcpClient(self.host, port=self.port, timeout=probe_timeout, retries=0)
+
+        async def worker() -> None:
+            session = None
+            try:
+                while pending:
+                    unit_id = pending.popleft()
+                    if session is None:
+                        session = probe_session()
+                        if not await session.connect():
+                            # Leave the unit for a worker that did connect
+                            pending.appendleft(unit_id)
+                            errors.append("Failed to establish TCP connection")
+                            return
+
+                    start = time.perf_counter()
+                    try:
+                        result = await asyncio.wait_for(
+                            session.read_holding_registers(0, 1, slave=unit_id), probe_timeout)
+                    except (asyncio.TimeoutError, ModbusException, OSError) as e:
+                        self.logger.debug(f"No response from unit ID {unit_id}: {e!r}")
+                        # A late reply must not be mistaken for the next probe's,
+                        # and a reset connection cannot carry one
+                        session.close()
+                        session = None
+                        continue
+
+                    if result.isError():
+                        self.logger.debug(f"No response from unit ID {unit_id}")
+                    else:
+                        latencies[unit_id] = (time.perf_counter() - start) * 1000
+                        self.logger.info(f"Found sensor at unit ID {unit_id} "
+                                         f"({latencies[unit_id]:.1f} ms)")
+            finally:
+                if session is not None:
+                    session.close()
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(ids)))))
+
+        if pending:
+            self._last_error = errors[-1] if errors else "Probe sweep incomplete"
+            raise DXMConnectionError(f"Could not probe {len(pending)} unit IDs on {self.host}: "
+                                     f"{self._last_error}")
+
+        self.logger.info(f"Sweep complete. Found {len(latencies)} sensors: {sorted(latencies)}")
+        return dict(sorted(latencies.items()))
+
+    async def _read_or_none(self, unit_id: int) -> Optional[SensorReading]:
+        """Read one sensor, mapping failures to None like DXMClient does."""
+        try:
+            return await self.read_sensor(unit_id)
+        except Exception as e:
+            self.logger.warning(f"Failed to read sensor {unit_id}: {e}")
+            return None
+
+    async def read_multiple_sensors(self, unit_ids: List[int]) -> Dict[int, Optional[SensorReading]]:
+        """
+        Read data from multiple sensors concurrently.
+
+        Educational Note:
+        All per-unit reads are started together and the semaphore keeps at
+        most ``max_in_flight`` of them on the wire. A slow or absent unit
+        therefore delays only its own result, not the rest of the cycle.
+
+        Args:
+            unit_ids: List of unit IDs to read
+
+        Returns:
+            Dictionary mapping unit IDs to sensor readings (None if failed)
+        """
+        results = await asyncio.gather(*(self._read_or_none(u) for u in unit_ids))
+        return dict(zip(unit_ids, results))
+
+    async def monitor_sensors(self, unit_ids: List[int], interval: float = 1.0,
+                              duration: Optional[float] = None,
+                              overrun_policy: Union[OverrunPolicy, str] = OverrunPolicy.SKIP,
+                              adaptive: Optional[AdaptivePollPolicy] = None,
+                              history_cycles: int = 0
+                              ) -> AsyncIterator[Dict[int, Optional[SensorReading]]]:
+        """
+        Monitor multiple sensors over time.
+
+        Cycles are scheduled on absolute monotonic deadlines exactly like
+        DXMClient.monitor_sensors.
+
+        Args:
+            unit_ids: List of unit IDs to monitor
+            interval: Time between readings (seconds)
+            duration: Total monitoring time (None for indefinite)
+            overrun_policy: What to do when a cycle misses its deadline
+                ("skip", "catch_up" or "stretch")
+            adaptive: Optional per-unit rate policy. When given, cycles tick
+                at ``adaptive.min_interval`` (``interval`` is ignored) and
+                each cycle reads and yields only the units that are due
+            history_cycles: Keep the last N cycles in ``self.history``
+                (a bounded ReadingHistory); 0 keeps no history
+
+        Yields:
+            Dictionary of readings for each monitoring cycle
+        """
+        if adaptive is not None:
+            interval = adaptive.min_interval
+        scheduler = DeadlineScheduler(interval, overrun_policy)
+        self._scheduler = scheduler
+        self.history = ReadingHistory(history_cycles, len(unit_ids)) if history_cycles > 0 else None
+
+        while True:
+            timing = await scheduler.wait_async()
+            if timing.missed:
+                self.logger.warning(f"Monitoring missed {timing.missed} deadline(s) before "
+                                    f"cycle {timing.cycle} (interval {interval}s, "
+                                    f"policy {scheduler.policy.value})")
+
+            if adaptive is None:
+                readings = await self.read_multiple_sensors(unit_ids)
+            else:
+                due = adaptive.due_units(unit_ids, timing.started_ns)
+                readings = (await self.read_multiple_sensors(due)) if due else {}
+                for unit_id, reading in readings.items():
+                    adaptive.update(unit_id, reading, timing.started_ns)
+
+            # Adaptive ticks with no unit due produce no output
+            if readings:
+                if self.history is not None:
+                    self.history.append(timing.cycle, readings)
+                yield readings
+
+            if duration and scheduler.elapsed() >= duration:
+                break
+
+    @property
+    def last_cycle_timing(self) -> Optional[CycleTiming]:
+        """Timing (deadline, start, jitter, misses) of the latest monitoring cycle."""
+        return self._scheduler.last_timing if self._scheduler else None
+
+    def get_monitor_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get scheduling statistics of the current or last monitoring run.
+
+        Returns:
+            Scheduler statistics, or None if monitoring has not run
+        """
+        return self._scheduler.stats() if self._scheduler else None
+
+    def get_connection_info(self) -> Dict[str, Any]:
+        """
+        Get detailed connection information.
+
+        Returns:
+            Dictionary with connection details
+        """
+        return {
+            'host': self.host,
+            'port': self.port,
+            'connected': self.connected,
+            'timeout': self.timeout,
+            'retry_attempts': self.retry_attempts,
+            'max_in_flight': self.max_in_flight,
+            'last_error': self.last_error,
+            'client_info': {
+                'sessions': len(self._sessions),
+                'idle_sessions': len(self._idle_sessions)
+            }
+        }
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Circuit Breakers for Unresponsive Sensors
+
+Tracks the health of each Modbus unit separately. A unit that keeps
+failing is "tripped": it is skipped without touching the network and is
+only probed again after a back-off delay that doubles with every failed
+probe. One dead sensor therefore stops costing a timeout per cycle, and
+the healthy units behind the same controller keep their normal rate.
+
+Educational Focus:
+- The closed / open / half-open circuit breaker pattern
+- Exponential back-off for recovery probes
+- Failing fast instead of waiting for timeouts
+"""
+
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+
+class BreakerState(Enum):
+    """
+    State of a circuit breaker.
+
+    Educational Note:
+    - CLOSED: the unit is healthy and every request goes through.
+    - OPEN: the unit failed repeatedly; requests fail immediately until
+      the back-off delay has passed.
+    - HALF_OPEN: the delay has passed and one probe request is allowed.
+      Success closes the breaker, failure opens it again for longer.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker with exponential probe back-off.
+
+    Usage:
+        breaker = CircuitBreaker(failure_threshold=3)
+        if breaker.allow():
+            try:
+                do_request()
+                breaker.record_success()
+            except IOError:
+                breaker.record_failure()
+    """
+
+    def __init__(self,
+                 failure_threshold: int = 3,
+                 base_backoff: float = 1.0,
+                 max_backoff: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            base_backoff: Delay before the first probe (seconds)
+            max_backoff: Upper bound of the probe delay (seconds)
+            clock: Monotonic clock in seconds (replaceable for testing)
+
+        Raises:
+            ValueError: If the threshold or delays are invalid
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be at least 1, got {failure_threshold}")
+        if base_backoff <= 0 or max_backoff < base_backoff:
+            raise ValueError(f"Need 0 < base_backoff <= max_backoff, got "
+                             f"{base_backoff} and {max_backoff}")
+
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self._backoff = base_backoff
+        self._open_until = 0.0
+
+    def allow(self) -> bool:
+        """
+        Decide whether a request may be sent now.
+
+        Returns:
+            True if the request should go ahead (possibly as a probe)
+        """
+        if self.state is BreakerState.CLOSED:
+            return True
+        if self.state is BreakerState.OPEN and self._clock() >= self._open_until:
+            self.state = BreakerState.HALF_OPEN
+            return True
+        # Open and still backing off, or a probe is already outstanding
+        return False
+
+    @property
+    def probing(self) -> bool:
+        """True while the single half-open probe is outstanding."""
+        return self.state is BreakerState.HALF_OPEN
+
+    def record_success(self) -> None:
+        """Record a successful request and close the breaker."""
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self._backoff = self.base_backoff
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the breaker when warranted."""
+        self.consecutive_failures += 1
+
+        if self.state is BreakerState.HALF_OPEN:
+            # Failed probe: stay away twice as long next time
+            self._backoff = min(self._backoff * 2, self.max_backoff)
+            self._open()
+        elif (self.state is BreakerState.CLOSED and
+              self.consecutive_failures >= self.failure_threshold):
+            self._backoff = self.base_backoff
+            self.trips += 1
+            self._open()
+
+    def _open(self) -> None:
+        self.state = BreakerState.OPEN
+        self._open_until = self._clock() + self._backoff
+
+    def abandon_probe(self) -> None:
+        """
+        Give back a half-open probe that could not be judged.
+
+        Educational Note:
+        If the probe never reached the unit (for example because the TCP
+        session was down), it says nothing about the unit. The breaker
+        returns to OPEN with its current delay already elapsed, so the
+        next request probes again without extending the back-off.
+        """
+        if self.state is BreakerState.HALF_OPEN:
+            self.state = BreakerState.OPEN
+            self._open_until = self._clock()
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 if not open)."""
+        if self.state is not BreakerState.OPEN:
+            return 0.0
+        return max(0.0, self._open_until - self._clock())
+
+    def reset(self) -> None:
+        """Forget all failures and close the breaker."""
+        self.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the breaker state.
+
+        Returns:
+            Dictionary with state, failure count, trips and probe timing
+        """
+        return {
+            'state': self.state.value,
+            'consecutive_failures': self.consecutive_failures,
+            'trips': self.trips,
+            'backoff': self._backoff,
+            'retry_in': self.retry_in()
+        }
+
+
+class BreakerBank:
+    """
+    Lazily created circuit breakers keyed by unit ID.
+
+    Educational Note:
+    Every unit gets its own breaker with the same settings, so a failure
+    on one unit never delays requests to another.
+    """
+
+    def __init__(self, failure_threshold: int = 3, base_backoff: float = 1.0,
+                 max_backoff: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the bank.
+
+        Args:
+            failure_threshold: Consecutive failures that open a breaker
+            base_backoff: Delay before a unit's first probe (seconds)
+            max_backoff: Upper bound of the probe delay (seconds)
+            clock: Monotonic clock in seconds (replaceable for testing)
+        """
+        # Validate the settings once, up front
+        CircuitBreaker(failure_threshold, base_backoff, max_backoff, clock)
+
+        self._settings = (failure_threshold, base_backoff, max_backoff, clock)
+        self._breakers: Dict[int, CircuitBreaker] = {}
+
+    def __getitem__(self, unit_id: int) -> CircuitBreaker:
+        breaker = self._breakers.get(unit_id)
+        if breaker is None:
+            breaker = self._breakers[unit_id] = CircuitBreaker(*self._settings)
+        return breaker
+
+    def get(self, unit_id: int) -> Optional[CircuitBreaker]:
+        """Breaker of a unit, or None if the unit was never used."""
+        return self._breakers.get(unit_id)
+
+    def open_units(self) -> List[int]:
+        """Unit IDs whose breaker is currently not closed."""
+        return sorted(unit_id for unit_id, breaker in self._breakers.items()
+                      if breaker.state is not BreakerState.CLOSED)
+
+    def reset(self) -> None:
+        """Close every breaker."""
+        for breaker in self._breakers.values():
+            breaker.reset()
+
+    def stats(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the state of every breaker.
+
+        Returns:
+            Dictionary mapping unit IDs to breaker statistics
+        """
+        return {unit_id: breaker.stats() for unit_id, breaker in sorted(self._breakers.items())}
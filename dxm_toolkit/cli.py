@@ -5,24 +5,33 @@ Command Line Interface for DXM Radar Toolkit
 CLI for interacting with Banner DXM wireless controllers and radar sensors.
 """
 
+import json
 import os
 import sys
 import time
-import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 
 import click
-from tabulate import tabulate
 
-# Import our DXM toolkit modules
-from .dxm_client import DXMClient, DXMConnectionError, DXMCommunicationError
+# Import our DXM toolkit modules. Heavy dependencies (pymodbus via
+# dxm_client, asyncio, yaml, tabulate) are imported inside the commands
+# that need them so "dxm --help" and simple commands start quickly.
+from .exceptions import DXMConnectionError, DXMCommunicationError
+from .output import FLUSH_POLICIES, FORMATS, ReadingStreamWriter, open_stdout
+from .recording import RecordingError, RecordingWriter
 from .sensor_decoder import SensorReading, SensorStatus
 from .utils import (
     validate_ip_address, colorize_text, format_timestamp,
-    validate_unit_id
+    validate_unit_id, parse_unit_ids
 )
 
+if TYPE_CHECKING:
+    from .discovery_cache import DiscoveryCache
+    from .dxm_client import DXMClient
+    from .history import ReadingHistory
+    from .unit_stats import ReadingStatistics
+
 
 # Global configuration object
 class Config:
@@ -39,12 +48,21 @@ class Config:
                 'dxm_ip': '192.168.0.1',
                 'modbus_port': 502,
                 'timeout': 5.0,
-                'retry_attempts': 3
+                'retry_attempts': 3,
+                'pipeline_depth': 1,
+                'fast_path': False,
+                'gap_tolerance': 8,
+                'failure_threshold': 3,
+                'probe_backoff': 1.0,
+                'max_probe_backoff': 60.0
             },
             'sensors': {
                 'max_modules': 8,
                 'base_unit_id': 1,
                 'monitor_interval': 1.0,
+                'overrun_policy': 'skip',
+                'history_cycles': 0,
+                'stats_window': None,
                 'distance_unit': 'mm'
             },
             'display': {
@@ -53,6 +71,51 @@ class Config:
                 'distance_precision': 1,
                 'show_timestamps': True
             },
+            'adaptive': {
+                'enabled': False,
+                'min_interval': 0.2,
+                'max_interval': 5.0,
+                'change_threshold': 50.0,
+                'backoff_factor': 2.0
+            },
+            'change_filter': {
+                'deadband': None,
+                'heartbeat': 60.0
+            },
+            'discovery': {
+                'cache_enabled': True,
+                'cache_ttl': 86400.0,
+                'cache_file': None,
+                'probe_timeout': 0.25,
+                'concurrency': 16
+            },
+            'simulator': {
+                'port': 5020,
+                'units': '1-8',
+                'waveform': 'sine',
+                'latency_ms': 0.0,
+                'jitter_ms': 0.0,
+                'max_connections': None
+            },
+            'output': {
+                'format': 'table',
+                'flush': 'cycle',
+                'buffer_size': 65536
+            },
+            'recording': {
+                'checkpoint_every': 1000,
+                'checkpoint_interval': 10.0
+            },
+            'exporter': {
+                'listen': '127.0.0.1:9850',
+                'interval': 1.0
+            },
+            'fleet': {
+                'global_concurrency': 64,
+                'per_host_concurrency': 1,
+                'workers': 1,
+                'shard_by': 'host'
+            },
             'advanced': {
                 'modbus_debug': False
             }
@@ -66,6 +129,8 @@ class Config:
                 click.echo(f"Warning: Config file {config_path} not found, using defaults")
                 return
 
+            import yaml
+
             with open(config_file, 'r') as f:
                 file_config = yaml.safe_load(f)
 
@@ -122,8 +187,10 @@ def find_config_file() -> Optional[str]:
     return None
 
 
-def setup_client(ip: Optional[str] = None, debug: bool = False) -> DXMClient:
+def setup_client(ip: Optional[str] = None, debug: bool = False) -> 'DXMClient':
     """Create and configure DXM client instance."""
+    from .dxm_client import DXMClient
+
     # Use provided IP or fall back to configuration
     dxm_ip = ip or config.get('network.dxm_ip')
 
@@ -135,12 +202,59 @@ def setup_client(ip: Optional[str] = None, debug: bool = False) -> DXMClient:
         port=config.get('network.modbus_port'),
         timeout=config.get('network.timeout'),
         retry_attempts=config.get('network.retry_attempts'),
+        pipeline_depth=config.get('network.pipeline_depth'),
+        fast_path=config.get('network.fast_path'),
+        gap_tolerance=config.get('network.gap_tolerance'),
+        failure_threshold=config.get('network.failure_threshold'),
+        probe_backoff=config.get('network.probe_backoff'),
+        max_probe_backoff=config.get('network.max_probe_backoff'),
         debug=debug or config.get('advanced.modbus_debug')
     )
 
 
+def setup_discovery_cache() -> Optional['DiscoveryCache']:
+    """Create the discovery cache from configuration (None if disabled)."""
+    if not config.get('discovery.cache_enabled'):
+        return None
+    from .discovery_cache import DiscoveryCache
+
+    return DiscoveryCache(config.get('discovery.cache_file'), config.get('discovery.cache_ttl'))
+
+
+def format_metrics_table(snapshot: Dict[str, Any]) -> str:
+    """Format a ClientMetrics snapshot as a per-unit table, busiest units first."""
+    from tabulate import tabulate
+
+    units = snapshot['units']
+    if not units:
+        return "No requests recorded"
+
+    total_ms = sum(m['latency']['total_ms'] for m in units.values()) or 1.0
+    rows = []
+    for unit_id, m in sorted(units.items(), key=lambda item: -item[1]['latency']['total_ms']):
+        latency = m['latency']
+        rows.append([
+            unit_id,
+            m['requests'],
+            m['successes'],
+            ", ".join(f"{name}: {n}" for name, n in sorted(m['errors'].items())) or '-',
+            sum(m['retries'].values()),
+            m['skipped'],
+            f"{latency['p50_ms']:.2f}",
+            f"{latency['p99_ms']:.2f}",
+            f"{latency['max_ms']:.2f}",
+            f"{latency['total_ms']:.1f}",
+            f"{latency['total_ms'] / total_ms * 100:.1f}%",
+        ])
+    headers = ['Unit', 'Requests', 'OK', 'Errors', 'Retries', 'Skipped',
+               'p50 (ms)', 'p99 (ms)', 'Max (ms)', 'Time (ms)', 'Share']
+    return tabulate(rows, headers=headers, tablefmt=config.get('display.table_format'))
+
+
 def format_reading_table(readings: List[SensorReading], show_timestamps: bool = True) -> str:
     """Format sensor readings as a table."""
+    from tabulate import tabulate
+
     if not readings:
         return "No sensor readings available"
 
@@ -201,8 +315,78 @@ def format_reading_table(readings: List[SensorReading], show_timestamps: bool =
     return tabulate(rows, headers=headers, tablefmt=table_format)
 
 
+def echo_cycle(readings: Dict[int, Optional[SensorReading]], index: int, timestamp: str,
+               timing_text: str) -> None:
+    """Print one monitoring cycle as shown by monitor and replay."""
+    # Separate live updates
+    if index > 0:
+        click.echo("\n" + "="*80)
+
+    # Convert readings dictionary to list for table formatting
+    current_readings = [r for r in readings.values() if r is not None]
+
+    if current_readings:
+        click.echo(f"Update {index + 1} - {timestamp} ({timing_text})")
+        click.echo(format_reading_table(current_readings))
+    else:
+        click.echo("No sensor data available")
+
+
+def echo_history_summary(history: 'ReadingHistory', err: bool = False) -> None:
+    """Print the per-unit distance range kept in a reading history."""
+    from tabulate import tabulate
+
+    click.echo(f"\nHistory: last {len(history)} cycles, {history.row_count} readings "
+               f"({history.nbytes / 1024:.1f} KB)", err=err)
+    summary = []
+    for unit_id in sorted(set(history.column('unit_id'))):
+        _, distances = history.unit_series(unit_id)
+        in_range = [d for d in distances if 0 < d < 65535]
+        if in_range:
+            summary.append([unit_id, len(distances), min(in_range), max(in_range)])
+        else:
+            summary.append([unit_id, len(distances), '-', '-'])
+    click.echo(tabulate(summary, headers=['Unit', 'Readings', 'Min (mm)', 'Max (mm)'],
+                        tablefmt=config.get('display.table_format')), err=err)
+
+
+def echo_statistics_summary(statistics: 'ReadingStatistics', err: bool = False) -> None:
+    """Print the running per-unit statistics of a monitoring or replay run."""
+    from tabulate import tabulate
+
+    def percentiles(quantiles) -> List[str]:
+        if quantiles is None or not len(quantiles):
+            return ['-'] * 3
+        return [f"{value:.0f}" for value in quantiles.sketch().quantiles((50, 95, 99))]
+
+    rows = []
+    for unit_id, stats in statistics.items():
+        distance = stats.distance
+        signal = percentiles(stats.signal_quantiles)
+        rows.append([
+            unit_id,
+            stats.count,
+            stats.failures,
+            f"{distance.mean:.1f}" if distance.count else '-',
+            f"{distance.stddev:.1f}" if distance.count else '-',
+            distance.min if distance.count else '-',
+            *percentiles(stats.distance_quantiles),
+            distance.max if distance.count else '-',
+            f"{stats.signal.mean:.1f}" if stats.count else '-',
+            f"{signal[0]}/{signal[2]}" if signal[0] != '-' else '-',
+            f"{stats.connection_stability:.1f}%",
+        ])
+    window = statistics.window
+    click.echo(f"\nStatistics (percentiles over the last {window:g}s):" if window
+               else "\nStatistics:", err=err)
+    click.echo(tabulate(rows, headers=['Unit', 'Readings', 'Failed', 'Mean (mm)', 'Std (mm)',
+                                       'Min (mm)', 'p50 (mm)', 'p95 (mm)', 'p99 (mm)',
+                                       'Max (mm)', 'Signal', 'Signal p50/p99', 'Connected'],
+                        tablefmt=config.get('display.table_format')), err=err)
+
+
 @click.group()
-@click.option('--config', '-c', help='Configuration file path')
+@click.option('--config', '-c', 'config_file', help='Configuration file path')
 @click.option('--debug', is_flag=True, help='Enable debug output')
 @click.pass_context
 def cli(ctx, config_file, debug):
@@ -226,15 +410,69 @@ def cli(ctx, config_file, debug):
     ctx.obj['debug'] = debug
 
 
+def sweep_units(ip: Optional[str], ranges: str, probe_timeout: float, concurrency: int,
+                debug: bool) -> None:
+    """Probe unit ID ranges in parallel and print the responders with their latency."""
+    import asyncio
+    from tabulate import tabulate
+    from .async_client import AsyncDXMClient
+
+    dxm_ip = ip or config.get('network.dxm_ip')
+    if not validate_ip_address(dxm_ip):
+        raise click.ClickException(f"Invalid IP address: {dxm_ip}")
+    try:
+        unit_ids = parse_unit_ids(ranges)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--ranges')
+
+    client = AsyncDXMClient(host=dxm_ip, port=config.get('network.modbus_port'), debug=debug)
+    click.echo(f"Sweeping {len(unit_ids)} unit IDs on DXM at {dxm_ip} "
+               f"({concurrency} parallel probes, {probe_timeout}s timeout)...")
+
+    start = time.perf_counter()
+    latencies = asyncio.run(client.scan_units(unit_ids, probe_timeout, concurrency))
+    elapsed = time.perf_counter() - start
+
+    click.echo(f"Sweep finished in {elapsed:.2f}s")
+    if not latencies:
+        click.echo("No sensors found")
+        return
+
+    click.echo(f"\nFound {len(latencies)} sensors:")
+    rows = [[unit_id, f"{latency:.1f}"] for unit_id, latency in latencies.items()]
+    click.echo(tabulate(rows, headers=['Unit ID', 'Probe Latency (ms)'],
+                        tablefmt=config.get('display.table_format')))
+
+    # Only a sweep of 1..N says which units are absent below N
+    cache = setup_discovery_cache()
+    if cache is not None and unit_ids == list(range(1, unit_ids[-1] + 1)):
+        cache.store(dxm_ip, config.get('network.modbus_port'), unit_ids[-1], list(latencies))
+
+
 @cli.command()
 @click.option('--ip', help='DXM IP address (overrides config)')
 @click.option('--max-units', default=None, type=int, help='Maximum unit IDs to scan')
+@click.option('--ranges', help='Probe these unit IDs in parallel instead, e.g. 1-247 or 1-16,100-120')
+@click.option('--probe-timeout', default=None, type=float,
+              help='Seconds to wait per probe with --ranges')
+@click.option('--concurrency', default=None, type=int, help='Parallel probes with --ranges')
 @click.pass_context
-def discover(ctx, ip, max_units):
+def discover(ctx, ip, max_units, ranges, probe_timeout, concurrency):
     """Discover connected sensors by scanning unit IDs."""
     debug = ctx.obj.get('debug', False)
     max_scan = max_units or config.get('sensors.max_modules')
 
+    if ranges:
+        try:
+            sweep_units(ip, ranges,
+                        probe_timeout or config.get('discovery.probe_timeout'),
+                        concurrency or config.get('discovery.concurrency'),
+                        debug)
+        except DXMConnectionError as e:
+            click.echo(f"Connection Error: {e}", err=True)
+            sys.exit(1)
+        return
+
     try:
         # Setup client and connect
         with setup_client(ip, debug) as client:
@@ -242,7 +480,8 @@ def discover(ctx, ip, max_units):
             click.echo(f"Scanning unit IDs 1-{max_scan}")
 
             # Perform discovery
-            discovered = client.discover_sensors(max_scan)
+            discovered = client.discover_sensors(max_scan, cache=setup_discovery_cache(),
+                                                 rediscover=True)
 
             if discovered:
                 click.echo(f"\nFound {len(discovered)} sensors:")
@@ -279,15 +518,76 @@ def discover(ctx, ip, max_units):
 
 @cli.command()
 @click.option('--ip', help='DXM IP address (overrides config)')
-@click.option('--units', help='Comma-separated unit IDs to monitor (default: discover)')
+@click.option('--units', help='Unit IDs to monitor, e.g. 1,2,5-8 (default: discover)')
 @click.option('--interval', default=None, type=float, help='Monitoring interval in seconds')
 @click.option('--duration', default=None, type=float, help='Monitoring duration in seconds')
+@click.option('--overrun', type=click.Choice(['skip', 'catch_up', 'stretch']), default=None,
+              help='What to do when a cycle misses its deadline')
+@click.option('--adaptive/--fixed-rate', default=None,
+              help='Poll fast-changing units faster and idle units slower')
+@click.option('--history', 'history_cycles', type=int, default=None,
+              help='Keep the last N cycles in memory for the final summary')
+@click.option('--stats', 'show_stats', is_flag=True,
+              help='Keep running per-unit statistics and print them at the end')
+@click.option('--stats-window', type=float, default=None,
+              help='Percentiles of --stats over the last N seconds (default: whole run)')
+@click.option('--deadband', default=None,
+              help='Only emit readings that changed: distance deadband in mm or %, '
+                   'with per-unit overrides, e.g. "10,3=2%"')
+@click.option('--heartbeat', type=float, default=None,
+              help='With --deadband, re-emit unchanged units every N seconds (0 disables)')
+@click.option('--rediscover', is_flag=True, help='Ignore cached discovery results and rescan')
+@click.option('--record', 'record_path', type=click.Path(dir_okay=False),
+              help='Append every cycle to this binary recording')
+@click.option('--format', 'output_format', type=click.Choice(FORMATS), default=None,
+              help='Output format: a live table, or one line per reading for other programs')
+@click.option('--flush', type=click.Choice(FLUSH_POLICIES), default=None,
+              help='When streamed output is flushed (line, cycle or never)')
 @click.option('--no-colors', is_flag=True, help='Disable colored output')
 @click.pass_context
-def monitor(ctx, ip, units, interval, duration, no_colors):
+def monitor(ctx, ip, units, interval, duration, overrun, adaptive, history_cycles, show_stats,
+            stats_window, deadband, heartbeat, rediscover, record_path, output_format, flush,
+            no_colors):
     """Monitor sensors in real-time with live updates."""
     debug = ctx.obj.get('debug', False)
+    output_format = output_format or config.get('output.format')
+    # Streamed readings own stdout; progress messages go to stderr
+    streaming = output_format != 'table'
+
+    def say(message: str) -> None:
+        click.echo(message, err=streaming)
+
     monitor_interval = interval or config.get('sensors.monitor_interval')
+    overrun_policy = overrun or config.get('sensors.overrun_policy')
+    if history_cycles is None:
+        history_cycles = config.get('sensors.history_cycles', 0)
+
+    if adaptive is None:
+        adaptive = config.get('adaptive.enabled')
+    poll_policy = None
+    if adaptive:
+        from .adaptive import AdaptivePollPolicy
+
+        poll_policy = AdaptivePollPolicy(
+            min_interval=config.get('adaptive.min_interval'),
+            max_interval=config.get('adaptive.max_interval'),
+            change_threshold=config.get('adaptive.change_threshold'),
+            backoff_factor=config.get('adaptive.backoff_factor')
+        )
+
+    if deadband is None:
+        deadband = config.get('change_filter.deadband')
+    change_filter = None
+    if deadband is not None:
+        from .deadband import DeadbandFilter, parse_deadbands
+
+        try:
+            default_deadband, unit_deadbands = parse_deadbands(str(deadband))
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint='--deadband')
+        if heartbeat is None:
+            heartbeat = config.get('change_filter.heartbeat')
+        change_filter = DeadbandFilter(default_deadband, unit_deadbands, heartbeat)
 
     # Temporarily disable colors if requested
     original_color_setting = config.get('display.use_colors')
@@ -297,51 +597,108 @@ def monitor(ctx, ip, units, interval, duration, no_colors):
     try:
         # Setup client and connect
         with setup_client(ip, debug) as client:
-            click.echo(f"Connecting to DXM at {client.host}...")
+            say(f"Connecting to DXM at {client.host}...")
 
             # Determine which units to monitor
             if units:
-                unit_ids = [int(u.strip()) for u in units.split(',')]
-                click.echo(f"Monitoring units: {unit_ids}")
+                unit_ids = parse_unit_ids(units)
+                say(f"Monitoring units: {unit_ids}")
             else:
-                click.echo("Discovering sensors...")
-                unit_ids = client.discover_sensors()
+                say("Discovering sensors...")
+                unit_ids = client.discover_sensors(config.get('sensors.max_modules'),
+                                                   cache=setup_discovery_cache(),
+                                                   rediscover=rediscover)
                 if not unit_ids:
-                    click.echo("No sensors found for monitoring")
+                    say("No sensors found for monitoring")
                     return
-                click.echo(f"Monitoring discovered units: {unit_ids}")
+                say(f"Monitoring discovered units: {unit_ids}")
 
             # Start monitoring
-            click.echo(f"\nStarting real-time monitoring (interval: {monitor_interval}s)")
+            if poll_policy:
+                say(f"\nStarting adaptive monitoring (interval: {poll_policy.min_interval}s"
+                    f" to {poll_policy.max_interval}s per unit)")
+            else:
+                say(f"\nStarting real-time monitoring (interval: {monitor_interval}s)")
             if duration:
-                click.echo(f"Duration: {duration}s")
-            click.echo("Press Ctrl+C to stop\n")
+                say(f"Duration: {duration}s")
+            if change_filter:
+                say(f"Emitting changes only (deadband: {change_filter.deadband}, heartbeat: "
+                    f"{f'{change_filter.heartbeat:g}s' if change_filter.heartbeat else 'off'})")
+            say("Press Ctrl+C to stop\n")
+
+            recorder = None
+            if record_path:
+                recorder = RecordingWriter(
+                    record_path,
+                    checkpoint_every=config.get('recording.checkpoint_every'),
+                    checkpoint_interval=config.get('recording.checkpoint_interval'))
+                say(f"Recording to {record_path}")
+
+            writer = None
+            if streaming:
+                writer = ReadingStreamWriter(open_stdout(config.get('output.buffer_size')),
+                                             output_format, flush or config.get('output.flush'))
+
+            statistics = None
+            if show_stats:
+                from .unit_stats import ReadingStatistics
+                statistics = ReadingStatistics(
+                    quantiles=True, window=stats_window or config.get('sensors.stats_window'))
 
             reading_count = 0
             try:
-                for readings_dict in client.monitor_sensors(unit_ids, monitor_interval, duration):
-                    # Clear screen for live updates (optional)
-                    if reading_count > 0:
-                        click.echo("\n" + "="*80)
-
-                    # Convert readings dictionary to list for table formatting
-                    current_readings = [r for r in readings_dict.values() if r is not None]
-
-                    if current_readings:
-                        timestamp = format_timestamp()
-                        click.echo(f"Update {reading_count + 1} - {timestamp}")
-                        click.echo(format_reading_table(current_readings))
+                for readings_dict in client.monitor_sensors(unit_ids, monitor_interval, duration,
+                                                            overrun_policy, poll_policy,
+                                                            history_cycles, recorder,
+                                                            change_filter):
+                    if statistics is not None:
+                        statistics.add_cycle(readings_dict)
+                    if writer is not None:
+                        writer.write_cycle(readings_dict, client.host, time.time_ns())
                     else:
-                        click.echo("No sensor data available")
-
+                        timing = client.last_cycle_timing
+                        timing_text = f"jitter {timing.jitter_ms:+.1f} ms"
+                        if timing.missed:
+                            timing_text += f", {timing.missed} missed"
+                        echo_cycle(readings_dict, reading_count, format_timestamp(), timing_text)
                     reading_count += 1
 
             except KeyboardInterrupt:
-                click.echo(f"\nMonitoring stopped after {reading_count} readings")
+                say(f"\nMonitoring stopped after {reading_count} readings")
+            except BrokenPipeError:
+                # The consumer of the stream went away (e.g. piped into head)
+                writer = None
+            finally:
+                if writer is not None:
+                    writer.close()
+                if recorder is not None:
+                    recorder.close()
+                    say(f"Recorded {recorder.records} readings to {record_path}")
+
+            stats = client.get_monitor_stats()
+            if stats:
+                say(f"Cycles: {stats['cycles']}, missed deadlines: {stats['missed_deadlines']}, "
+                    f"jitter mean/max: {stats['mean_jitter_ms']:.1f}/{stats['max_jitter_ms']:.1f} ms")
+            if poll_policy:
+                rates = ", ".join(f"{unit_id}: {info['interval']:g}s"
+                                  for unit_id, info in poll_policy.get_rates().items())
+                say(f"Final polling intervals - {rates}")
+            if change_filter:
+                filter_stats = change_filter.stats()
+                say(f"Change filter: emitted {filter_stats['emitted']} of "
+                    f"{filter_stats['received']} readings "
+                    f"({filter_stats['suppressed_ratio']:.0%} suppressed)")
+            if client.history:
+                echo_history_summary(client.history, err=streaming)
+            if statistics:
+                echo_statistics_summary(statistics, err=streaming)
 
     except DXMConnectionError as e:
         click.echo(f"Connection Error: {e}", err=True)
         sys.exit(1)
+    except RecordingError as e:
+        click.echo(f"Recording Error: {e}", err=True)
+        sys.exit(1)
     except Exception as e:
         click.echo(f"Monitoring Error: {e}", err=True)
         sys.exit(1)
@@ -407,6 +764,67 @@ def read(ctx, unit_id, ip, raw, detailed):
         sys.exit(1)
 
 
+@cli.command()
+@click.option('--ip', help='DXM IP address (overrides config)')
+@click.option('--units', help='Unit IDs to poll, e.g. 1,2,5-8 (default: discover)')
+@click.option('--cycles', default=20, type=int, help='Polling cycles to measure')
+@click.option('--interval', default=0.0, type=float, help='Pause between cycles in seconds')
+@click.option('--json', 'as_json', is_flag=True, help='Print the raw metrics as JSON')
+@click.pass_context
+def stats(ctx, ip, units, cycles, interval, as_json):
+    """Poll units for a number of cycles and show per-unit request metrics."""
+    debug = ctx.obj.get('debug', False)
+
+    try:
+        with setup_client(ip, debug) as client:
+            if units:
+                unit_ids = parse_unit_ids(units)
+            else:
+                unit_ids = client.discover_sensors(config.get('sensors.max_modules'),
+                                                   cache=setup_discovery_cache())
+                if not unit_ids:
+                    click.echo("No sensors found")
+                    return
+
+            # Discovery traffic is not part of the poll budget
+            client.metrics.reset()
+            if not as_json:
+                click.echo(f"Polling units {unit_ids} on {client.host} for {cycles} cycles...")
+
+            start = time.perf_counter()
+            for cycle in range(cycles):
+                if cycle and interval:
+                    time.sleep(interval)
+                client.read_multiple_sensors(unit_ids)
+            elapsed = time.perf_counter() - start
+
+            info = client.get_connection_info()
+
+        snapshot = info['metrics']
+        if as_json:
+            click.echo(json.dumps(snapshot, indent=2))
+            return
+
+        totals = snapshot['totals']
+        rate = totals['requests'] / elapsed if elapsed > 0 else 0.0
+        click.echo(f"\n{format_metrics_table(snapshot)}")
+        click.echo(f"\nRequests: {totals['requests']} in {elapsed:.2f}s "
+                   f"({rate:.0f}/s), "
+                   f"p50/p99 {totals['latency']['p50_ms']:.2f}/{totals['latency']['p99_ms']:.2f} ms")
+        click.echo(f"Reconnects: {snapshot['reconnects']}, open breakers: {info['open_units'] or 'none'}")
+        click.echo(f"Bytes sent/received: {snapshot['bytes_sent']}/{snapshot['bytes_received']}")
+
+    except DXMCommunicationError as e:
+        click.echo(f"Communication Error: {e}", err=True)
+        sys.exit(1)
+    except DXMConnectionError as e:
+        click.echo(f"Connection Error: {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Stats Error: {e}", err=True)
+        sys.exit(1)
+
+
 @cli.command()
 @click.option('--ip', help='DXM IP address (overrides config)')
 @click.pass_context
@@ -461,10 +879,323 @@ def test(ctx, ip):
         sys.exit(1)
 
 
+@cli.command()
+@click.argument('inventory', type=click.Path(exists=True, dir_okay=False))
+@click.option('--interval', default=None, type=float, help='Polling interval in seconds')
+@click.option('--duration', default=None, type=float, help='Polling duration in seconds')
+@click.option('--global-limit', default=None, type=int, help='Maximum requests in flight across all hosts')
+@click.option('--per-host-limit', default=None, type=int, help='Maximum requests in flight per host')
+@click.option('--workers', default=None, type=int,
+              help='Poll from N worker processes (0: one per CPU core)')
+@click.option('--shard-by', type=click.Choice(['host', 'unit']), default=None,
+              help='Give each worker whole hosts, or spread the units of every host')
+@click.option('--rediscover', is_flag=True, help='Ignore cached discovery results and rescan')
+@click.option('--no-colors', is_flag=True, help='Disable colored output')
+@click.pass_context
+def fleet(ctx, inventory, interval, duration, global_limit, per_host_limit, workers, shard_by,
+          rediscover, no_colors):
+    """Poll every DXM in a YAML/CSV host inventory."""
+    import asyncio
+    from .fleet import FleetPoller, load_inventory
+
+    poll_interval = interval or config.get('sensors.monitor_interval')
+    use_colors = config.get('display.use_colors') and not no_colors
+    distance_unit = config.get('sensors.distance_unit')
+
+    try:
+        hosts = load_inventory(inventory)
+    except Exception as e:
+        click.echo(f"Inventory Error: {e}", err=True)
+        sys.exit(1)
+
+    discovery_cache = setup_discovery_cache()
+    if discovery_cache and rediscover:
+        for spec in hosts:
+            discovery_cache.invalidate(spec.host, spec.port)
+
+    if workers is None:
+        workers = config.get('fleet.workers')
+    settings = {
+        'global_concurrency': global_limit or config.get('fleet.global_concurrency'),
+        'per_host_concurrency': per_host_limit or config.get('fleet.per_host_concurrency'),
+        'timeout': config.get('network.timeout'),
+        'max_units': config.get('sensors.max_modules'),
+        'discovery_cache': discovery_cache,
+    }
+
+    if workers != 1:
+        from .sharding import ShardedPoller
+
+        try:
+            sharded = ShardedPoller(hosts, workers or None,
+                                    shard_by or config.get('fleet.shard_by'),
+                                    poll_interval, **settings)
+        except ValueError as e:
+            click.echo(f"Inventory Error: {e}", err=True)
+            sys.exit(1)
+
+        click.echo(f"Polling {len(hosts)} DXM controllers from {len(sharded.shards)} worker "
+                   f"processes (interval: {poll_interval}s)")
+        click.echo("Press Ctrl+C to stop\n")
+        try:
+            with sharded:
+                for reading in sharded.stream(duration):
+                    click.echo(f"{reading.host:<16} "
+                               f"{reading.format_for_display(distance_unit, use_colors)}")
+        except KeyboardInterrupt:
+            click.echo("\nFleet polling stopped")
+        except Exception as e:
+            click.echo(f"Fleet Error: {e}", err=True)
+            sys.exit(1)
+        for index, info in sharded.get_shard_info().items():
+            click.echo(f"Worker {index}: {info['readings']} readings, "
+                       f"{info['restarts']} restarts, {info['dropped']} dropped", err=True)
+        return
+
+    poller = FleetPoller(hosts, **settings)
+
+    click.echo(f"Polling {len(hosts)} DXM controllers (interval: {poll_interval}s)")
+    click.echo("Press Ctrl+C to stop\n")
+
+    async def run():
+        async with poller:
+            async for reading in poller.stream(poll_interval, duration):
+                click.echo(f"{reading.host:<16} {reading.format_for_display(distance_unit, use_colors)}")
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        click.echo("\nFleet polling stopped")
+    except Exception as e:
+        click.echo(f"Fleet Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option('--host', default='127.0.0.1', help='Interface to listen on')
+@click.option('--port', default=None, type=int, help='TCP port to listen on')
+@click.option('--units', help='Simulated unit IDs, e.g. 1-8')
+@click.option('--waveform', type=click.Choice(['constant', 'sine', 'ramp', 'square', 'noise']),
+              default=None, help='Distance waveform of every unit')
+@click.option('--latency', 'latency_ms', default=None, type=float, help='Response latency in ms')
+@click.option('--jitter', 'jitter_ms', default=None, type=float,
+              help='Extra random latency of up to this many ms')
+@click.option('--max-connections', default=None, type=int, help='Concurrent TCP connections allowed')
+@click.option('--seed', default=0, type=int, help='Seed for jitter and noise')
+@click.option('--profile', type=click.Path(exists=True, dir_okay=False),
+              help='YAML file with per-unit profiles (overrides the options above)')
+@click.pass_context
+def simulate(ctx, host, port, units, waveform, latency_ms, jitter_ms, max_connections, seed,
+             profile):
+    """Run a local DXM/Q90R Modbus TCP simulator for testing and benchmarks."""
+    import asyncio
+    from .simulator import DXMSimulator, UnitProfile, load_profiles
+
+    try:
+        if profile:
+            settings = load_profiles(profile)
+        else:
+            unit_ids = parse_unit_ids(units or config.get('simulator.units'))
+            shape = waveform or config.get('simulator.waveform')
+            # Spread the units over one period so they do not move in lockstep
+            settings = {
+                'units': [UnitProfile(unit_id, waveform=shape, seed=seed,
+                                      phase=10.0 * i / len(unit_ids))
+                          for i, unit_id in enumerate(unit_ids)],
+                'latency': (latency_ms if latency_ms is not None
+                            else config.get('simulator.latency_ms')) / 1000,
+                'jitter': (jitter_ms if jitter_ms is not None
+                           else config.get('simulator.jitter_ms')) / 1000,
+                'max_connections': max_connections or config.get('simulator.max_connections'),
+                'seed': seed,
+            }
+        simulator = DXMSimulator(host=host,
+                                 port=port if port is not None else config.get('simulator.port'),
+                                 **settings)
+    except (ValueError, TypeError) as e:
+        raise click.ClickException(f"Invalid simulator settings: {e}")
+
+    async def run():
+        await simulator.start()
+        click.echo(f"Simulating DXM on {simulator.host}:{simulator.port} "
+                   f"with units {sorted(simulator.units)}")
+        click.echo(f"Latency: {simulator.latency * 1000:g} ms "
+                   f"(+ up to {simulator.jitter * 1000:g} ms jitter), "
+                   f"max connections: {simulator.max_connections or 'unlimited'}")
+        click.echo(f"Point clients at it with network.dxm_ip: {simulator.host} and "
+                   f"network.modbus_port: {simulator.port}")
+        click.echo("Press Ctrl+C to stop\n")
+        await simulator.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        stats = simulator.stats()
+        click.echo(f"\nSimulator stopped after {stats['requests_served']} requests")
+    except OSError as e:
+        click.echo(f"Simulator Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument('recording', type=click.Path(exists=True, dir_okay=False))
+@click.option('--speed', default='1x', help="Replay speed: a factor such as 10x, or 'max'")
+@click.option('--history', 'history_cycles', type=int, default=None,
+              help='Keep the last N cycles in memory for the final summary')
+@click.option('--stats', 'show_stats', is_flag=True,
+              help='Keep running per-unit statistics and print them at the end')
+@click.option('--stats-window', type=float, default=None,
+              help='Percentiles of --stats over the last N seconds (default: whole run)')
+@click.option('--validate/--no-validate', default=True, help='Validate every replayed reading')
+@click.option('--no-display', is_flag=True, help='Skip rendering (measure decoding only)')
+@click.option('--format', 'output_format', type=click.Choice(FORMATS), default=None,
+              help='Output format: a table per cycle, or one line per reading')
+@click.option('--flush', type=click.Choice(FLUSH_POLICIES), default=None,
+              help='When streamed output is flushed (line, cycle or never)')
+@click.option('--no-colors', is_flag=True, help='Disable colored output')
+@click.pass_context
+def replay(ctx, recording, speed, history_cycles, show_stats, stats_window, validate, no_display, output_format,
+           flush, no_colors):
+    """Replay a recorded session through the decoder and display."""
+    from .history import ReadingHistory
+    from .recording import RecordingReader
+    from .unit_stats import ReadingStatistics
+    from .replay import RecordingReplayer, parse_speed
+
+    output_format = output_format or config.get('output.format')
+    streaming = output_format != 'table' and not no_display
+
+    def say(message: str) -> None:
+        click.echo(message, err=streaming)
+
+    try:
+        replay_speed = parse_speed(speed)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--speed')
+    if history_cycles is None:
+        history_cycles = config.get('sensors.history_cycles', 0)
+
+    original_color_setting = config.get('display.use_colors')
+    if no_colors:
+        config.settings['display']['use_colors'] = False
+
+    try:
+        with RecordingReader(recording) as source:
+            if not len(source):
+                say("Recording holds no readings")
+                return
+            units = len({(r.host, r.unit_id) for r in source})
+            history = ReadingHistory(history_cycles, units) if history_cycles > 0 else None
+            replayer = RecordingReplayer(source, replay_speed, validate=validate)
+            statistics = None
+            if show_stats:
+                statistics = ReadingStatistics(
+                    quantiles=True, window=stats_window or config.get('sensors.stats_window'))
+
+            writer = None
+            if streaming:
+                writer = ReadingStreamWriter(open_stdout(config.get('output.buffer_size')),
+                                             output_format, flush or config.get('output.flush'))
+
+            try:
+                for readings in replayer.cycles():
+                    if history is not None:
+                        history.append(replayer.last_timing.cycle, readings)
+                    if statistics is not None:
+                        statistics.add_cycle(readings)
+                    if writer is not None:
+                        writer.write_cycle(readings, ts_ns=replayer.last_timing.recorded_ns)
+                    elif not no_display:
+                        timing = replayer.last_timing
+                        first = next((r for r in readings.values() if r is not None), None)
+                        recorded = first.timestamp.strftime("%Y-%m-%d %H:%M:%S") if first else '-'
+                        echo_cycle(readings, timing.cycle, recorded,
+                                   f"replay lag {timing.lag_ms:.1f} ms")
+            except KeyboardInterrupt:
+                say("\nReplay stopped by user")
+            except BrokenPipeError:
+                writer = None
+            finally:
+                if writer is not None:
+                    writer.close()
+
+            stats = replayer.stats()
+            say(f"\nReplayed {stats['cycles']} cycles, {stats['readings']} readings "
+                f"({stats['failed_reads']} failed reads) in {stats['elapsed_s']:.2f}s")
+            say(f"Recorded span {stats['recorded_span_s']:.1f}s, effective speed "
+                f"{stats['effective_speed']:.1f}x, {stats['readings_per_s']:,.0f} readings/s, "
+                f"max lag {stats['max_lag_ms']:.1f} ms")
+            if validate:
+                say(f"Validation issues: {stats['validation_issues']}")
+            if history:
+                echo_history_summary(history, err=streaming)
+            if statistics:
+                echo_statistics_summary(statistics, err=streaming)
+
+    except RecordingError as e:
+        click.echo(f"Recording Error: {e}", err=True)
+        sys.exit(1)
+    finally:
+        config.settings['display']['use_colors'] = original_color_setting
+
+
+@cli.command('export-metrics')
+@click.option('--ip', help='DXM IP address (overrides config)')
+@click.option('--units', help='Unit IDs to poll, e.g. 1,2,5-8 (default: discover)')
+@click.option('--listen', default=None, help='host:port to serve /metrics on')
+@click.option('--interval', default=None, type=float, help='Polling interval in seconds')
+@click.option('--rediscover', is_flag=True, help='Ignore cached discovery results and rescan')
+@click.pass_context
+def export_metrics(ctx, ip, units, listen, interval, rediscover):
+    """Poll sensors in the background and serve Prometheus metrics over HTTP."""
+    from .exporter import MetricsExporter, parse_listen
+
+    debug = ctx.obj.get('debug', False)
+    try:
+        listen_host, listen_port = parse_listen(listen or config.get('exporter.listen'))
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--listen')
+    poll_interval = interval or config.get('exporter.interval')
+
+    try:
+        with setup_client(ip, debug) as client:
+            if units:
+                unit_ids = parse_unit_ids(units)
+            else:
+                unit_ids = client.discover_sensors(config.get('sensors.max_modules'),
+                                                   cache=setup_discovery_cache(),
+                                                   rediscover=rediscover)
+                if not unit_ids:
+                    click.echo("No sensors found to export")
+                    return
+
+            exporter = MetricsExporter(client, unit_ids, poll_interval)
+            exporter.start(listen_host, listen_port)
+            host, port = exporter.address
+            click.echo(f"Polling units {unit_ids} on {client.host} every {poll_interval}s")
+            click.echo(f"Serving metrics on http://{host}:{port}/metrics")
+            click.echo("Press Ctrl+C to stop\n")
+            try:
+                exporter.join()
+            except KeyboardInterrupt:
+                click.echo(f"\nExporter stopped after {exporter.scrapes} scrapes")
+            finally:
+                exporter.stop()
+
+    except DXMConnectionError as e:
+        click.echo(f"Connection Error: {e}", err=True)
+        sys.exit(1)
+    except OSError as e:
+        click.echo(f"Exporter Error: {e}", err=True)
+        sys.exit(1)
+
+
 @cli.command()
 @click.pass_context
 def config_show(ctx):
     """Show current configuration settings."""
+    from .discovery_cache import DiscoveryCache
+
     click.echo("Current DXM Toolkit Configuration:")
     click.echo("=" * 40)
 
@@ -474,12 +1205,22 @@ def config_show(ctx):
     click.echo(f"  Modbus Port:       {config.get('network.modbus_port')}")
     click.echo(f"  Timeout:           {config.get('network.timeout')}s")
     click.echo(f"  Retry Attempts:    {config.get('network.retry_attempts')}")
+    click.echo(f"  Pipeline Depth:    {config.get('network.pipeline_depth')}")
+    click.echo(f"  Fast Path:         {config.get('network.fast_path')}")
+    click.echo(f"  Gap Tolerance:     {config.get('network.gap_tolerance')}")
+    click.echo(f"  Failure Threshold: {config.get('network.failure_threshold')}")
+    click.echo(f"  Probe Backoff:     {config.get('network.probe_backoff')}s "
+               f"(max {config.get('network.max_probe_backoff')}s)")
 
     # Sensor settings
     click.echo("\nSensor Settings:")
     click.echo(f"  Max Modules:       {config.get('sensors.max_modules')}")
     click.echo(f"  Base Unit ID:      {config.get('sensors.base_unit_id')}")
     click.echo(f"  Monitor Interval:  {config.get('sensors.monitor_interval')}s")
+    click.echo(f"  Overrun Policy:    {config.get('sensors.overrun_policy')}")
+    click.echo(f"  History Cycles:    {config.get('sensors.history_cycles')}")
+    stats_window = config.get('sensors.stats_window')
+    click.echo(f"  Stats Window:      {f'{stats_window}s' if stats_window else 'whole run'}")
     click.echo(f"  Distance Unit:     {config.get('sensors.distance_unit')}")
 
     # Display settings
@@ -488,6 +1229,37 @@ def config_show(ctx):
     click.echo(f"  Table Format:      {config.get('display.table_format')}")
     click.echo(f"  Show Timestamps:   {config.get('display.show_timestamps')}")
 
+    # Adaptive polling settings
+    click.echo("\nAdaptive Polling:")
+    click.echo(f"  Enabled:           {config.get('adaptive.enabled')}")
+    click.echo(f"  Interval Range:    {config.get('adaptive.min_interval')}s - "
+               f"{config.get('adaptive.max_interval')}s")
+    click.echo(f"  Change Threshold:  {config.get('adaptive.change_threshold')} mm/s")
+    click.echo(f"  Backoff Factor:    {config.get('adaptive.backoff_factor')}")
+
+    # Change filter settings
+    deadband = config.get('change_filter.deadband')
+    heartbeat = config.get('change_filter.heartbeat')
+    click.echo("\nChange Filter:")
+    click.echo(f"  Deadband:          {'off' if deadband is None else deadband}")
+    click.echo(f"  Heartbeat:         {f'{heartbeat}s' if heartbeat else 'off'}")
+
+    # Discovery settings
+    click.echo("\nDiscovery Cache:")
+    click.echo(f"  Enabled:           {config.get('discovery.cache_enabled')}")
+    click.echo(f"  TTL:               {config.get('discovery.cache_ttl')}s")
+    click.echo(f"  Cache File:        {config.get('discovery.cache_file') or DiscoveryCache().path}")
+    click.echo(f"  Sweep Probes:      {config.get('discovery.concurrency')} parallel, "
+               f"{config.get('discovery.probe_timeout')}s timeout")
+
+    # Fleet settings
+    click.echo("\nFleet Settings:")
+    click.echo(f"  Global Limit:      {config.get('fleet.global_concurrency')}")
+    click.echo(f"  Per-Host Limit:    {config.get('fleet.per_host_concurrency')}")
+    workers = config.get('fleet.workers')
+    click.echo(f"  Workers:           {workers or 'one per CPU core'} "
+               f"(sharded by {config.get('fleet.shard_by')})")
+
     # Configuration file info
     if config.config_file:
         click.echo(f"\nConfiguration loaded from: {config.config_file}")
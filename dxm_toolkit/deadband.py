@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Change-Only Reading Emission
+
+Suppresses readings that carry no news. A reading passes the filter when
+its distance moved beyond the unit's deadband since the last reading that
+passed, when its status, BDC bits or connection state changed, or when a
+heartbeat is due; everything else is dropped before it reaches displays,
+recordings or the network. Sensors watching static targets then cost
+almost nothing downstream, while any real change still goes out on the
+cycle it was read.
+
+Educational Focus:
+- Deadband (report-by-exception) filtering as used by SCADA historians
+- Absolute versus relative thresholds
+- Heartbeats that prove a quiet sensor is still alive
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from .sensor_decoder import SensorReading
+
+# Reasons a reading passes the filter
+REASONS = ('first', 'failure', 'recovered', 'status', 'bdc', 'connection', 'distance', 'heartbeat')
+
+
+@dataclass(frozen=True)
+class Deadband:
+    """
+    Distance change that counts as news.
+
+    Attributes:
+        absolute_mm: Changes up to this many millimeters are suppressed
+        percent: Changes up to this percentage of the last emitted
+            distance are suppressed
+
+    A change must exceed the larger of the two. The default (0, 0) passes
+    every change and suppresses only exact repeats.
+    """
+    absolute_mm: float = 0.0
+    percent: float = 0.0
+
+    def threshold(self, distance: float) -> float:
+        """Largest suppressed change from a distance, in millimeters."""
+        return max(self.absolute_mm, abs(distance) * self.percent / 100)
+
+    def __str__(self) -> str:
+        if self.percent and not self.absolute_mm:
+            return f"{self.percent:g}%"
+        if self.percent:
+            return f"max({self.absolute_mm:g} mm, {self.percent:g}%)"
+        return f"{self.absolute_mm:g} mm"
+
+
+def parse_deadband(text: str) -> Deadband:
+    """
+    Parse one deadband.
+
+    Args:
+        text: Millimeters ("5", "5mm") or a percentage ("2%")
+
+    Returns:
+        The deadband
+
+    Raises:
+        ValueError: If the text is not a non-negative number or percentage
+    """
+    text = text.strip().lower()
+    try:
+        if text.endswith('%'):
+            value = float(text[:-1])
+            deadband = Deadband(percent=value)
+        else:
+            value = float(text[:-2] if text.endswith('mm') else text)
+            deadband = Deadband(absolute_mm=value)
+    except ValueError:
+        raise ValueError(f"Deadband must be millimeters like '5' or a percentage like '2%', "
+                         f"got '{text}'")
+    if value < 0:
+        raise ValueError(f"Deadband must not be negative, got '{text}'")
+    return deadband
+
+
+def parse_deadbands(text: str) -> Tuple[Deadband, Dict[int, Deadband]]:
+    """
+    Parse a default deadband with per-unit overrides.
+
+    Args:
+        text: Comma-separated entries; "UNIT=SPEC" sets one unit, a bare
+            SPEC sets the default, e.g. "10, 3=2%, 7=0"
+
+    Returns:
+        Tuple of (default deadband, unit ID -> deadband)
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    default = Deadband()
+    units: Dict[int, Deadband] = {}
+    for entry in filter(None, (part.strip() for part in text.split(','))):
+        if '=' in entry:
+            unit, spec = entry.split('=', 1)
+            try:
+                unit_id = int(unit)
+            except ValueError:
+                raise ValueError(f"Invalid unit ID '{unit.strip()}' in deadband '{entry}'")
+            units[unit_id] = parse_deadband(spec)
+        else:
+            default = parse_deadband(entry)
+    return default, units
+
+
+class _UnitState:
+    """What was last emitted for one unit."""
+
+    __slots__ = ('reading', 'emitted_ns')
+
+    def __init__(self, reading: Optional[SensorReading], emitted_ns: int):
+        self.reading = reading
+        self.emitted_ns = emitted_ns
+
+
+class DeadbandFilter:
+    """
+    Per-unit change detection for monitoring cycles.
+
+    Educational Note:
+    Readings are compared with the last reading that was *emitted*, not
+    the last one read, so a slow drift is reported once it has added up
+    to more than the deadband instead of being hidden step by step.
+    Status, BDC and connection changes, failed reads and recoveries pass
+    immediately whatever the deadband. The heartbeat re-emits a unit that
+    has been quiet for ``heartbeat`` seconds, so consumers can tell "no
+    change" from "no data".
+
+    Usage:
+        change_filter = DeadbandFilter(Deadband(absolute_mm=10), heartbeat=60)
+        for readings in client.monitor_sensors(units, change_filter=change_filter):
+            ...   # only units with news
+    """
+
+    def __init__(self, deadband: Optional[Deadband] = None,
+                 unit_deadbands: Optional[Dict[int, Deadband]] = None,
+                 heartbeat: Optional[float] = 60.0):
+        """
+        Initialize the filter.
+
+        Args:
+            deadband: Default distance deadband (default: suppress exact
+                repeats only)
+            unit_deadbands: Per-unit deadbands overriding the default
+            heartbeat: Re-emit a quiet unit after this many seconds (None
+                or 0 disables heartbeats)
+
+        Raises:
+            ValueError: If the heartbeat is negative
+        """
+        if heartbeat is not None and heartbeat < 0:
+            raise ValueError(f"Heartbeat must not be negative, got {heartbeat}")
+        self.deadband = deadband or Deadband()
+        self.unit_deadbands: Dict[int, Deadband] = dict(unit_deadbands or {})
+        self.heartbeat = heartbeat or None
+        self._heartbeat_ns = int(heartbeat * 1e9) if heartbeat else None
+
+        self._state: Dict[int, _UnitState] = {}
+        self.received = 0
+        self.emitted = 0
+        self.reasons: Counter = Counter()
+
+    def deadband_for(self, unit_id: int) -> Deadband:
+        """Deadband that applies to a unit."""
+        return self.unit_deadbands.get(unit_id, self.deadband)
+
+    def _reason(self, unit_id: int, reading: Optional[SensorReading],
+                ts_ns: int) -> Optional[str]:
+        """Why a reading passes, or None if it is suppressed."""
+        state = self._state.get(unit_id)
+        if state is None:
+            return 'first'
+        last = state.reading
+        if reading is None:
+            reason = 'failure' if last is not None else None
+        elif last is None:
+            return 'recovered'
+        elif reading.status_raw != last.status_raw:
+            return 'status'
+        elif reading.bdc_states != last.bdc_states:
+            return 'bdc'
+        elif reading.connected != last.connected:
+            return 'connection'
+        else:
+            distance, previous = reading.distance_mm, last.distance_mm
+            if distance is None or previous is None:
+                # Out of range or disconnected on both sides: no news
+                # unless the raw value itself changed
+                reason = 'distance' if reading.distance_raw != last.distance_raw else None
+            elif distance != previous and \
+                    abs(distance - previous) > self.deadband_for(unit_id).threshold(previous):
+                reason = 'distance'
+            else:
+                reason = None
+        if reason is None and self._heartbeat_ns is not None and \
+                ts_ns - state.emitted_ns >= self._heartbeat_ns:
+            reason = 'heartbeat'
+        return reason
+
+    def accept(self, unit_id: int, reading: Optional[SensorReading], ts_ns: int = 0) -> bool:
+        """
+        Decide whether one reading is emitted.
+
+        Args:
+            unit_id: Unit that was read
+            reading: The reading, or None if the read failed
+            ts_ns: Time of a failed read (readings use their own timestamp)
+
+        Returns:
+            True if the reading should be passed on
+        """
+        if reading is not None:
+            ts_ns = reading.ts_ns
+        self.received += 1
+        reason = self._reason(unit_id, reading, ts_ns)
+        if reason is None:
+            return False
+        self._state[unit_id] = _UnitState(reading, ts_ns)
+        self.emitted += 1
+        self.reasons[reason] += 1
+        return True
+
+    def filter_cycle(self, readings: Dict[int, Optional[SensorReading]],
+                     ts_ns: int = 0) -> Dict[int, Optional[SensorReading]]:
+        """
+        Filter one monitoring cycle.
+
+        Args:
+            readings: Unit ID -> reading (None for failed reads)
+            ts_ns: Time of the cycle, used for failed reads
+
+        Returns:
+            The readings that carry news (possibly empty)
+        """
+        return {unit_id: reading for unit_id, reading in readings.items()
+                if self.accept(unit_id, reading, ts_ns)}
+
+    def reset(self) -> None:
+        """Forget every unit's last emitted reading and the counters."""
+        self._state.clear()
+        self.received = 0
+        self.emitted = 0
+        self.reasons.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get filter statistics.
+
+        Returns:
+            Dictionary with received, emitted and suppressed counts, the
+            suppressed fraction and emissions by reason
+        """
+        suppressed = self.received - self.emitted
+        return {
+            'received': self.received,
+            'emitted': self.emitted,
+            'suppressed': suppressed,
+            'suppressed_ratio': suppressed / self.received if self.received else 0.0,
+            'reasons': {reason: self.reasons[reason] for reason in REASONS
+                        if self.reasons[reason]},
+        }
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Persistent Sensor Discovery Cache
+
+Discovery probes every unit ID in turn, which makes it the slowest part of
+starting a monitor. This module remembers the discovered unit IDs of each
+controller (keyed by host and port) in a small JSON file, so the next start
+only has to confirm that the known units still answer.
+
+Educational Focus:
+- Caching slow network scans across process restarts
+- Validating cached data cheaply instead of trusting it blindly
+- Atomic file replacement for state shared between processes
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+# Cached scans older than this are ignored (seconds)
+DEFAULT_TTL = 24 * 3600.0
+
+
+def default_cache_path() -> Path:
+    """
+    Location of the shared discovery cache.
+
+    Returns:
+        ``$XDG_CACHE_HOME/dxm_toolkit/discovery.json`` (``~/.cache`` if unset)
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'dxm_toolkit' / 'discovery.json'
+
+
+class DiscoveryCache:
+    """
+    Discovered unit IDs per controller, persisted as JSON.
+
+    Educational Note:
+    A cache entry is only a hint. Clients confirm it by probing the cached
+    units once (the "fingerprint" check) and fall back to a full scan when
+    any of them stopped answering or the entry has expired. Units added
+    since the last scan are picked up when the TTL runs out, or at once
+    with a forced rediscovery.
+
+    Usage:
+        cache = DiscoveryCache(ttl=3600)
+        unit_ids = client.discover_sensors(8, cache=cache)
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None,
+                 ttl: float = DEFAULT_TTL,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Cache file (default: see default_cache_path)
+            ttl: Seconds a scan result stays valid
+            clock: Wall-clock time in seconds (replaceable for testing)
+
+        Raises:
+            ValueError: If ttl is not positive
+        """
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+
+        self.path = Path(path) if path else default_cache_path()
+        self.ttl = ttl
+        self._clock = clock
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def _key(host: str, port: int) -> str:
+        return f"{host}:{port}"
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read all entries (an unreadable file counts as empty)."""
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable discovery cache {self.path}: {e}")
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Write all entries atomically.
+
+        Educational Note:
+        The file is written to a temporary name and then renamed over the
+        old one, so a concurrently starting process never reads a
+        half-written cache. Failing to write only costs the next start a
+        full scan, so errors are logged rather than raised.
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix='.discovery-')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entries, f, indent=2, sort_keys=True)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            self.logger.warning(f"Could not write discovery cache {self.path}: {e}")
+
+    def lookup(self, host: str, port: int, max_units: int) -> Optional[List[int]]:
+        """
+        Get the cached unit IDs of a controller.
+
+        Args:
+            host: Controller address
+            port: Modbus TCP port
+            max_units: Highest unit ID the caller would scan
+
+        Returns:
+            Cached unit IDs up to max_units, or None if there is no usable
+            entry (missing, expired, empty, or from a narrower scan)
+        """
+        entry = self._load().get(self._key(host, port))
+        if not entry:
+            return None
+
+        try:
+            age = self._clock() - float(entry['discovered_at'])
+            scanned = int(entry['max_units'])
+            unit_ids = [int(u) for u in entry['unit_ids']]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if age > self.ttl or age < 0 or scanned < max_units:
+            return None
+        unit_ids = [u for u in unit_ids if u <= max_units]
+        return unit_ids or None
+
+    def store(self, host: str, port: int, max_units: int, unit_ids: List[int]) -> None:
+        """
+        Record the result of a full scan.
+
+        Args:
+            host: Controller address
+            port: Modbus TCP port
+            max_units: Highest unit ID that was scanned
+            unit_ids: Unit IDs that answered
+        """
+        entries = self._load()
+        entries[self._key(host, port)] = {
+            'unit_ids': sorted(unit_ids),
+            'max_units': max_units,
+            'discovered_at': self._clock()
+        }
+        self._save(entries)
+
+    def invalidate(self, host: str, port: int) -> None:
+        """Forget the entry of one controller."""
+        entries = self._load()
+        if entries.pop(self._key(host, port), None) is not None:
+            self._save(entries)
+
+    def clear(self) -> None:
+        """Forget all entries."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -9,7 +9,7 @@ Handles connection management, register reading, and error recovery.
 import logging
 import socket
 import time
-from typing import List, Optional, Dict, Any, Union
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Set, Tuple, Union
 from contextlib import contextmanager
 
 try:
@@ -21,17 +21,25 @@ except ImportError:
     raise ImportError("pymodbus library is required. Install with: pip install pymodbus>=3.0.0")
 
 from .sensor_decoder import SensorDecoder, SensorReading
+from .adaptive import AdaptivePollPolicy
+from .circuit_breaker import BreakerBank, BreakerState, CircuitBreaker
+from .deadband import DeadbandFilter
+from .discovery_cache import DiscoveryCache
+from .exceptions import DXMCommunicationError, DXMConnectionError, DXMUnitUnavailableError
+from .history import ReadingHistory
+from .metrics import ClientMetrics, error_name
+from .read_planner import ReadPlanner, RegisterPoint
+from .recording import RecordingWriter
+from .scheduler import CycleTiming, DeadlineScheduler, OverrunPolicy
+from .transport import (MAX_READ_REGISTERS, FastReadTransport, ModbusExceptionResponse,
+                        PipelinedTransport)
 from .utils import validate_ip_address, validate_unit_id
 
 
-class DXMConnectionError(Exception):
-    """Custom exception for DXM connection issues."""
-    pass
-
-
-class DXMCommunicationError(Exception):
-    """Custom exception for DXM communication issues."""
-    pass
+# Modbus exception codes meaning the addressed unit itself did not answer
+# (0x0A gateway path unavailable, 0x0B gateway target failed to respond).
+# Any other exception response proves the unit is alive.
+UNIT_UNREACHABLE_CODES = (0x0A, 0x0B)
 
 
 class DXMClient:
@@ -55,6 +63,12 @@ class DXMClient:
                  port: int = 502,
                  timeout: float = 5.0,
                  retry_attempts: int = 3,
+                 pipeline_depth: int = 1,
+                 fast_path: bool = False,
+                 gap_tolerance: int = 8,
+                 failure_threshold: int = 3,
+                 probe_backoff: float = 1.0,
+                 max_probe_backoff: float = 60.0,
                  debug: bool = False):
         """
         Initialize DXM Modbus TCP client.
@@ -70,18 +84,32 @@ class DXMClient:
             port: Modbus TCP port (standard is 502)
             timeout: Connection timeout in seconds
             retry_attempts: Number of retry attempts for failed operations
+            pipeline_depth: Requests kept in flight by read_multiple_sensors
+                (1 disables pipelining)
+            fast_path: Read single units through the preassembled-frame
+                FastReadTransport, falling back to pymodbus when it fails
+            gap_tolerance: Unwanted registers read_registers may read to
+                merge two wanted registers into one request
+            failure_threshold: Consecutive failed reads that trip a unit's
+                circuit breaker
+            probe_backoff: Delay before a tripped unit (or a dropped
+                connection) is first retried, doubling per failure
+            max_probe_backoff: Upper bound of that delay
             debug: Enable detailed logging for troubleshooting
 
         Raises:
-            ValueError: If invalid IP address provided
+            ValueError: If invalid IP address or pipeline depth provided
         """
         if not validate_ip_address(host):
             raise ValueError(f"Invalid IP address: {host}")
+        if pipeline_depth < 1:
+            raise ValueError(f"Pipeline depth must be at least 1, got {pipeline_depth}")
 
         self.host = host
         self.port = port
         self.timeout = timeout
         self.retry_attempts = retry_attempts
+        self.pipeline_depth = pipeline_depth
 
         # Configure logging
         self.logger = logging.getLogger(__name__)
@@ -101,9 +129,51 @@ class DXMClient:
             source_address=None  # Let system choose source port
         )
 
+        # Optional pipelined transport for multi-unit reads
+        # Educational Note: The pipelined transport holds its own socket so
+        # that several FC03 requests can be outstanding at once, something
+        # the request/response ModbusTcpClient cannot do.
+        self._pipeline: Optional[PipelinedTransport] = None
+        if self.pipeline_depth > 1:
+            self._pipeline = PipelinedTransport(
+                host=self.host,
+                port=self.port,
+                timeout=self.timeout,
+                depth=self.pipeline_depth
+            )
+
+        # Optional lean transport for single-unit reads
+        # Educational Note: Like the pipelined transport it holds its own
+        # socket. pymodbus stays connected for everything else and takes
+        # over any read the fast path cannot handle.
+        self._fast: Optional[FastReadTransport] = None
+        self.fast_path_fallbacks = 0
+        if fast_path:
+            self._fast = FastReadTransport(host=self.host, port=self.port, timeout=self.timeout)
+
+        # Register read planner for scattered register reads
+        self._planner = ReadPlanner(gap_tolerance=gap_tolerance)
+
         # Initialize sensor decoder
         self._decoder = SensorDecoder()
 
+        # Per-unit circuit breakers, plus one for reconnecting the session
+        # Educational Note: An unplugged sensor would otherwise cost
+        # retry_attempts timeouts every cycle; once its breaker trips it is
+        # skipped and only probed with exponential back-off.
+        self._breakers = BreakerBank(failure_threshold, probe_backoff, max_probe_backoff)
+        self._link_breaker = CircuitBreaker(1, probe_backoff, max_probe_backoff)
+
+        # Per-unit request, error, retry and latency metrics
+        self.metrics = ClientMetrics()
+
+        # Scheduler of the current or last monitoring run
+        self._scheduler: Optional[DeadlineScheduler] = None
+
+        # Bounded reading history of the current or last monitoring run
+        # (None unless monitoring was started with history_cycles > 0)
+        self.history: Optional[ReadingHistory] = None
+
         # Connection state tracking
         self._connected = False
         self._last_error = None
@@ -122,6 +192,11 @@ class DXMClient:
         """Check if client is currently connected."""
         return self._connected and self._client.connected
 
+    @property
+    def reconnects(self) -> int:
+        """Times the TCP session was transparently reopened."""
+        return self.metrics.reconnects
+
     @property
     def last_error(self) -> Optional[str]:
         """Get the last error message encountered."""
@@ -153,10 +228,15 @@ class DXMClient:
             # Verify Modbus communication with a test read
             # Educational Note: Reading a known register verifies that
             # the Modbus protocol layer is working correctly
-            test_result = self._client.read_holding_registers(0, 1, unit=1)
+            test_result = self._client.read_holding_registers(0, 1, slave=1)
             if test_result.isError():
                 raise DXMConnectionError(f"Modbus communication test failed: {test_result}")
 
+            if self._pipeline is not None:
+                self._pipeline.connect()
+            if self._fast is not None:
+                self._fast.connect()
+
             self._connected = True
             self._last_error = None
             self.logger.info("Successfully connected to DXM")
@@ -168,6 +248,43 @@ class DXMClient:
             self.logger.error(f"Connection failed: {e}")
             raise DXMConnectionError(f"Failed to connect to DXM: {e}")
 
+    def _ensure_session(self) -> None:
+        """
+        Reopen the TCP session if it dropped since connect().
+
+        Educational Note:
+        Controllers reboot and networks hiccup. Rather than failing every
+        later read, the client reconnects on demand. Failed attempts back
+        off exponentially, so a controller that is down is not hammered
+        with connection attempts.
+
+        Raises:
+            DXMConnectionError: If the session is down and cannot be reopened now
+        """
+        if self._client.connected:
+            return
+
+        if not self._link_breaker.allow():
+            raise DXMConnectionError(f"Connection to {self.host} lost; next reconnect attempt "
+                                     f"in {self._link_breaker.retry_in():.1f}s")
+
+        self.logger.info(f"Connection to {self.host} lost, reconnecting")
+        try:
+            reopened = self._client.connect()
+        except Exception as e:
+            self.logger.debug(f"Reconnect raised: {e}")
+            reopened = False
+
+        if not reopened:
+            self._link_breaker.record_failure()
+            self._last_error = f"Reconnect to {self.host}:{self.port} failed"
+            raise DXMConnectionError(f"{self._last_error}; retrying in "
+                                     f"{self._link_breaker.retry_in():.1f}s")
+
+        self._link_breaker.record_success()
+        self.metrics.reconnects += 1
+        self.logger.info(f"Reconnected to {self.host}")
+
     def disconnect(self) -> None:
         """
         Close connection to DXM controller.
@@ -177,6 +294,10 @@ class DXMClient:
         to avoid resource leaks and ensure other applications can connect.
         """
         try:
+            if self._pipeline is not None:
+                self._pipeline.close()
+            if self._fast is not None:
+                self._fast.close()
             if self._client.connected:
                 self._client.close()
                 self.logger.info("Disconnected from DXM")
@@ -229,7 +350,7 @@ class DXMClient:
                 # Try reading from multiple unit IDs
                 for unit_id in range(1, 5):
                     try:
-                        result = self._client.read_holding_registers(0, 4, unit=unit_id)
+                        result = self._client.read_holding_registers(0, 4, slave=unit_id)
                         if not result.isError():
                             test_results['modbus_communication'] = True
                             test_results['sensor_detection'] = True
@@ -242,7 +363,8 @@ class DXMClient:
 
         return test_results
 
-    def read_sensor_registers(self, unit_id: int, register_count: int = 4) -> List[int]:
+    def read_sensor_registers(self, unit_id: int, register_count: int = 4,
+                              address: int = 0) -> List[int]:
         """
         Read holding registers from a specific sensor unit.
 
@@ -251,65 +373,316 @@ class DXMClient:
         DXM controllers map IO-Link sensor data to consecutive Modbus holding
         registers, starting from address 0.
 
+        Each unit has a circuit breaker. After ``failure_threshold`` failed
+        calls the unit is skipped (DXMUnitUnavailableError, no network
+        traffic) until its back-off delay passes; then a single probe
+        attempt is made. A dropped TCP session is reopened transparently.
+
         Args:
             unit_id: Modbus unit ID (1-247)
             register_count: Number of registers to read
+            address: First register address to read
 
         Returns:
             List of register values
 
         Raises:
+            DXMUnitUnavailableError: If the unit's circuit breaker is open
             DXMCommunicationError: If read operation fails
+            DXMConnectionError: If the session is down and cannot be reopened
         """
         if not validate_unit_id(unit_id):
             raise ValueError(f"Invalid unit ID: {unit_id}")
 
-        if not self.connected:
+        if not self._connected:
             raise DXMConnectionError("Not connected to DXM")
+        self._ensure_session()
 
-        for attempt in range(self.retry_attempts):
-            try:
-                self.logger.debug(f"Reading {register_count} registers from unit {unit_id}")
-
-                # Read holding registers starting from address 0
-                # Educational Note: Holding registers are 16-bit read/write registers
-                # commonly used for sensor data in industrial applications
-                result = self._client.read_holding_registers(
-                    address=0,  # Start at register 0
-                    count=register_count,
-                    unit=unit_id
-                )
-
-                if result.isError():
-                    error_msg = f"Modbus error reading unit {unit_id}: {result}"
+        breaker = self._breakers[unit_id]
+        if not breaker.allow():
+            self.metrics.record_skip(unit_id)
+            raise DXMUnitUnavailableError(f"Unit {unit_id} is not responding; next probe in "
+                                          f"{breaker.retry_in():.1f}s")
+
+        # A recovery probe gets one attempt; a dead unit should cost little
+        attempts = 1 if breaker.probing else self.retry_attempts
+        error_msg = ""
+        error_label = ""
+        metrics = self.metrics
+
+        try:
+            for attempt in range(attempts):
+                if attempt:
+                    metrics.record_retry(unit_id, error_label)
+                    # Brief delay before retry
+                    time.sleep(0.1)
+                    self._ensure_session()
+
+                started = time.perf_counter_ns()
+                try:
+                    self.logger.debug(f"Reading {register_count} registers from unit {unit_id} "
+                                      f"at address {address}")
+
+                    registers = None
+                    if self._fast is not None and register_count <= MAX_READ_REGISTERS:
+                        registers = self._read_fast(unit_id, address, register_count)
+
+                    if registers is None:
+                        # Read holding registers starting from the requested address
+                        # Educational Note: Holding registers are 16-bit read/write registers
+                        # commonly used for sensor data in industrial applications
+                        result = self._client.read_holding_registers(
+                            address=address,
+                            count=register_count,
+                            slave=unit_id
+                        )
+
+                        if result.isError():
+                            error_msg, error_label = self._record_error_response(
+                                unit_id, result, started)
+                            continue
+
+                        # Extract register values
+                        registers = result.registers
+
+                    metrics.record_request(unit_id, time.perf_counter_ns() - started,
+                                           registers=len(registers))
+                    self.logger.debug(f"Successfully read registers: {registers}")
+                    breaker.record_success()
+                    return registers
+
+                except ModbusExceptionResponse as e:
+                    # Exception response received by the fast path
+                    error_msg, error_label = self._record_error_response(unit_id, e, started)
+
+                except (TimeoutError, socket.timeout) as e:
+                    error_msg = f"Timeout on attempt {attempt + 1}: {e}"
+                    error_label = error_name(e)
+                    metrics.record_request(unit_id, time.perf_counter_ns() - started,
+                                           error_label, answered=False)
                     self.logger.warning(error_msg)
-                    if attempt == self.retry_attempts - 1:
-                        raise DXMCommunicationError(error_msg)
-                    continue
 
-                # Extract register values
-                registers = result.registers
-                self.logger.debug(f"Successfully read registers: {registers}")
-                return registers
+                except ConnectionException as e:
+                    # The session dropped: close it so the next attempt reconnects
+                    error_msg = f"Connection lost on attempt {attempt + 1}: {e}"
+                    error_label = error_name(e)
+                    metrics.record_request(unit_id, time.perf_counter_ns() - started,
+                                           error_label, answered=False)
+                    self.logger.warning(error_msg)
+                    self._client.close()
 
-            except ModbusException as e:
-                error_msg = f"Modbus exception on attempt {attempt + 1}: {e}"
-                self.logger.warning(error_msg)
-                if attempt == self.retry_attempts - 1:
-                    raise DXMCommunicationError(error_msg)
+                except ModbusException as e:
+                    error_msg = f"Modbus exception on attempt {attempt + 1}: {e}"
+                    error_label = error_name(e)
+                    metrics.record_request(unit_id, time.perf_counter_ns() - started,
+                                           error_label, answered=False)
+                    self.logger.warning(error_msg)
 
-            except Exception as e:
-                error_msg = f"Unexpected error on attempt {attempt + 1}: {e}"
-                self.logger.error(error_msg)
-                if attempt == self.retry_attempts - 1:
-                    raise DXMCommunicationError(error_msg)
+                except DXMCommunicationError:
+                    raise
+
+                except Exception as e:
+                    error_msg = f"Unexpected error on attempt {attempt + 1}: {e}"
+                    error_label = error_name(e)
+                    metrics.record_request(unit_id, time.perf_counter_ns() - started,
+                                           error_label, answered=False)
+                    self.logger.error(error_msg)
 
-            # Brief delay before retry
-            if attempt < self.retry_attempts - 1:
-                time.sleep(0.1)
+        except DXMConnectionError:
+            # The unit was never reached, so this says nothing about it
+            breaker.abandon_probe()
+            raise
+
+        breaker.record_failure()
+        if breaker.state is BreakerState.OPEN:
+            self.logger.warning(f"Unit {unit_id} tripped its circuit breaker; next probe in "
+                                f"{breaker.retry_in():.1f}s")
+        raise DXMCommunicationError(error_msg or
+                                    f"Failed to read registers after {attempts} attempts")
+
+    def _record_error_response(self, unit_id: int, response: Any,
+                               started: int) -> Tuple[str, str]:
+        """
+        Account for an error response to a register read.
 
-        # This line should never be reached due to the retry logic above
-        raise DXMCommunicationError(f"Failed to read registers after {self.retry_attempts} attempts")
+        Args:
+            unit_id: Unit that was read
+            response: pymodbus error response or ModbusExceptionResponse
+            started: perf_counter_ns() when the request was sent
+
+        Returns:
+            Tuple of (error message, error label) for a retry
+
+        Raises:
+            DXMCommunicationError: If the unit answered with a refusal,
+                which a retry will not change
+        """
+        error_msg = f"Modbus error reading unit {unit_id}: {response}"
+        error_label = error_name(response)
+        exception_code = getattr(response, 'exception_code', None)
+        self.metrics.record_request(unit_id, time.perf_counter_ns() - started,
+                                    error_label, answered=exception_code is not None)
+        self.logger.warning(error_msg)
+        if exception_code is not None and exception_code not in UNIT_UNREACHABLE_CODES:
+            # The unit answered; retrying a refusal will not help
+            self._breakers[unit_id].record_success()
+            raise DXMCommunicationError(error_msg)
+        return error_msg, error_label
+
+    def _read_fast(self, unit_id: int, address: int, count: int) -> Optional[List[int]]:
+        """
+        Read registers through the fast transport.
+
+        Educational Note:
+        Exception responses and timeouts are genuine answers (or the lack
+        of one) and are raised to the retry loop. Anything else unusual,
+        such as a refused connection or a frame the fast path does not
+        expect, returns None so that pymodbus performs this read instead.
+
+        Returns:
+            Register values, or None to fall back to pymodbus
+
+        Raises:
+            ModbusExceptionResponse: If the unit answered with an exception
+            TimeoutError: If no response arrived in time
+        """
+        fast = self._fast
+        try:
+            if not fast.connected:
+                fast.connect()
+            return fast.read(unit_id, address, count)
+        except ModbusExceptionResponse:
+            raise
+        except (TimeoutError, socket.timeout):
+            # A late response would desynchronize the stream
+            fast.close()
+            raise
+        except (OSError, ValueError) as e:
+            fast.close()
+            self.fast_path_fallbacks += 1
+            self.logger.debug(f"Fast path read of unit {unit_id} failed ({e}); using pymodbus")
+            return None
+
+    def read_registers(self, points: Iterable[RegisterPoint],
+                       split_failed: bool = True) -> Tuple[Dict[RegisterPoint, int],
+                                                           Dict[RegisterPoint, Exception]]:
+        """
+        Read a scattered set of registers with as few requests as possible.
+
+        Educational Note:
+        The read planner merges nearby addresses into FC03 block reads
+        (up to 125 registers, bridging gaps of up to ``gap_tolerance``
+        registers). A merged block can fail as a whole when it spans an
+        address the device refuses; with ``split_failed`` the wanted
+        registers of such a block are retried one by one so that a single
+        bad address only costs its own value.
+
+        Args:
+            points: Wanted (unit_id, address) pairs
+            split_failed: Retry failed multi-register blocks per register
+
+        Returns:
+            Tuple of (values by point, errors by point)
+
+        Raises:
+            DXMConnectionError: If not connected
+        """
+        if not self.connected:
+            raise DXMConnectionError("Not connected to DXM")
+
+        planned = self._planner.plan(points)
+        self.logger.debug(f"Planned {len(planned)} block reads")
+        values, errors = ReadPlanner.scatter(planned, self._read_blocks(planned))
+
+        if split_failed and errors:
+            retry = [read for read in planned
+                     if len(read.points) > 1 and (read.unit_id, read.points[0]) in errors]
+            singles = [ReadPlanner.make_read(read.unit_id, [a]) for read in retry for a in read.points]
+            if singles:
+                retry_values, retry_errors = ReadPlanner.scatter(singles, self._read_blocks(singles))
+                for point in retry_values:
+                    errors.pop(point, None)
+                values.update(retry_values)
+                errors.update(retry_errors)
+
+        return values, errors
+
+    def _read_blocks(self, planned) -> List[Union[List[int], Exception]]:
+        """Execute planned block reads, pipelined when available."""
+        if self._pipeline is not None:
+            return self._read_blocks_pipelined(planned)
+
+        results: List[Union[List[int], Exception]] = []
+        for read in planned:
+            try:
+                results.append(self.read_sensor_registers(read.unit_id, read.count, read.address))
+            except DXMCommunicationError as e:
+                results.append(e)
+        return results
+
+    def _read_blocks_pipelined(self, planned) -> List[Union[List[int], Exception]]:
+        """
+        Execute planned block reads as one pipelined batch.
+
+        Educational Note:
+        Each block is accounted for as if read_sensor_registers had read
+        it: a block of a unit whose breaker is open is skipped, only the
+        first block of a probing unit is sent, and every request is
+        recorded in the metrics and settles its unit's breaker.
+        """
+        metrics = self.metrics
+        results: List[Union[List[int], Exception, None]] = [None] * len(planned)
+        batch: List[int] = []
+        probes: Set[int] = set()
+        for index, read in enumerate(planned):
+            breaker = self._breakers[read.unit_id]
+            if breaker.allow():
+                batch.append(index)
+                if breaker.probing:
+                    probes.add(read.unit_id)
+            else:
+                metrics.record_skip(read.unit_id)
+                results[index] = DXMUnitUnavailableError(
+                    f"Unit {read.unit_id} is not responding; next probe in "
+                    f"{breaker.retry_in():.1f}s")
+        if not batch:
+            return results
+
+        try:
+            try:
+                if not self._pipeline.connected:
+                    self._pipeline.connect()
+                batch_results = self._pipeline.read_many([planned[i].request for i in batch])
+                latencies = self._pipeline.last_latencies_ns
+            except OSError as e:
+                self._pipeline.close()
+                batch_results = [e] * len(batch)
+                latencies = [None] * len(batch)
+
+            for index, result, latency in zip(batch, batch_results, latencies):
+                unit_id = planned[index].unit_id
+                breaker = self._breakers[unit_id]
+                results[index] = result
+                if isinstance(result, Exception):
+                    if latency is not None:
+                        metrics.record_request(unit_id, latency, error_name(result),
+                                               answered=isinstance(result, ModbusExceptionResponse))
+                    self._last_error = str(result)
+                    exception_code = getattr(result, 'exception_code', None)
+                    if exception_code is not None and exception_code not in UNIT_UNREACHABLE_CODES:
+                        # The unit answered with a refusal; it is alive
+                        breaker.record_success()
+                    else:
+                        breaker.record_failure()
+                else:
+                    metrics.record_request(unit_id, latency or 0, registers=len(result))
+                    breaker.record_success()
+        finally:
+            # Release a probe an unexpected error kept from settling
+            for unit_id in probes:
+                self._breakers[unit_id].abandon_probe()
+
+        return results
 
     def read_sensor(self, unit_id: int) -> SensorReading:
         """
@@ -341,11 +714,29 @@ class DXMClient:
             self.logger.debug(f"Decoded reading for unit {unit_id}: {reading}")
             return reading
 
+        except DXMUnitUnavailableError:
+            # Expected while the unit's breaker is open; not worth an error log
+            raise
         except Exception as e:
             self.logger.error(f"Failed to read sensor {unit_id}: {e}")
             raise
 
-    def discover_sensors(self, max_units: int = 8) -> List[int]:
+    def _probe_unit(self, unit_id: int) -> bool:
+        """Probe a single unit ID with a minimal one-register read."""
+        try:
+            # Educational Note: We use a minimal read to reduce network
+            # traffic during discovery while still confirming sensor presence
+            result = self._client.read_holding_registers(0, 1, slave=unit_id)
+            if not result.isError():
+                return True
+            self.logger.debug(f"No response from unit ID {unit_id}")
+        except Exception as e:
+            self.logger.debug(f"Error scanning unit ID {unit_id}: {e}")
+        return False
+
+    def discover_sensors(self, max_units: int = 8,
+                         cache: Optional[DiscoveryCache] = None,
+                         rediscover: bool = False) -> List[int]:
         """
         Discover connected sensors by scanning unit IDs.
 
@@ -355,8 +746,14 @@ class DXMClient:
         responding sensors. This is useful for initial system setup and
         diagnostics.
 
+        With a cache, the units found by an earlier scan of this controller
+        are probed first (one request each, no pacing delay). If they all
+        answer, the full scan is skipped.
+
         Args:
             max_units: Maximum number of unit IDs to scan
+            cache: Optional DiscoveryCache to consult and update
+            rediscover: Ignore cached results and always scan
 
         Returns:
             List of responding unit IDs
@@ -367,30 +764,30 @@ class DXMClient:
         if not self.connected:
             raise DXMConnectionError("Not connected to DXM")
 
+        if cache is not None and not rediscover:
+            cached = cache.lookup(self.host, self.port, max_units)
+            if cached is not None:
+                if all(self._probe_unit(unit_id) for unit_id in cached):
+                    self.logger.info(f"Using cached discovery for {self.host}: {cached}")
+                    return cached
+                self.logger.info(f"Cached units of {self.host} changed, rescanning")
+
         discovered_units = []
         self.logger.info(f"Scanning for sensors (units 1-{max_units})")
 
         for unit_id in range(1, max_units + 1):
-            try:
-                # Attempt to read a small number of registers
-                # Educational Note: We use a minimal read to reduce network
-                # traffic during discovery while still confirming sensor presence
-                result = self._client.read_holding_registers(0, 1, unit=unit_id)
-
-                if not result.isError():
-                    discovered_units.append(unit_id)
-                    self.logger.info(f"Found sensor at unit ID {unit_id}")
-                else:
-                    self.logger.debug(f"No response from unit ID {unit_id}")
-
-            except Exception as e:
-                self.logger.debug(f"Error scanning unit ID {unit_id}: {e}")
-                continue
+            if self._probe_unit(unit_id):
+                discovered_units.append(unit_id)
+                self.logger.info(f"Found sensor at unit ID {unit_id}")
 
             # Brief delay to avoid overwhelming the network
             time.sleep(0.05)
 
         self.logger.info(f"Discovery complete. Found {len(discovered_units)} sensors: {discovered_units}")
+
+        # An empty result is more likely a wiring problem than a fact worth keeping
+        if cache is not None and discovered_units:
+            cache.store(self.host, self.port, max_units, discovered_units)
         return discovered_units
 
     def read_multiple_sensors(self, unit_ids: List[int]) -> Dict[int, Optional[SensorReading]]:
@@ -403,72 +800,232 @@ class DXMClient:
         we reuse the single connection while handling individual sensor
         failures gracefully.
 
+        When pipelining is enabled (``pipeline_depth`` > 1) the reads are
+        sent through the pipelined transport instead, so several units are
+        in flight at once on a single connection.
+
         Args:
             unit_ids: List of unit IDs to read
 
         Returns:
             Dictionary mapping unit IDs to sensor readings (None if failed)
         """
+        if self._pipeline is not None:
+            return self._read_multiple_pipelined(unit_ids)
+
         readings = {}
 
-        for unit_id in unit_ids:
+        for index, unit_id in enumerate(unit_ids):
             try:
                 reading = self.read_sensor(unit_id)
                 readings[unit_id] = reading
+            except DXMUnitUnavailableError as e:
+                # Tripped unit: skipped without network traffic
+                self.logger.debug(str(e))
+                readings[unit_id] = None
+            except DXMConnectionError as e:
+                # No session: the remaining units cannot be read either
+                self.logger.warning(f"Failed to read sensors {unit_ids[index:]}: {e}")
+                for remaining in unit_ids[index:]:
+                    readings[remaining] = None
+                break
             except Exception as e:
                 self.logger.warning(f"Failed to read sensor {unit_id}: {e}")
                 readings[unit_id] = None
 
         return readings
 
+    def _read_multiple_pipelined(self, unit_ids: List[int]) -> Dict[int, Optional[SensorReading]]:
+        """
+        Read multiple sensors through the pipelined transport.
+
+        Educational Note:
+        Failed units are retried as a smaller pipelined batch, up to
+        ``retry_attempts`` batches in total. A dropped socket is reopened
+        before the next batch. Units whose circuit breaker is open are left
+        out entirely, and a unit being probed gets a single batch.
+
+        Args:
+            unit_ids: List of unit IDs to read
+
+        Returns:
+            Dictionary mapping unit IDs to sensor readings (None if failed)
+        """
+        if not self._connected:
+            raise DXMConnectionError("Not connected to DXM")
+
+        readings: Dict[int, Optional[SensorReading]] = {unit_id: None for unit_id in unit_ids}
+        pending = [u for u in unit_ids if validate_unit_id(u) and self._breakers[u].allow()]
+        probes = {u for u in pending if self._breakers[u].probing}
+
+        metrics = self.metrics
+        for unit_id in set(unit_ids).difference(pending):
+            if validate_unit_id(unit_id):
+                metrics.record_skip(unit_id)
+        failures: Dict[int, str] = {}
+
+        try:
+            pending = self._read_pipelined_batches(pending, probes, readings, failures)
+        finally:
+            # A probe still outstanding never reached its unit (the pipeline
+            # failed, or the batches were cut short by an unexpected error).
+            # Its breaker must not stay half-open, which would block the
+            # unit for good.
+            for unit_id in probes:
+                self._breakers[unit_id].abandon_probe()
+
+        for unit_id in pending:
+            if unit_id not in probes:
+                self._breakers[unit_id].record_failure()
+            self.logger.warning(f"Failed to read sensor {unit_id}: {self._last_error}")
+
+        return readings
+
+    def _read_pipelined_batches(self, pending: List[int], probes: Set[int],
+                                readings: Dict[int, Optional[SensorReading]],
+                                failures: Dict[int, str]) -> List[int]:
+        """
+        Run up to ``retry_attempts`` pipelined batches.
+
+        Args:
+            pending: Units to read
+            probes: Units whose breaker is probing (read in one batch only)
+            readings: Filled in with the decoded readings
+            failures: Filled in with the error name of each failed unit
+
+        Returns:
+            Units still unread after the last batch
+        """
+        metrics = self.metrics
+        for attempt in range(self.retry_attempts):
+            if not pending:
+                break
+
+            try:
+                if not self._pipeline.connected:
+                    self._pipeline.connect()
+                results = self._pipeline.read_many([(u, 0, 4) for u in pending])
+            except (OSError, ValueError) as e:
+                self._pipeline.close()
+                self._last_error = str(e)
+                self.logger.warning(f"Pipelined read failed on attempt {attempt + 1}: {e}")
+                continue
+
+            for unit_id in pending:
+                if unit_id in failures:
+                    metrics.record_retry(unit_id, failures[unit_id])
+
+            failed = []
+            for unit_id, result, latency in zip(pending, results, self._pipeline.last_latencies_ns):
+                breaker = self._breakers[unit_id]
+                if isinstance(result, Exception):
+                    failures[unit_id] = error_name(result)
+                    if latency is not None:
+                        metrics.record_request(unit_id, latency, failures[unit_id],
+                                               answered=isinstance(result, ModbusExceptionResponse))
+                    self._last_error = str(result)
+                    self.logger.debug(f"Pipelined read of unit {unit_id} failed: {result}")
+                    exception_code = getattr(result, 'exception_code', None)
+                    if exception_code is not None and exception_code not in UNIT_UNREACHABLE_CODES:
+                        # The unit answered with a refusal; retrying will not help
+                        breaker.record_success()
+                    elif unit_id in probes:
+                        breaker.record_failure()
+                    else:
+                        failed.append(unit_id)
+                else:
+                    metrics.record_request(unit_id, latency or 0, registers=len(result))
+                    breaker.record_success()
+                    readings[unit_id] = self._decoder.decode_registers(unit_id, result)
+            pending = failed
+
+        return pending
+
     def monitor_sensors(self, unit_ids: List[int], interval: float = 1.0,
-                       duration: Optional[float] = None) -> List[Dict[int, Optional[SensorReading]]]:
+                       duration: Optional[float] = None,
+                       overrun_policy: Union[OverrunPolicy, str] = OverrunPolicy.SKIP,
+                       adaptive: Optional[AdaptivePollPolicy] = None,
+                       history_cycles: int = 0,
+                       recorder: Optional[RecordingWriter] = None,
+                       change_filter: Optional[DeadbandFilter] = None
+                       ) -> Iterator[Dict[int, Optional[SensorReading]]]:
         """
         Monitor multiple sensors over time.
 
         Educational Note:
         This method demonstrates real-time data acquisition patterns
-        used in industrial monitoring applications. It handles timing,
-        error recovery, and data collection efficiently.
+        used in industrial monitoring applications. Cycles start on an
+        absolute grid of monotonic deadlines (see DeadlineScheduler), so
+        the time the caller spends handling each yielded cycle does not
+        make the sampling drift. The timing of the most recent cycle is
+        available from ``last_cycle_timing``. Past cycles are only kept
+        when ``history_cycles`` is set, and then in a fixed-size ring
+        buffer, so an indefinite monitor runs in constant memory. With a
+        ``recorder`` every cycle is also appended to a binary recording
+        before it is yielded, so nothing is lost if the caller crashes.
+        A ``change_filter`` drops readings that carry no news before they
+        reach the history, the recorder and the caller; cycles where
+        nothing changed are not yielded at all.
 
         Args:
             unit_ids: List of unit IDs to monitor
             interval: Time between readings (seconds)
             duration: Total monitoring time (None for indefinite)
-
-        Returns:
-            List of reading dictionaries (one per time interval)
+            overrun_policy: What to do when a cycle misses its deadline
+                ("skip", "catch_up" or "stretch")
+            adaptive: Optional per-unit rate policy. When given, cycles tick
+                at ``adaptive.min_interval`` (``interval`` is ignored) and
+                each cycle reads and yields only the units that are due
+            history_cycles: Keep the last N cycles in ``self.history``
+                (a bounded ReadingHistory); 0 keeps no history
+            recorder: Optional RecordingWriter that receives every cycle,
+                failed reads included
+            change_filter: Optional DeadbandFilter; only readings that pass
+                it are kept, recorded and yielded
 
         Yields:
             Dictionary of readings for each monitoring cycle
         """
-        start_time = time.time()
-        reading_history = []
+        if adaptive is not None:
+            interval = adaptive.min_interval
+        scheduler = DeadlineScheduler(interval, overrun_policy)
+        self._scheduler = scheduler
+        self.history = ReadingHistory(history_cycles, len(unit_ids)) if history_cycles > 0 else None
 
         try:
             while True:
-                cycle_start = time.time()
+                timing = scheduler.wait()
+                if timing.missed:
+                    self.logger.warning(f"Monitoring missed {timing.missed} deadline(s) before "
+                                        f"cycle {timing.cycle} (interval {interval}s, "
+                                        f"policy {scheduler.policy.value})")
 
                 # Read all sensors for this cycle
-                readings = self.read_multiple_sensors(unit_ids)
-                reading_history.append(readings)
+                if adaptive is None:
+                    readings = self.read_multiple_sensors(unit_ids)
+                else:
+                    due = adaptive.due_units(unit_ids, timing.started_ns)
+                    readings = self.read_multiple_sensors(due) if due else {}
+                    for unit_id, reading in readings.items():
+                        adaptive.update(unit_id, reading, timing.started_ns)
 
-                # Yield current readings for real-time processing
-                yield readings
+                if change_filter is not None and readings:
+                    readings = change_filter.filter_cycle(readings, time.time_ns())
 
-                # Check duration limit
-                if duration and (time.time() - start_time) >= duration:
-                    break
+                # Adaptive ticks with no unit due and cycles without
+                # changes produce no output
+                if readings:
+                    if self.history is not None:
+                        self.history.append(timing.cycle, readings)
+                    if recorder is not None:
+                        recorder.write_cycle(readings, self.host)
 
-                # Calculate sleep time to maintain interval
-                cycle_time = time.time() - cycle_start
-                sleep_time = max(0, interval - cycle_time)
+                    # Yield current readings for real-time processing
+                    yield readings
 
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                else:
-                    self.logger.warning(f"Monitoring cycle took {cycle_time:.2f}s, "
-                                      f"longer than interval {interval}s")
+                # Check duration limit
+                if duration and scheduler.elapsed() >= duration:
+                    break
 
         except KeyboardInterrupt:
             self.logger.info("Monitoring stopped by user")
@@ -476,7 +1033,34 @@ class DXMClient:
             self.logger.error(f"Monitoring error: {e}")
             raise
 
-        return reading_history
+    def get_unit_health(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the circuit breaker state of every unit read so far.
+
+        Returns:
+            Dictionary mapping unit IDs to breaker statistics (state,
+            consecutive_failures, trips, backoff, retry_in)
+        """
+        return self._breakers.stats()
+
+    def reset_unit_health(self) -> None:
+        """Close all circuit breakers so every unit is read again immediately."""
+        self._breakers.reset()
+        self._link_breaker.reset()
+
+    @property
+    def last_cycle_timing(self) -> Optional[CycleTiming]:
+        """Timing (deadline, start, jitter, misses) of the latest monitoring cycle."""
+        return self._scheduler.last_timing if self._scheduler else None
+
+    def get_monitor_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get scheduling statistics of the current or last monitoring run.
+
+        Returns:
+            Scheduler statistics, or None if monitoring has not run
+        """
+        return self._scheduler.stats() if self._scheduler else None
 
     def get_connection_info(self) -> Dict[str, Any]:
         """
@@ -491,7 +1075,14 @@ class DXMClient:
             'connected': self.connected,
             'timeout': self.timeout,
             'retry_attempts': self.retry_attempts,
+            'pipeline_depth': self.pipeline_depth,
+            'fast_path': self._fast is not None,
+            'fast_path_fallbacks': self.fast_path_fallbacks,
+            'gap_tolerance': self._planner.gap_tolerance,
+            'open_units': self._breakers.open_units(),
+            'reconnects': self.reconnects,
             'last_error': self.last_error,
+            'metrics': self.metrics.snapshot(),
             'client_info': {
                 'connected': self._client.connected if hasattr(self._client, 'connected') else False,
                 'socket': str(getattr(self._client, 'socket', 'Not available'))
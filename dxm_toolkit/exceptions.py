@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+DXM Toolkit Exceptions
+
+Kept in a module without third-party imports, so code that only needs
+to catch these errors (such as the CLI) does not load pymodbus.
+"""
+
+
+class DXMConnectionError(Exception):
+    """Custom exception for DXM connection issues."""
+    pass
+
+
+class DXMCommunicationError(Exception):
+    """Custom exception for DXM communication issues."""
+    pass
+
+
+class DXMUnitUnavailableError(DXMCommunicationError):
+    """Raised without touching the network while a unit's circuit breaker is open."""
+    pass
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Prometheus Metrics Exporter
+
+Polls a DXM controller on a background thread and serves the latest
+reading of every unit, together with the client's request counters and
+latency histograms, in the Prometheus text exposition format. The poll
+thread renders the page once per cycle; a scrape only copies that
+pre-rendered snapshot, so scrapes never cause Modbus traffic and any
+number of scrapers can share one persistent connection.
+
+Educational Focus:
+- Decoupling data acquisition from data serving
+- Rendering once per cycle instead of once per request
+- Prometheus text exposition format (gauges, counters, histograms)
+"""
+
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .circuit_breaker import BreakerState
+from .dxm_client import DXMClient
+from .metrics import ClientMetrics
+from .scheduler import DeadlineScheduler
+from .sensor_decoder import SensorReading, SensorStatus
+
+DEFAULT_LISTEN = "127.0.0.1:9850"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request latency histogram bounds exported as ``le`` buckets (seconds)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def parse_listen(listen: str) -> Tuple[str, int]:
+    """
+    Split a ``host:port`` listen address.
+
+    Args:
+        listen: Address such as "127.0.0.1:9850" or ":9850" (all interfaces)
+
+    Returns:
+        (host, port) tuple
+
+    Raises:
+        ValueError: If the address has no valid port
+    """
+    host, sep, port = listen.rpartition(':')
+    if not sep or not port.isdigit() or not 0 <= int(port) <= 65535:
+        raise ValueError(f"Listen address must be host:port, got '{listen}'")
+    return host.strip('[]') or '0.0.0.0', int(port)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels: Dict[str, object]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + '}'
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class _Family:
+    """Samples of one metric family, rendered with its HELP and TYPE lines."""
+
+    def __init__(self, name: str, kind: str, help_text: str):
+        self.name = name
+        self.lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+    def add(self, value: float, suffix: str = '', **labels) -> None:
+        self.lines.append(f"{self.name}{suffix}{_labels(labels)} {_number(value)}")
+
+
+def render_readings(host: str, readings: Dict[int, SensorReading],
+                    up: Dict[int, bool]) -> List[str]:
+    """
+    Render sensor gauges.
+
+    Args:
+        host: Controller the readings came from (``host`` label)
+        readings: Latest successful reading of each unit
+        up: Whether the latest read of each unit succeeded
+
+    Returns:
+        Exposition lines
+    """
+    sensor_up = _Family('dxm_sensor_up', 'gauge', 'Whether the latest read of the unit succeeded.')
+    distance = _Family('dxm_sensor_distance_mm', 'gauge',
+                       'Latest distance in millimeters (absent when out of range or disconnected).')
+    signal = _Family('dxm_sensor_signal_quality', 'gauge', 'Latest signal quality (excess gain).')
+    status = _Family('dxm_sensor_status', 'gauge', 'Latest sensor status (1 for the current state).')
+    connected = _Family('dxm_sensor_connected', 'gauge', 'Whether a sensor is attached to the unit.')
+    taken = _Family('dxm_sensor_reading_timestamp_seconds', 'gauge',
+                    'When the latest successful reading was taken (Unix time).')
+
+    for unit_id in sorted(up):
+        sensor_up.add(int(up[unit_id]), host=host, unit=unit_id)
+    for unit_id in sorted(readings):
+        reading = readings[unit_id]
+        labels = {'host': host, 'unit': unit_id}
+        if reading.distance_mm is not None:
+            distance.add(reading.distance_mm, **labels)
+        signal.add(reading.signal_quality, **labels)
+        for state in SensorStatus:
+            status.add(int(reading.status is state), **labels, status=state.name)
+        connected.add(int(reading.connected), **labels)
+        taken.add(reading.ts_ns / 1e9, **labels)
+
+    return [line for family in (sensor_up, distance, signal, status, connected, taken)
+            for line in family.lines]
+
+
+def render_client_metrics(host: str, metrics: ClientMetrics,
+                          open_units: Iterable[int] = ()) -> List[str]:
+    """
+    Render client counters and request latency histograms.
+
+    Args:
+        host: Controller the client talks to (``host`` label)
+        metrics: The client's metrics registry
+        open_units: Units whose circuit breaker is currently open
+
+    Returns:
+        Exposition lines
+    """
+    requests = _Family('dxm_client_requests_total', 'counter', 'Modbus requests sent per unit.')
+    errors = _Family('dxm_client_errors_total', 'counter', 'Failed requests per unit and error type.')
+    retries = _Family('dxm_client_retries_total', 'counter', 'Retried requests per unit and cause.')
+    skipped = _Family('dxm_client_skipped_total', 'counter',
+                      'Reads skipped because the unit circuit breaker was open.')
+    breaker = _Family('dxm_client_breaker_open', 'gauge', 'Whether the unit circuit breaker is open.')
+    latency = _Family('dxm_client_request_duration_seconds', 'histogram',
+                      'Modbus request latency per unit.')
+    bounds_ns = [int(bound * 1e9) for bound in LATENCY_BUCKETS]
+    open_units = set(open_units)
+
+    for unit_id in sorted(metrics.units):
+        unit = metrics.units[unit_id]
+        labels = {'host': host, 'unit': unit_id}
+        requests.add(unit.requests, **labels)
+        for name, count in sorted(unit.errors.items()):
+            errors.add(count, **labels, error=name)
+        for name, count in sorted(unit.retries.items()):
+            retries.add(count, **labels, reason=name)
+        skipped.add(unit.skipped, **labels)
+        breaker.add(int(unit_id in open_units), **labels)
+
+        hist = unit.latency
+        for bound, count in zip(LATENCY_BUCKETS, hist.cumulative_counts(bounds_ns)):
+            latency.add(count, '_bucket', **labels, le=_number(bound))
+        latency.add(hist.count, '_bucket', **labels, le='+Inf')
+        latency.add(hist.total_ns / 1e9, '_sum', **labels)
+        latency.add(hist.count, '_count', **labels)
+
+    lines = [line for family in (requests, errors, retries, skipped, breaker, latency)
+             for line in family.lines]
+
+    for name, value, help_text in (
+            ('dxm_client_reconnects_total', metrics.reconnects, 'Reconnects after a dropped session.'),
+            ('dxm_client_bytes_sent_total', metrics.bytes_sent, 'Modbus TCP bytes sent.'),
+            ('dxm_client_bytes_received_total', metrics.bytes_received, 'Modbus TCP bytes received.')):
+        family = _Family(name, 'counter', help_text)
+        family.add(value, host=host)
+        lines.extend(family.lines)
+    return lines
+
+
+class MetricsExporter:
+    """
+    Background poller that serves its latest results over HTTP.
+
+    Educational Note:
+    Polling and serving run on different threads and share exactly one
+    object: the rendered page, swapped in whole after every cycle. The
+    poll thread is the only user of the Modbus client and its metrics, so
+    neither needs a lock, and a slow or frequent scraper cannot delay a
+    poll (or cause one).
+
+    Usage:
+        with DXMClient("192.168.0.1") as client:
+            exporter = MetricsExporter(client, [1, 2, 3], interval=1.0)
+            exporter.serve_forever("127.0.0.1", 9850)
+    """
+
+    def __init__(self, client: DXMClient, unit_ids: List[int], interval: float = 1.0):
+        """
+        Initialize the exporter.
+
+        Args:
+            client: Connected client used by the poll thread
+            unit_ids: Units to poll every cycle
+            interval: Seconds between poll cycles
+        """
+        self.client = client
+        self.unit_ids = list(unit_ids)
+        self.interval = interval
+        self.logger = logging.getLogger(__name__)
+
+        self._latest: Dict[int, SensorReading] = {}
+        self._up: Dict[int, bool] = {}
+        self._page = b''
+        self._rendered_at = 0.0
+        self._cycle_seconds = 0.0
+        self._poll_errors = 0
+        self._scheduler = DeadlineScheduler(interval)
+        self.scrapes = 0
+
+        self._stop = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def address(self) -> Optional[Tuple[str, int]]:
+        """(host, port) the HTTP server is bound to, once started."""
+        return self._server.server_address[:2] if self._server else None
+
+    def poll_once(self) -> None:
+        """Read every unit once and re-render the page."""
+        start = time.perf_counter()
+        try:
+            readings = self.client.read_multiple_sensors(self.unit_ids)
+        except Exception as e:
+            self.logger.warning(f"Poll cycle failed: {e}")
+            self._poll_errors += 1
+            readings = dict.fromkeys(self.unit_ids)
+
+        for unit_id, reading in readings.items():
+            self._up[unit_id] = reading is not None
+            if reading is not None:
+                self._latest[unit_id] = reading
+        self._cycle_seconds = time.perf_counter() - start
+        self.render()
+
+    def render(self) -> bytes:
+        """Render the current snapshot and make it the page served to scrapers."""
+        host = self.client.host
+        open_units = [unit_id for unit_id, health in self.client.get_unit_health().items()
+                      if health['state'] != BreakerState.CLOSED.value]
+
+        lines = []
+        up = _Family('dxm_up', 'gauge', 'Whether the latest poll cycle got any response.')
+        up.add(int(any(self._up.values())), host=host)
+        lines.extend(up.lines)
+        lines.extend(render_readings(host, self._latest, self._up))
+        lines.extend(render_client_metrics(host, self.client.metrics, open_units))
+
+        cycle = _Family('dxm_poll_cycle_seconds', 'gauge', 'Duration of the latest poll cycle.')
+        cycle.add(self._cycle_seconds, host=host)
+        lines.extend(cycle.lines)
+        failed = _Family('dxm_poll_errors_total', 'counter', 'Poll cycles that raised an error.')
+        failed.add(self._poll_errors, host=host)
+        lines.extend(failed.lines)
+        missed = _Family('dxm_poll_missed_deadlines_total', 'counter',
+                         'Poll cycles skipped because the previous one overran.')
+        missed.add(self._scheduler.missed_deadlines, host=host)
+        lines.extend(missed.lines)
+
+        page = ('\n'.join(lines) + '\n').encode('utf-8')
+        # A single reference assignment: scrapers see the old or the new page
+        self._page = page
+        self._rendered_at = time.time()
+        return page
+
+    def scrape(self) -> bytes:
+        """
+        Get the page for one scrape (no Modbus traffic).
+
+        Returns:
+            The latest rendered snapshot plus exporter self-metrics
+        """
+        self.scrapes += 1
+        page, rendered_at = self._page, self._rendered_at
+        age = time.time() - rendered_at if rendered_at else 0.0
+        return page + (
+            "# HELP dxm_exporter_snapshot_age_seconds Seconds since the snapshot was rendered.\n"
+            "# TYPE dxm_exporter_snapshot_age_seconds gauge\n"
+            f"dxm_exporter_snapshot_age_seconds {age!r}\n"
+            "# HELP dxm_exporter_scrapes_total Scrapes served.\n"
+            "# TYPE dxm_exporter_scrapes_total counter\n"
+            f"dxm_exporter_scrapes_total {self.scrapes}\n"
+        ).encode('utf-8')
+
+    def _poll_loop(self) -> None:
+        while not self._stop.is_set():
+            self._scheduler.wait()
+            if self._stop.is_set():
+                break
+            self.poll_once()
+
+    def start(self, host: str = '127.0.0.1', port: int = 9850) -> None:
+        """
+        Start the poll thread and the HTTP server (port 0 picks a free port).
+
+        Raises:
+            OSError: If the listen address cannot be bound
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] == '/metrics':
+                    body, content_type, code = exporter.scrape(), CONTENT_TYPE, 200
+                elif self.path == '/':
+                    body = b'<html><body><a href="/metrics">/metrics</a></body></html>\n'
+                    content_type, code = 'text/html', 200
+                else:
+                    body, content_type, code = b'Not found\n', 'text/plain', 404
+                self.send_response(code)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                exporter.logger.debug("%s - %s", self.address_string(), format % args)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.render()
+        self._stop.clear()
+        self._poller = threading.Thread(target=self._poll_loop, name="dxm-exporter-poll",
+                                        daemon=True)
+        self._poller.start()
+        threading.Thread(target=self._server.serve_forever, name="dxm-exporter-http",
+                         daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop polling and serving."""
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._poller is not None:
+            self._poller.join(timeout=self.interval + self.client.timeout + 1)
+            self._poller = None
+
+    def join(self) -> None:
+        """Block until the exporter is stopped (interruptible by Ctrl+C)."""
+        while self._poller is not None and self._poller.is_alive():
+            self._poller.join(timeout=1.0)
+
+    def serve_forever(self, host: str = '127.0.0.1', port: int = 9850) -> None:
+        """Start, then block until interrupted."""
+        self.start(host, port)
+        try:
+            self.join()
+        finally:
+            self.stop()
+
+    def __enter__(self) -> 'MetricsExporter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
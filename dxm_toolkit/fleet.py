@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Fleet Poller for Many DXM Controllers
+
+Polls a whole inventory of DXM controllers from a single process. Each
+controller gets one persistent AsyncDXMClient, and every per-unit read in
+the fleet runs under a global concurrency limit as well as the per-host
+limit of its client.
+
+Educational Focus:
+- Host inventories (YAML/CSV)
+- Connection pooling across many Modbus TCP servers
+- Layered concurrency limits with asyncio
+"""
+
+import asyncio
+import csv
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+import yaml
+
+from .async_client import AsyncDXMClient
+from .circuit_breaker import CircuitBreaker
+from .discovery_cache import DiscoveryCache
+from .scheduler import DeadlineScheduler, OverrunPolicy
+from .sensor_decoder import SensorReading
+from .utils import parse_unit_ids, validate_ip_address
+
+
+@dataclass
+class HostSpec:
+    """
+    One DXM controller in a fleet inventory.
+
+    Attributes:
+        host: DXM controller IP address
+        port: Modbus TCP port
+        name: Label used to tag readings (defaults to the host address)
+        unit_ids: Unit IDs to poll (None means discover on first connect)
+    """
+    host: str
+    port: int = 502
+    name: Optional[str] = None
+    unit_ids: Optional[List[int]] = None
+
+    def __post_init__(self):
+        if not self.name:
+            self.name = self.host
+
+
+def _host_spec_from_dict(entry: Dict) -> HostSpec:
+    """Build a HostSpec from one inventory row or mapping."""
+    if not entry.get('host'):
+        raise ValueError(f"Inventory entry is missing 'host': {entry}")
+
+    host = str(entry['host']).strip()
+    if not validate_ip_address(host):
+        raise ValueError(f"Inventory entry {entry}: host must be an IPv4 address, got '{host}'")
+
+    units = entry.get('units')
+    if isinstance(units, list):
+        units = ','.join(str(u) for u in units)
+
+    return HostSpec(
+        host=host,
+        port=int(entry.get('port') or 502),
+        name=(str(entry['name']).strip() if entry.get('name') else None),
+        unit_ids=parse_unit_ids(units) if units else None
+    )
+
+
+def load_inventory(path: str) -> List[HostSpec]:
+    """
+    Load a host inventory from a YAML or CSV file.
+
+    YAML files hold either a list of entries or a mapping with a ``hosts``
+    list. Each entry is a host string or a mapping with ``host`` and
+    optional ``port``, ``name`` and ``units`` keys. CSV files use the same
+    keys as column headers. Units are written as "1-8" or "1,3,5".
+
+    Args:
+        path: Inventory file path (.yaml, .yml or .csv)
+
+    Returns:
+        List of HostSpec entries
+
+    Raises:
+        ValueError: If the file format or an entry is invalid
+    """
+    inventory_file = Path(path)
+
+    if inventory_file.suffix.lower() == '.csv':
+        with open(inventory_file, 'r', newline='') as f:
+            entries = [row for row in csv.DictReader(f) if any(row.values())]
+    elif inventory_file.suffix.lower() in ('.yaml', '.yml'):
+        with open(inventory_file, 'r') as f:
+            data = yaml.safe_load(f) or []
+        entries = data.get('hosts', []) if isinstance(data, dict) else data
+        entries = [{'host': e} if isinstance(e, str) else e for e in entries]
+    else:
+        raise ValueError(f"Unsupported inventory format: {inventory_file.suffix}")
+
+    hosts = [_host_spec_from_dict(entry) for entry in entries]
+
+    names = [h.name for h in hosts]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate host names in inventory: {duplicates}")
+
+    return hosts
+
+
+class FleetPoller:
+    """
+    Poll many DXM controllers concurrently from one process.
+
+    Educational Note:
+    Two limits shape the load. The global limit caps the number of Modbus
+    requests in flight across the whole fleet, which protects the polling
+    host and the plant network. The per-host limit caps the requests (and
+    therefore TCP sessions) against one controller; the default of 1 keeps
+    exactly one persistent connection per DXM.
+
+    Every host connects and reads on its own, so readings from healthy
+    controllers flow while another is still connecting or timing out. A
+    controller that cannot be reached is skipped behind a circuit breaker
+    and only tried again after a back-off that doubles with every failed
+    reconnect, so one bad host never stalls the fleet.
+    """
+
+    def __init__(self,
+                 hosts: List[HostSpec],
+                 global_concurrency: int = 64,
+                 per_host_concurrency: int = 1,
+                 timeout: float = 5.0,
+                 retry_attempts: int = 1,
+                 max_units: int = 8,
+                 discovery_cache: Optional[DiscoveryCache] = None,
+                 reconnect_backoff: float = 1.0,
+                 max_reconnect_backoff: float = 60.0):
+        """
+        Initialize the fleet poller.
+
+        Args:
+            hosts: Controllers to poll
+            global_concurrency: Maximum requests in flight across all hosts
+            per_host_concurrency: Maximum requests in flight per host
+            timeout: Per-request timeout in seconds
+            retry_attempts: Retry attempts per unit read
+            max_units: Unit IDs scanned for hosts without an explicit list
+            discovery_cache: Optional cache of earlier scans, so restarting
+                the poller does not rescan every controller
+            reconnect_backoff: Delay before an unreachable host is tried
+                again (seconds, doubling per failed reconnect)
+            max_reconnect_backoff: Upper bound of the reconnect delay
+
+        Raises:
+            ValueError: If a concurrency limit is less than 1 or the
+                back-off delays are invalid
+        """
+        if global_concurrency < 1 or per_host_concurrency < 1:
+            raise ValueError("Concurrency limits must be at least 1")
+
+        self.hosts = list(hosts)
+        self.global_concurrency = global_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        self.max_units = max_units
+        self.discovery_cache = discovery_cache
+
+        self.logger = logging.getLogger(__name__)
+
+        # Connection pool: one persistent client per controller
+        self._clients: Dict[str, AsyncDXMClient] = {}
+        self._unit_ids: Dict[str, List[int]] = {
+            h.name: list(h.unit_ids) for h in self.hosts if h.unit_ids
+        }
+        # Reconnect back-off: one failed connect opens a host's breaker
+        self._breakers: Dict[str, CircuitBreaker] = {
+            h.name: CircuitBreaker(failure_threshold=1, base_backoff=reconnect_backoff,
+                                   max_backoff=max_reconnect_backoff)
+            for h in self.hosts
+        }
+        self._global_limit: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _get_client(self, spec: HostSpec) -> Optional[AsyncDXMClient]:
+        """
+        Return the pooled client for a host, connecting it if needed.
+
+        Returns:
+            Connected client, or None if the host is unreachable right now
+            or still backing off after a failed connect
+        """
+        client = self._clients.pop(spec.name, None)
+        if client is not None:
+            if client.connected:
+                self._clients[spec.name] = client
+                return client
+            await client.disconnect()
+
+        breaker = self._breakers[spec.name]
+        if not breaker.allow():
+            return None
+
+        client = None
+        try:
+            client = AsyncDXMClient(
+                host=spec.host,
+                port=spec.port,
+                timeout=self.timeout,
+                retry_attempts=self.retry_attempts,
+                max_in_flight=self.per_host_concurrency
+            )
+            async with self._global_limit:
+                await client.connect()
+            if spec.name not in self._unit_ids:
+                self._unit_ids[spec.name] = await client.discover_sensors(
+                    self.max_units, cache=self.discovery_cache)
+        except Exception as e:
+            breaker.record_failure()
+            self.logger.warning(f"Host {spec.name} unavailable, retrying in "
+                                f"{breaker.retry_in():.1f}s: {e}")
+            if client is not None:
+                await client.disconnect()
+            return None
+
+        breaker.record_success()
+        self._clients[spec.name] = client
+        return client
+
+    async def _read_unit(self, spec: HostSpec, client: AsyncDXMClient,
+                         unit_id: int) -> Optional[SensorReading]:
+        """Read one unit under the global limit and tag it with its host."""
+        async with self._global_limit:
+            try:
+                reading = await client.read_sensor(unit_id)
+            except Exception as e:
+                self.logger.debug(f"Host {spec.name} unit {unit_id} failed: {e}")
+                return None
+        return reading.with_host(spec.name)
+
+    async def _poll_host(self, spec: HostSpec, results: asyncio.Queue) -> None:
+        """Connect a host if needed, then read its units into ``results``."""
+        client = await self._get_client(spec)
+        if client is None:
+            return
+        reads = [self._read_unit(spec, client, unit_id)
+                 for unit_id in self._unit_ids.get(spec.name, [])]
+        for next_done in asyncio.as_completed(reads):
+            reading = await next_done
+            if reading is not None:
+                results.put_nowait(reading)
+
+    async def _poll_hosts(self, results: asyncio.Queue) -> None:
+        """Poll every host independently; a None in ``results`` marks the end."""
+        try:
+            await asyncio.gather(*(self._poll_host(spec, results) for spec in self.hosts))
+        finally:
+            results.put_nowait(None)
+
+    async def _cycle(self) -> AsyncIterator[SensorReading]:
+        """Run one polling cycle, yielding readings as they complete."""
+        if self._global_limit is None:
+            self._global_limit = asyncio.Semaphore(self.global_concurrency)
+
+        results: asyncio.Queue = asyncio.Queue()
+        hosts = asyncio.ensure_future(self._poll_hosts(results))
+        try:
+            while True:
+                reading = await results.get()
+                if reading is None:
+                    break
+                yield reading
+            await hosts
+        finally:
+            if not hosts.done():
+                hosts.cancel()
+
+    async def poll_once(self) -> List[SensorReading]:
+        """
+        Poll every unit of every host once.
+
+        Returns:
+            Host-tagged readings for all units that answered
+        """
+        return [reading async for reading in self._cycle()]
+
+    async def stream(self, interval: float = 1.0,
+                     duration: Optional[float] = None,
+                     stop: Optional[Callable[[], bool]] = None) -> AsyncIterator[SensorReading]:
+        """
+        Poll the fleet repeatedly and stream readings as they arrive.
+
+        Args:
+            interval: Time between cycle starts (seconds)
+            duration: Total polling time (None for indefinite)
+            stop: Checked at the start and end of every cycle; polling
+                ends once it returns True, even if no host answers
+
+        Yields:
+            SensorReading objects tagged with their host name
+        """
+        scheduler = DeadlineScheduler(interval, OverrunPolicy.SKIP)
+
+        while True:
+            timing = await scheduler.wait_async()
+            if timing.missed:
+                self.logger.warning(f"Fleet polling missed {timing.missed} cycle(s); "
+                                    f"interval {interval}s is too short for this fleet")
+            if stop is not None and stop():
+                break
+
+            async for reading in self._cycle():
+                yield reading
+
+            if duration and scheduler.elapsed() >= duration:
+                break
+            if stop is not None and stop():
+                break
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        await asyncio.gather(*(c.disconnect() for c in self._clients.values()))
+        self._clients.clear()
+
+    def get_fleet_info(self) -> Dict[str, Dict]:
+        """
+        Get connection state for every host in the fleet.
+
+        Returns:
+            Dictionary mapping host names to connection details
+        """
+        info = {}
+        for spec in self.hosts:
+            client = self._clients.get(spec.name)
+            info[spec.name] = {
+                'host': spec.host,
+                'port': spec.port,
+                'connected': bool(client and client.connected),
+                'unit_ids': self._unit_ids.get(spec.name),
+                'reconnect': self._breakers[spec.name].stats()
+            }
+        return info
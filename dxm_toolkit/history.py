@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Bounded Columnar Reading History
+
+A fixed-capacity ring buffer that keeps the most recent monitoring cycles.
+Readings are stored as rows across a handful of typed ``array`` columns
+instead of as lists of SensorReading objects, so a long-running monitor
+holds a small, constant amount of memory no matter how long it runs.
+
+Educational Focus:
+- Ring buffers for bounded retention in long-running processes
+- Columnar (structure-of-arrays) storage versus lists of objects
+- Rebuilding rich objects on demand from compact storage
+"""
+
+import time
+from array import array
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from .batch import ReadingBatch, decode_register_blocks
+from .sensor_decoder import SensorDecoder, SensorReading
+
+# Row flag bits
+FLAG_FAILED = 0x01   # The read failed; only unit_id and ts_ns are meaningful
+
+# Column name -> array typecode
+COLUMNS = {
+    'cycle': 'q',
+    'unit_id': 'B',
+    'ts_ns': 'q',
+    'status': 'H',
+    'bdc': 'H',
+    'distance': 'H',
+    'signal': 'H',
+    'flags': 'B',
+}
+
+
+class ReadingHistory:
+    """
+    Ring buffer of the last ``max_cycles`` monitoring cycles.
+
+    Educational Note:
+    Every reading becomes one row: eight small integers written into
+    preallocated arrays (26 bytes per reading, against about 190 for a
+    SensorReading object). The arrays are sized
+    once for ``max_cycles * units_per_cycle`` rows and rows are written at
+    ``row % capacity``, so appending never allocates. A deque of
+    ``(cycle, first_row, row_count)`` records where each cycle starts;
+    when it is full, the oldest cycle is dropped and its rows are simply
+    overwritten later.
+
+    Usage:
+        history = ReadingHistory(max_cycles=3600, units_per_cycle=8)
+        history.append(cycle, readings)
+        for readings in history.cycles():
+            ...
+    """
+
+    def __init__(self, max_cycles: int, units_per_cycle: int):
+        """
+        Initialize the history buffer.
+
+        Args:
+            max_cycles: Number of most recent cycles to retain
+            units_per_cycle: Largest number of units recorded in one cycle
+
+        Raises:
+            ValueError: If either size is not positive
+        """
+        if max_cycles <= 0:
+            raise ValueError(f"max_cycles must be positive, got {max_cycles}")
+        if units_per_cycle <= 0:
+            raise ValueError(f"units_per_cycle must be positive, got {units_per_cycle}")
+
+        self.max_cycles = max_cycles
+        self.units_per_cycle = units_per_cycle
+        self.capacity = max_cycles * units_per_cycle
+
+        self._columns: Dict[str, array] = {
+            name: array(code, bytes(array(code).itemsize * self.capacity))
+            for name, code in COLUMNS.items()
+        }
+        self._cycles: Deque[Tuple[int, int, int]] = deque()
+        self._rows_written = 0
+        self._decoder = SensorDecoder()
+
+    def __len__(self) -> int:
+        """Number of cycles currently retained."""
+        return len(self._cycles)
+
+    @property
+    def row_count(self) -> int:
+        """Number of readings currently retained."""
+        return sum(count for _, _, count in self._cycles)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for the column storage."""
+        return sum(col.itemsize * len(col) for col in self._columns.values())
+
+    def clear(self) -> None:
+        """Forget all retained cycles (storage stays allocated)."""
+        self._cycles.clear()
+
+    def append(self, cycle: int, readings: Dict[int, Optional[SensorReading]]) -> None:
+        """
+        Record one monitoring cycle, evicting the oldest cycle if needed.
+
+        Args:
+            cycle: Cycle number
+            readings: Dictionary mapping unit IDs to readings (None if failed)
+
+        Raises:
+            ValueError: If the cycle holds more than units_per_cycle readings
+        """
+        if len(readings) > self.units_per_cycle:
+            raise ValueError(f"Cycle has {len(readings)} readings, history was sized "
+                             f"for {self.units_per_cycle} per cycle")
+
+        if len(self._cycles) == self.max_cycles:
+            self._cycles.popleft()
+
+        cols = self._columns
+        first_row = self._rows_written
+        now_ns = time.time_ns()
+
+        for offset, (unit_id, reading) in enumerate(readings.items()):
+            i = (first_row + offset) % self.capacity
+            cols['cycle'][i] = cycle
+            cols['unit_id'][i] = unit_id
+            if reading is None:
+                cols['ts_ns'][i] = now_ns
+                cols['status'][i] = 0
+                cols['bdc'][i] = 0
+                cols['distance'][i] = 0
+                cols['signal'][i] = 0
+                cols['flags'][i] = FLAG_FAILED
+            else:
+                cols['ts_ns'][i] = reading.ts_ns
+                cols['status'][i] = reading.status_raw
+                cols['bdc'][i] = reading.bdc_states
+                cols['distance'][i] = reading.distance_raw
+                cols['signal'][i] = reading.signal_quality
+                cols['flags'][i] = 0
+
+        self._rows_written += len(readings)
+        self._cycles.append((cycle, first_row, len(readings)))
+
+    def _rows(self, first_row: int, count: int) -> Iterator[int]:
+        """Physical indices of a run of logical rows."""
+        return ((first_row + offset) % self.capacity for offset in range(count))
+
+    def _reading(self, i: int) -> Optional[SensorReading]:
+        """Rebuild the SensorReading stored at physical row i."""
+        cols = self._columns
+        if cols['flags'][i] & FLAG_FAILED:
+            return None
+        return self._decoder.decode_registers(
+            cols['unit_id'][i],
+            [cols['status'][i], cols['bdc'][i], cols['distance'][i], cols['signal'][i]],
+            ts_ns=cols['ts_ns'][i]
+        )
+
+    def cycles(self) -> Iterator[Dict[int, Optional[SensorReading]]]:
+        """
+        Iterate over retained cycles, oldest first, as reading dictionaries.
+
+        Yields:
+            Dictionary mapping unit IDs to readings (None if the read failed)
+        """
+        for _, first_row, count in list(self._cycles):
+            yield {self._columns['unit_id'][i]: self._reading(i)
+                   for i in self._rows(first_row, count)}
+
+    def latest(self) -> Optional[Dict[int, Optional[SensorReading]]]:
+        """Most recent cycle as a reading dictionary (None if empty)."""
+        if not self._cycles:
+            return None
+        _, first_row, count = self._cycles[-1]
+        return {self._columns['unit_id'][i]: self._reading(i)
+                for i in self._rows(first_row, count)}
+
+    def column(self, name: str) -> array:
+        """
+        Get one column for all retained readings in chronological order.
+
+        Args:
+            name: Column name (cycle, unit_id, ts_ns, status, bdc,
+                distance, signal or flags)
+
+        Returns:
+            A new array holding the column values
+
+        Raises:
+            KeyError: If the column name is unknown
+        """
+        source = self._columns[name]
+        result = array(source.typecode)
+        for _, first_row, count in self._cycles:
+            start = first_row % self.capacity
+            end = start + count
+            if end <= self.capacity:
+                result.extend(source[start:end])
+            else:
+                result.extend(source[start:])
+                result.extend(source[:end - self.capacity])
+        return result
+
+    def to_batch(self) -> ReadingBatch:
+        """
+        Get the successful readings of all retained cycles as a ReadingBatch.
+
+        Returns:
+            ReadingBatch in chronological order (failed reads are left out)
+        """
+        flags = self.column('flags')
+        ok = [i for i in range(len(flags)) if not flags[i] & FLAG_FAILED]
+        columns = {}
+        for name in ('unit_id', 'ts_ns', 'status', 'bdc', 'distance', 'signal'):
+            values = self.column(name)
+            columns[name] = array(values.typecode, [values[i] for i in ok])
+        return decode_register_blocks(
+            columns['unit_id'],
+            list(zip(columns['status'], columns['bdc'], columns['distance'], columns['signal'])),
+            columns['ts_ns']
+        )
+
+    def unit_series(self, unit_id: int) -> Tuple[List[int], List[int]]:
+        """
+        Get the successful (ts_ns, distance_raw) samples of one unit.
+
+        Args:
+            unit_id: Unit to extract
+
+        Returns:
+            Tuple of (timestamps in ns, raw distance values)
+        """
+        units = self.column('unit_id')
+        flags = self.column('flags')
+        ts = self.column('ts_ns')
+        distance = self.column('distance')
+        rows = [i for i in range(len(units))
+                if units[i] == unit_id and not flags[i] & FLAG_FAILED]
+        return [ts[i] for i in rows], [distance[i] for i in rows]
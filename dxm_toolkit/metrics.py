@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Client Metrics Registry
+
+Low-overhead counters and latency histograms for a DXM client: requests,
+errors and retries per unit (broken down by error type), reconnects and
+bytes on the wire. Recording a request costs a few integer additions and
+one histogram bucket increment, so the registry can stay on in production
+polling loops and show which units are using up the poll budget.
+
+Educational Focus:
+- HDR-style log-linear histograms with bounded relative error
+- Counting instead of storing samples in long-running processes
+- Attributing time and errors to individual devices
+"""
+
+import math
+from array import array
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence
+
+# Linear sub-buckets per power of two (2**4 = 16, at most 1/16 = 6.25% error)
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# Largest recordable latency; longer values land in the top bucket (~68.7 s)
+MAX_TRACKED_NS = (1 << 36) - 1
+
+# Modbus TCP frame sizes used for byte accounting
+# (MBAP header 7 bytes; FC03 request PDU 5 bytes; response PDU 2 + 2 per register)
+FC03_REQUEST_BYTES = 12
+FC03_RESPONSE_OVERHEAD = 9
+EXCEPTION_RESPONSE_BYTES = 9
+
+
+def bucket_index(value: int, bits: int = SUB_BUCKET_BITS) -> int:
+    """
+    Log-linear bucket of a non-negative integer.
+
+    Args:
+        value: The value
+        bits: log2 of the linear sub-buckets per power of two (values
+            below 2 ** (bits + 1) get a bucket of their own)
+    """
+    if value < 2 << bits:
+        return value
+    shift = value.bit_length() - bits - 1
+    return (shift << bits) + (value >> shift)
+
+
+def bucket_lower(index: int, bits: int = SUB_BUCKET_BITS) -> int:
+    """Smallest value that falls into a bucket."""
+    if index < 2 << bits:
+        return index
+    shift = (index >> bits) - 1
+    return (index - (shift << bits)) << shift
+
+
+def bucket_upper(index: int, bits: int = SUB_BUCKET_BITS) -> int:
+    """Largest value that falls into a bucket."""
+    if index < 2 << bits:
+        return index
+    shift = (index >> bits) - 1
+    mantissa = index - (shift << bits)
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of nanosecond latencies.
+
+    Educational Note:
+    Like an HDR histogram, buckets are linear within each power of two
+    (16 buckets between 1 and 2 ms, 16 between 2 and 4 ms, and so on), so
+    every recorded value is known to within 6.25% while the whole range
+    from 1 ns to about a minute needs only ~530 counters. Percentiles are
+    read from the cumulative counts without keeping any samples.
+
+    Usage:
+        hist = LatencyHistogram()
+        hist.record(elapsed_ns)
+        p99_ms = hist.percentile(99) / 1e6
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._counts = array('Q', bytes(8 * (bucket_index(MAX_TRACKED_NS) + 1)))
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, value_ns: int) -> None:
+        """
+        Record one latency.
+
+        Args:
+            value_ns: Latency in nanoseconds (negative values count as 0)
+        """
+        value_ns = max(0, value_ns)
+        self._counts[bucket_index(min(value_ns, MAX_TRACKED_NS))] += 1
+        if not self.count or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+        self.total_ns += value_ns
+
+    def percentile(self, q: float) -> int:
+        """
+        Get a percentile of the recorded latencies.
+
+        Args:
+            q: Percentile in [0, 100]
+
+        Returns:
+            Upper bound of the bucket holding that rank, in nanoseconds
+            (never above the largest recorded value; 0 if empty)
+        """
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(self.count * q / 100))
+        if rank >= self.count:
+            return self.max_ns
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bucket_upper(index), self.max_ns)
+        return self.max_ns
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean of the recorded latencies (0.0 if empty)."""
+        return self.total_ns / self.count if self.count else 0.0
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add the counts of another histogram to this one."""
+        if not other.count:
+            return
+        for index, bucket_count in enumerate(other._counts):
+            if bucket_count:
+                self._counts[index] += bucket_count
+        self.min_ns = other.min_ns if not self.count else min(self.min_ns, other.min_ns)
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+
+    def cumulative_counts(self, bounds_ns: Sequence[int]) -> List[int]:
+        """
+        Count the values at or below each bound (Prometheus ``le`` buckets).
+
+        Educational Note:
+        A value is counted against a bound only if its whole bucket lies at
+        or below it, so a latency just under a bound may be reported in the
+        next one up. Exported latencies can be overstated by at most the
+        bucket error, never understated.
+
+        Args:
+            bounds_ns: Ascending upper bounds in nanoseconds
+
+        Returns:
+            Cumulative counts, one per bound
+        """
+        counts = []
+        seen = 0
+        index = 0
+        for bound in bounds_ns:
+            while index < len(self._counts) and bucket_upper(index) <= bound:
+                seen += self._counts[index]
+                index += 1
+            counts.append(seen)
+        return counts
+
+    def reset(self) -> None:
+        """Forget all recorded values."""
+        for index in range(len(self._counts)):
+            self._counts[index] = 0
+        self.count = self.total_ns = self.min_ns = self.max_ns = 0
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Get the histogram summary in milliseconds.
+
+        Returns:
+            Dictionary with count, total, mean, min, p50, p90, p99 and max
+        """
+        return {
+            'count': self.count,
+            'total_ms': self.total_ns / 1e6,
+            'mean_ms': self.mean_ns / 1e6,
+            'min_ms': self.min_ns / 1e6,
+            'p50_ms': self.percentile(50) / 1e6,
+            'p90_ms': self.percentile(90) / 1e6,
+            'p99_ms': self.percentile(99) / 1e6,
+            'max_ms': self.max_ns / 1e6,
+        }
+
+
+def error_name(error: Any) -> str:
+    """
+    Short label for an exception or pymodbus error response.
+
+    Exception responses are labelled by code (for example
+    ``exception_0x0B``) so that gateway timeouts and refusals stay apart.
+    """
+    code = getattr(error, 'exception_code', None)
+    if isinstance(code, int):
+        return f"exception_0x{code:02X}"
+    return type(error).__name__
+
+
+class UnitMetrics:
+    """Counters and latency histogram of one Modbus unit."""
+
+    __slots__ = ('requests', 'successes', 'skipped', 'errors', 'retries', 'latency')
+
+    def __init__(self):
+        self.requests = 0
+        self.successes = 0
+        self.skipped = 0
+        self.errors: Counter = Counter()
+        self.retries: Counter = Counter()
+        self.latency = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the counters as a dictionary."""
+        return {
+            'requests': self.requests,
+            'successes': self.successes,
+            'errors': dict(self.errors),
+            'retries': dict(self.retries),
+            'skipped': self.skipped,
+            'latency': self.latency.snapshot(),
+        }
+
+
+class ClientMetrics:
+    """
+    Metrics registry of one client connection.
+
+    Educational Note:
+    A "request" is one transaction on the wire, so a read that needed two
+    retries counts three requests, two retries (labelled with the error
+    that caused them) and the errors of the failed attempts. The latency
+    histogram covers every request that got a response or timed out, so
+    its total is the time the unit cost the polling loop.
+
+    Usage:
+        metrics = ClientMetrics()
+        metrics.record_request(unit_id, elapsed_ns, error=None, registers=4)
+        print(metrics.snapshot()['units'][unit_id]['latency']['p99_ms'])
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.units: Dict[int, UnitMetrics] = {}
+        self.reconnects = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def unit(self, unit_id: int) -> UnitMetrics:
+        """Metrics of one unit (created on first use)."""
+        metrics = self.units.get(unit_id)
+        if metrics is None:
+            metrics = self.units[unit_id] = UnitMetrics()
+        return metrics
+
+    def record_request(self, unit_id: int, latency_ns: int, error: Optional[str] = None,
+                       registers: int = 0, answered: bool = True) -> None:
+        """
+        Record one request/response transaction.
+
+        Args:
+            unit_id: Unit the request was sent to
+            latency_ns: Time from send to response (or to giving up)
+            error: Error label if the request failed (see error_name)
+            registers: Registers returned (sizes the response on success)
+            answered: False if no response frame arrived at all
+        """
+        metrics = self.unit(unit_id)
+        metrics.requests += 1
+        metrics.latency.record(latency_ns)
+        self.bytes_sent += FC03_REQUEST_BYTES
+        if error is None:
+            metrics.successes += 1
+            self.bytes_received += FC03_RESPONSE_OVERHEAD + 2 * registers
+        else:
+            metrics.errors[error] += 1
+            if answered:
+                self.bytes_received += EXCEPTION_RESPONSE_BYTES
+
+    def record_retry(self, unit_id: int, reason: str) -> None:
+        """Record that a failed request is being retried."""
+        self.unit(unit_id).retries[reason] += 1
+
+    def record_skip(self, unit_id: int) -> None:
+        """Record a read skipped without network traffic (open circuit breaker)."""
+        self.unit(unit_id).skipped += 1
+
+    def totals(self) -> Dict[str, Any]:
+        """
+        Get counters summed over all units.
+
+        Returns:
+            Dictionary with request, success, error, retry and skip totals
+            and the merged latency summary
+        """
+        latency = LatencyHistogram()
+        errors: Counter = Counter()
+        retries: Counter = Counter()
+        for metrics in self.units.values():
+            latency.merge(metrics.latency)
+            errors.update(metrics.errors)
+            retries.update(metrics.retries)
+        return {
+            'requests': sum(m.requests for m in self.units.values()),
+            'successes': sum(m.successes for m in self.units.values()),
+            'errors': dict(errors),
+            'retries': dict(retries),
+            'skipped': sum(m.skipped for m in self.units.values()),
+            'latency': latency.snapshot(),
+        }
+
+    def busiest_units(self, count: int = 5) -> List[int]:
+        """Units that spent the most time on the wire, busiest first."""
+        return sorted(self.units, key=lambda u: self.units[u].latency.total_ns,
+                      reverse=True)[:count]
+
+    def reset(self) -> None:
+        """Forget all metrics."""
+        self.units.clear()
+        self.reconnects = self.bytes_sent = self.bytes_received = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get every metric as a dictionary.
+
+        Returns:
+            Dictionary with per-unit metrics, totals, reconnects and bytes
+        """
+        return {
+            'units': {unit_id: self.units[unit_id].snapshot() for unit_id in sorted(self.units)},
+            'totals': self.totals(),
+            'reconnects': self.reconnects,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+        }
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Streaming Quantile Sketches
+
+Bounded-memory percentile estimates (p50/p95/p99) for distance and signal
+quality. A sketch is a sparse log-linear histogram, the same bucketing as
+the client's LatencyHistogram but with finer buckets: memory depends on
+how widely the values spread, never on how many were added. Sliding
+windows are built from panes, one sketch per slice of time, so old data
+is dropped a whole pane at a time.
+
+Educational Focus:
+- Quantiles from histograms with bounded relative error
+- Mergeable summaries for windows and shards
+- Sliding windows without per-sample eviction
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from .metrics import bucket_index, bucket_lower, bucket_upper
+
+# 64 linear buckets per power of two: bucket width at most 1/64 (1.6%) of
+# the value, so the midpoint estimate is within 0.8%. Values below 128
+# (signal quality, short distances) are counted exactly.
+DEFAULT_PRECISION_BITS = 6
+
+# Percentiles reported by default
+DEFAULT_QUANTILES = (50, 95, 99)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch of non-negative values.
+
+    Educational Note:
+    Exact percentiles need every sample. Counting samples per bucket
+    instead, with bucket widths proportional to the value, bounds the
+    relative error of every percentile while keeping one counter per
+    occupied bucket. A radar distance that moves between 1 and 2 m
+    occupies at most 64 buckets however long it is watched. Two sketches
+    merge by adding their counts, which makes panes and shards cheap.
+
+    Usage:
+        sketch = QuantileSketch()
+        for reading in readings:
+            sketch.add(reading.distance_mm)
+        p99 = sketch.quantile(99)
+    """
+
+    __slots__ = ('bits', 'counts', 'count', 'min', 'max')
+
+    def __init__(self, bits: int = DEFAULT_PRECISION_BITS):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            bits: log2 of the buckets per power of two (precision)
+        """
+        self.bits = bits
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def add(self, value: float) -> None:
+        """
+        Add one value.
+
+        Args:
+            value: Non-negative value (rounded to an integer; negative
+                values count as 0)
+        """
+        value = max(0, int(round(value)))
+        index = bucket_index(value, self.bits)
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+        self.count += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Add the values of another sketch.
+
+        Args:
+            other: Sketch with the same precision (left unchanged)
+
+        Returns:
+            self
+
+        Raises:
+            ValueError: If the precisions differ
+        """
+        if other.bits != self.bits:
+            raise ValueError(f"Cannot merge sketches of precision {other.bits} and {self.bits}")
+        if not other.count:
+            return self
+        counts = self.counts
+        for index, count in other.counts.items():
+            counts[index] = counts.get(index, 0) + count
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a percentile.
+
+        Args:
+            q: Percentile in [0, 100]
+
+        Returns:
+            Midpoint of the bucket holding that rank, clamped to the
+            observed range (None if the sketch is empty)
+        """
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs: Iterable[float] = DEFAULT_QUANTILES) -> List[Optional[float]]:
+        """
+        Estimate several percentiles with one pass over the buckets.
+
+        Args:
+            qs: Percentiles in [0, 100]
+
+        Returns:
+            Estimates in the order of ``qs`` (None if the sketch is empty)
+        """
+        qs = list(qs)
+        if not self.count:
+            return [None] * len(qs)
+
+        # Smallest rank r with r >= count * q / 100, as for LatencyHistogram
+        ranks = sorted((max(1, -(-self.count * q // 100)), i) for i, q in enumerate(qs))
+        results: List[Optional[float]] = [None] * len(qs)
+        bits = self.bits
+        seen = 0
+        pending = 0
+        # The top rank is the largest value, which is known exactly
+        last = len(ranks)
+        while last and ranks[last - 1][0] >= self.count:
+            last -= 1
+            results[ranks[last][1]] = float(self.max)
+        ranks = ranks[:last]
+        for index in sorted(self.counts):
+            if pending == len(ranks):
+                break
+            seen += self.counts[index]
+            while pending < len(ranks) and ranks[pending][0] <= seen:
+                middle = (bucket_lower(index, bits) + bucket_upper(index, bits)) / 2
+                results[ranks[pending][1]] = min(max(middle, self.min), self.max)
+                pending += 1
+        return results
+
+    def snapshot(self, qs: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Optional[float]]:
+        """
+        Get percentiles as a dictionary.
+
+        Returns:
+            Dictionary like {'p50': ..., 'p95': ..., 'p99': ...}
+        """
+        qs = list(qs)
+        return {f"p{q:g}": value for q, value in zip(qs, self.quantiles(qs))}
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class WindowedQuantiles:
+    """
+    Quantile sketch over a sliding time window.
+
+    Educational Note:
+    The window is divided into ``panes`` slices with one sketch each.
+    A value lands in the pane of its timestamp; once the newest pane is a
+    whole window ahead of a pane, that pane is dropped. Queries merge the
+    live panes, so the window covers between ``window`` and ``window``
+    plus one pane of data, and memory is at most ``panes + 1`` sketches.
+    Timestamps come from the readings, which makes replays of recorded
+    sessions produce the same windows as the live run.
+
+    Usage:
+        p = WindowedQuantiles(window=60.0)
+        p.add(reading.distance_mm, reading.ts_ns)
+        p.snapshot()   # {'p50': ..., 'p95': ..., 'p99': ...} of the last minute
+    """
+
+    def __init__(self, window: Optional[float] = 60.0, panes: int = 6,
+                 bits: int = DEFAULT_PRECISION_BITS):
+        """
+        Initialize the window.
+
+        Args:
+            window: Window length in seconds (None: everything ever added)
+            panes: Slices the window is divided into
+            bits: Sketch precision (see QuantileSketch)
+
+        Raises:
+            ValueError: If window or panes is not positive
+        """
+        if window is not None and window <= 0:
+            raise ValueError(f"Window must be positive, got {window}")
+        if panes < 1:
+            raise ValueError(f"Panes must be at least 1, got {panes}")
+        self.window = window
+        self.panes = panes
+        self.bits = bits
+        self._pane_ns = int(window * 1e9 / panes) if window is not None else 0
+        # Pane number -> sketch, oldest first
+        self._sketches: Dict[int, QuantileSketch] = {}
+        self._newest = 0
+
+    def _pane(self, ts_ns: int) -> int:
+        return ts_ns // self._pane_ns if self._pane_ns else 0
+
+    def _expire(self) -> None:
+        oldest = self._newest - self.panes
+        for pane in [p for p in self._sketches if p < oldest]:
+            del self._sketches[pane]
+
+    def add(self, value: float, ts_ns: int) -> None:
+        """
+        Add one value.
+
+        Args:
+            value: Non-negative value
+            ts_ns: Timestamp of the value (nanoseconds since the epoch)
+        """
+        pane = self._pane(ts_ns)
+        if not self._sketches or pane > self._newest:
+            self._newest = pane
+            self._expire()
+        elif pane < self._newest - self.panes:
+            return   # older than the window
+        sketch = self._sketches.get(pane)
+        if sketch is None:
+            sketch = self._sketches[pane] = QuantileSketch(self.bits)
+        sketch.add(value)
+
+    def merge(self, other: 'WindowedQuantiles') -> 'WindowedQuantiles':
+        """
+        Add the panes of another window with the same configuration.
+
+        Args:
+            other: Window to merge into this one (left unchanged)
+
+        Returns:
+            self
+
+        Raises:
+            ValueError: If the windows are configured differently
+        """
+        if (other.window, other.panes, other.bits) != (self.window, self.panes, self.bits):
+            raise ValueError("Cannot merge windows with different configurations")
+        for pane, sketch in other._sketches.items():
+            self._sketches.setdefault(pane, QuantileSketch(self.bits)).merge(sketch)
+        if other._sketches:
+            self._newest = max(self._newest, other._newest) if self._sketches else other._newest
+        self._expire()
+        return self
+
+    def sketch(self) -> QuantileSketch:
+        """Get one sketch of everything in the window."""
+        merged = QuantileSketch(self.bits)
+        for sketch in self._sketches.values():
+            merged.merge(sketch)
+        return merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a percentile of the window (None if empty)."""
+        return self.sketch().quantile(q)
+
+    def snapshot(self, qs: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Optional[float]]:
+        """Get percentiles of the window as a dictionary."""
+        return self.sketch().snapshot(qs)
+
+    def __len__(self) -> int:
+        """Number of values in the window."""
+        return sum(sketch.count for sketch in self._sketches.values())
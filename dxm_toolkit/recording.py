@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Append-Only Binary Recordings of Monitoring Sessions
+
+A recording is a sequence of fixed-size 24-byte slots. Almost every slot
+is one packed reading (timestamp, host id, unit, the 4 raw registers and
+flags); the rest are header blocks (the host table, repeated
+periodically) and checkpoints (record count and CRC32 of the records
+since the previous checkpoint). Records are written as each monitoring
+cycle completes, so a session costs constant memory, survives being
+killed at any point, and can be read back through mmap without parsing.
+
+Layout:
+    slot 0            file header: magic, version, slot size, creation time
+    'H' slot + body   header block: JSON host table, padded to whole slots
+    'R' slot          one reading
+    'C' slot          checkpoint
+
+Educational Focus:
+- Fixed-width records for append-only logs
+- Crash safety through incremental writes and checksummed checkpoints
+- Memory-mapped, zero-parse reading of large captures
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import (TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, NamedTuple, Optional,
+                    Tuple, Union)
+
+from .sensor_decoder import SensorDecoder, SensorReading
+
+if TYPE_CHECKING:
+    from .batch import ReadingBatch
+
+MAGIC = b'DXMREC\x00\x01'
+VERSION = 1
+SLOT_SIZE = 24
+
+KIND_RECORD = ord('R')
+KIND_HEADER = ord('H')
+KIND_CHECKPOINT = ord('C')
+
+# Record flag bits
+FLAG_FAILED = 0x01   # The read failed; only ts_ns, host and unit are meaningful
+FLAG_VALID = 0x02    # The reading was marked valid by the decoder
+
+# Slot layouts (each exactly SLOT_SIZE bytes)
+FILE_HEADER = struct.Struct('<8sHHq4x')          # magic, version, slot size, created ns (+pad to 24)
+RECORD = struct.Struct('<BBBxHxxq4H')            # kind, unit, flags, host id, ts_ns, registers
+HEADER = struct.Struct('<BxHIq8x')               # kind, version, payload bytes, written ns
+CHECKPOINT = struct.Struct('<BxxxIqQ')           # kind, crc32, written ns, total records
+
+# Kind bytes that end a run of records
+_NON_RECORD = re.compile(b'[^R]')
+
+
+class RecordingError(Exception):
+    """Raised when a file is not a readable recording."""
+    pass
+
+
+class RecordedReading(NamedTuple):
+    """One raw record of a recording."""
+    ts_ns: int
+    host: Optional[str]
+    unit_id: int
+    registers: Tuple[int, int, int, int]
+    flags: int
+
+    @property
+    def failed(self) -> bool:
+        """Whether the read failed when it was recorded."""
+        return bool(self.flags & FLAG_FAILED)
+
+
+def _padded(length: int) -> int:
+    """Bytes needed to hold ``length`` bytes in whole slots."""
+    return -(-length // SLOT_SIZE) * SLOT_SIZE
+
+
+class RecordingWriter:
+    """
+    Incremental writer of a recording.
+
+    Educational Note:
+    Each monitoring cycle is packed into a few 24-byte slots and handed
+    to the OS in one write, so a crash loses at most the cycle being
+    written. Every ``checkpoint_every`` records (or ``checkpoint_interval``
+    seconds) a checkpoint stores a CRC32 of the records since the last
+    one and the file is fsynced, which bounds what a power failure can
+    lose and lets a reader verify the data. The host table is repeated in
+    a header block every ``header_every`` records so any stretch of a
+    multi-day capture is self-describing.
+
+    Usage:
+        with RecordingWriter("session.dxmrec") as recorder:
+            for readings in client.monitor_sensors(units, recorder=recorder):
+                ...
+    """
+
+    def __init__(self, path: Union[str, Path], checkpoint_every: int = 1000,
+                 checkpoint_interval: float = 10.0, header_every: int = 100_000,
+                 fsync: bool = True):
+        """
+        Open a recording for appending (created if missing).
+
+        Args:
+            path: Recording file
+            checkpoint_every: Records between checkpoints
+            checkpoint_interval: Maximum seconds between checkpoints
+            header_every: Records between repeated header blocks
+            fsync: Whether checkpoints force the data to disk
+
+        Raises:
+            RecordingError: If the file exists but is not a recording
+        """
+        self.path = Path(path)
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self.header_every = header_every
+        self.fsync = fsync
+
+        self.hosts: Dict[str, int] = {}
+        self.records = 0
+        self._crc = 0
+        self._since_checkpoint = 0
+        self._since_header = 0
+        self._last_checkpoint = time.monotonic()
+
+        if self.path.exists() and self.path.stat().st_size > 0:
+            self._resume()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'wb')
+            self._file.write(FILE_HEADER.pack(MAGIC, VERSION, SLOT_SIZE, time.time_ns()))
+            self._write_header()
+            self._file.flush()
+
+    def _resume(self) -> None:
+        """Continue an existing recording after its last complete slot."""
+        with RecordingReader(self.path) as reader:
+            self.hosts = {name: host_id for host_id, name in reader.hosts.items()}
+            self.records = len(reader)
+            end = reader.end_offset
+            # Records after the last checkpoint are covered by the next one
+            last = reader.checkpoints[-1][0] if reader.checkpoints else 0
+            for start, stop in reader.runs:
+                if start > last:
+                    self._crc = zlib.crc32(reader._mm[start:stop], self._crc)
+                    self._since_checkpoint += (stop - start) // SLOT_SIZE
+        self._file = open(self.path, 'r+b')
+        # Drop a torn trailing slot or block left by a crash
+        self._file.truncate(end)
+        self._file.seek(end)
+        self._write_header()
+
+    def _write_header(self) -> None:
+        payload = json.dumps({'hosts': {str(i): h for h, i in self.hosts.items()}}).encode('utf-8')
+        self._file.write(HEADER.pack(KIND_HEADER, VERSION, len(payload), time.time_ns()))
+        self._file.write(payload.ljust(_padded(len(payload)), b' '))
+        self._since_header = 0
+
+    def host_id(self, host: Optional[str]) -> int:
+        """Id of a host name in this recording (registered on first use)."""
+        host = host or ''
+        host_id = self.hosts.get(host)
+        if host_id is None:
+            host_id = self.hosts[host] = len(self.hosts)
+            self._write_header()
+        return host_id
+
+    def write(self, unit_id: int, reading: Optional[SensorReading],
+              host: Optional[str] = None, ts_ns: Optional[int] = None) -> None:
+        """
+        Append one reading (or a failed read when reading is None).
+
+        Args:
+            unit_id: Unit that was read
+            reading: The reading, or None if the read failed
+            host: Controller name (defaults to the reading's host tag)
+            ts_ns: Time of a failed read (default: now)
+        """
+        self.write_cycle({unit_id: reading}, host, ts_ns)
+
+    def write_cycle(self, readings: Mapping[int, Optional[SensorReading]],
+                    host: Optional[str] = None, ts_ns: Optional[int] = None) -> None:
+        """
+        Append one monitoring cycle in a single write.
+
+        Args:
+            readings: Unit ID -> reading (None for failed reads)
+            host: Controller name (defaults to each reading's host tag)
+            ts_ns: Time recorded for failed reads (default: now)
+        """
+        if ts_ns is None:
+            ts_ns = time.time_ns()
+        chunk = bytearray()
+        for unit_id, reading in readings.items():
+            if reading is None:
+                chunk += RECORD.pack(KIND_RECORD, unit_id, FLAG_FAILED, self.host_id(host),
+                                     ts_ns, 0, 0, 0, 0)
+            else:
+                chunk += RECORD.pack(KIND_RECORD, unit_id,
+                                     FLAG_VALID if reading.valid else 0,
+                                     self.host_id(host or reading.host), reading.ts_ns,
+                                     reading.status_raw, reading.bdc_states,
+                                     reading.distance_raw, reading.signal_quality & 0xFFFF)
+
+        self._file.write(chunk)
+        count = len(readings)
+        self._crc = zlib.crc32(chunk, self._crc)
+        self.records += count
+        self._since_checkpoint += count
+        self._since_header += count
+
+        if (self._since_checkpoint >= self.checkpoint_every or
+                time.monotonic() - self._last_checkpoint >= self.checkpoint_interval):
+            self.checkpoint()
+        if self._since_header >= self.header_every:
+            self._write_header()
+        self._file.flush()
+
+    def checkpoint(self) -> None:
+        """Write a checkpoint for the records since the last one and sync."""
+        self._file.write(CHECKPOINT.pack(KIND_CHECKPOINT, self._crc, time.time_ns(),
+                                         self.records))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._crc = 0
+        self._since_checkpoint = 0
+        self._last_checkpoint = time.monotonic()
+
+    def close(self) -> None:
+        """Write a final checkpoint and close the file."""
+        if self._file.closed:
+            return
+        if self._since_checkpoint:
+            self.checkpoint()
+        self._file.close()
+
+    def __enter__(self) -> 'RecordingWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class RecordingReader:
+    """
+    Memory-mapped reader of a recording.
+
+    Educational Note:
+    The first byte of every slot is its kind, so ``mm[0::24]`` yields the
+    kinds of all slots in one C-level slice. Header and checkpoint slots
+    are found with a regex over that string; everything between them is a
+    contiguous run of records that ``struct.iter_unpack`` decodes straight
+    from the mapped file. Opening a multi-day capture reads only the
+    kind bytes, and the records themselves stay in the page cache.
+
+    Usage:
+        with RecordingReader("session.dxmrec") as recording:
+            for record in recording:
+                print(record.ts_ns, record.unit_id, record.registers)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Map a recording and index its blocks.
+
+        Raises:
+            RecordingError: If the file is not a recording or a header is corrupt
+        """
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < FILE_HEADER.size:
+            self._file.close()
+            raise RecordingError(f"{self.path} is too short to be a recording")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, slot_size, self.created_ns = FILE_HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or slot_size != SLOT_SIZE:
+            self.close()
+            raise RecordingError(f"{self.path} is not a DXM recording")
+        if version > VERSION:
+            self.close()
+            raise RecordingError(f"{self.path} uses recording version {version}, "
+                                 f"this toolkit reads up to {VERSION}")
+
+        self.hosts: Dict[int, str] = {}
+        self.runs: List[Tuple[int, int]] = []
+        self.checkpoints: List[Tuple[int, int, int, int]] = []
+        self.end_offset = SLOT_SIZE
+        try:
+            self._index(size - size % SLOT_SIZE)
+        except RecordingError:
+            self.close()
+            raise
+
+    def _index(self, end: int) -> None:
+        """Find record runs, headers and checkpoints up to ``end``."""
+        kinds = self._mm[SLOT_SIZE:end:SLOT_SIZE]
+        run_start = SLOT_SIZE
+        resume = 0
+        for match in _NON_RECORD.finditer(kinds):
+            slot = match.start()
+            if slot < resume:
+                continue   # Inside a header body
+            offset = SLOT_SIZE + slot * SLOT_SIZE
+            if offset > run_start:
+                self.runs.append((run_start, offset))
+            kind = kinds[slot]
+
+            if kind == KIND_HEADER:
+                _, _, length, _ = HEADER.unpack_from(self._mm, offset)
+                body_end = offset + SLOT_SIZE + _padded(length)
+                if body_end > end:
+                    self.end_offset = offset
+                    return   # Torn header block: the data ends before it
+                try:
+                    table = json.loads(self._mm[offset + SLOT_SIZE:offset + SLOT_SIZE + length])
+                    self.hosts.update({int(i): h for i, h in table['hosts'].items()})
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    # Covers JSONDecodeError and UnicodeDecodeError
+                    raise RecordingError(f"{self.path} has a corrupt header "
+                                         f"at offset {offset}: {e}") from e
+                next_offset = body_end
+            elif kind == KIND_CHECKPOINT:
+                _, crc, written_ns, total = CHECKPOINT.unpack_from(self._mm, offset)
+                self.checkpoints.append((offset, crc, written_ns, total))
+                next_offset = offset + SLOT_SIZE
+            else:
+                self.end_offset = offset
+                return     # Unknown slot: treat as the end of the readable data
+
+            run_start = next_offset
+            resume = (next_offset - SLOT_SIZE) // SLOT_SIZE
+
+        if end > run_start:
+            self.runs.append((run_start, end))
+        self.end_offset = max(run_start, end)
+
+    def __len__(self) -> int:
+        return sum(end - start for start, end in self.runs) // SLOT_SIZE
+
+    def __iter__(self) -> Iterator[RecordedReading]:
+        """Iterate over every record in file order."""
+        hosts = self.hosts
+        for start, end in self.runs:
+            for _, unit_id, flags, host_id, ts_ns, r0, r1, r2, r3 in \
+                    RECORD.iter_unpack(self._mm[start:end]):
+                yield RecordedReading(ts_ns, hosts.get(host_id) or None, unit_id,
+                                      (r0, r1, r2, r3), flags)
+
+    def cycles(self) -> Iterator[List[RecordedReading]]:
+        """
+        Iterate over the records grouped into monitoring cycles.
+
+        Educational Note:
+        Cycles are not stored explicitly. A cycle is a run of consecutive
+        records from one host in which no unit appears twice, which is
+        exactly what write_cycle() produces.
+        """
+        current: List[RecordedReading] = []
+        seen = set()
+        host = None
+        for record in self:
+            if current and (record.host != host or record.unit_id in seen):
+                yield current
+                current = []
+                seen.clear()
+            host = record.host
+            seen.add(record.unit_id)
+            current.append(record)
+        if current:
+            yield current
+
+    def readings(self, decoder: Optional[SensorDecoder] = None) -> Iterator[SensorReading]:
+        """
+        Iterate over the successful reads as SensorReading objects.
+
+        Args:
+            decoder: Decoder for the status mapping (default: SensorDecoder())
+        """
+        decoder = decoder or SensorDecoder()
+        for record in self:
+            if not record.failed:
+                reading = decoder.decode_registers(record.unit_id, record.registers, record.ts_ns)
+                yield reading.with_host(record.host) if record.host else reading
+
+    def to_batch(self) -> 'ReadingBatch':
+        """Load the successful reads into a columnar ReadingBatch."""
+        from .batch import decode_register_blocks
+
+        records = [record for record in self if not record.failed]
+        return decode_register_blocks([r.unit_id for r in records],
+                                      [r.registers for r in records],
+                                      [r.ts_ns for r in records])
+
+    def verify(self) -> Dict[str, Any]:
+        """
+        Check every checkpoint against the records before it.
+
+        Returns:
+            Dictionary with record, checkpoint and verified counts, the
+            offsets of checkpoints whose CRC does not match, and the
+            number of records after the last checkpoint
+        """
+        bad = []
+        verified = 0
+        crc = 0
+        pending = 0
+        runs = iter(self.runs)
+        run = next(runs, None)
+        for offset, expected, _, total in self.checkpoints:
+            while run is not None and run[1] <= offset:
+                crc = zlib.crc32(self._mm[run[0]:run[1]], crc)
+                pending += (run[1] - run[0]) // SLOT_SIZE
+                run = next(runs, None)
+            if crc != expected:
+                bad.append(offset)
+            else:
+                verified += pending
+            crc = 0
+            pending = 0
+        return {
+            'records': len(self),
+            'checkpoints': len(self.checkpoints),
+            'verified_records': verified,
+            'corrupt_checkpoints': bad,
+            'unverified_tail': len(self) - (self.checkpoints[-1][3] if self.checkpoints else 0),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Summary of the recording (records, hosts, units, time span, size)."""
+        first = last = None
+        units = set()
+        for record in self:
+            if first is None:
+                first = record.ts_ns
+            last = record.ts_ns
+            units.add((record.host, record.unit_id))
+        return {
+            'records': len(self),
+            'hosts': sorted(h for h in self.hosts.values() if h),
+            'units': sorted(units, key=lambda u: (u[0] or '', u[1])),
+            'first_ns': first,
+            'last_ns': last,
+            'bytes': self.end_offset,
+        }
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if getattr(self, '_mm', None) is not None and not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> 'RecordingReader':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
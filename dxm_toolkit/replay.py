@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Replay of Recorded Monitoring Sessions
+
+Feeds the raw registers of a recording (see recording.py) back through
+SensorDecoder and validation, one monitoring cycle at a time, so the
+analytics and display path can be exercised offline. Cycles are released
+at their recorded pace scaled by a speed factor, or as fast as the
+consumer takes them.
+
+Educational Focus:
+- Deterministic offline testing of a live data path
+- Time scaling against a monotonic clock
+- Measuring how far above real time a pipeline can run
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .recording import RecordingReader
+from .sensor_decoder import SensorDecoder, SensorReading
+
+
+def parse_speed(text: str) -> Optional[float]:
+    """
+    Parse a replay speed.
+
+    Args:
+        text: "max" (no pacing) or a factor such as "10x", "10" or "0.5x"
+
+    Returns:
+        Speed factor, or None for as fast as possible
+
+    Raises:
+        ValueError: If the speed is not "max" or a positive number
+    """
+    text = text.strip().lower()
+    if text == 'max':
+        return None
+    try:
+        speed = float(text[:-1] if text.endswith('x') else text)
+    except ValueError:
+        raise ValueError(f"Speed must be 'max' or a factor like '10x', got '{text}'")
+    if speed <= 0:
+        raise ValueError(f"Speed must be positive, got {speed}")
+    return speed
+
+
+@dataclass
+class ReplayTiming:
+    """
+    Timing of one replayed cycle.
+
+    Attributes:
+        cycle: Cycle number (from 0)
+        recorded_ns: Recorded timestamp of the cycle's first reading
+        lag_ns: How late the cycle was released against the scaled
+            recording clock (0 when unpaced or on time)
+    """
+    cycle: int
+    recorded_ns: int
+    lag_ns: int
+
+    @property
+    def lag_ms(self) -> float:
+        """Release lag in milliseconds."""
+        return self.lag_ns / 1e6
+
+
+class RecordingReplayer:
+    """
+    Replays a recording as monitoring cycles.
+
+    Educational Note:
+    Each cycle is due at ``start + (recorded_ts - first_ts) / speed`` on
+    the monotonic clock. Like DeadlineScheduler, deadlines are absolute,
+    so time spent by the consumer of one cycle does not push the later
+    ones back; if the consumer cannot keep up, cycles are released late
+    (and the lag is reported) rather than dropped. With ``speed=None``
+    there is no waiting at all and the replay measures the throughput of
+    whatever consumes it.
+
+    Usage:
+        with RecordingReader("session.dxmrec") as recording:
+            replayer = RecordingReplayer(recording, speed=10.0)
+            for readings in replayer.cycles():
+                ...
+    """
+
+    def __init__(self, recording: RecordingReader, speed: Optional[float] = 1.0,
+                 decoder: Optional[SensorDecoder] = None, validate: bool = True,
+                 clock: Callable[[], int] = time.monotonic_ns,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize the replayer.
+
+        Args:
+            recording: Open recording to replay
+            speed: Time scale (2.0 = twice real time), None for no pacing
+            decoder: Decoder for the raw registers (default: SensorDecoder())
+            validate: Run SensorDecoder.validate_reading on every reading
+            clock: Nanosecond monotonic clock (replaceable for testing)
+            sleep: Sleep function (replaceable for testing)
+
+        Raises:
+            ValueError: If speed is not positive
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"Speed must be positive, got {speed}")
+        self.recording = recording
+        self.speed = speed
+        self.decoder = decoder or SensorDecoder()
+        self.validate = validate
+        self._clock = clock
+        self._sleep = sleep
+
+        self.last_timing: Optional[ReplayTiming] = None
+        self.validation_issues: Dict[int, int] = {}
+        self._cycles = 0
+        self._readings = 0
+        self._failed = 0
+        self._max_lag_ns = 0
+        self._first_ns: Optional[int] = None
+        self._last_ns: Optional[int] = None
+        self._started: Optional[int] = None
+        self._finished: Optional[int] = None
+
+    def cycles(self) -> Iterator[Dict[int, Optional[SensorReading]]]:
+        """
+        Replay the recording.
+
+        Yields:
+            Dictionary mapping unit IDs to readings (None for reads that
+            failed when recorded), like DXMClient.monitor_sensors
+        """
+        decoder = self.decoder
+        self._started = self._clock()
+
+        for number, records in enumerate(self.recording.cycles()):
+            recorded_ns = records[0].ts_ns
+            if self._first_ns is None:
+                self._first_ns = recorded_ns
+            self._last_ns = recorded_ns
+
+            lag = 0
+            if self.speed is not None:
+                due = self._started + int((recorded_ns - self._first_ns) / self.speed)
+                now = self._clock()
+                if due > now:
+                    self._sleep((due - now) / 1e9)
+                else:
+                    lag = now - due
+            self._max_lag_ns = max(self._max_lag_ns, lag)
+
+            readings: Dict[int, Optional[SensorReading]] = {}
+            for record in records:
+                if record.failed:
+                    readings[record.unit_id] = None
+                    self._failed += 1
+                    continue
+                reading = decoder.decode_registers(record.unit_id, record.registers, record.ts_ns)
+                if record.host:
+                    reading = reading.with_host(record.host)
+                if self.validate and decoder.validate_reading(reading):
+                    self.validation_issues[record.unit_id] = \
+                        self.validation_issues.get(record.unit_id, 0) + 1
+                readings[record.unit_id] = reading
+
+            self._cycles += 1
+            self._readings += len(records)
+            self.last_timing = ReplayTiming(number, recorded_ns, lag)
+            yield readings
+
+        self._finished = self._clock()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get replay statistics.
+
+        Returns:
+            Dictionary with cycle and reading counts, recorded span, wall
+            time, effective speed, readings per second and maximum lag
+        """
+        end = self._finished if self._finished is not None else self._clock()
+        elapsed = (end - self._started) / 1e9 if self._started is not None else 0.0
+        span = ((self._last_ns - self._first_ns) / 1e9
+                if self._first_ns is not None else 0.0)
+        return {
+            'speed': self.speed,
+            'cycles': self._cycles,
+            'readings': self._readings,
+            'failed_reads': self._failed,
+            'validation_issues': sum(self.validation_issues.values()),
+            'recorded_span_s': span,
+            'elapsed_s': elapsed,
+            'effective_speed': span / elapsed if elapsed > 0 else 0.0,
+            'readings_per_s': self._readings / elapsed if elapsed > 0 else 0.0,
+            'max_lag_ms': self._max_lag_ns / 1e6,
+        }
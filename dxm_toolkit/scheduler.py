@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Drift-Free Deadline Scheduler for Polling Loops
+
+Schedules polling cycles on an absolute grid of deadlines measured with
+time.monotonic_ns(), so per-cycle work, consumer time and rounding never
+accumulate into drift. Overruns are handled by an explicit policy and
+counted, and the start jitter of every cycle is measured.
+
+Educational Focus:
+- Relative sleeps versus absolute deadlines
+- Monotonic clocks versus wall-clock time
+- Overrun policies in periodic real-time loops
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, Optional, Union
+
+
+class OverrunPolicy(Enum):
+    """
+    What to do when a cycle starts after its deadline.
+
+    Educational Note:
+    - SKIP drops the deadlines that already passed and waits for the next
+      one on the original grid, so samples stay evenly spaced.
+    - CATCH_UP runs the late cycles back to back until the schedule is
+      met again, so no sample slot is lost.
+    - STRETCH starts a new grid at the moment the late cycle begins, the
+      same behaviour as a relative ``sleep(interval)`` loop.
+    """
+    SKIP = "skip"
+    CATCH_UP = "catch_up"
+    STRETCH = "stretch"
+
+
+@dataclass
+class CycleTiming:
+    """
+    Timing of one scheduled cycle.
+
+    Attributes:
+        cycle: Zero-based cycle number
+        deadline_ns: Monotonic time the cycle was scheduled to start
+        started_ns: Monotonic time the cycle actually started
+        jitter_ns: Start lateness (started_ns - deadline_ns)
+        missed: Deadlines missed just before this cycle
+    """
+    cycle: int
+    deadline_ns: int
+    started_ns: int
+    jitter_ns: int
+    missed: int
+
+    @property
+    def jitter_ms(self) -> float:
+        """Start jitter in milliseconds."""
+        return self.jitter_ns / 1e6
+
+
+class DeadlineScheduler:
+    """
+    Absolute-deadline scheduler for periodic polling.
+
+    Educational Note:
+    ``sleep(interval - cycle_time)`` measures from when the cycle *ended*,
+    so any time spent outside the measured window (the consumer of a
+    generator, scheduler wake-up latency, rounding) pushes every later
+    sample back a little. Deadlines at ``start + n * interval`` do not
+    depend on when the previous cycle ended, so errors never accumulate.
+    The monotonic clock is immune to NTP steps and manual clock changes.
+
+    Usage:
+        scheduler = DeadlineScheduler(1.0, "skip")
+        while True:
+            timing = scheduler.wait()
+            do_cycle()
+    """
+
+    def __init__(self, interval: float,
+                 policy: Union[OverrunPolicy, str] = OverrunPolicy.SKIP,
+                 clock: Callable[[], int] = time.monotonic_ns):
+        """
+        Initialize the scheduler.
+
+        Args:
+            interval: Cycle period in seconds
+            policy: Overrun policy (OverrunPolicy or its string value)
+            clock: Nanosecond monotonic clock (replaceable for testing)
+
+        Raises:
+            ValueError: If interval is not positive or policy is unknown
+        """
+        if interval <= 0:
+            raise ValueError(f"Interval must be positive, got {interval}")
+
+        self.interval = interval
+        self.policy = OverrunPolicy(policy)
+        self._clock = clock
+        self._interval_ns = int(round(interval * 1e9))
+
+        self._next_deadline: Optional[int] = None
+        self._start_ns: Optional[int] = None
+        self.last_timing: Optional[CycleTiming] = None
+
+        # Running statistics
+        self.cycles = 0
+        self.overruns = 0
+        self.missed_deadlines = 0
+        self._jitter_sum_ns = 0
+        self._jitter_max_ns = 0
+
+    def elapsed(self) -> float:
+        """Seconds since the first cycle started (0.0 before it)."""
+        if self._start_ns is None:
+            return 0.0
+        return (self._clock() - self._start_ns) / 1e9
+
+    def _schedule(self) -> int:
+        """
+        Fix the deadline of the next cycle according to the overrun policy.
+
+        Returns:
+            Nanoseconds to wait before the next cycle may start
+        """
+        now = self._clock()
+
+        if self._next_deadline is None:
+            # First cycle starts immediately and anchors the grid
+            self._next_deadline = now
+            self._start_ns = now
+            return 0
+
+        deadline = self._next_deadline
+        if now > deadline:
+            self.overruns += 1
+            if self.policy is OverrunPolicy.SKIP:
+                skipped = (now - deadline) // self._interval_ns + 1
+                self.missed_deadlines += skipped
+                deadline += skipped * self._interval_ns
+            elif self.policy is OverrunPolicy.CATCH_UP:
+                self.missed_deadlines += 1
+            else:
+                self.missed_deadlines += 1
+                deadline = now
+            self._next_deadline = deadline
+
+        return max(0, deadline - now)
+
+    def _begin_cycle(self, missed_before: int) -> CycleTiming:
+        """Record the start of a cycle and advance the grid."""
+        started = self._clock()
+        deadline = self._next_deadline
+        jitter = started - deadline
+
+        timing = CycleTiming(
+            cycle=self.cycles,
+            deadline_ns=deadline,
+            started_ns=started,
+            jitter_ns=jitter,
+            missed=self.missed_deadlines - missed_before
+        )
+
+        self.cycles += 1
+        self._jitter_sum_ns += abs(jitter)
+        self._jitter_max_ns = max(self._jitter_max_ns, abs(jitter))
+        self._next_deadline = deadline + self._interval_ns
+        self.last_timing = timing
+        return timing
+
+    def wait(self) -> CycleTiming:
+        """
+        Block until the next cycle's deadline, then start the cycle.
+
+        Returns:
+            CycleTiming for the cycle that is starting
+        """
+        missed_before = self.missed_deadlines
+        delay_ns = self._schedule()
+        if delay_ns > 0:
+            time.sleep(delay_ns / 1e9)
+        return self._begin_cycle(missed_before)
+
+    async def wait_async(self) -> CycleTiming:
+        """
+        asyncio version of wait().
+
+        Returns:
+            CycleTiming for the cycle that is starting
+        """
+        missed_before = self.missed_deadlines
+        delay_ns = self._schedule()
+        if delay_ns > 0:
+            await asyncio.sleep(delay_ns / 1e9)
+        return self._begin_cycle(missed_before)
+
+    def stats(self) -> Dict[str, Union[int, float, str]]:
+        """
+        Get running scheduler statistics.
+
+        Returns:
+            Dictionary with cycle, overrun, missed-deadline and jitter figures
+        """
+        return {
+            'interval': self.interval,
+            'policy': self.policy.value,
+            'cycles': self.cycles,
+            'overruns': self.overruns,
+            'missed_deadlines': self.missed_deadlines,
+            'mean_jitter_ms': (self._jitter_sum_ns / self.cycles / 1e6) if self.cycles else 0.0,
+            'max_jitter_ms': self._jitter_max_ns / 1e6
+        }
@@ -13,13 +13,17 @@ Educational Focus:
 - Status code interpretation and error handling
 """
 
-from dataclasses import dataclass
+import struct
+import time
 from enum import Enum, IntEnum
-from typing import Dict, List, Optional, Any, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Union
 from datetime import datetime
 
 from .utils import format_distance, format_signal_quality, format_bdc_states
 
+if TYPE_CHECKING:
+    from .batch import ReadingBatch
+
 
 class SensorStatus(IntEnum):
     """
@@ -40,58 +44,174 @@ class SensorStatus(IntEnum):
     UNKNOWN = -1          # Unrecognized status code
 
 
-@dataclass
+NS_PER_SECOND = 1_000_000_000
+
+# SensorStatus members by value, so readings resolve a status without
+# calling the enum constructor
+_STATUS_MEMBERS: Dict[int, 'SensorStatus'] = {status.value: status for status in SensorStatus}
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime (naive = local time) to integer epoch nanoseconds."""
+    whole_seconds = int(value.replace(microsecond=0).timestamp())
+    return whole_seconds * NS_PER_SECOND + value.microsecond * 1000
+
+
+def ns_to_datetime(ts_ns: int) -> datetime:
+    """Convert integer epoch nanoseconds to a naive local datetime."""
+    seconds, remainder = divmod(ts_ns, NS_PER_SECOND)
+    # Whole seconds plus microseconds fit a double exactly, so this is exact
+    return datetime.fromtimestamp(seconds + remainder // 1000 / 1e6)
+
+
 class SensorReading:
     """
     Complete sensor reading data structure.
 
     Educational Note:
-    This dataclass demonstrates how to structure complex sensor data
-    in a way that's both programmatically useful and human-readable.
-    The dataclass decorator automatically generates __init__, __repr__,
-    and __eq__ methods.
+    Monitoring and analytics keep many readings alive at once, so a
+    reading is a small ``__slots__`` object rather than a dataclass: no
+    per-instance ``__dict__``, no datetime, and the status is the shared
+    SensorStatus member, looked up once. The timestamp is held as integer
+    epoch nanoseconds (``ts_ns``) and only turned into a datetime when
+    ``timestamp`` or ``iso_timestamp`` is read. Every other field is a
+    plain slot, so attribute reads cost what they did on the dataclass
+    while a kept reading needs about 30% less memory (see
+    benchmarks/reading_memory.py).
 
     Attributes:
         unit_id: Modbus unit ID of the sensor
-        timestamp: When the reading was taken
+        ts_ns: When the reading was taken (epoch nanoseconds)
+        timestamp: ts_ns as a local datetime (computed)
         status: Current sensor operational status
         status_raw: Raw status register value (for debugging)
         bdc_states: Binary Diagnostic Code states
-        distance_mm: Distance measurement in millimeters
+        distance_mm: Distance in millimeters (None if not a distance)
         distance_raw: Raw distance register value
         signal_quality: Signal quality (excess gain)
         connected: Whether sensor is connected and responding
         valid: Whether the reading contains valid data
+        host: DXM controller the reading came from (set by fleet polling)
     """
-    unit_id: int
-    timestamp: datetime
-    status: SensorStatus
-    status_raw: int
-    bdc_states: int
-    distance_mm: Optional[int]
-    distance_raw: int
-    signal_quality: int
-    connected: bool = True
-    valid: bool = True
-
-    def __post_init__(self):
+
+    # Fixed-size header of to_bytes(): ts_ns, status_raw, bdc_states,
+    # distance_raw, signal_quality, status, unit_id, valid; the host name
+    # (UTF-8) fills the rest
+    WIRE_HEADER = struct.Struct('<qHHHihBB')
+
+    __slots__ = ('unit_id', 'ts_ns', 'status', 'status_raw', 'bdc_states',
+                 'distance_raw', 'signal_quality', 'connected', 'valid', 'host',
+                 'distance_mm')
+
+    def __init__(self, unit_id: int, timestamp: Optional[datetime],
+                 status: SensorStatus, status_raw: int, bdc_states: int,
+                 distance_raw: int, signal_quality: int,
+                 connected: bool = True, valid: bool = True,
+                 host: Optional[str] = None, ts_ns: Optional[int] = None):
         """
-        Post-initialization processing to derive additional fields.
+        Create a reading.
+
+        Args:
+            unit_id: Modbus unit ID of the sensor
+            timestamp: When the reading was taken (ignored if ts_ns is given)
+            status: Decoded sensor status (a SensorStatus or its value)
+            status_raw: Raw status register value
+            bdc_states: Binary Diagnostic Code states
+            distance_raw: Raw distance register value
+            signal_quality: Signal quality (excess gain)
+            connected: Accepted for compatibility; always derived from
+                distance_raw
+            valid: Whether the reading contains valid data
+            host: DXM controller the reading came from
+            ts_ns: When the reading was taken (epoch nanoseconds)
+
+        Raises:
+            ValueError: If status is not a SensorStatus value
+        """
+        member = _STATUS_MEMBERS.get(status)
+        if member is None:
+            raise ValueError(f"{status!r} is not a valid SensorStatus")
+        self.unit_id = unit_id
+        self.ts_ns = datetime_to_ns(timestamp) if ts_ns is None else ts_ns
+        self.status = member
+        self.status_raw = status_raw
+        self.bdc_states = bdc_states
+        self.distance_raw = distance_raw
+        self.signal_quality = signal_quality
+        # 0 in the distance register means no sensor is connected and 65535
+        # means the sensor sees no target; neither is a distance
+        self.connected = distance_raw != 0
+        self.distance_mm = None if distance_raw == 0 or distance_raw == 65535 else distance_raw
+        self.valid = valid
+        self.host = host
+
+    def with_host(self, host: Optional[str]) -> 'SensorReading':
+        """Copy of the reading tagged with a controller name."""
+        return SensorReading(self.unit_id, None, self.status, self.status_raw, self.bdc_states,
+                             self.distance_raw, self.signal_quality, valid=self.valid,
+                             host=host, ts_ns=self.ts_ns)
+
+    def _fields(self) -> tuple:
+        return (self.unit_id, self.ts_ns, self.status, self.status_raw, self.bdc_states,
+                self.distance_raw, self.signal_quality, self.valid, self.host)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    # Mutable like the former dataclass, so not hashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def to_bytes(self) -> bytes:
+        """
+        Pack the reading into bytes (WIRE_HEADER followed by the host name).
 
         Educational Note:
-        __post_init__ is called after dataclass initialization,
-        allowing for computed fields and validation logic.
+        Readings only need a byte form where they cross a process
+        boundary, such as the shared-memory ring used by sharded polling.
+
+        Raises:
+            struct.error: If a field is outside its packed range
         """
-        # Determine connection status from distance reading
-        if self.distance_raw == 0:
-            self.connected = False
-            self.distance_mm = None
-        elif self.distance_raw == 65535:
-            self.connected = True
-            self.distance_mm = None  # Out of range, but sensor is connected
-        else:
-            self.connected = True
-            self.distance_mm = self.distance_raw
+        data = self.WIRE_HEADER.pack(self.ts_ns, self.status_raw, self.bdc_states,
+                                     self.distance_raw, self.signal_quality, self.status,
+                                     self.unit_id, self.valid)
+        return data + self.host.encode('utf-8') if self.host else data
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> 'SensorReading':
+        """
+        Rebuild a reading packed by to_bytes().
+
+        Raises:
+            struct.error: If data is shorter than WIRE_HEADER
+        """
+        (ts_ns, status_raw, bdc_states, distance_raw, signal_quality, status,
+         unit_id, valid) = cls.WIRE_HEADER.unpack_from(data)
+        host = bytes(data[cls.WIRE_HEADER.size:]).decode('utf-8') or None
+        return cls(unit_id, None, status, status_raw, bdc_states, distance_raw,
+                   signal_quality, valid=bool(valid), host=host, ts_ns=ts_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the reading was taken, as a local datetime."""
+        return ns_to_datetime(self.ts_ns)
+
+    @property
+    def iso_timestamp(self) -> str:
+        """When the reading was taken, in ISO 8601 format."""
+        return self.timestamp.isoformat()
+
+    def __repr__(self) -> str:
+        return (f"SensorReading(unit_id={self.unit_id!r}, timestamp={self.timestamp!r}, "
+                f"status={self.status!r}, status_raw={self.status_raw!r}, "
+                f"bdc_states={self.bdc_states!r}, distance_raw={self.distance_raw!r}, "
+                f"signal_quality={self.signal_quality!r}, connected={self.connected!r}, "
+                f"valid={self.valid!r}, host={self.host!r}, "
+                f"distance_mm={self.distance_mm!r})")
+
+    __str__ = __repr__
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -106,7 +226,7 @@ class SensorReading:
         """
         return {
             'unit_id': self.unit_id,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.iso_timestamp,
             'status': self.status.name,
             'status_raw': self.status_raw,
             'bdc_states': self.bdc_states,
@@ -114,7 +234,8 @@ class SensorReading:
             'distance_raw': self.distance_raw,
             'signal_quality': self.signal_quality,
             'connected': self.connected,
-            'valid': self.valid
+            'valid': self.valid,
+            'host': self.host
         }
 
     def format_for_display(self, distance_unit: str = "mm", use_colors: bool = True) -> str:
@@ -187,6 +308,9 @@ class SensorDecoder:
         and suitable for concurrent use across multiple sensor connections.
         """
         self._status_map = self._build_status_map()
+        # Shared int objects for the known status codes, so kept readings
+        # do not each hold their own copy of 303
+        self._known_status_raw = {raw: raw for raw in self._status_map}
 
     def _build_status_map(self) -> Dict[int, SensorStatus]:
         """
@@ -206,7 +330,8 @@ class SensorDecoder:
             0: SensorStatus.ERROR,
         }
 
-    def decode_registers(self, unit_id: int, registers: List[int]) -> SensorReading:
+    def decode_registers(self, unit_id: int, registers: List[int],
+                         ts_ns: Optional[int] = None) -> SensorReading:
         """
         Decode raw Modbus register data into structured sensor reading.
 
@@ -218,6 +343,7 @@ class SensorDecoder:
         Args:
             unit_id: Modbus unit ID of the sensor
             registers: List of register values (must be at least 4 values)
+            ts_ns: When the registers were read (epoch ns, default: now)
 
         Returns:
             SensorReading object with decoded data
@@ -231,6 +357,7 @@ class SensorDecoder:
 
         # Extract raw register values
         status_raw = registers[self.STATUS_REGISTER]
+        status_raw = self._known_status_raw.get(status_raw, status_raw)
         bdc_states = registers[self.BDC_REGISTER]
         distance_raw = registers[self.DISTANCE_REGISTER]
         signal_quality = registers[self.SIGNAL_QUALITY_REGISTER]
@@ -241,7 +368,8 @@ class SensorDecoder:
         # Create reading object
         reading = SensorReading(
             unit_id=unit_id,
-            timestamp=datetime.now(),
+            timestamp=None,
+            ts_ns=time.time_ns() if ts_ns is None else ts_ns,
             status=status,
             status_raw=status_raw,
             bdc_states=bdc_states,
@@ -251,6 +379,33 @@ class SensorDecoder:
 
         return reading
 
+    def decode_batch(self, unit_ids: List[int], blocks: Any,
+                     timestamps_ns: Optional[List[int]] = None) -> 'ReadingBatch':
+        """
+        Decode many register blocks into a columnar ReadingBatch.
+
+        Educational Note:
+        decode_registers builds an object and reads the clock for every
+        reading. For bulk analytics decode_batch does
+        one pass over all blocks into typed columns instead, and only
+        builds SensorReading objects when they are asked for.
+
+        Args:
+            unit_ids: Unit ID of each block
+            blocks: Register lists (at least 4 values each), or a NumPy
+                matrix of shape (n, >=4)
+            timestamps_ns: Per-block wall-clock times in ns (default: now)
+
+        Returns:
+            ReadingBatch with one row per block
+
+        Raises:
+            ValueError: If the inputs differ in length or a block is too short
+        """
+        # Imported here because the batch module builds on SensorReading
+        from .batch import decode_register_blocks
+        return decode_register_blocks(unit_ids, blocks, timestamps_ns, self._status_map)
+
     def decode_single_register(self, register_address: int, value: int) -> Dict[str, Any]:
         """
         Decode a single register value with interpretation.
@@ -347,12 +502,16 @@ class SensorDecoder:
         if reading.distance_raw == 0 and reading.connected:
             issues.append("Distance indicates disconnected but sensor shows connected")
 
+        # An error status should not come with a live distance measurement
+        if reading.status == SensorStatus.ERROR and reading.distance_mm is not None:
+            issues.append("Error status reported but distance register holds a measurement")
+
         # Check signal quality range
         if reading.signal_quality < 0:
             issues.append(f"Invalid signal quality: {reading.signal_quality}")
 
         # Validate timestamp
-        if reading.timestamp > datetime.now():
+        if reading.ts_ns > time.time_ns():
             issues.append("Reading timestamp is in the future")
 
         # Check for impossible distance values (sensor-specific limits)
@@ -403,7 +562,9 @@ class SensorDecoder:
         Educational Note:
         Pattern analysis helps identify sensor behavior trends,
         calibration issues, and environmental factors affecting
-        sensor performance.
+        sensor performance. To follow a long run without keeping every
+        reading, feed the readings to unit_stats.UnitStatistics as they
+        arrive instead.
 
         Args:
             readings: List of SensorReading objects to analyze
@@ -414,48 +575,14 @@ class SensorDecoder:
         if not readings:
             return {'error': 'No readings provided'}
 
-        analysis = {
-            'reading_count': len(readings),
-            'time_span': None,
-            'status_distribution': {},
-            'distance_stats': {},
-            'signal_quality_stats': {},
-            'connection_stability': 0.0
-        }
+        # Built on the streaming accumulator, so the numbers match what a
+        # long-running monitor computes incrementally
+        from .unit_stats import UnitStatistics
 
-        # Time span analysis
-        if len(readings) > 1:
-            timestamps = [r.timestamp for r in readings]
-            time_span = max(timestamps) - min(timestamps)
-            analysis['time_span'] = time_span.total_seconds()
-
-        # Status distribution
-        status_counts = {}
+        stats = UnitStatistics()
         for reading in readings:
-            status_name = reading.status.name
-            status_counts[status_name] = status_counts.get(status_name, 0) + 1
-        analysis['status_distribution'] = status_counts
-
-        # Distance statistics
-        valid_distances = [r.distance_mm for r in readings if r.distance_mm is not None]
-        if valid_distances:
-            analysis['distance_stats'] = {
-                'min': min(valid_distances),
-                'max': max(valid_distances),
-                'avg': sum(valid_distances) / len(valid_distances),
-                'count': len(valid_distances)
-            }
-
-        # Signal quality statistics
-        signal_qualities = [r.signal_quality for r in readings]
-        analysis['signal_quality_stats'] = {
-            'min': min(signal_qualities),
-            'max': max(signal_qualities),
-            'avg': sum(signal_qualities) / len(signal_qualities)
-        }
-
-        # Connection stability (percentage of connected readings)
-        connected_count = sum(1 for r in readings if r.connected)
-        analysis['connection_stability'] = connected_count / len(readings) * 100
+            stats.add(reading)
 
-        return analysis
\ No newline at end of file
+        analysis = stats.analysis()
+        del analysis['failed_reads'], analysis['success_rate']
+        return analysis
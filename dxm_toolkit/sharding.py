@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Multi-Process Sharded Polling
+
+Spreads a fleet over several worker processes so polling can use every
+core of the host instead of one interpreter's share. The supervisor
+splits the inventory into shards (whole hosts, or the units of hosts),
+starts one worker per shard with its own FleetPoller, and restarts
+workers that die. Workers hand decoded readings to the supervisor
+through a ring buffer in shared memory: each SensorReading is packed
+with to_bytes() into a fixed-layout slot and rebuilt with from_bytes()
+on the other side, without pickling.
+
+Educational Focus:
+- Sharding work across processes to sidestep the GIL
+- Single-producer/single-consumer ring buffers in shared memory
+- Supervising and restarting worker processes
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from .sensor_decoder import SensorReading
+
+if TYPE_CHECKING:
+    from .discovery_cache import DiscoveryCache
+    from .fleet import HostSpec
+
+SHARD_MODES = ('host', 'unit')
+
+# Ring header: write index and dropped-reading count, both written only by
+# the producer. Padded to a cache line.
+_RING_HEADER = struct.Struct('<QQ')
+_RING_HEADER_SIZE = 64
+_SLOT_LENGTH = struct.Struct('<H')
+
+
+class SharedReadingRing:
+    """
+    Bounded ring of SensorReadings in shared memory, one producer and one
+    consumer.
+
+    Educational Note:
+    Each slot holds a length prefix and the packed bytes of one reading.
+    Two semaphores count the free and the filled slots: the producer takes
+    a free slot, copies the reading in and then posts a filled slot; the
+    consumer does the reverse. Semaphore operations are full memory
+    barriers, so a slot is never seen before its bytes are, on any CPU,
+    and a producer that dies mid-write never publishes a torn slot. When
+    the consumer falls behind the producer drops readings (and counts
+    them) instead of blocking the polling loop.
+
+    The creating process owns the shared memory block and frees it on
+    ``close()``; other processes get the ring as a Process argument, call
+    ``attach()`` and only unmap it.
+    """
+
+    def __init__(self, capacity: int = 4096, slot_size: int = 128,
+                 context: Optional[Any] = None):
+        """
+        Create the ring.
+
+        Args:
+            capacity: Number of slots
+            slot_size: Bytes per slot, including the 2-byte length prefix
+            context: multiprocessing context for the semaphores
+
+        Raises:
+            ValueError: If capacity or slot_size is too small
+        """
+        if capacity < 1:
+            raise ValueError(f"Ring capacity must be at least 1, got {capacity}")
+        if slot_size < _SLOT_LENGTH.size + SensorReading.WIRE_HEADER.size:
+            raise ValueError(f"Slot size {slot_size} cannot hold a reading")
+        context = context or multiprocessing
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=_RING_HEADER_SIZE + capacity * slot_size)
+        self._owner_pid = os.getpid()
+        self._free = context.Semaphore(capacity)
+        self._filled = context.Semaphore(0)
+        self._write = 0
+        self._read = 0
+        self._dropped = 0
+
+    def __getstate__(self):
+        return {'name': self._shm.name, 'capacity': self.capacity,
+                'slot_size': self.slot_size, 'free': self._free, 'filled': self._filled}
+
+    def __setstate__(self, state):
+        self.capacity = state['capacity']
+        self.slot_size = state['slot_size']
+        self._free = state['free']
+        self._filled = state['filled']
+        self._shm = state['name']   # attached on demand
+        self._owner_pid = None
+        self._read = 0
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._shm if isinstance(self._shm, str) else self._shm.name
+
+    def attach(self) -> None:
+        """Map the shared memory in a process that received the ring."""
+        if isinstance(self._shm, str):
+            self._shm = shared_memory.SharedMemory(name=self._shm)
+        # Continue after the last reading a previous producer published
+        self._write, self._dropped = _RING_HEADER.unpack_from(self._shm.buf, 0)
+
+    @property
+    def max_reading_size(self) -> int:
+        """Largest packed reading (including its host tag) that fits a slot."""
+        return self.slot_size - _SLOT_LENGTH.size
+
+    def publish(self, reading: SensorReading) -> bool:
+        """
+        Append a reading (producer side).
+
+        Args:
+            reading: Reading to append
+
+        Returns:
+            False if the ring was full and the reading was dropped
+
+        Raises:
+            ValueError: If the reading does not fit a slot
+        """
+        data = reading.to_bytes()
+        size = len(data)
+        if size > self.max_reading_size:
+            raise ValueError(f"Reading of {size} bytes does not fit a {self.slot_size}-byte slot")
+        buf = self._shm.buf
+        if not self._free.acquire(False):
+            self._dropped += 1
+            _RING_HEADER.pack_into(buf, 0, self._write, self._dropped)
+            return False
+        offset = _RING_HEADER_SIZE + (self._write % self.capacity) * self.slot_size
+        _SLOT_LENGTH.pack_into(buf, offset, size)
+        buf[offset + _SLOT_LENGTH.size:offset + _SLOT_LENGTH.size + size] = data
+        self._write += 1
+        _RING_HEADER.pack_into(buf, 0, self._write, self._dropped)
+        self._filled.release()
+        return True
+
+    def consume(self, limit: Optional[int] = None) -> List[SensorReading]:
+        """
+        Take the readings published so far (consumer side).
+
+        Args:
+            limit: Return at most this many readings
+
+        Returns:
+            Readings in publication order (empty if none are waiting)
+        """
+        readings = []
+        buf = self._shm.buf
+        while (limit is None or len(readings) < limit) and self._filled.acquire(False):
+            offset = _RING_HEADER_SIZE + (self._read % self.capacity) * self.slot_size
+            size = _SLOT_LENGTH.unpack_from(buf, offset)[0]
+            start = offset + _SLOT_LENGTH.size
+            readings.append(SensorReading.from_bytes(buf[start:start + size]))
+            self._read += 1
+            self._free.release()
+        return readings
+
+    @property
+    def dropped(self) -> int:
+        """Readings the producer dropped because the ring was full."""
+        if isinstance(self._shm, str):
+            return 0
+        return _RING_HEADER.unpack_from(self._shm.buf, 0)[1]
+
+    def close(self) -> None:
+        """Unmap the ring, and free it in the creating process."""
+        if isinstance(self._shm, str):
+            return
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
+        self._shm = self._shm.name
+
+
+def plan_shards(hosts: List['HostSpec'], workers: int, by: str = 'host') -> List[List['HostSpec']]:
+    """
+    Split an inventory into at most ``workers`` shards.
+
+    Args:
+        hosts: Controllers to poll
+        workers: Number of worker processes
+        by: 'host' keeps each controller in one shard; 'unit' spreads the
+            units of every controller over the shards (one connection per
+            shard and controller, so the DXM must accept that many)
+
+    Returns:
+        Non-empty shards, each a list of HostSpecs
+
+    Raises:
+        ValueError: If the mode is unknown, workers is less than 1, or a
+            host has no explicit units in 'unit' mode
+    """
+    from .fleet import HostSpec
+
+    if by not in SHARD_MODES:
+        raise ValueError(f"Unknown shard mode '{by}', expected one of {SHARD_MODES}")
+    if workers < 1:
+        raise ValueError(f"Workers must be at least 1, got {workers}")
+
+    shards: List[List[HostSpec]] = [[] for _ in range(workers)]
+    if by == 'host':
+        for i, spec in enumerate(hosts):
+            shards[i % workers].append(spec)
+    else:
+        slot = 0
+        for spec in hosts:
+            if not spec.unit_ids:
+                raise ValueError(f"Host {spec.name} needs explicit units to shard by unit")
+            units: Dict[int, List[int]] = {}
+            for unit_id in spec.unit_ids:
+                units.setdefault(slot % workers, []).append(unit_id)
+                slot += 1
+            for shard, unit_ids in units.items():
+                shards[shard].append(HostSpec(spec.host, spec.port, spec.name, unit_ids))
+    return [shard for shard in shards if shard]
+
+
+async def _poll_shard(hosts: List['HostSpec'], ring: SharedReadingRing, stop: Any,
+                      interval: float, options: Dict[str, Any]) -> None:
+    """Poll one shard and publish every reading until asked to stop."""
+    from .fleet import FleetPoller
+
+    async with FleetPoller(hosts, **options) as poller:
+        # Checked every cycle, so a shard whose hosts are all down still exits
+        async for reading in poller.stream(interval, stop=stop.is_set):
+            ring.publish(reading)
+
+
+def _shard_main(hosts: List['HostSpec'], ring: SharedReadingRing, stop: Any,
+                interval: float, options: Dict[str, Any]) -> None:
+    """Entry point of a worker process."""
+    ring.attach()
+    try:
+        asyncio.run(_poll_shard(hosts, ring, stop, interval, options))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ring.close()
+
+
+class _Worker:
+    """Supervisor-side state of one shard."""
+
+    def __init__(self, index: int, hosts: List['HostSpec']):
+        self.index = index
+        self.hosts = hosts
+        self.process: Optional[multiprocessing.Process] = None
+        self.ring: Optional[SharedReadingRing] = None
+        self.readings = 0
+        self.dropped = 0
+        self.restarts = 0
+        self.backoff = 0.0
+        self.restart_at: Optional[float] = None
+        self.last_exitcode: Optional[int] = None
+
+
+class ShardedPoller:
+    """
+    Poll a fleet from several worker processes.
+
+    Educational Note:
+    One Python process runs one thread of bytecode at a time, so decoding
+    and socket handling for a large fleet saturate a single core long
+    before the network is busy. Each worker here is a separate interpreter
+    with its own FleetPoller, so shards poll in parallel on separate
+    cores. The supervisor only copies finished readings out of the shared
+    rings and watches its workers: a worker that exits is restarted after
+    a backoff that doubles with every crash in a row and resets once the
+    worker delivers readings again.
+
+    Limits such as ``global_concurrency`` apply per worker.
+
+    Usage:
+        with ShardedPoller(load_inventory("hosts.yaml"), workers=4) as poller:
+            for reading in poller.stream(duration=60):
+                print(reading.host, reading.unit_id, reading.distance_mm)
+    """
+
+    def __init__(self,
+                 hosts: List['HostSpec'],
+                 workers: Optional[int] = None,
+                 shard_by: str = 'host',
+                 interval: float = 1.0,
+                 global_concurrency: int = 64,
+                 per_host_concurrency: int = 1,
+                 timeout: float = 5.0,
+                 retry_attempts: int = 1,
+                 max_units: int = 8,
+                 discovery_cache: Optional['DiscoveryCache'] = None,
+                 ring_capacity: int = 4096,
+                 slot_size: int = 128,
+                 restart_backoff: float = 1.0,
+                 max_restart_backoff: float = 30.0,
+                 start_method: Optional[str] = None):
+        """
+        Initialize the supervisor (workers start with ``start()``).
+
+        Args:
+            hosts: Controllers to poll
+            workers: Worker processes (default: one per CPU core, at most
+                one per shard)
+            shard_by: 'host' or 'unit' (see plan_shards)
+            interval: Polling interval of every worker in seconds
+            global_concurrency: Maximum requests in flight per worker
+            per_host_concurrency: Maximum requests in flight per host and worker
+            timeout: Per-request timeout in seconds
+            retry_attempts: Retry attempts per unit read
+            max_units: Unit IDs scanned for hosts without an explicit list
+            discovery_cache: Optional cache of earlier scans, shared by the
+                workers through its file
+            ring_capacity: Readings each worker can have waiting
+            slot_size: Bytes per ring slot (limits the host name length)
+            restart_backoff: First delay before restarting a dead worker
+            max_restart_backoff: Longest delay between restarts
+            start_method: multiprocessing start method (default: platform
+                default)
+
+        Raises:
+            ValueError: If the shard plan is invalid or a host name does
+                not fit a ring slot
+        """
+        self.shards = plan_shards(hosts, workers or os.cpu_count() or 1, shard_by)
+        limit = slot_size - _SLOT_LENGTH.size - SensorReading.WIRE_HEADER.size
+        for spec in hosts:
+            if len(spec.name.encode('utf-8')) > limit:
+                raise ValueError(f"Host name '{spec.name}' is longer than {limit} bytes; "
+                                 f"increase slot_size")
+
+        self.shard_by = shard_by
+        self.interval = interval
+        self.ring_capacity = ring_capacity
+        self.slot_size = slot_size
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self._options = {
+            'global_concurrency': global_concurrency,
+            'per_host_concurrency': per_host_concurrency,
+            'timeout': timeout,
+            'retry_attempts': retry_attempts,
+            'max_units': max_units,
+            'discovery_cache': discovery_cache,
+        }
+        self._context = multiprocessing.get_context(start_method)
+        self._stop = self._context.Event()
+        self._workers = [_Worker(i, shard) for i, shard in enumerate(self.shards)]
+        self._started = False
+
+        self.logger = logging.getLogger(__name__)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _spawn(self, worker: _Worker) -> None:
+        """Start a worker process with a fresh ring."""
+        worker.ring = SharedReadingRing(self.ring_capacity, self.slot_size, self._context)
+        worker.process = self._context.Process(
+            target=_shard_main, name=f"dxm-shard-{worker.index}", daemon=True,
+            args=(worker.hosts, worker.ring, self._stop, self.interval, self._options))
+        worker.process.start()
+        worker.restart_at = None
+
+    def _retire(self, worker: _Worker) -> List[SensorReading]:
+        """Collect what a finished worker left in its ring and free the ring."""
+        readings = worker.ring.consume()
+        worker.readings += len(readings)
+        worker.dropped += worker.ring.dropped
+        worker.ring.close()
+        worker.ring = None
+        worker.last_exitcode = worker.process.exitcode
+        worker.process.join()
+        worker.process = None
+        return readings
+
+    def start(self) -> None:
+        """Start every worker."""
+        if self._started:
+            return
+        self._stop.clear()
+        for worker in self._workers:
+            self._spawn(worker)
+        self._started = True
+        self.logger.info(f"Started {len(self._workers)} polling workers "
+                         f"(sharded by {self.shard_by})")
+
+    def poll(self) -> List[SensorReading]:
+        """
+        Collect the readings every worker published since the last call
+        and restart workers that died.
+
+        Returns:
+            Host-tagged readings, grouped by worker
+        """
+        readings: List[SensorReading] = []
+        now = time.monotonic()
+        for worker in self._workers:
+            if worker.process is not None:
+                batch = worker.ring.consume()
+                if batch:
+                    worker.readings += len(batch)
+                    worker.backoff = 0.0
+                    readings.extend(batch)
+                if not worker.process.is_alive():
+                    readings.extend(self._retire(worker))
+                    worker.backoff = min(max(worker.backoff * 2, self.restart_backoff),
+                                         self.max_restart_backoff)
+                    worker.restart_at = now + worker.backoff
+                    self.logger.warning(f"Polling worker {worker.index} exited with code "
+                                        f"{worker.last_exitcode}; restarting in "
+                                        f"{worker.backoff:g}s")
+            if worker.process is None and worker.restart_at is not None and \
+                    now >= worker.restart_at and self._started:
+                worker.restarts += 1
+                self._spawn(worker)
+        return readings
+
+    def stream(self, duration: Optional[float] = None,
+               idle_sleep: float = 0.005) -> Iterator[SensorReading]:
+        """
+        Yield readings from all workers as they arrive.
+
+        Args:
+            duration: Total polling time (None for indefinite)
+            idle_sleep: Pause when no worker has published anything
+
+        Yields:
+            SensorReading objects tagged with their host name
+        """
+        self.start()
+        deadline = time.monotonic() + duration if duration else None
+        while deadline is None or time.monotonic() < deadline:
+            readings = self.poll()
+            if readings:
+                yield from readings
+            else:
+                time.sleep(idle_sleep)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop every worker and free the rings.
+
+        Args:
+            timeout: Grace period for workers to finish their current cycle
+                (default: one interval plus one second); stragglers are
+                terminated
+        """
+        if not self._started:
+            return
+        self._started = False
+        self._stop.set()
+        grace = timeout if timeout is not None else self.interval + 1.0
+        deadline = time.monotonic() + grace
+        for worker in self._workers:
+            if worker.process is not None:
+                worker.process.join(max(0.0, deadline - time.monotonic()))
+                if worker.process.is_alive():
+                    worker.process.terminate()
+                    worker.process.join()
+                self._retire(worker)
+            worker.restart_at = None
+
+    def get_shard_info(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the state of every worker.
+
+        Returns:
+            Dictionary mapping worker indexes to pid, alive, hosts,
+            readings, dropped, restarts and last_exitcode
+        """
+        info = {}
+        for worker in self._workers:
+            process = worker.process
+            ring_dropped = worker.ring.dropped if worker.ring is not None else 0
+            info[worker.index] = {
+                'pid': process.pid if process is not None else None,
+                'alive': bool(process and process.is_alive()),
+                'hosts': {spec.name: spec.unit_ids for spec in worker.hosts},
+                'readings': worker.readings,
+                'dropped': worker.dropped + ring_dropped,
+                'restarts': worker.restarts,
+                'last_exitcode': worker.last_exitcode,
+            }
+        return info
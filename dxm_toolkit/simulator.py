@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Local DXM/Q90R Modbus TCP Simulator
+
+A pymodbus server that answers like a DXM controller with Q90R radar
+sensors attached. Each simulated unit serves the 4-register sensor block
+(status, BDC, distance, signal) computed from a scripted distance
+waveform, with optional response latency, jitter and a cap on concurrent
+TCP connections. It lets client throughput and latency be measured
+reproducibly without hardware.
+
+Educational Focus:
+- Building a Modbus TCP server on pymodbus' datastore API
+- Scripted, deterministic test signals
+- Reproducing network conditions (latency, jitter, connection limits)
+"""
+
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import yaml
+
+try:
+    from pymodbus.datastore import ModbusServerContext
+    from pymodbus.datastore.context import ModbusBaseSlaveContext
+    from pymodbus.server import ModbusTcpServer
+    from pymodbus.server.async_io import ModbusServerRequestHandler
+except ImportError:
+    raise ImportError("pymodbus library is required. Install with: pip install pymodbus>=3.0.0")
+
+from .sensor_decoder import SensorStatus
+from .utils import parse_unit_ids
+
+WAVEFORMS = ('constant', 'sine', 'ramp', 'square', 'noise')
+
+# Registers served per unit; only the first four carry sensor data
+REGISTER_COUNT = 16
+
+# Distance register value of an out-of-range target
+DISTANCE_OUT_OF_RANGE = 65535
+
+# Seconds each 'noise' sample is held
+NOISE_STEP = 0.1
+
+
+@dataclass
+class UnitProfile:
+    """
+    Behaviour of one simulated sensor.
+
+    Attributes:
+        unit_id: Modbus unit ID (1-247)
+        waveform: constant, sine, ramp, square or noise
+        center: Mean distance (mm)
+        amplitude: Peak deviation from center (mm)
+        period: Waveform period (seconds)
+        phase: Time offset into the waveform (seconds)
+        max_range: Distances beyond this read as out of range (mm)
+        signal: Signal quality register value while in range
+        bdc: BDC register value
+        connected: False simulates an unplugged sensor (all registers 0)
+        seed: Seed of the 'noise' waveform
+    """
+    unit_id: int
+    waveform: str = 'sine'
+    center: float = 1500.0
+    amplitude: float = 500.0
+    period: float = 10.0
+    phase: float = 0.0
+    max_range: int = 10000
+    signal: int = 50
+    bdc: int = 0
+    connected: bool = True
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.waveform not in WAVEFORMS:
+            raise ValueError(f"Unknown waveform '{self.waveform}', expected one of {WAVEFORMS}")
+        if self.period <= 0:
+            raise ValueError(f"period must be positive, got {self.period}")
+
+    def distance_at(self, t: float) -> float:
+        """
+        Distance of the simulated target at time t.
+
+        Args:
+            t: Seconds since the simulator started
+
+        Returns:
+            Distance in mm (may be out of range)
+        """
+        t += self.phase
+        if self.waveform == 'constant':
+            return self.center
+        if self.waveform == 'sine':
+            return self.center + self.amplitude * math.sin(2 * math.pi * t / self.period)
+        if self.waveform == 'ramp':
+            return self.center + self.amplitude * (2 * (t % self.period) / self.period - 1)
+        if self.waveform == 'square':
+            high = (t % self.period) < self.period / 2
+            return self.center + (self.amplitude if high else -self.amplitude)
+        # noise: a new seeded sample every NOISE_STEP seconds
+        step = int(t // NOISE_STEP)
+        rng = random.Random(self.seed * 1_000_003 + self.unit_id * 7919 + step)
+        return self.center + self.amplitude * rng.uniform(-1.0, 1.0)
+
+    def registers_at(self, t: float) -> List[int]:
+        """
+        Sensor register block at time t.
+
+        Returns:
+            [status, bdc, distance, signal] as the Q90R reports them
+        """
+        if not self.connected:
+            return [SensorStatus.ERROR.value, 0, 0, 0]
+        distance = int(round(self.distance_at(t)))
+        if distance <= 0 or distance > self.max_range:
+            return [SensorStatus.OUT_OF_RANGE.value, self.bdc, DISTANCE_OUT_OF_RANGE, 0]
+        return [SensorStatus.NORMAL.value, self.bdc, distance, self.signal]
+
+
+def load_profiles(path: str) -> Dict[str, Any]:
+    """
+    Load simulator settings from a YAML file.
+
+    The file holds a ``units`` list of UnitProfile fields (``units`` may
+    also be written as a range string such as "1-8" for default profiles)
+    and optional ``latency_ms``, ``jitter_ms``, ``max_connections`` and
+    ``seed`` keys.
+
+    Args:
+        path: YAML file path
+
+    Returns:
+        Dictionary of DXMSimulator keyword arguments
+
+    Raises:
+        ValueError: If the file or a unit entry is invalid
+    """
+    with open(Path(path), 'r') as f:
+        data = yaml.safe_load(f) or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Simulator profile must be a mapping, got {type(data).__name__}")
+
+    units = data.get('units', '1-8')
+    if isinstance(units, (str, int)):
+        profiles = [UnitProfile(unit_id) for unit_id in parse_unit_ids(str(units))]
+    else:
+        profiles = [UnitProfile(**entry) for entry in units]
+
+    return {
+        'units': profiles,
+        'latency': float(data.get('latency_ms', 0.0)) / 1000,
+        'jitter': float(data.get('jitter_ms', 0.0)) / 1000,
+        'max_connections': data.get('max_connections'),
+        'seed': int(data.get('seed', 0)),
+    }
+
+
+class _SimulatedUnit(ModbusBaseSlaveContext):
+    """Read-only pymodbus datastore computing one unit's registers on demand."""
+
+    def __init__(self, profile: UnitProfile, simulator: 'DXMSimulator'):
+        self.profile = profile
+        self._simulator = simulator
+
+    def validate(self, fc_as_hex: int, address: int, count: int = 1) -> bool:
+        # Holding and input registers only; writes are refused
+        return fc_as_hex in (3, 4) and address >= 0 and address + count <= REGISTER_COUNT
+
+    def getValues(self, fc_as_hex: int, address: int, count: int = 1) -> List[int]:
+        registers = self.profile.registers_at(self._simulator.elapsed())
+        registers += [0] * (REGISTER_COUNT - len(registers))
+        self._simulator.requests_served += 1
+        return registers[address:address + count]
+
+    async def async_getValues(self, fc_as_hex: int, address: int, count: int = 1) -> List[int]:
+        delay = self._simulator.response_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self.getValues(fc_as_hex, address, count)
+
+    def setValues(self, fc_as_hex: int, address: int, values: List[int]) -> None:
+        pass
+
+
+class _GatewayContext(ModbusServerContext):
+    """
+    Server context that accepts requests for every unit ID.
+
+    pymodbus silently drops frames for unit IDs missing from ``slaves()``,
+    which leaves clients waiting for their timeout. Listing all IDs makes
+    lookups of absent units raise NoSuchSlaveException instead, which the
+    server answers with exception 0x0B like a real gateway.
+    """
+
+    def slaves(self):
+        return list(range(1, 248))
+
+
+class _ConnectionHandler(ModbusServerRequestHandler):
+    """Request handler that drops connections beyond the server's cap."""
+
+    def callback_connected(self) -> None:
+        limit = self.server.max_connections
+        if limit is not None and len(self.server.active_connections) > limit:
+            self.server.connections_rejected += 1
+            self.close()
+            return
+        self.server.connections_accepted += 1
+        super().callback_connected()
+
+
+class _SimulatorServer(ModbusTcpServer):
+    """ModbusTcpServer with a concurrent connection cap."""
+
+    def __init__(self, context, address, max_connections: Optional[int]):
+        super().__init__(context, address=address)
+        self.max_connections = max_connections
+        self.connections_accepted = 0
+        self.connections_rejected = 0
+
+    def callback_new_connection(self):
+        return _ConnectionHandler(self)
+
+
+class DXMSimulator:
+    """
+    Simulated DXM controller serving Q90R register blocks over Modbus TCP.
+
+    Educational Note:
+    Each unit is a custom pymodbus datastore whose registers are computed
+    from the unit's waveform at the moment a request arrives. Latency and
+    jitter are added with ``asyncio.sleep`` inside the datastore read, so
+    a slow response never blocks other requests. This mirrors a gateway
+    that serves several requests at once. Unit IDs without a profile
+    answer with Modbus exception 0x0B (gateway target failed to respond),
+    as the DXM does. All randomness is seeded, so runs are repeatable.
+
+    Usage:
+        with DXMSimulator([UnitProfile(1), UnitProfile(2)], port=0).running() as sim:
+            client = DXMClient("127.0.0.1", port=sim.port)
+    """
+
+    def __init__(self,
+                 units: List[UnitProfile],
+                 host: str = "127.0.0.1",
+                 port: int = 5020,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 max_connections: Optional[int] = None,
+                 seed: int = 0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the simulator.
+
+        Args:
+            units: Profiles of the simulated sensors
+            host: Interface to listen on
+            port: TCP port to listen on (0 picks a free port)
+            latency: Minimum response delay in seconds
+            jitter: Extra random delay of up to this many seconds
+            max_connections: Concurrent TCP connections accepted (None = no cap)
+            seed: Seed of the jitter generator
+            clock: Monotonic clock in seconds (replaceable for testing)
+
+        Raises:
+            ValueError: If the units or settings are invalid
+        """
+        unit_ids = [u.unit_id for u in units]
+        if not unit_ids:
+            raise ValueError("At least one unit is required")
+        if len(set(unit_ids)) != len(unit_ids):
+            raise ValueError(f"Duplicate unit IDs: {sorted(unit_ids)}")
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency and jitter must not be negative")
+        if max_connections is not None and max_connections < 1:
+            raise ValueError(f"max_connections must be at least 1, got {max_connections}")
+
+        self.units = {u.unit_id: u for u in units}
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.max_connections = max_connections
+        self._clock = clock
+        self._rng = random.Random(seed)
+        self._started = clock()
+        self.requests_served = 0
+
+        self.logger = logging.getLogger(__name__)
+
+        self._server: Optional[_SimulatorServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def elapsed(self) -> float:
+        """Seconds since the simulator started (the waveform time base)."""
+        return self._clock() - self._started
+
+    def response_delay(self) -> float:
+        """Delay to apply to the next response in seconds."""
+        if self.jitter:
+            return self.latency + self._rng.uniform(0.0, self.jitter)
+        return self.latency
+
+    def _context(self) -> ModbusServerContext:
+        slaves = {unit_id: _SimulatedUnit(profile, self) for unit_id, profile in self.units.items()}
+        return _GatewayContext(slaves=slaves, single=False)
+
+    async def start(self) -> None:
+        """
+        Start listening (returns once the port is bound).
+
+        Raises:
+            OSError: If the port cannot be bound
+        """
+        self._server = _SimulatorServer(self._context(), (self.host, self.port),
+                                        self.max_connections)
+        if not await self._server.listen():
+            raise OSError(f"Could not listen on {self.host}:{self.port}")
+        self.port = self._server.transport.sockets[0].getsockname()[1]
+        self._started = self._clock()
+        self.logger.info(f"Simulating DXM with units {sorted(self.units)} "
+                         f"on {self.host}:{self.port}")
+
+    async def stop(self) -> None:
+        """Close the listener and every open connection."""
+        if self._server is not None:
+            await self._server.shutdown()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        """Start (if needed) and serve until stop() is called or the task is cancelled."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serving
+        finally:
+            await self.stop()
+
+    @contextmanager
+    def running(self) -> Iterator['DXMSimulator']:
+        """
+        Run the simulator on a background thread for synchronous callers.
+
+        Yields:
+            The started simulator (``port`` holds the bound port)
+        """
+        ready = threading.Event()
+        errors: List[BaseException] = []
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self.start())
+            except BaseException as e:
+                errors.append(e)
+                ready.set()
+                self._loop.close()
+                return
+            ready.set()
+            self._loop.run_until_complete(self.serve_forever())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="dxm-simulator", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+
+        try:
+            yield self
+        finally:
+            server = self._server
+            if server is not None:
+                self._loop.call_soon_threadsafe(
+                    lambda: server.serving.done() or server.serving.set_result(True))
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get server counters.
+
+        Returns:
+            Dictionary with requests served and connection counts
+        """
+        server = self._server
+        return {
+            'units': sorted(self.units),
+            'requests_served': self.requests_served,
+            'open_connections': len(server.active_connections) if server else 0,
+            'connections_accepted': server.connections_accepted if server else 0,
+            'connections_rejected': server.connections_rejected if server else 0,
+        }
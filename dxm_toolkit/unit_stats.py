@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Streaming Per-Unit Reading Statistics
+
+Incremental statistics over sensor readings: count, mean and variance
+(Welford's algorithm), minimum and maximum, status distribution,
+connection stability and signal quality, optionally with p50/p95/p99
+from quantile sketches (see quantiles.py). Every reading updates a unit's
+statistics in constant time and memory, so a summary of a week-long run
+costs the same as one of a minute. Statistics of different shards,
+processes or time ranges can be merged exactly.
+
+Educational Focus:
+- Welford's numerically stable running variance
+- Merging partial statistics (Chan et al.) for sharded collection
+- Constant-time summaries instead of rescanning history
+"""
+
+import math
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .quantiles import WindowedQuantiles
+from .sensor_decoder import SensorReading, SensorStatus
+
+
+class RunningStats:
+    """
+    Count, mean, variance, minimum and maximum of a stream of numbers.
+
+    Educational Note:
+    The textbook formula ``sum(x**2)/n - mean**2`` subtracts two large,
+    nearly equal numbers and loses precision on long runs. Welford's
+    algorithm instead updates the mean and the sum of squared deviations
+    (M2) by the deviation of each new value, which stays accurate however
+    many values are added. Two accumulators combine with the parallel
+    form of the same update, so the result does not depend on how the
+    stream was split.
+
+    Usage:
+        stats = RunningStats()
+        for value in values:
+            stats.add(value)
+        print(stats.mean, stats.stddev)
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """
+        Add one value.
+
+        Args:
+            value: The value to add
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """
+        Add the values summarized by another accumulator.
+
+        Args:
+            other: Statistics to merge into this one (left unchanged)
+
+        Returns:
+            self
+        """
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 with fewer than two values)."""
+        return self.m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def sample_variance(self) -> float:
+        """Sample variance (0.0 with fewer than two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(self.variance)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the statistics as a dictionary.
+
+        Returns:
+            Dictionary with min, max, avg, stddev and count (empty if no
+            values were added)
+        """
+        if not self.count:
+            return {}
+        return {'min': self.min, 'max': self.max, 'avg': self.mean,
+                'stddev': self.stddev, 'count': self.count}
+
+
+class UnitStatistics:
+    """
+    Statistics of the readings of one unit.
+
+    Educational Note:
+    Adding a reading costs a handful of additions and comparisons, no
+    matter how many readings came before. The summary has the same shape
+    as SensorDecoder.analyze_register_pattern, which is built on it.
+    Averages hide spikes, so percentiles of distance and signal quality
+    can be tracked as well, over the whole run or a sliding window, in
+    bounded memory.
+    """
+
+    __slots__ = ('count', 'failures', 'connected', 'statuses', 'distance', 'signal',
+                 'first_ns', 'last_ns', 'distance_quantiles', 'signal_quantiles')
+
+    def __init__(self, quantiles: bool = False, window: Optional[float] = None,
+                 panes: int = 6):
+        """
+        Initialize empty statistics.
+
+        Args:
+            quantiles: Also track distance and signal percentiles
+            window: Percentile window in seconds (None: the whole run)
+            panes: Slices of the percentile window (see WindowedQuantiles)
+        """
+        self.count = 0
+        self.failures = 0
+        self.connected = 0
+        self.statuses: Dict[str, int] = {}
+        self.distance = RunningStats()
+        self.signal = RunningStats()
+        self.first_ns: Optional[int] = None
+        self.last_ns: Optional[int] = None
+        self.distance_quantiles: Optional[WindowedQuantiles] = None
+        self.signal_quantiles: Optional[WindowedQuantiles] = None
+        if quantiles:
+            self.distance_quantiles = WindowedQuantiles(window, panes)
+            self.signal_quantiles = WindowedQuantiles(window, panes)
+
+    def add(self, reading: SensorReading) -> None:
+        """
+        Add one reading.
+
+        Args:
+            reading: The reading to add
+        """
+        self.count += 1
+        status = reading.status
+        self.statuses[status.name] = self.statuses.get(status.name, 0) + 1
+        if reading.connected:
+            self.connected += 1
+
+        # Out-of-range readings carry no usable target distance
+        ts_ns = reading.ts_ns
+        distance = reading.distance_mm
+        if distance is not None and status != SensorStatus.OUT_OF_RANGE:
+            self.distance.add(distance)
+            if self.distance_quantiles is not None:
+                self.distance_quantiles.add(distance, ts_ns)
+        self.signal.add(reading.signal_quality)
+        if self.signal_quantiles is not None:
+            self.signal_quantiles.add(reading.signal_quality, ts_ns)
+
+        if self.first_ns is None or ts_ns < self.first_ns:
+            self.first_ns = ts_ns
+        if self.last_ns is None or ts_ns > self.last_ns:
+            self.last_ns = ts_ns
+
+    def add_failure(self) -> None:
+        """Count a read that returned no reading."""
+        self.failures += 1
+
+    def _quantile_config(self) -> Optional[Tuple[Optional[float], int, int]]:
+        """Window, panes and precision of the percentiles (None if not tracked)."""
+        sketch = self.distance_quantiles
+        if sketch is None:
+            return None
+        return sketch.window, sketch.panes, sketch.bits
+
+    def merge(self, other: 'UnitStatistics') -> 'UnitStatistics':
+        """
+        Add the readings summarized by another UnitStatistics.
+
+        Args:
+            other: Statistics to merge into this one (left unchanged)
+
+        Returns:
+            self
+
+        Raises:
+            ValueError: If only one side tracks percentiles, or their
+                windows are configured differently
+        """
+        if self._quantile_config() != other._quantile_config():
+            raise ValueError("Cannot merge statistics with different percentile configurations")
+        self.count += other.count
+        self.failures += other.failures
+        self.connected += other.connected
+        for name, count in other.statuses.items():
+            self.statuses[name] = self.statuses.get(name, 0) + count
+        self.distance.merge(other.distance)
+        self.signal.merge(other.signal)
+        if self.distance_quantiles is not None:
+            self.distance_quantiles.merge(other.distance_quantiles)
+            self.signal_quantiles.merge(other.signal_quantiles)
+        if other.first_ns is not None and (self.first_ns is None or other.first_ns < self.first_ns):
+            self.first_ns = other.first_ns
+        if other.last_ns is not None and (self.last_ns is None or other.last_ns > self.last_ns):
+            self.last_ns = other.last_ns
+        return self
+
+    @property
+    def time_span(self) -> Optional[float]:
+        """Seconds between the first and last reading (None below two readings)."""
+        if self.count < 2:
+            return None
+        return (self.last_ns - self.first_ns) / 1e9
+
+    @property
+    def connection_stability(self) -> float:
+        """Percentage of readings with a connected sensor."""
+        return self.connected / self.count * 100 if self.count else 0.0
+
+    @property
+    def success_rate(self) -> float:
+        """Percentage of reads that returned a reading."""
+        attempts = self.count + self.failures
+        return self.count / attempts * 100 if attempts else 0.0
+
+    def analysis(self) -> Dict[str, Any]:
+        """
+        Get the summary.
+
+        Returns:
+            Dictionary with reading_count, time_span, status_distribution,
+            distance_stats, signal_quality_stats, connection_stability,
+            failed_reads and success_rate (with percentiles tracked, the
+            distance and signal stats include p50, p95 and p99)
+        """
+        distance_stats = self.distance.snapshot()
+        signal_stats = self.signal.snapshot()
+        if self.distance_quantiles is not None:
+            if distance_stats:
+                distance_stats.update(self.distance_quantiles.snapshot())
+            if signal_stats:
+                signal_stats.update(self.signal_quantiles.snapshot())
+        return {
+            'reading_count': self.count,
+            'time_span': self.time_span,
+            'status_distribution': dict(self.statuses),
+            'distance_stats': distance_stats,
+            'signal_quality_stats': signal_stats,
+            'connection_stability': self.connection_stability,
+            'failed_reads': self.failures,
+            'success_rate': self.success_rate,
+        }
+
+
+class ReadingStatistics:
+    """
+    Streaming statistics for every unit of a monitoring run.
+
+    Usage:
+        stats = ReadingStatistics(quantiles=True, window=60.0)
+        for readings in client.monitor_sensors([1, 2, 3]):
+            stats.add_cycle(readings)
+        print(stats[1].distance.mean, stats[1].distance_quantiles.quantile(99))
+    """
+
+    def __init__(self, quantiles: bool = False, window: Optional[float] = None,
+                 panes: int = 6):
+        """
+        Initialize empty statistics.
+
+        Args:
+            quantiles: Also track distance and signal percentiles per unit
+            window: Percentile window in seconds (None: the whole run)
+            panes: Slices of the percentile window
+        """
+        self.quantiles = quantiles
+        self.window = window
+        self.panes = panes
+        self.units: Dict[int, UnitStatistics] = {}
+
+    def unit(self, unit_id: int) -> UnitStatistics:
+        """Get (creating it on first use) the statistics of one unit."""
+        stats = self.units.get(unit_id)
+        if stats is None:
+            stats = self.units[unit_id] = UnitStatistics(self.quantiles, self.window, self.panes)
+        return stats
+
+    def add(self, unit_id: int, reading: Optional[SensorReading]) -> None:
+        """
+        Add one reading.
+
+        Args:
+            unit_id: Unit that was read
+            reading: The reading, or None if the read failed
+        """
+        if reading is None:
+            self.unit(unit_id).add_failure()
+        else:
+            self.unit(unit_id).add(reading)
+
+    def add_cycle(self, readings: Dict[int, Optional[SensorReading]]) -> None:
+        """
+        Add one monitoring cycle.
+
+        Args:
+            readings: Unit ID -> reading (None for failed reads)
+        """
+        for unit_id, reading in readings.items():
+            self.add(unit_id, reading)
+
+    def merge(self, other: 'ReadingStatistics') -> 'ReadingStatistics':
+        """
+        Add the statistics of another run or shard.
+
+        Args:
+            other: Statistics to merge into these (left unchanged)
+
+        Returns:
+            self
+        """
+        for unit_id, stats in other.units.items():
+            self.unit(unit_id).merge(stats)
+        return self
+
+    def __getitem__(self, unit_id: int) -> UnitStatistics:
+        return self.units[unit_id]
+
+    def __contains__(self, unit_id: int) -> bool:
+        return unit_id in self.units
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def items(self) -> Iterator[Tuple[int, UnitStatistics]]:
+        """Iterate over (unit ID, statistics) in unit order."""
+        return iter(sorted(self.units.items()))
+
+    def reset(self) -> None:
+        """Forget all statistics."""
+        self.units.clear()
+
+    def snapshot(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the summary of every unit.
+
+        Returns:
+            Dictionary mapping unit IDs to UnitStatistics.analysis()
+        """
+        return {unit_id: stats.analysis() for unit_id, stats in self.items()}
@@ -15,21 +15,31 @@ Educational Focus:
 import re
 import socket
 import struct
-from typing import Union, Optional, Tuple
+from typing import List, Union, Optional, Tuple
 from datetime import datetime
 
 try:
-    from colorama import Fore, Back, Style, init
-    init(autoreset=True)  # Initialize colorama for cross-platform color support
-    COLORS_AVAILABLE = True
-except ImportError:
-    # Gracefully handle missing colorama dependency
+    import importlib.util
+    COLORS_AVAILABLE = importlib.util.find_spec('colorama') is not None
+except (ImportError, ValueError):
     COLORS_AVAILABLE = False
-    # Create dummy color constants
-    class _DummyColor:
-        def __getattr__(self, name):
-            return ""
-    Fore = Back = Style = _DummyColor()
+
+# colorama is imported by the first colorize_text() call that needs it
+_colorama = None
+
+
+def _load_colorama():
+    """Import and initialize colorama once (None if it is missing)."""
+    global _colorama, COLORS_AVAILABLE
+    if _colorama is None and COLORS_AVAILABLE:
+        try:
+            import colorama
+            colorama.init(autoreset=True)  # Cross-platform color support
+            _colorama = colorama
+        except ImportError:
+            # Gracefully handle missing colorama dependency
+            COLORS_AVAILABLE = False
+    return _colorama
 
 
 def validate_ip_address(ip: str) -> bool:
@@ -195,9 +205,10 @@ def colorize_text(text: str, color: str, use_colors: bool = True) -> str:
     Returns:
         str: Colorized text (or plain text if colors disabled)
     """
-    if not use_colors or not COLORS_AVAILABLE:
+    if not use_colors or _load_colorama() is None:
         return text
 
+    Fore, Style = _colorama.Fore, _colorama.Style
     color_map = {
         "red": Fore.RED,
         "green": Fore.GREEN,
@@ -253,6 +264,42 @@ def validate_unit_id(unit_id: Union[int, str]) -> bool:
         return False
 
 
+def parse_unit_ids(spec: str) -> List[int]:
+    """
+    Parse a unit ID specification such as "1,2,5-8" into a list.
+
+    Educational Note:
+    Gateways expose sensors on consecutive unit IDs, so ranges are the
+    natural way to write them down in inventories and on the command line.
+
+    Args:
+        spec: Comma-separated unit IDs and inclusive ranges
+
+    Returns:
+        Sorted list of unique unit IDs
+
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    unit_ids = set()
+    for part in str(spec).split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            first, last = (int(p) for p in part.split('-', 1))
+            if first > last:
+                raise ValueError(f"Invalid unit ID range: {part}")
+            ids = range(first, last + 1)
+        else:
+            ids = [int(part)]
+        for uid in ids:
+            if not validate_unit_id(uid):
+                raise ValueError(f"Invalid unit ID: {uid}")
+            unit_ids.add(uid)
+    return sorted(unit_ids)
+
+
 def bytes_to_int16(byte_data: bytes, big_endian: bool = True) -> int:
     """
     Convert byte data to signed 16-bit integer.
@@ -123,47 +123,36 @@ class RegisterDiscovery:
 
         register_data = {}
 
-        for reg_addr in range(max_registers):
-            try:
-                # Read single register
-                result = self.client._client.read_holding_registers(
-                    address=reg_addr,
-                    count=1,
-                    unit=unit_id
-                )
-
-                if not result.isError():
-                    value = result.registers[0]
+        # Read the whole range through the read planner: the addresses are
+        # merged into a few block reads instead of one request per register
+        values, errors = self.client.read_registers(
+            [(unit_id, reg_addr) for reg_addr in range(max_registers)]
+        )
 
-                    # Decode using our known register interpretations
-                    decoded = self.decoder.decode_single_register(reg_addr, value)
+        for reg_addr in range(max_registers):
+            if (unit_id, reg_addr) in values:
+                value = values[(unit_id, reg_addr)]
 
-                    register_data[reg_addr] = {
-                        'value': value,
-                        'hex': f"0x{value:04X}",
-                        'binary': f"0b{value:016b}",
-                        'decoded': decoded,
-                        'accessible': True
-                    }
+                # Decode using our known register interpretations
+                decoded = self.decoder.decode_single_register(reg_addr, value)
 
-                    print(f"  Reg {reg_addr:2d}: {value:5d} (0x{value:04X}) - {decoded.get('interpretation', 'Unknown')}")
+                register_data[reg_addr] = {
+                    'value': value,
+                    'hex': f"0x{value:04X}",
+                    'binary': f"0b{value:016b}",
+                    'decoded': decoded,
+                    'accessible': True
+                }
 
-                else:
-                    register_data[reg_addr] = {
-                        'accessible': False,
-                        'error': str(result)
-                    }
-                    print(f"  Reg {reg_addr:2d}: Error - {result}")
+                print(f"  Reg {reg_addr:2d}: {value:5d} (0x{value:04X}) - {decoded.get('interpretation', 'Unknown')}")
 
-            except Exception as e:
+            else:
+                error = errors.get((unit_id, reg_addr))
                 register_data[reg_addr] = {
                     'accessible': False,
-                    'error': str(e)
+                    'error': str(error)
                 }
-                print(f"  Reg {reg_addr:2d}: Exception - {e}")
-
-            # Small delay to be gentle on the DXM
-            time.sleep(0.05)
+                print(f"  Reg {reg_addr:2d}: Error - {error}")
 
         return register_data
 
@@ -190,15 +179,8 @@ class RegisterDiscovery:
 
         # First, determine which registers are accessible
         print("  Determining accessible registers...")
-        accessible_regs = []
-
-        for reg_addr in range(10):  # Scan first 10 registers
-            try:
-                result = self.client._client.read_holding_registers(reg_addr, 1, unit=unit_id)
-                if not result.isError():
-                    accessible_regs.append(reg_addr)
-            except:
-                pass
+        values, _ = self.client.read_registers([(unit_id, reg_addr) for reg_addr in range(10)])
+        accessible_regs = sorted(addr for _, addr in values)
 
         if not accessible_regs:
             print("  No accessible registers found")
@@ -216,13 +198,14 @@ class RegisterDiscovery:
             sample_time = time.time()
             sample = {'timestamp': sample_time, 'registers': {}}
 
-            for reg_addr in accessible_regs:
-                try:
-                    result = self.client._client.read_holding_registers(reg_addr, 1, unit=unit_id)
-                    if not result.isError():
-                        sample['registers'][reg_addr] = result.registers[0]
-                except:
-                    pass
+            # One planned read per sample instead of one request per register
+            try:
+                values, _ = self.client.read_registers(
+                    [(unit_id, reg_addr) for reg_addr in accessible_regs]
+                )
+                sample['registers'] = {addr: value for (_, addr), value in values.items()}
+            except Exception:
+                pass
 
             samples.append(sample)
             time.sleep(sample_interval)
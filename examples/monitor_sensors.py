@@ -32,7 +32,8 @@ from typing import List, Dict, Optional
 # Add parent directory to path to import our toolkit
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from dxm_toolkit import DXMClient, SensorReading, SensorStatus, DXMConnectionError
+from dxm_toolkit import (DXMClient, SensorReading, SensorStatus, DXMConnectionError,
+                         ReadingStatistics, RecordingReader, RecordingWriter)
 
 
 class SensorMonitor:
@@ -57,6 +58,8 @@ class SensorMonitor:
         self.monitoring = False
         self.sensor_data_history = {}  # Store reading history per sensor
         self.error_counts = {}  # Track errors per sensor
+        # Running per-sensor statistics with bounded-memory percentiles
+        self.statistics = ReadingStatistics(quantiles=True)
         self.start_time = None
 
     def connect(self):
@@ -92,19 +95,23 @@ class SensorMonitor:
         print(f"✓ Found {len(sensors)} sensors: {sensors}")
         return sensors
 
-    def start_monitoring(self, unit_ids: List[int], duration: float = 60.0, interval: float = 1.0):
+    def start_monitoring(self, unit_ids: List[int], duration: float = 60.0, interval: float = 1.0,
+                         record_path: Optional[str] = None):
         """
         Start continuous monitoring of specified sensors.
 
         Educational Note:
         This method demonstrates the main monitoring loop pattern
         used in industrial applications. It handles timing, error
-        recovery, and data collection efficiently.
+        recovery, and data collection efficiently. With ``record_path``
+        every cycle is appended to a binary recording as it happens, so
+        long sessions survive a crash and do not grow in memory.
 
         Args:
             unit_ids: List of sensor unit IDs to monitor
             duration: Total monitoring time in seconds
             interval: Time between readings in seconds
+            record_path: Optional recording file (see dxm_toolkit.recording)
         """
         if not self.client:
             raise RuntimeError("Not connected to DXM")
@@ -119,11 +126,13 @@ class SensorMonitor:
         print("-" * 80)
 
         # Initialize data structures
+        self.statistics.reset()
         for unit_id in unit_ids:
             self.sensor_data_history[unit_id] = []
             self.error_counts[unit_id] = 0
 
         reading_count = 0
+        recorder = RecordingWriter(record_path) if record_path else None
 
         try:
             while self.monitoring and datetime.now() < end_time:
@@ -141,6 +150,10 @@ class SensorMonitor:
                         self.error_counts[unit_id] += 1
                         readings[unit_id] = None
 
+                self.statistics.add_cycle(readings)
+                if recorder:
+                    recorder.write_cycle(readings, self.dxm_ip)
+
                 # Display current readings
                 self.display_readings(readings, reading_count)
 
@@ -160,6 +173,9 @@ class SensorMonitor:
             print("\nMonitoring stopped by user")
         finally:
             self.monitoring = False
+            if recorder:
+                recorder.close()
+                print(f"✓ Recorded {recorder.records} readings to {record_path}")
 
         print(f"\nMonitoring completed - {reading_count} cycles")
         self.show_statistics(unit_ids)
@@ -228,7 +244,9 @@ class SensorMonitor:
         Educational Note:
         Post-monitoring analysis helps identify patterns, issues,
         and system performance characteristics. This is valuable
-        for system optimization and troubleshooting.
+        for system optimization and troubleshooting. The statistics are
+        updated as each reading arrives, so showing them does not rescan
+        the reading history.
 
         Args:
             unit_ids: List of monitored unit IDs
@@ -237,47 +255,40 @@ class SensorMonitor:
         print("=" * 50)
 
         for unit_id in unit_ids:
-            readings = self.sensor_data_history.get(unit_id, [])
-            error_count = self.error_counts.get(unit_id, 0)
+            stats = self.statistics.unit(unit_id)
 
             print(f"\nSensor Unit {unit_id}:")
-            print(f"  Total readings:     {len(readings)}")
-            print(f"  Communication errors: {error_count}")
-
-            if readings:
-                # Calculate success rate
-                success_rate = (len(readings) / (len(readings) + error_count)) * 100
-                print(f"  Success rate:       {success_rate:.1f}%")
+            print(f"  Total readings:     {stats.count}")
+            print(f"  Communication errors: {stats.failures}")
 
-                # Status distribution
-                status_counts = {}
-                for reading in readings:
-                    status = reading.status.name
-                    status_counts[status] = status_counts.get(status, 0) + 1
+            if stats.count:
+                print(f"  Success rate:       {stats.success_rate:.1f}%")
 
                 print("  Status distribution:")
-                for status, count in status_counts.items():
-                    percentage = (count / len(readings)) * 100
+                for status, count in stats.statuses.items():
+                    percentage = (count / stats.count) * 100
                     print(f"    {status}: {count} ({percentage:.1f}%)")
 
-                # Distance statistics (valid readings only)
-                valid_distances = [r.distance_mm for r in readings
-                                 if r.distance_mm is not None]
-
-                if valid_distances:
+                # Distance statistics (in-range readings only)
+                distance = stats.distance
+                if distance.count:
                     print("  Distance statistics:")
-                    print(f"    Valid measurements: {len(valid_distances)}")
-                    print(f"    Min distance:       {min(valid_distances)} mm")
-                    print(f"    Max distance:       {max(valid_distances)} mm")
-                    print(f"    Average distance:   {sum(valid_distances)/len(valid_distances):.1f} mm")
+                    print(f"    Valid measurements: {distance.count}")
+                    print(f"    Min distance:       {distance.min} mm")
+                    print(f"    Max distance:       {distance.max} mm")
+                    print(f"    Average distance:   {distance.mean:.1f} mm")
+                    print(f"    Std deviation:      {distance.stddev:.1f} mm")
+                    p50, p95, p99 = stats.distance_quantiles.sketch().quantiles((50, 95, 99))
+                    print(f"    p50/p95/p99:        {p50:.0f} / {p95:.0f} / {p99:.0f} mm")
 
                 # Signal quality statistics
-                signals = [r.signal_quality for r in readings]
-                if signals:
-                    print("  Signal quality:")
-                    print(f"    Min signal:         {min(signals)}")
-                    print(f"    Max signal:         {max(signals)}")
-                    print(f"    Average signal:     {sum(signals)/len(signals):.1f}")
+                signal = stats.signal
+                print("  Signal quality:")
+                print(f"    Min signal:         {signal.min}")
+                print(f"    Max signal:         {signal.max}")
+                print(f"    Average signal:     {signal.mean:.1f}")
+                p50, p95, p99 = stats.signal_quantiles.sketch().quantiles((50, 95, 99))
+                print(f"    p50/p95/p99:        {p50:.0f} / {p95:.0f} / {p99:.0f}")
 
     def export_data(self, filename: str = None):
         """
@@ -285,7 +296,10 @@ class SensorMonitor:
 
         Educational Note:
         Data export capabilities are important for further analysis,
-        reporting, and integration with other systems.
+        reporting, and integration with other systems. This builds the
+        whole session in memory, which is fine for short demos; for long
+        captures record with ``start_monitoring(record_path=...)`` and use
+        export_recording() afterwards.
 
         Args:
             filename: Output filename (auto-generated if None)
@@ -321,6 +335,23 @@ class SensorMonitor:
         except Exception as e:
             print(f"✗ Failed to export data: {e}")
 
+    def export_recording(self, record_path: str, filename: str):
+        """
+        Convert a binary recording to JSON lines, one reading at a time.
+
+        Educational Note:
+        The recording is memory-mapped and streamed, so converting a
+        multi-day capture needs no more memory than a single reading.
+
+        Args:
+            record_path: Recording written by start_monitoring
+            filename: Output file (one JSON object per line)
+        """
+        with RecordingReader(record_path) as recording, open(filename, 'w') as f:
+            for reading in recording.readings():
+                f.write(json.dumps(reading.to_dict()) + "\n")
+        print(f"✓ Recording exported to {filename}")
+
 
 def main():
     """
@@ -348,14 +379,17 @@ def main():
 
         # Start monitoring
         print(f"\nPress Ctrl+C to stop monitoring early")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        record_path = f"sensor_data_{timestamp}.dxmrec"
         monitor.start_monitoring(
             unit_ids=sensors,
             duration=MONITOR_DURATION,
-            interval=MONITOR_INTERVAL
+            interval=MONITOR_INTERVAL,
+            record_path=record_path
         )
 
         # Export data
-        monitor.export_data()
+        monitor.export_recording(record_path, f"sensor_data_{timestamp}.jsonl")
 
     except DXMConnectionError as e:
         print(f"Connection error: {e}")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit tests for adaptive per-unit polling.
+
+Poll times are passed explicitly in nanoseconds, and monitoring runs
+against a fake clock, so the tests are exact and instantaneous.
+
+Run tests with:
+    python -m pytest tests/test_adaptive.py -v
+"""
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.adaptive import AdaptivePollPolicy
+from dxm_toolkit.dxm_client import DXMClient
+from dxm_toolkit.scheduler import DeadlineScheduler
+from dxm_toolkit.sensor_decoder import SensorReading, SensorStatus
+
+MS = 1_000_000
+
+
+def make_reading(unit_id, distance_raw, status_raw=303):
+    """Build a reading with the given distance register."""
+    return SensorReading(
+        unit_id=unit_id,
+        timestamp=datetime.now(),
+        status=SensorStatus.NORMAL if status_raw == 303 else SensorStatus.OUT_OF_RANGE,
+        status_raw=status_raw,
+        bdc_states=0,
+        distance_raw=distance_raw,
+        signal_quality=50
+    )
+
+
+class TestAdaptivePollPolicy(unittest.TestCase):
+    """Test interval back-off and recovery."""
+
+    def setUp(self):
+        self.policy = AdaptivePollPolicy(min_interval=0.1, max_interval=0.8,
+                                         change_threshold=50.0, backoff_factor=2.0)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            AdaptivePollPolicy(min_interval=0)
+        with self.assertRaises(ValueError):
+            AdaptivePollPolicy(min_interval=2.0, max_interval=1.0)
+        with self.assertRaises(ValueError):
+            AdaptivePollPolicy(backoff_factor=1.0)
+
+    def test_stable_unit_backs_off_to_max(self):
+        now = 0
+        intervals = []
+        for _ in range(6):
+            intervals.append(self.policy.update(1, make_reading(1, 1000), now))
+            now += int(intervals[-1] * 1e9)
+        self.assertEqual(intervals, [0.1, 0.2, 0.4, 0.8, 0.8, 0.8])
+        self.assertEqual(self.policy.change_rate(1), 0.0)
+
+    def test_fast_change_snaps_back_to_min(self):
+        self.policy.update(1, make_reading(1, 1000), 0)
+        self.policy.update(1, make_reading(1, 1000), 100 * MS)
+        self.assertEqual(self.policy.interval_for(1), 0.2)
+
+        # 30 mm in 200 ms is 150 mm/s, above the threshold
+        interval = self.policy.update(1, make_reading(1, 1030), 300 * MS)
+        self.assertEqual(interval, 0.1)
+        self.assertAlmostEqual(self.policy.change_rate(1), 150.0)
+
+    def test_slow_drift_keeps_backing_off(self):
+        self.policy.update(1, make_reading(1, 1000), 0)
+        # 2 mm in 100 ms is 20 mm/s, below the threshold
+        self.assertEqual(self.policy.update(1, make_reading(1, 1002), 100 * MS), 0.2)
+
+    def test_status_change_is_active(self):
+        self.policy.update(1, make_reading(1, 65535, 271), 0)
+        self.assertEqual(self.policy.update(1, make_reading(1, 65535, 271), 100 * MS), 0.2)
+        # Out of range -> back in range resets even without a rate estimate
+        self.assertEqual(self.policy.update(1, make_reading(1, 900), 300 * MS), 0.1)
+
+    def test_failed_reads_back_off(self):
+        self.assertEqual(self.policy.update(1, None, 0), 0.2)
+        self.assertEqual(self.policy.update(1, None, 200 * MS), 0.4)
+
+    def test_due_units(self):
+        self.assertEqual(self.policy.due_units([1, 2], 0), [1, 2])
+        self.policy.update(1, make_reading(1, 1000), 0)
+        self.policy.update(1, make_reading(1, 1000), 100 * MS)   # next due at 300 ms
+        self.policy.update(2, make_reading(2, 1000), 100 * MS)   # next due at 200 ms
+        self.assertEqual(self.policy.due_units([1, 2], 200 * MS), [2])
+        # Within half a tick of the deadline counts as due
+        self.assertEqual(self.policy.due_units([1, 2], 260 * MS), [1, 2])
+
+
+class FakeClock:
+    """Manually advanced nanosecond clock."""
+
+    def __init__(self):
+        self.now = 1_000 * MS
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += int(round(seconds * 1e9))
+
+
+class TestAdaptiveMonitoring(unittest.TestCase):
+    """Test monitor_sensors with an adaptive policy."""
+
+    def test_idle_units_are_polled_less(self):
+        clock = FakeClock()
+        distances = {1: iter(range(1000, 5000, 40)), 2: iter([])}
+
+        def read_multiple(unit_ids):
+            return {u: make_reading(u, next(distances[u], 1500)) for u in unit_ids}
+
+        client = DXMClient("192.168.0.1")
+        policy = AdaptivePollPolicy(min_interval=0.1, max_interval=0.8)
+
+        def make_scheduler(interval, overrun_policy):
+            return DeadlineScheduler(interval, overrun_policy, clock=clock)
+
+        with patch('dxm_toolkit.scheduler.time.sleep', clock.sleep), \
+                patch('dxm_toolkit.dxm_client.DeadlineScheduler', make_scheduler), \
+                patch.object(client, 'read_multiple_sensors', side_effect=read_multiple):
+            polls = {1: 0, 2: 0}
+            for readings in client.monitor_sensors([1, 2], duration=3.0, adaptive=policy):
+                self.assertTrue(readings)
+                for unit_id in readings:
+                    polls[unit_id] += 1
+
+        # Unit 1 moves 40 mm per 100 ms tick and is read every tick
+        self.assertGreaterEqual(polls[1], 30)
+        self.assertLessEqual(polls[2], 8)
+        self.assertEqual(policy.interval_for(1), 0.1)
+        self.assertEqual(policy.interval_for(2), 0.8)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the AsyncDXMClient module.
+
+The pymodbus async client is replaced with an in-memory fake so the tests
+exercise concurrency and error handling without hardware.
+
+Run tests with:
+    python -m pytest tests/test_async_client.py -v
+"""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.async_client import AsyncDXMClient
+from dxm_toolkit.dxm_client import DXMConnectionError
+from dxm_toolkit.sensor_decoder import SensorStatus
+
+
+class FakeResult:
+    """Minimal stand-in for a pymodbus register response."""
+
+    def __init__(self, registers=None, error=False):
+        self.registers = registers or []
+        self._error = error
+
+    def isError(self):
+        return self._error
+
+
+class FakeSession:
+    """Fake AsyncModbusTcpClient session with a fixed response delay."""
+
+    delay = 0.05
+    units = {1: [303, 0, 1250, 45], 2: [271, 0, 65535, 12], 3: [303, 0, 800, 60]}
+    in_flight = 0
+    max_seen = 0
+
+    def __init__(self, host, port=502, timeout=3, retries=3, **kwargs):
+        self.connected = False
+
+    async def connect(self):
+        self.connected = True
+        return True
+
+    async def read_holding_registers(self, address, count=1, slave=0):
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_seen = max(cls.max_seen, cls.in_flight)
+        try:
+            await asyncio.sleep(cls.delay)
+        finally:
+            cls.in_flight -= 1
+        if slave not in cls.units:
+            return FakeResult(error=True)
+        return FakeResult(cls.units[slave][:count])
+
+    def close(self):
+        self.connected = False
+
+
+class TestAsyncDXMClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncDXMClient against a fake session."""
+
+    def setUp(self):
+        FakeSession.in_flight = 0
+        FakeSession.max_seen = 0
+        patcher = patch('dxm_toolkit.async_client.AsyncModbusTcpClient', FakeSession)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_invalid_arguments(self):
+        """Invalid host or in-flight limit is rejected."""
+        with self.assertRaises(ValueError):
+            AsyncDXMClient(host="999.1.1.1")
+        with self.assertRaises(ValueError):
+            AsyncDXMClient(max_in_flight=0)
+
+    async def test_read_sensor(self):
+        """A single read is decoded into a SensorReading."""
+        async with AsyncDXMClient(host="127.0.0.1") as client:
+            reading = await client.read_sensor(1)
+        self.assertEqual(reading.unit_id, 1)
+        self.assertEqual(reading.status, SensorStatus.NORMAL)
+        self.assertEqual(reading.distance_mm, 1250)
+        self.assertFalse(client.connected)
+
+    async def test_read_multiple_sensors_concurrently(self):
+        """Per-unit reads overlap, so a cycle costs about one round trip."""
+        async with AsyncDXMClient(host="127.0.0.1", retry_attempts=1, max_in_flight=8) as client:
+            start = time.monotonic()
+            readings = await client.read_multiple_sensors([1, 2, 3, 4])
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(set(readings), {1, 2, 3, 4})
+        self.assertEqual(readings[3].distance_mm, 800)
+        self.assertIsNone(readings[4])
+        self.assertLess(elapsed, FakeSession.delay * 3)
+        self.assertEqual(FakeSession.max_seen, 4)
+
+    async def test_in_flight_limit(self):
+        """No more than max_in_flight requests are outstanding."""
+        async with AsyncDXMClient(host="127.0.0.1", max_in_flight=2) as client:
+            await client.read_multiple_sensors([1, 2, 3, 1, 2, 3])
+            self.assertLessEqual(client.get_connection_info()['client_info']['sessions'], 2)
+        self.assertEqual(FakeSession.max_seen, 2)
+
+    async def test_discover_sensors(self):
+        """Discovery probes concurrently and returns sorted unit IDs."""
+        async with AsyncDXMClient(host="127.0.0.1") as client:
+            found = await client.discover_sensors(max_units=6)
+        self.assertEqual(found, [1, 2, 3])
+
+    async def test_monitor_sensors(self):
+        """monitor_sensors is an async generator yielding one dict per cycle."""
+        cycles = []
+        async with AsyncDXMClient(host="127.0.0.1") as client:
+            async for readings in client.monitor_sensors([1, 3], interval=0.01):
+                cycles.append(readings)
+                if len(cycles) == 3:
+                    break
+        self.assertEqual(len(cycles), 3)
+        self.assertEqual(cycles[-1][3].distance_mm, 800)
+
+    async def test_scan_units(self):
+        """A sweep probes in parallel and reports per-unit latency."""
+        client = AsyncDXMClient(host="127.0.0.1")
+        start = time.monotonic()
+        found = await client.scan_units(range(1, 41), probe_timeout=1.0, concurrency=8)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(list(found), [1, 2, 3])
+        self.assertTrue(all(latency >= FakeSession.delay * 1000 * 0.5 for latency in found.values()))
+        # 40 probes on 8 sessions take about 5 round trips, not 40
+        self.assertLess(elapsed, FakeSession.delay * 15)
+        self.assertEqual(FakeSession.max_seen, 8)
+
+    async def test_scan_units_probe_timeout(self):
+        """A silent unit costs one probe timeout, not the request timeout."""
+        class SilentUnitSession(FakeSession):
+            async def read_holding_registers(self, address, count=1, slave=0):
+                if slave == 2:
+                    await asyncio.sleep(10)
+                return await super().read_holding_registers(address, count, slave)
+
+        with patch('dxm_toolkit.async_client.AsyncModbusTcpClient', SilentUnitSession):
+            client = AsyncDXMClient(host="127.0.0.1", timeout=5.0)
+            start = time.monotonic()
+            found = await client.scan_units([1, 2, 3, 4], probe_timeout=0.2, concurrency=4)
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(list(found), [1, 3])
+        self.assertLess(elapsed, 1.0)
+
+    async def test_scan_units_connection_reset(self):
+        """A unit whose probe resets the connection is recorded as absent."""
+        class ResettingSession(FakeSession):
+            async def read_holding_registers(self, address, count=1, slave=0):
+                if slave == 2:
+                    raise ConnectionResetError("Connection reset by peer")
+                return await super().read_holding_registers(address, count, slave)
+
+        with patch('dxm_toolkit.async_client.AsyncModbusTcpClient', ResettingSession):
+            client = AsyncDXMClient(host="127.0.0.1")
+            found = await client.scan_units([1, 2, 3, 4], probe_timeout=1.0, concurrency=2)
+
+        self.assertEqual(list(found), [1, 3])
+
+    async def test_scan_units_invalid_arguments(self):
+        """Bad unit IDs, timeouts and limits are rejected before probing."""
+        client = AsyncDXMClient(host="127.0.0.1")
+        with self.assertRaises(ValueError):
+            await client.scan_units([0, 1])
+        with self.assertRaises(ValueError):
+            await client.scan_units(probe_timeout=0)
+        with self.assertRaises(ValueError):
+            await client.scan_units(concurrency=0)
+
+    async def test_not_connected(self):
+        """Reads before connect() raise DXMConnectionError."""
+        client = AsyncDXMClient(host="127.0.0.1")
+        with self.assertRaises(DXMConnectionError):
+            await client.read_sensor_registers(1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
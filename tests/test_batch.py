@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit tests for columnar reading batches and SensorDecoder.decode_batch.
+
+Run tests with:
+    python -m pytest tests/test_batch.py -v
+"""
+
+import unittest
+from array import array
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.batch import (FLAG_CONNECTED, FLAG_IN_RANGE, NUMPY_AVAILABLE,
+                               ReadingBatch)
+from dxm_toolkit.sensor_decoder import SensorDecoder, SensorStatus
+
+BLOCKS = [
+    [303, 0, 1500, 45],      # Normal
+    [271, 0, 65535, 0],      # Out of range
+    [303, 1, 0, 0],          # Disconnected
+    [999, 2, 800, 12, 7],    # Unknown status, extra register ignored
+]
+UNITS = [1, 2, 3, 4]
+TS = [1_700_000_000_000_000_000 + i * 1_000_000 for i in range(4)]
+
+
+class TestDecodeBatch(unittest.TestCase):
+    """Test batch decoding against the per-reading decoder."""
+
+    def setUp(self):
+        self.decoder = SensorDecoder()
+
+    def test_columns(self):
+        batch = self.decoder.decode_batch(UNITS, BLOCKS, TS)
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(list(batch.column('unit_id')), UNITS)
+        self.assertEqual(list(batch.column('status')), [303, 271, 303, 999])
+        self.assertEqual(list(batch.column('distance')), [1500, 65535, 0, 800])
+        self.assertEqual(list(batch.column('signal')), [45, 0, 0, 12])
+        self.assertEqual(list(batch.column('ts_ns')), TS)
+        self.assertEqual(list(batch.column('flags')),
+                         [FLAG_CONNECTED | FLAG_IN_RANGE, FLAG_CONNECTED, 0,
+                          FLAG_CONNECTED | FLAG_IN_RANGE])
+        self.assertEqual(batch.nbytes, 4 * 18)
+
+    def test_matches_decode_registers(self):
+        batch = self.decoder.decode_batch(UNITS, BLOCKS)
+        for unit_id, block, reading in zip(UNITS, BLOCKS, batch):
+            expected = self.decoder.decode_registers(unit_id, block)
+            for attr in ('unit_id', 'status', 'status_raw', 'bdc_states', 'distance_mm',
+                         'distance_raw', 'signal_quality', 'connected'):
+                self.assertEqual(getattr(reading, attr), getattr(expected, attr), attr)
+        self.assertEqual(batch[-1].status, SensorStatus.UNKNOWN)
+
+    def test_lazy_timestamps(self):
+        batch = self.decoder.decode_batch(UNITS, BLOCKS, TS)
+        self.assertEqual(int(batch[1].timestamp.timestamp() * 1000), TS[1] // 1_000_000)
+        with self.assertRaises(IndexError):
+            batch[4]
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            self.decoder.decode_batch([1, 2], BLOCKS)
+        with self.assertRaises(ValueError):
+            self.decoder.decode_batch([1], [[303, 0, 5]])
+        with self.assertRaises(ValueError):
+            self.decoder.decode_batch(UNITS, BLOCKS, TS[:2])
+
+    def test_select_unit_and_round_trip(self):
+        batch = self.decoder.decode_batch([1, 2, 1, 2], BLOCKS, TS)
+        unit_1 = batch.select_unit(1)
+        self.assertEqual(list(unit_1.column('distance')), [1500, 0])
+
+        rebuilt = ReadingBatch.from_readings(batch.to_readings())
+        for name in ('unit_id', 'status', 'bdc', 'distance', 'signal', 'flags'):
+            self.assertEqual(list(rebuilt.column(name)), list(batch.column(name)))
+
+    def test_empty(self):
+        batch = self.decoder.decode_batch([], [])
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.to_readings(), [])
+        self.assertEqual(len(ReadingBatch.empty()), 0)
+
+    def test_missing_column(self):
+        with self.assertRaises(ValueError):
+            ReadingBatch({'unit_id': array('B', [1])})
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy not installed")
+class TestNumpyBatch(unittest.TestCase):
+    """Test the NumPy path of decode_batch."""
+
+    def test_matrix_matches_lists(self):
+        import numpy as np
+        decoder = SensorDecoder()
+        matrix = np.array([b[:4] for b in BLOCKS], dtype=np.uint16)
+        fast = decoder.decode_batch(UNITS, matrix, TS)
+        slow = decoder.decode_batch(UNITS, BLOCKS, TS)
+        self.assertTrue(fast.is_numpy)
+        for name, column in slow.as_numpy().items():
+            self.assertEqual(column.tolist(), fast.column(name).tolist(), name)
+        self.assertEqual(fast[0].distance_mm, 1500)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Smoke tests for the benchmark stages.
+
+Run tests with:
+    python -m pytest tests/test_benchmarks.py -v
+"""
+
+import unittest
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks import stages
+
+
+class TestBenchmarkStages(unittest.TestCase):
+    """Test percentile summaries and short stage runs."""
+
+    def test_percentile(self):
+        samples = list(range(1, 101))
+        self.assertEqual(stages.percentile(samples, 50), 50)
+        self.assertEqual(stages.percentile(samples, 99), 99)
+        self.assertEqual(stages.percentile(samples, 100), 100)
+        self.assertEqual(stages.percentile([], 50), 0.0)
+
+    def test_summarize(self):
+        summary = stages.summarize([3.0, 1.0, 2.0], 'ms')
+        self.assertEqual(summary['count'], 3)
+        self.assertEqual(summary['p50'], 2.0)
+        self.assertEqual(summary['max'], 3.0)
+        self.assertEqual(summary['unit'], 'ms')
+
+    def test_decoder_stage(self):
+        result = stages.bench_decoder(ops=2000, window=100)
+        self.assertEqual(set(result), {'decode_registers', 'validate_reading',
+                                       'analyze_register_pattern'})
+        self.assertGreater(result['decode_registers']['ops_per_s'], 0)
+
+    def test_read_cpu_stage(self):
+        result = stages.bench_read_cpu(reads=20)
+        self.assertEqual(result['fast_path']['cpu']['count'], 20)
+        self.assertEqual(result['pymodbus']['latency']['unit'], 'ms')
+        self.assertIn('cpu_saved_pct', result)
+
+    def test_cycle_stage(self):
+        result = stages.bench_cycle_time(unit_counts=(1, 2), cycles=5)
+        self.assertEqual(set(result['units']), {'1', '2'})
+        self.assertEqual(result['units']['2']['count'], 5)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Unit tests for per-unit circuit breakers and transparent reconnects.
+
+The breakers run on a fake clock and DXMClient talks to a fake Modbus
+session, so unplugged units and dropped connections are simulated exactly.
+
+Run tests with:
+    python -m pytest tests/test_circuit_breaker.py -v
+"""
+
+import unittest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+from dxm_toolkit.circuit_breaker import BreakerBank, BreakerState, CircuitBreaker
+from dxm_toolkit.dxm_client import (DXMClient, DXMCommunicationError, DXMConnectionError,
+                                    DXMUnitUnavailableError)
+
+
+class FakeClock:
+    """Manually advanced clock in seconds."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    """Minimal pymodbus response."""
+
+    def __init__(self, registers=None, exception_code=None):
+        self.registers = registers or []
+        self.exception_code = exception_code
+
+    def isError(self):
+        return self.exception_code is not None
+
+
+class FakeSession:
+    """Stand-in for ModbusTcpClient with scriptable units and link drops."""
+
+    def __init__(self):
+        self.connected = True
+        self.dead_units = set()
+        self.drop_next = False
+        self.refuse_reconnect = False
+        self.requests = []
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+        self.connected = not self.refuse_reconnect
+        return self.connected
+
+    def close(self):
+        self.connected = False
+
+    def read_holding_registers(self, address, count, slave):
+        self.requests.append(slave)
+        if self.drop_next:
+            self.drop_next = False
+            self.connected = False
+            raise ConnectionException("socket closed")
+        if slave in self.dead_units:
+            raise ModbusIOException("No response received")
+        return FakeResponse([303, 0, 1000, 50][:count])
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test breaker state transitions."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=2, base_backoff=1.0,
+                                      max_backoff=4.0, clock=self.clock)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(base_backoff=5.0, max_backoff=1.0)
+
+    def test_trips_after_threshold(self):
+        self.breaker.record_failure()
+        self.assertIs(self.breaker.state, BreakerState.CLOSED)
+        self.breaker.record_failure()
+        self.assertIs(self.breaker.state, BreakerState.OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.retry_in(), 1.0)
+        self.assertEqual(self.breaker.trips, 1)
+
+    def test_success_resets_failure_count(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertIs(self.breaker.state, BreakerState.CLOSED)
+
+    def test_probe_backoff_doubles_and_caps(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        delays = []
+        for _ in range(4):
+            self.clock.now += self.breaker.retry_in()
+            self.assertTrue(self.breaker.allow())
+            self.assertTrue(self.breaker.probing)
+            # Only one probe at a time
+            self.assertFalse(self.breaker.allow())
+            self.breaker.record_failure()
+            delays.append(self.breaker.retry_in())
+        self.assertEqual(delays, [2.0, 4.0, 4.0, 4.0])
+
+        self.clock.now += 4.0
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_success()
+        self.assertIs(self.breaker.state, BreakerState.CLOSED)
+        self.assertEqual(self.breaker.stats()['backoff'], 1.0)
+
+    def test_abandoned_probe_keeps_backoff(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now += 1.0
+        self.assertTrue(self.breaker.allow())
+        self.breaker.abandon_probe()
+        self.assertIs(self.breaker.state, BreakerState.OPEN)
+        self.assertTrue(self.breaker.allow())
+
+    def test_bank_tracks_units_separately(self):
+        bank = BreakerBank(failure_threshold=1, clock=self.clock)
+        bank[3].record_failure()
+        self.assertEqual(bank.open_units(), [3])
+        self.assertTrue(bank[4].allow())
+        self.assertEqual(set(bank.stats()), {3, 4})
+        bank.reset()
+        self.assertEqual(bank.open_units(), [])
+
+
+class TestClientBreakers(unittest.TestCase):
+    """Test DXMClient with an unplugged unit and a dropping connection."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.session = FakeSession()
+        self.client = DXMClient("192.168.0.1", retry_attempts=3, failure_threshold=2,
+                                probe_backoff=1.0, max_probe_backoff=8.0)
+        self.client._client = self.session
+        self.client._connected = True
+        self.client._breakers = BreakerBank(2, 1.0, 8.0, clock=self.clock)
+        self.client._link_breaker = CircuitBreaker(1, 1.0, 8.0, clock=self.clock)
+
+        patcher = patch('dxm_toolkit.dxm_client.time.sleep')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_dead_unit_costs_nothing_once_tripped(self):
+        self.session.dead_units = {2}
+
+        for _ in range(2):
+            readings = self.client.read_multiple_sensors([1, 2, 3])
+            self.assertIsNone(readings[2])
+            self.assertIsNotNone(readings[1])
+        self.assertEqual(self.session.requests.count(2), 6)
+
+        self.session.requests.clear()
+        for _ in range(10):
+            self.client.read_multiple_sensors([1, 2, 3])
+        self.assertNotIn(2, self.session.requests)
+        self.assertEqual(self.client.get_connection_info()['open_units'], [2])
+
+        with self.assertRaises(DXMUnitUnavailableError):
+            self.client.read_sensor_registers(2)
+
+    def test_probe_is_single_attempt_and_recovers(self):
+        self.session.dead_units = {2}
+        self.client.read_multiple_sensors([2])
+        self.client.read_multiple_sensors([2])
+
+        # Failed probe: one request, then twice the delay
+        self.clock.now += 1.0
+        self.session.requests.clear()
+        self.assertIsNone(self.client.read_multiple_sensors([2])[2])
+        self.assertEqual(self.session.requests, [2])
+        self.assertEqual(self.client.get_unit_health()[2]['retry_in'], 2.0)
+
+        # Unit comes back
+        self.session.dead_units = set()
+        self.clock.now += 2.0
+        self.assertIsNotNone(self.client.read_multiple_sensors([2])[2])
+        self.assertEqual(self.client.get_unit_health()[2]['state'], 'closed')
+
+    def test_exception_response_is_not_retried(self):
+        def refuse(address, count, slave):
+            self.session.requests.append(slave)
+            return FakeResponse(exception_code=0x02)
+
+        self.session.read_holding_registers = refuse
+        with self.assertRaises(DXMCommunicationError):
+            self.client.read_sensor_registers(1)
+        self.assertEqual(self.session.requests, [1])
+        self.assertIs(self.client._breakers[1].state, BreakerState.CLOSED)
+
+    def test_reconnects_after_drop(self):
+        self.session.drop_next = True
+        registers = self.client.read_sensor_registers(1)
+        self.assertEqual(registers, [303, 0, 1000, 50])
+        self.assertEqual(self.session.connects, 1)
+        self.assertEqual(self.client.reconnects, 1)
+        self.assertIs(self.client._breakers[1].state, BreakerState.CLOSED)
+
+    def test_reconnect_backs_off(self):
+        self.session.connected = False
+        self.session.refuse_reconnect = True
+
+        readings = self.client.read_multiple_sensors([1, 2, 3])
+        self.assertEqual(readings, {1: None, 2: None, 3: None})
+        self.assertEqual(self.session.connects, 1)
+
+        # Within the back-off no connection attempt is made
+        with self.assertRaises(DXMConnectionError):
+            self.client.read_sensor_registers(1)
+        self.assertEqual(self.session.connects, 1)
+
+        # Unit breakers are not charged for the link being down
+        self.assertEqual(self.client.get_connection_info()['open_units'], [])
+
+        self.session.refuse_reconnect = False
+        self.clock.now += 1.0
+        self.assertIsNotNone(self.client.read_multiple_sensors([1])[1])
+        self.assertEqual(self.client.reconnects, 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
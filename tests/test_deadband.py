@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Unit tests for change-only reading emission.
+
+Readings carry explicit timestamps, so deadband and heartbeat decisions
+are exact; monitoring runs against a fake clock.
+
+Run tests with:
+    python -m pytest tests/test_deadband.py -v
+"""
+
+import unittest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.deadband import Deadband, DeadbandFilter, parse_deadband, parse_deadbands
+from dxm_toolkit.dxm_client import DXMClient
+from dxm_toolkit.scheduler import DeadlineScheduler
+from dxm_toolkit.sensor_decoder import SensorDecoder
+
+decoder = SensorDecoder()
+
+START_NS = 1_700_000_000_000_000_000
+
+
+def reading(unit_id, distance, n, status=303, bdc=0):
+    """A reading taken n seconds into a run."""
+    return decoder.decode_registers(unit_id, [status, bdc, distance, 40],
+                                    START_NS + int(n * 1_000_000_000))
+
+
+class TestParseDeadband(unittest.TestCase):
+    """Test deadband parsing."""
+
+    def test_millimeters_and_percent(self):
+        self.assertEqual(parse_deadband("5"), Deadband(absolute_mm=5))
+        self.assertEqual(parse_deadband(" 7.5mm "), Deadband(absolute_mm=7.5))
+        self.assertEqual(parse_deadband("2%"), Deadband(percent=2))
+
+    def test_per_unit_overrides(self):
+        default, units = parse_deadbands("10, 3=2%, 7=0")
+        self.assertEqual(default, Deadband(absolute_mm=10))
+        self.assertEqual(units, {3: Deadband(percent=2), 7: Deadband()})
+
+    def test_invalid(self):
+        for text in ("abc", "-1", "x=5", "2%%"):
+            with self.assertRaises(ValueError):
+                parse_deadbands(text)
+
+
+class TestDeadbandFilter(unittest.TestCase):
+    """Test suppression, pass-through and heartbeat decisions."""
+
+    def test_first_reading_passes_and_repeats_are_suppressed(self):
+        change_filter = DeadbandFilter(heartbeat=None)
+        self.assertTrue(change_filter.accept(1, reading(1, 1500, 0)))
+        self.assertFalse(change_filter.accept(1, reading(1, 1500, 1)))
+        self.assertTrue(change_filter.accept(1, reading(1, 1501, 2)))
+
+    def test_absolute_deadband(self):
+        change_filter = DeadbandFilter(Deadband(absolute_mm=10), heartbeat=None)
+        change_filter.accept(1, reading(1, 1500, 0))
+        self.assertFalse(change_filter.accept(1, reading(1, 1510, 1)))
+        self.assertFalse(change_filter.accept(1, reading(1, 1490, 2)))
+        self.assertTrue(change_filter.accept(1, reading(1, 1511, 3)))
+
+    def test_percent_deadband(self):
+        change_filter = DeadbandFilter(Deadband(percent=2), heartbeat=None)
+        change_filter.accept(1, reading(1, 2000, 0))
+        self.assertFalse(change_filter.accept(1, reading(1, 2040, 1)))
+        self.assertTrue(change_filter.accept(1, reading(1, 1959, 2)))
+
+    def test_slow_drift_is_reported_against_last_emitted(self):
+        change_filter = DeadbandFilter(Deadband(absolute_mm=10), heartbeat=None)
+        emitted = [change_filter.accept(1, reading(1, 1500 + 4 * n, n)) for n in range(6)]
+        # 4 mm per step: suppressed until 12 mm have added up
+        self.assertEqual(emitted, [True, False, False, True, False, False])
+
+    def test_per_unit_deadband(self):
+        change_filter = DeadbandFilter(Deadband(absolute_mm=100), {2: Deadband()},
+                                       heartbeat=None)
+        result = change_filter.filter_cycle({1: reading(1, 1500, 0), 2: reading(2, 1500, 0)})
+        self.assertEqual(set(result), {1, 2})
+        result = change_filter.filter_cycle({1: reading(1, 1550, 1), 2: reading(2, 1550, 1)})
+        self.assertEqual(set(result), {2})
+
+    def test_status_and_bdc_changes_pass_immediately(self):
+        change_filter = DeadbandFilter(Deadband(absolute_mm=1000), heartbeat=None)
+        change_filter.accept(1, reading(1, 1500, 0))
+        self.assertTrue(change_filter.accept(1, reading(1, 1500, 1, bdc=1)))
+        self.assertTrue(change_filter.accept(1, reading(1, 65535, 2, status=271, bdc=1)))
+        self.assertFalse(change_filter.accept(1, reading(1, 65535, 3, status=271, bdc=1)))
+        self.assertEqual(change_filter.stats()['reasons'], {'first': 1, 'status': 1, 'bdc': 1})
+
+    def test_failures_and_recovery(self):
+        change_filter = DeadbandFilter(heartbeat=None)
+        change_filter.accept(1, reading(1, 1500, 0))
+        self.assertTrue(change_filter.accept(1, None, START_NS + 10**9))
+        self.assertFalse(change_filter.accept(1, None, START_NS + 2 * 10**9))
+        self.assertTrue(change_filter.accept(1, reading(1, 1500, 3)))
+
+    def test_heartbeat(self):
+        change_filter = DeadbandFilter(heartbeat=5.0)
+        emitted = [n for n in range(12) if change_filter.accept(1, reading(1, 1500, n))]
+        self.assertEqual(emitted, [0, 5, 10])
+        self.assertEqual(change_filter.reasons['heartbeat'], 2)
+
+    def test_stats(self):
+        change_filter = DeadbandFilter(heartbeat=None)
+        for n in range(10):
+            change_filter.accept(1, reading(1, 1500, n))
+        stats = change_filter.stats()
+        self.assertEqual((stats['received'], stats['emitted'], stats['suppressed']), (10, 1, 9))
+        self.assertAlmostEqual(stats['suppressed_ratio'], 0.9)
+        change_filter.reset()
+        self.assertEqual(change_filter.stats()['received'], 0)
+        self.assertTrue(change_filter.accept(1, reading(1, 1500, 11)))
+
+    def test_negative_heartbeat_rejected(self):
+        with self.assertRaises(ValueError):
+            DeadbandFilter(heartbeat=-1)
+
+
+class FakeClock:
+    """Manually advanced nanosecond clock."""
+
+    def __init__(self):
+        self.now = 1_000_000_000
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += int(round(seconds * 1e9))
+
+
+class TestChangeOnlyMonitoring(unittest.TestCase):
+    """Test monitor_sensors with a change filter."""
+
+    def test_quiet_cycles_are_not_yielded(self):
+        clock = FakeClock()
+        cycle = iter(range(100))
+
+        def read_multiple(unit_ids):
+            n = next(cycle)
+            # Unit 1 is static; unit 2 steps by 50 mm every fifth cycle
+            return {1: reading(1, 1500, n), 2: reading(2, 2000 + 50 * (n // 5), n)}
+
+        client = DXMClient("192.168.0.1")
+        change_filter = DeadbandFilter(Deadband(absolute_mm=10), heartbeat=None)
+
+        def make_scheduler(interval, overrun_policy):
+            return DeadlineScheduler(interval, overrun_policy, clock=clock)
+
+        with patch('dxm_toolkit.scheduler.time.sleep', clock.sleep), \
+                patch('dxm_toolkit.dxm_client.DeadlineScheduler', make_scheduler), \
+                patch.object(client, 'read_multiple_sensors', side_effect=read_multiple):
+            cycles = list(client.monitor_sensors([1, 2], interval=0.1, duration=1.85,
+                                                 history_cycles=50,
+                                                 change_filter=change_filter))
+
+        self.assertEqual(cycles[0].keys(), {1, 2})
+        self.assertTrue(all(set(readings) == {2} for readings in cycles[1:]))
+        self.assertEqual(len(cycles), 4)
+        self.assertEqual(len(client.history), 4)
+        self.assertEqual(change_filter.stats()['suppressed'], 40 - 5)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -387,6 +387,91 @@ class TestSensorReading(unittest.TestCase):
         display_no_color = self.reading.format_for_display(use_colors=False)
         self.assertIsInstance(display_no_color, str)
 
+    def test_integer_timestamp(self):
+        """The timestamp is held as epoch nanoseconds and converted on access."""
+        when = datetime(2024, 3, 1, 12, 0, 0, 123456)
+        reading = SensorReading(1, when, SensorStatus.NORMAL, 303, 0, 1250, 45)
+        self.assertEqual(reading.timestamp, when)
+        self.assertEqual(reading.iso_timestamp, when.isoformat())
+        self.assertEqual(reading.ts_ns % 1_000_000_000, 123456000)
+
+        by_ns = SensorReading(1, None, SensorStatus.NORMAL, 303, 0, 1250, 45,
+                              ts_ns=reading.ts_ns)
+        self.assertEqual(by_ns, reading)
+
+    def test_slotted_record(self):
+        """Readings are slotted, copy on with_host and survive pickling."""
+        import pickle
+
+        self.assertFalse(hasattr(self.reading, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.reading.extra = 10
+        self.assertIs(self.reading.status, SensorStatus.NORMAL)
+
+        tagged = self.reading.with_host("line-1")
+        self.assertIsNone(self.reading.host)
+        self.assertEqual(tagged.host, "line-1")
+        self.assertEqual(tagged.distance_mm, 1250)
+
+        restored = pickle.loads(pickle.dumps(tagged))
+        self.assertIsInstance(restored, SensorReading)
+        self.assertEqual(restored, tagged)
+
+    def test_wire_round_trip(self):
+        """to_bytes()/from_bytes() keep every field, host included."""
+        tagged = self.reading.with_host("line-1")
+        data = tagged.to_bytes()
+        self.assertIs(type(data), bytes)
+        self.assertEqual(len(data), SensorReading.WIRE_HEADER.size + len("line-1"))
+        self.assertEqual(SensorReading.from_bytes(data), tagged)
+        self.assertEqual(SensorReading.from_bytes(memoryview(self.reading.to_bytes())),
+                         self.reading)
+
+    def test_equality_by_fields(self):
+        """Readings compare by all fields, host included, and are unhashable."""
+        same = SensorReading.from_bytes(self.reading.to_bytes())
+        self.assertEqual(same, self.reading)
+        self.assertNotEqual(self.reading, self.reading.to_bytes())
+        self.assertNotEqual(self.reading.with_host("line-1"), self.reading)
+        self.assertEqual(self.reading.with_host("line-1").with_host(None), self.reading)
+        with self.assertRaises(TypeError):
+            hash(self.reading)
+
+    def test_memory_footprint(self):
+        """Kept-alive readings need clearly less memory than the former dataclass."""
+        import tracemalloc
+        from dataclasses import dataclass
+
+        @dataclass
+        class DataclassReading:
+            unit_id: int
+            timestamp: datetime
+            status: SensorStatus
+            status_raw: int
+            bdc_states: int
+            distance_raw: int
+            signal_quality: int
+            connected: bool = True
+            valid: bool = True
+            host: object = None
+            distance_mm: object = None
+
+        def held(factory, count=5000):
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            readings = [factory(i) for i in range(count)]
+            used = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+            del readings
+            return used / count
+
+        dataclass_bytes = held(lambda i: DataclassReading(
+            1, datetime.now(), SensorStatus.NORMAL, 303, 0, 1000 + i, 45, distance_mm=1000 + i))
+        slotted_bytes = held(lambda i: SensorReading(
+            1, None, SensorStatus.NORMAL, 303, 0, 1000 + i, 45,
+            ts_ns=1_700_000_000_000_000_000 + i))
+        self.assertGreaterEqual(dataclass_bytes / slotted_bytes, 1.3)
+
 
 class TestSensorDecoderEdgeCases(unittest.TestCase):
     """
@@ -468,12 +553,12 @@ class TestMockIntegration(unittest.TestCase):
         """Set up decoder for mock testing."""
         self.decoder = SensorDecoder()
 
-    @patch('dxm_toolkit.sensor_decoder.datetime')
-    def test_decode_with_mocked_timestamp(self, mock_datetime):
+    @patch('dxm_toolkit.sensor_decoder.time')
+    def test_decode_with_mocked_timestamp(self, mock_time):
         """Test decoding with controlled timestamp."""
-        # Mock datetime.now() to return fixed time
+        # Mock time.time_ns() (the decoder's clock) to return fixed time
         fixed_time = datetime(2023, 10, 15, 14, 30, 25)
-        mock_datetime.now.return_value = fixed_time
+        mock_time.time_ns.return_value = int(fixed_time.timestamp()) * 1_000_000_000
 
         registers = [303, 0, 1250, 45]
         reading = self.decoder.decode_registers(1, registers)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent discovery cache.
+
+Run tests with:
+    python -m pytest tests/test_discovery_cache.py -v
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.discovery_cache import DiscoveryCache
+from dxm_toolkit.dxm_client import DXMClient
+
+
+class FakeClock:
+    """Manually advanced wall clock in seconds."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    """Minimal pymodbus response."""
+
+    def __init__(self, ok):
+        self.ok = ok
+        self.registers = [303]
+
+    def isError(self):
+        return not self.ok
+
+
+class FakeSession:
+    """Stand-in for ModbusTcpClient that answers for a set of units."""
+
+    def __init__(self, units):
+        self.connected = True
+        self.units = set(units)
+        self.probes = []
+
+    def read_holding_registers(self, address, count, slave):
+        self.probes.append(slave)
+        return FakeResponse(slave in self.units)
+
+
+class TestDiscoveryCache(unittest.TestCase):
+    """Test storage, expiry and scan-width rules."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / 'sub' / 'discovery.json'
+        self.clock = FakeClock()
+        self.cache = DiscoveryCache(self.path, ttl=60.0, clock=self.clock)
+
+    def test_round_trip(self):
+        self.assertIsNone(self.cache.lookup('10.0.0.1', 502, 8))
+        self.cache.store('10.0.0.1', 502, 8, [3, 1])
+        self.assertEqual(self.cache.lookup('10.0.0.1', 502, 8), [1, 3])
+        # Keyed by host and port
+        self.assertIsNone(self.cache.lookup('10.0.0.1', 5020, 8))
+        self.assertIsNone(self.cache.lookup('10.0.0.2', 502, 8))
+
+    def test_shared_between_instances(self):
+        self.cache.store('10.0.0.1', 502, 8, [2])
+        other = DiscoveryCache(self.path, ttl=60.0, clock=self.clock)
+        self.assertEqual(other.lookup('10.0.0.1', 502, 8), [2])
+
+    def test_expiry(self):
+        self.cache.store('10.0.0.1', 502, 8, [1])
+        self.clock.now += 61
+        self.assertIsNone(self.cache.lookup('10.0.0.1', 502, 8))
+
+    def test_scan_width(self):
+        self.cache.store('10.0.0.1', 502, 8, [1, 7])
+        # A narrower request uses the subset; a wider one needs a new scan
+        self.assertEqual(self.cache.lookup('10.0.0.1', 502, 4), [1])
+        self.assertIsNone(self.cache.lookup('10.0.0.1', 502, 16))
+
+    def test_corrupt_file_is_ignored(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text("{not json")
+        self.assertIsNone(self.cache.lookup('10.0.0.1', 502, 8))
+        self.cache.store('10.0.0.1', 502, 8, [1])
+        self.assertEqual(json.loads(self.path.read_text())['10.0.0.1:502']['unit_ids'], [1])
+
+    def test_invalidate(self):
+        self.cache.store('10.0.0.1', 502, 8, [1])
+        self.cache.store('10.0.0.2', 502, 8, [2])
+        self.cache.invalidate('10.0.0.1', 502)
+        self.assertIsNone(self.cache.lookup('10.0.0.1', 502, 8))
+        self.assertEqual(self.cache.lookup('10.0.0.2', 502, 8), [2])
+        self.cache.clear()
+        self.assertFalse(self.path.exists())
+
+
+class TestCachedDiscovery(unittest.TestCase):
+    """Test DXMClient.discover_sensors with a cache."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = DiscoveryCache(Path(tmp.name) / 'discovery.json')
+
+        self.session = FakeSession({2, 5})
+        self.client = DXMClient("192.168.0.1")
+        self.client._client = self.session
+        self.client._connected = True
+
+        patcher = patch('dxm_toolkit.dxm_client.time.sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_second_discovery_only_probes_known_units(self):
+        self.assertEqual(self.client.discover_sensors(8, cache=self.cache), [2, 5])
+        self.assertEqual(len(self.session.probes), 8)
+
+        self.session.probes.clear()
+        self.sleep.reset_mock()
+        self.assertEqual(self.client.discover_sensors(8, cache=self.cache), [2, 5])
+        self.assertEqual(self.session.probes, [2, 5])
+        self.sleep.assert_not_called()
+
+    def test_missing_unit_triggers_rescan(self):
+        self.client.discover_sensors(8, cache=self.cache)
+        self.session.units = {2, 6}
+
+        self.assertEqual(self.client.discover_sensors(8, cache=self.cache), [2, 6])
+        self.assertEqual(self.cache.lookup("192.168.0.1", 502, 8), [2, 6])
+
+    def test_rediscover_forces_full_scan(self):
+        self.client.discover_sensors(8, cache=self.cache)
+        self.session.units = {2, 5, 7}
+        self.session.probes.clear()
+
+        self.assertEqual(self.client.discover_sensors(8, cache=self.cache, rediscover=True),
+                         [2, 5, 7])
+        self.assertEqual(len(self.session.probes), 8)
+
+    def test_empty_result_is_not_cached(self):
+        self.session.units = set()
+        self.assertEqual(self.client.discover_sensors(8, cache=self.cache), [])
+        self.assertIsNone(self.cache.lookup("192.168.0.1", 502, 8))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
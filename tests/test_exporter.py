@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Prometheus metrics exporter.
+
+Rendering is checked on hand-made readings and metrics; the HTTP tests
+poll a local simulator and scrape the exporter with urllib.
+
+Run tests with:
+    python -m pytest tests/test_exporter.py -v
+"""
+
+import time
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.dxm_client import DXMClient
+from dxm_toolkit.exporter import (MetricsExporter, parse_listen, render_client_metrics,
+                                  render_readings)
+from dxm_toolkit.metrics import ClientMetrics
+from dxm_toolkit.sensor_decoder import SensorReading, SensorStatus
+from dxm_toolkit.simulator import DXMSimulator, UnitProfile
+
+
+def make_reading(unit_id, distance_raw, status=SensorStatus.NORMAL):
+    return SensorReading(unit_id, None, status, int(status), 0, distance_raw, 42,
+                         ts_ns=1_700_000_000_000_000_000)
+
+
+class TestRendering(unittest.TestCase):
+    """Test the text exposition output."""
+
+    def test_parse_listen(self):
+        self.assertEqual(parse_listen("127.0.0.1:9850"), ("127.0.0.1", 9850))
+        self.assertEqual(parse_listen(":9850"), ("0.0.0.0", 9850))
+        self.assertEqual(parse_listen("[::1]:9850"), ("::1", 9850))
+        for bad in ("9850", "host:", "host:http", "host:70000"):
+            with self.assertRaises(ValueError):
+                parse_listen(bad)
+
+    def test_readings(self):
+        readings = {1: make_reading(1, 1250), 2: make_reading(2, 65535, SensorStatus.OUT_OF_RANGE)}
+        lines = render_readings('dxm"1', readings, {1: True, 2: True, 3: False})
+
+        self.assertIn('# TYPE dxm_sensor_distance_mm gauge', lines)
+        self.assertIn('dxm_sensor_distance_mm{host="dxm\\"1",unit="1"} 1250', lines)
+        # Out of range: no distance sample, but the status says why
+        self.assertFalse(any(l.startswith('dxm_sensor_distance_mm{host="dxm\\"1",unit="2"')
+                             for l in lines))
+        self.assertIn('dxm_sensor_status{host="dxm\\"1",unit="2",status="OUT_OF_RANGE"} 1', lines)
+        self.assertIn('dxm_sensor_up{host="dxm\\"1",unit="3"} 0', lines)
+        self.assertIn('dxm_sensor_reading_timestamp_seconds{host="dxm\\"1",unit="1"} 1700000000.0',
+                      lines)
+
+    def test_client_histogram(self):
+        metrics = ClientMetrics()
+        for latency_ms in (0.5, 3, 3, 40, 7000):
+            metrics.record_request(1, int(latency_ms * 1e6), registers=4)
+        metrics.record_request(1, 1_000_000, error='exception_0x0B')
+        lines = render_client_metrics('dxm', metrics, open_units=[1])
+
+        def sample(suffix, **labels):
+            prefix = 'dxm_client_request_duration_seconds' + suffix + '{host="dxm",unit="1"'
+            prefix += ''.join(f',{k}="{v}"' for k, v in labels.items()) + '} '
+            return next(l[len(prefix):] for l in lines if l.startswith(prefix))
+
+        self.assertEqual(sample('_bucket', le='0.001'), '1')
+        self.assertEqual(sample('_bucket', le='0.005'), '4')
+        self.assertEqual(sample('_bucket', le='5.0'), '5')
+        self.assertEqual(sample('_bucket', le='+Inf'), '6')
+        self.assertEqual(sample('_count'), '6')
+        self.assertAlmostEqual(float(sample('_sum')), 7.0475)
+        self.assertIn('dxm_client_errors_total{host="dxm",unit="1",error="exception_0x0B"} 1', lines)
+        self.assertIn('dxm_client_breaker_open{host="dxm",unit="1"} 1', lines)
+
+
+class TestMetricsExporter(unittest.TestCase):
+    """Test polling and serving against the simulator."""
+
+    def test_scrapes_do_not_poll(self):
+        with DXMSimulator([UnitProfile(1), UnitProfile(2)], port=0).running() as sim:
+            with DXMClient("127.0.0.1", port=sim.port) as client:
+                exporter = MetricsExporter(client, [1, 2], interval=60.0)
+                exporter.poll_once()
+                requests = client.metrics.totals()['requests']
+
+                pages = [exporter.scrape().decode() for _ in range(20)]
+
+        self.assertEqual(client.metrics.totals()['requests'], requests)
+        self.assertIn('dxm_up{host="127.0.0.1"} 1', pages[-1])
+        self.assertIn('dxm_exporter_scrapes_total 20', pages[-1])
+
+    def test_http_endpoint(self):
+        with DXMSimulator([UnitProfile(1, waveform='constant', center=900)], port=0).running() as sim:
+            with DXMClient("127.0.0.1", port=sim.port) as client:
+                with MetricsExporter(client, [1], interval=0.05) as exporter:
+                    exporter.start('127.0.0.1', 0)
+                    host, port = exporter.address
+                    deadline = time.monotonic() + 5
+                    while not client.metrics.units and time.monotonic() < deadline:
+                        time.sleep(0.01)
+                    time.sleep(0.1)
+
+                    with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+                        content_type = response.headers['Content-Type']
+                        body = response.read().decode()
+                    with self.assertRaises(urllib.error.HTTPError):
+                        urllib.request.urlopen(f"http://{host}:{port}/other")
+
+        self.assertTrue(content_type.startswith('text/plain; version=0.0.4'))
+        self.assertIn('dxm_sensor_distance_mm{host="127.0.0.1",unit="1"} 900', body)
+        self.assertIn('# TYPE dxm_client_request_duration_seconds histogram', body)
+        self.assertTrue(body.endswith('\n'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
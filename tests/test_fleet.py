@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the fleet poller and host inventory loader.
+
+Run tests with:
+    python -m pytest tests/test_fleet.py -v
+"""
+
+import asyncio
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.fleet import FleetPoller, HostSpec, load_inventory
+from dxm_toolkit.utils import parse_unit_ids
+
+
+class FakeResult:
+    """Minimal stand-in for a pymodbus register response."""
+
+    def __init__(self, registers=None, error=False):
+        self.registers = registers or []
+        self._error = error
+
+    def isError(self):
+        return self._error
+
+
+class FakeSession:
+    """Fake AsyncModbusTcpClient; 10.0.0.99 is unreachable, 10.0.0.98 slow to connect."""
+
+    in_flight = 0
+    max_seen = 0
+    connects = []
+
+    def __init__(self, host, port=502, timeout=3, retries=3, **kwargs):
+        self.host = host
+        self.connected = False
+
+    async def connect(self):
+        type(self).connects.append(self.host)
+        if self.host == "10.0.0.98":
+            await asyncio.sleep(0.5)
+        self.connected = self.host != "10.0.0.99"
+        return self.connected
+
+    async def read_holding_registers(self, address, count=1, slave=0):
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_seen = max(cls.max_seen, cls.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            cls.in_flight -= 1
+        if slave > 3:
+            return FakeResult(error=True)
+        octet = int(self.host.split('.')[-1])
+        return FakeResult([303, 0, octet * 100 + slave, 50][:count])
+
+    def close(self):
+        self.connected = False
+
+
+class TestInventory(unittest.TestCase):
+    """Test YAML/CSV inventory loading."""
+
+    def _write(self, suffix, text):
+        handle = tempfile.NamedTemporaryFile('w', suffix=suffix, delete=False)
+        handle.write(text)
+        handle.close()
+        self.addCleanup(Path(handle.name).unlink)
+        return handle.name
+
+    def test_parse_unit_ids(self):
+        self.assertEqual(parse_unit_ids("3,1-2, 5"), [1, 2, 3, 5])
+        with self.assertRaises(ValueError):
+            parse_unit_ids("0-3")
+
+    def test_load_yaml(self):
+        path = self._write('.yaml', "hosts:\n"
+                                    "  - 10.0.0.1\n"
+                                    "  - {host: 10.0.0.2, port: 5020, name: line2, units: 1-4}\n")
+        hosts = load_inventory(path)
+        self.assertEqual([h.name for h in hosts], ["10.0.0.1", "line2"])
+        self.assertIsNone(hosts[0].unit_ids)
+        self.assertEqual(hosts[1].port, 5020)
+        self.assertEqual(hosts[1].unit_ids, [1, 2, 3, 4])
+
+    def test_load_csv(self):
+        path = self._write('.csv', "host,port,name,units\n"
+                                   "10.0.0.1,,press,\"1,2\"\n"
+                                   "10.0.0.2,502,,\n")
+        hosts = load_inventory(path)
+        self.assertEqual(hosts[0].unit_ids, [1, 2])
+        self.assertEqual(hosts[0].port, 502)
+        self.assertEqual(hosts[1].name, "10.0.0.2")
+
+    def test_duplicate_names_rejected(self):
+        path = self._write('.yaml', "- 10.0.0.1\n- 10.0.0.1\n")
+        with self.assertRaises(ValueError):
+            load_inventory(path)
+
+    def test_hostname_rejected(self):
+        path = self._write('.yaml', "- 10.0.0.1\n- {host: dxm-01.local, name: press}\n")
+        with self.assertRaisesRegex(ValueError, "dxm-01.local"):
+            load_inventory(path)
+
+
+class TestFleetPoller(unittest.IsolatedAsyncioTestCase):
+    """Test fleet polling against fake sessions."""
+
+    def setUp(self):
+        FakeSession.in_flight = 0
+        FakeSession.max_seen = 0
+        FakeSession.connects = []
+        patcher = patch('dxm_toolkit.async_client.AsyncModbusTcpClient', FakeSession)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_poll_once_tags_readings(self):
+        hosts = [HostSpec("10.0.0.1", unit_ids=[1, 2]), HostSpec("10.0.0.2", name="line2")]
+        async with FleetPoller(hosts, max_units=5) as poller:
+            readings = await poller.poll_once()
+            info = poller.get_fleet_info()
+
+        by_key = {(r.host, r.unit_id): r for r in readings}
+        self.assertEqual(set(by_key), {("10.0.0.1", 1), ("10.0.0.1", 2),
+                                       ("line2", 1), ("line2", 2), ("line2", 3)})
+        self.assertEqual(by_key[("line2", 3)].distance_mm, 203)
+        self.assertEqual(info["line2"]["unit_ids"], [1, 2, 3])
+
+    async def test_unreachable_host_skipped(self):
+        hosts = [HostSpec("10.0.0.1", unit_ids=[1]), HostSpec("10.0.0.99", unit_ids=[1])]
+        async with FleetPoller(hosts) as poller:
+            readings = await poller.poll_once()
+            info = poller.get_fleet_info()
+
+        self.assertEqual([r.host for r in readings], ["10.0.0.1"])
+        self.assertFalse(info["10.0.0.99"]["connected"])
+
+    async def test_invalid_host_only_fails_itself(self):
+        hosts = [HostSpec("10.0.0.1", unit_ids=[1]), HostSpec("dxm-01.local", unit_ids=[1])]
+        async with FleetPoller(hosts) as poller:
+            readings = await poller.poll_once()
+            info = poller.get_fleet_info()
+
+        self.assertEqual([r.host for r in readings], ["10.0.0.1"])
+        self.assertFalse(info["dxm-01.local"]["connected"])
+
+    async def test_slow_host_does_not_hold_up_others(self):
+        hosts = [HostSpec("10.0.0.98", unit_ids=[1]), HostSpec("10.0.0.1", unit_ids=[1, 2])]
+        async with FleetPoller(hosts) as poller:
+            start = time.monotonic()
+            arrivals = []
+            async for reading in poller._cycle():
+                arrivals.append((reading.host, time.monotonic() - start))
+
+        self.assertEqual([host for host, _ in arrivals], ["10.0.0.1", "10.0.0.1", "10.0.0.98"])
+        self.assertLess(arrivals[1][1], 0.25)
+
+    async def test_unreachable_host_backs_off(self):
+        hosts = [HostSpec("10.0.0.1", unit_ids=[1]), HostSpec("10.0.0.99", unit_ids=[1])]
+        async with FleetPoller(hosts, reconnect_backoff=0.2) as poller:
+            for _ in range(3):
+                readings = await poller.poll_once()
+            self.assertEqual(FakeSession.connects.count("10.0.0.99"), 1)
+            self.assertEqual(poller.get_fleet_info()["10.0.0.99"]["reconnect"]["state"], "open")
+            await asyncio.sleep(0.25)
+            await poller.poll_once()
+
+        self.assertEqual([r.host for r in readings], ["10.0.0.1"])
+        self.assertEqual(FakeSession.connects.count("10.0.0.99"), 2)
+        self.assertEqual(FakeSession.connects.count("10.0.0.1"), 1)
+
+    async def test_global_concurrency_limit(self):
+        hosts = [HostSpec(f"10.0.1.{i}", unit_ids=[1, 2, 3]) for i in range(1, 11)]
+        async with FleetPoller(hosts, global_concurrency=4, per_host_concurrency=2) as poller:
+            readings = await poller.poll_once()
+
+        self.assertEqual(len(readings), 30)
+        self.assertLessEqual(FakeSession.max_seen, 4)
+
+    async def test_stream_duration(self):
+        hosts = [HostSpec("10.0.0.1", unit_ids=[1])]
+        async with FleetPoller(hosts) as poller:
+            readings = [r async for r in poller.stream(interval=0.01, duration=0.2)]
+        self.assertGreaterEqual(len(readings), 2)
+
+    async def test_stream_stops_without_readings(self):
+        checks = []
+
+        def stop():
+            checks.append(None)
+            return len(checks) >= 4
+
+        hosts = [HostSpec("10.0.0.99", unit_ids=[1])]
+        async with FleetPoller(hosts) as poller:
+            readings = [r async for r in poller.stream(interval=0.01, stop=stop)]
+        self.assertEqual(readings, [])
+        self.assertEqual(len(checks), 4)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
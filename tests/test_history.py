@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the bounded columnar reading history.
+
+Run tests with:
+    python -m pytest tests/test_history.py -v
+"""
+
+import unittest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.dxm_client import DXMClient
+from dxm_toolkit.history import ReadingHistory
+from dxm_toolkit.sensor_decoder import SensorDecoder
+
+
+def make_cycle(cycle, unit_ids, failed=()):
+    """Readings for one cycle; distance encodes the cycle and unit."""
+    decoder = SensorDecoder()
+    return {
+        unit_id: None if unit_id in failed else
+        decoder.decode_registers(unit_id, [303, 0, cycle * 10 + unit_id, 40])
+        for unit_id in unit_ids
+    }
+
+
+class TestReadingHistory(unittest.TestCase):
+    """Test ring buffer retention and reconstruction."""
+
+    def test_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            ReadingHistory(0, 4)
+        with self.assertRaises(ValueError):
+            ReadingHistory(4, 0)
+
+    def test_round_trip(self):
+        history = ReadingHistory(4, 2)
+        readings = make_cycle(1, [1, 2])
+        history.append(0, readings)
+
+        restored = history.latest()
+        self.assertEqual(list(restored), [1, 2])
+        for unit_id, reading in readings.items():
+            self.assertEqual(restored[unit_id].distance_mm, reading.distance_mm)
+            self.assertEqual(restored[unit_id].status, reading.status)
+            self.assertEqual(restored[unit_id].signal_quality, 40)
+            self.assertAlmostEqual(restored[unit_id].timestamp.timestamp(),
+                                   reading.timestamp.timestamp(), places=5)
+
+    def test_bounded_to_max_cycles(self):
+        history = ReadingHistory(3, 2)
+        for cycle in range(10):
+            history.append(cycle, make_cycle(cycle, [1, 2]))
+
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history.row_count, 6)
+        self.assertEqual(list(history.column('cycle')), [7, 7, 8, 8, 9, 9])
+        self.assertEqual([c[1].distance_mm for c in history.cycles()], [71, 81, 91])
+        self.assertEqual(history.nbytes, 6 * 26)
+
+    def test_partial_cycles_and_failures(self):
+        """Cycles may hold fewer units (adaptive polling) or failed reads."""
+        history = ReadingHistory(3, 3)
+        history.append(0, make_cycle(0, [1, 2, 3], failed=[2]))
+        history.append(1, make_cycle(1, [1]))
+        history.append(2, make_cycle(2, [1, 3]))
+        history.append(3, make_cycle(3, [1, 2, 3]))
+
+        self.assertEqual([len(c) for c in history.cycles()], [1, 2, 3])
+        self.assertEqual(history.unit_series(1)[1], [11, 21, 31])
+
+        history.append(4, make_cycle(4, [2], failed=[2]))
+        self.assertIsNone(history.latest()[2])
+        self.assertEqual(history.unit_series(2)[1], [32])
+
+    def test_to_batch(self):
+        history = ReadingHistory(2, 2)
+        history.append(0, make_cycle(0, [1, 2], failed=[2]))
+        history.append(1, make_cycle(1, [1, 2]))
+        batch = history.to_batch()
+        self.assertEqual(list(batch.column('unit_id')), [1, 1, 2])
+        self.assertEqual(list(batch.column('distance')), [1, 11, 12])
+        self.assertEqual(batch[2].distance_mm, 12)
+
+    def test_cycle_too_large(self):
+        history = ReadingHistory(2, 1)
+        with self.assertRaises(ValueError):
+            history.append(0, make_cycle(0, [1, 2]))
+
+
+class TestMonitorHistory(unittest.TestCase):
+    """Test history retention in DXMClient.monitor_sensors."""
+
+    def run_monitor(self, cycles, **kwargs):
+        client = DXMClient("192.168.0.1")
+        counter = iter(range(cycles))
+
+        with patch('dxm_toolkit.scheduler.time.sleep'), \
+                patch.object(client, 'read_multiple_sensors',
+                             side_effect=lambda units: make_cycle(next(counter), units)):
+            monitor = client.monitor_sensors([1, 2], interval=0.01, **kwargs)
+            for _ in range(cycles):
+                next(monitor)
+            monitor.close()
+        return client
+
+    def test_history_is_opt_in(self):
+        client = self.run_monitor(5)
+        self.assertIsNone(client.history)
+
+    def test_history_is_bounded(self):
+        client = self.run_monitor(50, history_cycles=10)
+        self.assertEqual(len(client.history), 10)
+        self.assertEqual(list(client.history.column('cycle')),
+                         [c for c in range(40, 50) for _ in (1, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
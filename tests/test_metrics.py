@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the client metrics registry.
+
+The histogram is checked against exact percentiles of known samples; the
+client tests poll a local simulator and inspect DXMClient.metrics.
+
+Run tests with:
+    python -m pytest tests/test_metrics.py -v
+"""
+
+import math
+import random
+import unittest
+from pathlib import Path
+
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pymodbus.pdu import ExceptionResponse
+
+from dxm_toolkit.dxm_client import DXMClient
+from dxm_toolkit.metrics import (ClientMetrics, LatencyHistogram, MAX_TRACKED_NS,
+                                 error_name)
+from dxm_toolkit.simulator import DXMSimulator, UnitProfile
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test percentile accuracy and merging."""
+
+    def test_percentiles_within_bucket_error(self):
+        rng = random.Random(3)
+        samples = sorted(int(rng.lognormvariate(15, 1.0)) for _ in range(5000))
+        hist = LatencyHistogram()
+        for value in samples:
+            hist.record(value)
+
+        for q in (50, 90, 99, 99.9):
+            exact = samples[max(1, math.ceil(len(samples) * q / 100)) - 1]
+            self.assertGreaterEqual(hist.percentile(q), exact)
+            self.assertLessEqual(hist.percentile(q), exact * 1.0625)
+
+        self.assertEqual(hist.count, 5000)
+        self.assertEqual(hist.min_ns, samples[0])
+        self.assertEqual(hist.percentile(100), samples[-1])
+
+    def test_small_values_are_exact(self):
+        hist = LatencyHistogram()
+        for value in range(1, 11):
+            hist.record(value)
+        self.assertEqual(hist.percentile(50), 5)
+        self.assertEqual(hist.percentile(0), 1)
+
+    def test_out_of_range_values(self):
+        hist = LatencyHistogram()
+        hist.record(-5)
+        hist.record(MAX_TRACKED_NS * 4)
+        self.assertEqual(hist.min_ns, 0)
+        self.assertEqual(hist.percentile(100), MAX_TRACKED_NS * 4)
+        self.assertEqual(LatencyHistogram().percentile(50), 0)
+
+    def test_merge_and_reset(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        for value in range(1000, 2000):
+            a.record(value)
+        for value in range(5000, 6000):
+            b.record(value)
+        a.merge(b)
+        self.assertEqual(a.count, 2000)
+        self.assertEqual((a.min_ns, a.max_ns), (1000, 5999))
+        self.assertGreaterEqual(a.percentile(75), 5499)
+
+        a.reset()
+        self.assertEqual(a.count, 0)
+        self.assertEqual(a.snapshot()['p99_ms'], 0.0)
+
+
+class TestClientMetrics(unittest.TestCase):
+    """Test counters, labels and totals."""
+
+    def test_error_name(self):
+        self.assertEqual(error_name(ExceptionResponse(3, 0x0B)), 'exception_0x0B')
+        self.assertEqual(error_name(TimeoutError()), 'TimeoutError')
+
+    def test_counters_and_bytes(self):
+        metrics = ClientMetrics()
+        metrics.record_request(1, 2_000_000, registers=4)
+        metrics.record_request(2, 1_000_000, error='exception_0x0B')
+        metrics.record_retry(2, 'exception_0x0B')
+        metrics.record_request(2, 500_000_000, error='ModbusIOException', answered=False)
+        metrics.record_skip(2)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['units'][1]['successes'], 1)
+        self.assertEqual(snapshot['units'][2]['errors'],
+                         {'exception_0x0B': 1, 'ModbusIOException': 1})
+        self.assertEqual(snapshot['totals']['requests'], 3)
+        self.assertEqual(snapshot['totals']['skipped'], 1)
+        self.assertEqual(metrics.bytes_sent, 36)
+        self.assertEqual(metrics.bytes_received, 17 + 9)
+        self.assertEqual(metrics.busiest_units(1), [2])
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()['units'], {})
+
+
+class TestDXMClientMetrics(unittest.TestCase):
+    """Test that DXMClient records its traffic."""
+
+    def make_simulator(self):
+        return DXMSimulator([UnitProfile(1), UnitProfile(2)], port=0)
+
+    def test_poll_is_recorded(self):
+        with self.make_simulator().running() as sim:
+            with DXMClient("127.0.0.1", port=sim.port, retry_attempts=2,
+                           failure_threshold=2) as client:
+                for _ in range(5):
+                    client.read_multiple_sensors([1, 2, 9])
+                info = client.get_connection_info()
+
+        units = info['metrics']['units']
+        self.assertEqual(units[1]['requests'], 5)
+        self.assertEqual(units[1]['successes'], 5)
+        self.assertEqual(units[1]['latency']['count'], 5)
+        # Unit 9 is absent: the gateway answers 0x0B until its breaker opens
+        self.assertEqual(units[9]['successes'], 0)
+        self.assertIn('exception_0x0B', units[9]['errors'])
+        self.assertGreater(units[9]['skipped'], 0)
+        self.assertEqual(info['metrics']['reconnects'], 0)
+
+    def test_pipelined_poll_is_recorded(self):
+        with self.make_simulator().running() as sim:
+            with DXMClient("127.0.0.1", port=sim.port, pipeline_depth=4) as client:
+                for _ in range(3):
+                    client.read_multiple_sensors([1, 2])
+                totals = client.metrics.totals()
+
+        self.assertEqual(totals['requests'], 6)
+        self.assertEqual(totals['successes'], 6)
+        self.assertGreater(totals['latency']['p50_ms'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Unit tests for streaming reading output.
+
+Output is written to in-memory streams and parsed back with the json and
+csv modules to check that the hand-built lines are well formed.
+
+Run tests with:
+    python -m pytest tests/test_output.py -v
+"""
+
+import csv
+import io
+import json
+import unittest
+from pathlib import Path
+
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.output import FIELDS, ReadingStreamWriter
+from dxm_toolkit.sensor_decoder import SensorDecoder
+
+decoder = SensorDecoder()
+TS = 1_700_000_000_123_456_000
+
+
+def sample_cycle():
+    return {
+        1: decoder.decode_registers(1, [303, 0, 1250, 40], TS),
+        2: decoder.decode_registers(2, [271, 0, 65535, 3], TS),
+        3: None,
+    }
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts flushes."""
+
+    flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class TestReadingStreamWriter(unittest.TestCase):
+    """Test the line formats and flush policies."""
+
+    def test_ndjson(self):
+        stream = io.StringIO()
+        writer = ReadingStreamWriter(stream, 'ndjson')
+        writer.write_cycle(sample_cycle(), 'dxm "a"', ts_ns=TS)
+
+        rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0], {'ts': 1700000000.123456, 'host': 'dxm "a"', 'unit': 1,
+                                   'status': 'NORMAL', 'distance_mm': 1250,
+                                   'distance_raw': 1250, 'signal': 40, 'connected': True})
+        self.assertIsNone(rows[1]['distance_mm'])
+        self.assertEqual(rows[1]['status'], 'OUT_OF_RANGE')
+        self.assertEqual(rows[2]['status'], 'FAILED')
+        self.assertEqual(writer.lines, 3)
+
+    def test_csv_and_tsv(self):
+        stream = io.StringIO()
+        ReadingStreamWriter(stream, 'csv').write_cycle(sample_cycle(), 'plant,line 1', ts_ns=TS)
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        self.assertEqual(list(rows[0]), list(FIELDS))
+        self.assertEqual(rows[0]['host'], 'plant,line 1')
+        self.assertEqual(rows[0]['distance_mm'], '1250')
+        self.assertEqual(rows[1]['distance_mm'], '')
+        self.assertEqual(rows[2]['connected'], '0')
+
+        stream = io.StringIO()
+        ReadingStreamWriter(stream, 'tsv', header=False).write_cycle(sample_cycle(), 'dxm')
+        first = stream.getvalue().splitlines()[0].split('\t')
+        self.assertEqual(first, ['1700000000.123456', 'dxm', '1', 'NORMAL', '1250', '1250',
+                                 '40', '1'])
+
+    def test_flush_policies(self):
+        for policy, expected in (('line', 6), ('cycle', 2), ('never', 0)):
+            stream = CountingStream()
+            writer = ReadingStreamWriter(stream, 'ndjson', flush=policy)
+            writer.write_cycle(sample_cycle())
+            writer.write_cycle(sample_cycle())
+            self.assertEqual(stream.flushes, expected, policy)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            ReadingStreamWriter(io.StringIO(), 'table')
+        with self.assertRaises(ValueError):
+            ReadingStreamWriter(io.StringIO(), 'ndjson', flush='sometimes')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Unit tests for streaming quantile sketches.
+
+Sketch estimates are compared with exact percentiles of the same data;
+sliding windows are driven by explicit timestamps.
+
+Run tests with:
+    python -m pytest tests/test_quantiles.py -v
+"""
+
+import math
+import random
+import unittest
+from pathlib import Path
+
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.metrics import bucket_index, bucket_lower, bucket_upper
+from dxm_toolkit.quantiles import QuantileSketch, WindowedQuantiles
+from dxm_toolkit.sensor_decoder import SensorDecoder
+from dxm_toolkit.unit_stats import ReadingStatistics
+
+SECOND = 1_000_000_000
+
+
+def exact(values, q):
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(len(ordered) * q / 100)) - 1]
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """Test sketch accuracy, memory and merging."""
+
+    def setUp(self):
+        rng = random.Random(3)
+        # Mostly around 2 m, with 2% spikes at 5-6 m
+        self.values = [int(rng.gauss(2000, 80)) for _ in range(20000)]
+        self.values += [rng.randint(5000, 6000) for _ in range(400)]
+        rng.shuffle(self.values)
+
+    def test_bucket_bounds(self):
+        for bits in (4, 6):
+            for value in (0, 1, 127, 128, 1999, 2000, 65535, 10 ** 9):
+                index = bucket_index(value, bits)
+                self.assertLessEqual(bucket_lower(index, bits), value)
+                self.assertLessEqual(value, bucket_upper(index, bits))
+
+    def test_relative_error(self):
+        sketch = QuantileSketch()
+        for value in self.values:
+            sketch.add(value)
+
+        for q in (1, 50, 95, 99, 99.9):
+            self.assertAlmostEqual(sketch.quantile(q), exact(self.values, q),
+                                   delta=exact(self.values, q) * 0.01)
+        self.assertEqual(sketch.quantile(100), max(self.values))
+        self.assertEqual(sketch.quantile(0), min(self.values))
+        # Memory follows the spread of the values, not their number
+        self.assertLess(len(sketch.counts), 200)
+
+    def test_small_values_are_exact(self):
+        sketch = QuantileSketch()
+        for value in range(1, 101):
+            sketch.add(value)
+        self.assertEqual(sketch.snapshot(), {'p50': 50, 'p95': 95, 'p99': 99})
+
+    def test_merge_equals_single_sketch(self):
+        whole, parts = QuantileSketch(), [QuantileSketch(), QuantileSketch(), QuantileSketch()]
+        for i, value in enumerate(self.values):
+            whole.add(value)
+            parts[i % 3].add(value)
+        merged = QuantileSketch()
+        for part in parts:
+            merged.merge(part)
+
+        self.assertEqual(merged.counts, whole.counts)
+        self.assertEqual(merged.quantiles(), whole.quantiles())
+        with self.assertRaises(ValueError):
+            merged.merge(QuantileSketch(bits=4))
+
+    def test_empty(self):
+        self.assertIsNone(QuantileSketch().quantile(50))
+        self.assertEqual(QuantileSketch().snapshot((50,)), {'p50': None})
+
+
+class TestWindowedQuantiles(unittest.TestCase):
+    """Test sliding windows made of panes."""
+
+    def test_old_panes_expire(self):
+        window = WindowedQuantiles(window=10.0, panes=5)
+        for second in range(30):
+            window.add(1000 if second < 10 else 3000, second * SECOND)
+
+        self.assertEqual(window.sketch().min, 3000)
+        self.assertEqual(window.quantile(50), 3000)
+        self.assertLessEqual(len(window), 12)   # at most one pane beyond the window
+        # Late values older than the window are ignored
+        window.add(1, 0)
+        self.assertGreater(window.quantile(1), 1000)
+
+    def test_whole_run(self):
+        window = WindowedQuantiles(window=None)
+        for second in range(100):
+            window.add(second, second * SECOND)
+        self.assertEqual(len(window), 100)
+        self.assertEqual(window.quantile(50), 49)
+
+    def test_merge_shards(self):
+        a, b = WindowedQuantiles(window=4.0, panes=4), WindowedQuantiles(window=4.0, panes=4)
+        for second in range(8):
+            a.add(100 + second, second * SECOND)
+            b.add(200 + second, (second + 4) * SECOND)
+        a.merge(b)
+        # Only panes 7-11 are within a window of the newest value
+        self.assertEqual(a.sketch().min, 107)
+        self.assertEqual(len(a), 6)
+        with self.assertRaises(ValueError):
+            a.merge(WindowedQuantiles(window=5.0))
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            WindowedQuantiles(window=0)
+        with self.assertRaises(ValueError):
+            WindowedQuantiles(panes=0)
+
+
+class TestStatisticsPercentiles(unittest.TestCase):
+    """Test percentiles in the per-unit statistics API."""
+
+    def test_analysis_includes_percentiles(self):
+        decoder = SensorDecoder()
+        stats = ReadingStatistics(quantiles=True, window=30.0)
+        for n in range(100):
+            distance = 4000 if n % 50 == 49 else 1000 + n % 10
+            stats.add_cycle({1: decoder.decode_registers(1, [303, 0, distance, 40], n * SECOND)})
+
+        distance_stats = stats.snapshot()[1]['distance_stats']
+        self.assertAlmostEqual(distance_stats['p50'], 1005, delta=1005 * 0.01)
+        self.assertEqual(distance_stats['p99'], 4000)
+        self.assertEqual(stats.snapshot()[1]['signal_quality_stats']['p95'], 40)
+        # Plain statistics stay without percentiles
+        plain = ReadingStatistics()
+        plain.add(1, decoder.decode_registers(1, [303, 0, 1000, 40], 0))
+        self.assertNotIn('p50', plain.snapshot()[1]['distance_stats'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the register read planner.
+
+Run tests with:
+    python -m pytest tests/test_read_planner.py -v
+"""
+
+import unittest
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.read_planner import ReadPlanner, PlannedRead
+from dxm_toolkit.transport import ModbusExceptionResponse
+
+
+class TestReadPlanner(unittest.TestCase):
+    """Test block coalescing and result scattering."""
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            ReadPlanner(max_registers=126)
+        with self.assertRaises(ValueError):
+            ReadPlanner(gap_tolerance=-1)
+
+    def test_contiguous_points_single_read(self):
+        planner = ReadPlanner(gap_tolerance=0)
+        planned = planner.plan([(1, a) for a in range(20)])
+        self.assertEqual(planned, [PlannedRead(1, 0, 20, tuple(range(20)))])
+
+    def test_gap_tolerance(self):
+        points = [(1, 0), (1, 3), (1, 10)]
+        self.assertEqual(len(ReadPlanner(gap_tolerance=2).plan(points)), 2)
+        self.assertEqual(len(ReadPlanner(gap_tolerance=6).plan(points)), 1)
+        self.assertEqual(len(ReadPlanner(gap_tolerance=1).plan(points)), 3)
+
+    def test_units_never_merged(self):
+        planned = ReadPlanner().plan([(2, 0), (1, 1), (1, 0), (2, 1)])
+        self.assertEqual([p.request for p in planned], [(1, 0, 2), (2, 0, 2)])
+
+    def test_pdu_limit(self):
+        planned = ReadPlanner(gap_tolerance=0).plan([(1, a) for a in range(300)])
+        self.assertEqual([p.count for p in planned], [125, 125, 50])
+        self.assertEqual(planned[1].address, 125)
+
+    def test_duplicates_ignored(self):
+        planned = ReadPlanner().plan([(1, 5), (1, 5), (1, 6)])
+        self.assertEqual(planned, [PlannedRead(1, 5, 2, (5, 6))])
+
+    def test_scatter(self):
+        planner = ReadPlanner(gap_tolerance=4)
+        planned = planner.plan([(1, 0), (1, 3), (2, 7)])
+        error = ModbusExceptionResponse(2, 3, 2)
+        values, errors = ReadPlanner.scatter(planned, [[10, 11, 12, 13], error])
+
+        self.assertEqual(values, {(1, 0): 10, (1, 3): 13})
+        self.assertEqual(errors, {(2, 7): error})
+
+    def test_scatter_short_response(self):
+        planned = [PlannedRead(1, 0, 4, (0, 3))]
+        values, errors = ReadPlanner.scatter(planned, [[1, 2]])
+        self.assertEqual(values, {})
+        self.assertIsInstance(errors[(1, 3)], ValueError)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
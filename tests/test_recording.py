@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unit tests for binary monitoring recordings.
+
+Recordings are written to temporary files and read back; crash recovery
+is simulated by truncating and corrupting the files.
+
+Run tests with:
+    python -m pytest tests/test_recording.py -v
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.dxm_client import DXMClient
+from dxm_toolkit.recording import (RECORD, SLOT_SIZE, RecordingError, RecordingReader,
+                                   RecordingWriter)
+from dxm_toolkit.sensor_decoder import SensorDecoder
+from dxm_toolkit.simulator import DXMSimulator, UnitProfile
+
+decoder = SensorDecoder()
+
+
+def cycle(n, units=(1, 2, 3)):
+    """Readings of one cycle; unit 3 fails on odd cycles."""
+    ts = 1_700_000_000_000_000_000 + n * 1_000_000_000
+    return {unit: None if unit == 3 and n % 2 else
+            decoder.decode_registers(unit, [303, 0, 1000 + 10 * n + unit, 40], ts)
+            for unit in units}
+
+
+class TestRecording(unittest.TestCase):
+    """Test writing and reading recordings."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / 'session.dxmrec'
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_record_layout(self):
+        self.assertEqual(RECORD.size, SLOT_SIZE)
+
+    def test_round_trip(self):
+        with RecordingWriter(self.path, checkpoint_every=5) as writer:
+            for n in range(10):
+                writer.write_cycle(cycle(n), 'dxm-a')
+            writer.write_cycle({7: decoder.decode_registers(7, [271, 0, 65535, 0], 5)}, 'dxm-b')
+
+        with RecordingReader(self.path) as recording:
+            records = list(recording)
+            readings = list(recording.readings())
+            batch = recording.to_batch()
+            check = recording.verify()
+
+        self.assertEqual(len(records), 31)
+        self.assertEqual(sum(r.failed for r in records), 5)
+        self.assertEqual(records[0].host, 'dxm-a')
+        self.assertEqual(records[0].registers, (303, 0, 1001, 40))
+        self.assertEqual(records[-1].host, 'dxm-b')
+
+        self.assertEqual(len(readings), 26)
+        self.assertEqual(readings[0], cycle(0)[1].with_host('dxm-a'))
+        self.assertEqual(len(batch), 26)
+        self.assertEqual(list(batch.column('distance'))[:3], [1001, 1002, 1003])
+
+        self.assertEqual(check['verified_records'], 31)
+        self.assertEqual(check['corrupt_checkpoints'], [])
+        self.assertEqual(check['unverified_tail'], 0)
+        # Fixed-width: a header, checkpoints and 24 bytes per reading
+        self.assertLess(self.path.stat().st_size, 31 * SLOT_SIZE + 400)
+
+    def test_killed_writer_is_readable_and_resumable(self):
+        writer = RecordingWriter(self.path, checkpoint_every=6)
+        for n in range(4):
+            writer.write_cycle(cycle(n), 'dxm-a')
+        # Simulate a kill during a write: no close(), half a record at the end
+        writer._file.write(b'R' * 10)
+        writer._file.flush()
+
+        with RecordingReader(self.path) as recording:
+            self.assertEqual(len(recording), 12)
+            self.assertEqual(recording.verify()['unverified_tail'], 0)
+
+        with RecordingWriter(self.path, checkpoint_every=6) as resumed:
+            self.assertEqual(resumed.records, 12)
+            resumed.write_cycle(cycle(4), 'dxm-b')
+            resumed.write_cycle(cycle(5), 'dxm-a')
+        writer._file.close()
+
+        with RecordingReader(self.path) as recording:
+            check = recording.verify()
+            hosts = [r.host for r in recording]
+        self.assertEqual(check['records'], 18)
+        self.assertEqual(check['verified_records'], 18)
+        self.assertEqual(hosts[12:15], ['dxm-b'] * 3)
+
+    def test_corruption_is_detected(self):
+        with RecordingWriter(self.path, checkpoint_every=3) as writer:
+            for n in range(4):
+                writer.write_cycle(cycle(n), 'dxm-a')
+
+        data = bytearray(self.path.read_bytes())
+        with RecordingReader(self.path) as recording:
+            start = recording.runs[1][0]
+        data[start + 12] ^= 0xFF   # flip a bit in a register of the second run
+        self.path.write_bytes(bytes(data))
+
+        with RecordingReader(self.path) as recording:
+            check = recording.verify()
+        self.assertEqual(len(check['corrupt_checkpoints']), 1)
+        self.assertEqual(check['verified_records'], 9)
+
+    def test_not_a_recording(self):
+        self.path.write_bytes(b'{"sensors": {}}' * 4)
+        with self.assertRaises(RecordingError):
+            RecordingReader(self.path)
+        with self.assertRaises(RecordingError):
+            RecordingWriter(self.path)
+
+    def test_corrupt_header_is_reported(self):
+        with RecordingWriter(self.path) as writer:
+            writer.write_cycle(cycle(0), 'dxm-a')
+        original = self.path.read_bytes()
+        body = 2 * SLOT_SIZE   # file header slot, then the host table header slot
+
+        for damage in (b'\xff', b'}'):
+            data = bytearray(original)
+            data[body:body + 1] = damage
+            self.path.write_bytes(bytes(data))
+            with self.assertRaisesRegex(RecordingError, 'corrupt header'):
+                RecordingReader(self.path)
+            with self.assertRaisesRegex(RecordingError, 'corrupt header'):
+                RecordingWriter(self.path)
+
+    def test_monitor_sensors_records(self):
+        with DXMSimulator([UnitProfile(1), UnitProfile(2)], port=0).running() as sim:
+            with DXMClient("127.0.0.1", port=sim.port) as client, \
+                    RecordingWriter(self.path) as recorder:
+                cycles = list(client.monitor_sensors([1, 2, 5], interval=0.01, duration=0.05,
+                                                     recorder=recorder))
+
+        with RecordingReader(self.path) as recording:
+            records = list(recording)
+        self.assertEqual(len(records), 3 * len(cycles))
+        self.assertEqual({r.host for r in records}, {'127.0.0.1'})
+        self.assertTrue(all(r.failed == (r.unit_id == 5) for r in records))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
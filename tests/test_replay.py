@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Unit tests for replaying recorded sessions.
+
+Recordings are written to temporary files; pacing is checked with a fake
+clock and sleep function.
+
+Run tests with:
+    python -m pytest tests/test_replay.py -v
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.recording import RecordingReader, RecordingWriter
+from dxm_toolkit.replay import RecordingReplayer, parse_speed
+from dxm_toolkit.sensor_decoder import SensorDecoder
+
+decoder = SensorDecoder()
+START_NS = 1_700_000_000_000_000_000
+
+
+class FakeClock:
+    """Monotonic clock advanced only by sleep()."""
+
+    def __init__(self):
+        self.now = 0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += int(seconds * 1e9)
+
+
+class TestReplay(unittest.TestCase):
+    """Test cycle grouping, decoding and pacing."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / 'session.dxmrec'
+        with RecordingWriter(self.path) as writer:
+            for n in range(5):
+                ts = START_NS + n * 1_000_000_000
+                writer.write_cycle({
+                    1: decoder.decode_registers(1, [303, 0, 1000 + n, 40], ts),
+                    2: None if n == 2 else decoder.decode_registers(2, [999, 0, 0, 0], ts),
+                }, 'dxm-a', ts_ns=ts)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_parse_speed(self):
+        self.assertEqual(parse_speed('10x'), 10.0)
+        self.assertEqual(parse_speed('0.5'), 0.5)
+        self.assertIsNone(parse_speed('MAX'))
+        for bad in ('fast', '0x', '-2'):
+            with self.assertRaises(ValueError):
+                parse_speed(bad)
+
+    def test_cycles_are_decoded(self):
+        with RecordingReader(self.path) as recording:
+            replayer = RecordingReplayer(recording, speed=None)
+            cycles = list(replayer.cycles())
+            stats = replayer.stats()
+
+        self.assertEqual(len(cycles), 5)
+        self.assertEqual(cycles[3][1].distance_mm, 1003)
+        self.assertEqual(cycles[3][1].host, 'dxm-a')
+        self.assertIsNone(cycles[2][2])
+        self.assertEqual(stats['failed_reads'], 1)
+        # Unit 2 reports an unknown status code in every successful read
+        self.assertEqual(replayer.validation_issues, {2: 4})
+        self.assertEqual(stats['recorded_span_s'], 4.0)
+
+    def test_paced_replay(self):
+        clock = FakeClock()
+        with RecordingReader(self.path) as recording:
+            replayer = RecordingReplayer(recording, speed=10.0, clock=clock, sleep=clock.sleep)
+            for _ in replayer.cycles():
+                clock.now += 30_000_000   # the consumer takes 30 ms per cycle
+            stats = replayer.stats()
+
+        # Absolute deadlines 100 ms apart: sleeps absorb the consumer's time
+        self.assertEqual([round(s, 3) for s in clock.sleeps], [0.07] * 4)
+        self.assertEqual(stats['max_lag_ms'], 0.0)
+        self.assertAlmostEqual(stats['effective_speed'], 4.0 / 0.43, places=3)
+
+    def test_slow_consumer_lags(self):
+        clock = FakeClock()
+        with RecordingReader(self.path) as recording:
+            replayer = RecordingReplayer(recording, speed=10.0, clock=clock, sleep=clock.sleep)
+            for _ in replayer.cycles():
+                clock.now += 150_000_000
+            stats = replayer.stats()
+
+        self.assertEqual(clock.sleeps, [])
+        self.assertAlmostEqual(stats['max_lag_ms'], 200.0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
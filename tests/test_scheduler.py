@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the deadline scheduler.
+
+A fake nanosecond clock replaces time.monotonic_ns, and sleeping simply
+advances it, so the tests are exact and instantaneous.
+
+Run tests with:
+    python -m pytest tests/test_scheduler.py -v
+"""
+
+import unittest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.scheduler import DeadlineScheduler, OverrunPolicy
+
+MS = 1_000_000
+
+
+class FakeClock:
+    """Manually advanced nanosecond clock."""
+
+    def __init__(self, start_ns=10_000 * MS):
+        self.now = start_ns
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += int(round(seconds * 1e9))
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+    """Test deadline computation and overrun policies."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch('dxm_toolkit.scheduler.time.sleep', self.clock.sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_cycles(self, policy, work_ms):
+        """Run one cycle per work duration and return the timings."""
+        scheduler = DeadlineScheduler(0.1, policy, clock=self.clock)
+        timings = []
+        for work in work_ms:
+            timings.append(scheduler.wait())
+            self.clock.now += work * MS
+        return scheduler, timings
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            DeadlineScheduler(0)
+        with self.assertRaises(ValueError):
+            DeadlineScheduler(1.0, "sometimes")
+
+    def test_no_drift(self):
+        """Work time (including consumer time) never shifts the grid."""
+        scheduler, timings = self.run_cycles("skip", [37, 99, 1, 50, 80])
+        origin = timings[0].started_ns
+        self.assertEqual([t.started_ns - origin for t in timings],
+                         [0, 100 * MS, 200 * MS, 300 * MS, 400 * MS])
+        self.assertEqual(scheduler.missed_deadlines, 0)
+        self.assertEqual(scheduler.stats()['max_jitter_ms'], 0.0)
+
+    def test_skip_policy(self):
+        """Missed deadlines are dropped and the original grid is kept."""
+        scheduler, timings = self.run_cycles(OverrunPolicy.SKIP, [250, 10, 10])
+        origin = timings[0].started_ns
+        self.assertEqual(timings[1].started_ns - origin, 300 * MS)
+        self.assertEqual(timings[1].missed, 2)
+        self.assertEqual(timings[2].started_ns - origin, 400 * MS)
+        self.assertEqual(scheduler.missed_deadlines, 2)
+        self.assertEqual(scheduler.overruns, 1)
+
+    def test_catch_up_policy(self):
+        """Late cycles run back to back until the schedule is met."""
+        scheduler, timings = self.run_cycles("catch_up", [250, 10, 10, 10])
+        origin = timings[0].started_ns
+        self.assertEqual([t.started_ns - origin for t in timings],
+                         [0, 250 * MS, 260 * MS, 300 * MS])
+        self.assertEqual(timings[1].jitter_ns, 150 * MS)
+        self.assertEqual(scheduler.missed_deadlines, 2)
+
+    def test_stretch_policy(self):
+        """A late cycle re-bases the grid at its own start time."""
+        scheduler, timings = self.run_cycles("stretch", [250, 10, 10])
+        origin = timings[0].started_ns
+        self.assertEqual([t.started_ns - origin for t in timings],
+                         [0, 250 * MS, 350 * MS])
+        self.assertEqual(timings[1].jitter_ns, 0)
+        self.assertEqual(scheduler.missed_deadlines, 1)
+
+    def test_elapsed(self):
+        scheduler = DeadlineScheduler(0.1, clock=self.clock)
+        self.assertEqual(scheduler.elapsed(), 0.0)
+        scheduler.wait()
+        self.clock.now += 250 * MS
+        self.assertAlmostEqual(scheduler.elapsed(), 0.25)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
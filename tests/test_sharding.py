@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Unit tests for multi-process sharded polling.
+
+The shared-memory ring is tested within one process and across a real
+child process; the supervisor polls a local DXMSimulator from worker
+processes, one of which is killed to test restarts.
+
+Run tests with:
+    python -m pytest tests/test_sharding.py -v
+"""
+
+import multiprocessing
+import os
+import signal
+import socket
+import time
+import unittest
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.fleet import HostSpec
+from dxm_toolkit.sensor_decoder import SensorDecoder
+from dxm_toolkit.sharding import ShardedPoller, SharedReadingRing, plan_shards
+from dxm_toolkit.simulator import DXMSimulator, UnitProfile
+
+decoder = SensorDecoder()
+
+
+def reading(unit_id, distance, host=None):
+    """A host-tagged reading."""
+    return decoder.decode_registers(unit_id, [303, 0, distance, 40]).with_host(host)
+
+
+def produce(ring, count):
+    """Child process: publish ``count`` readings into a ring."""
+    ring.attach()
+    for i in range(count):
+        ring.publish(reading(i % 8 + 1, 1000 + i, "child"))
+    ring.close()
+
+
+class TestSharedReadingRing(unittest.TestCase):
+    """Test publishing and consuming through shared memory."""
+
+    def setUp(self):
+        self.ring = SharedReadingRing(capacity=4)
+
+    def tearDown(self):
+        self.ring.close()
+
+    def test_round_trip_keeps_every_field(self):
+        original = reading(5, 1234, "dxm-a")
+        self.assertTrue(self.ring.publish(original))
+        result = self.ring.consume()
+        self.assertEqual(result, [original])
+        self.assertEqual(result[0].host, "dxm-a")
+        self.assertEqual(result[0].distance_mm, 1234)
+        self.assertEqual(self.ring.consume(), [])
+
+    def test_full_ring_drops_and_counts(self):
+        published = [self.ring.publish(reading(1, 1000 + i)) for i in range(6)]
+        self.assertEqual(published, [True] * 4 + [False] * 2)
+        self.assertEqual(self.ring.dropped, 2)
+        self.assertEqual([r.distance_mm for r in self.ring.consume()], [1000, 1001, 1002, 1003])
+
+    def test_wraps_around(self):
+        distances = []
+        for i in range(10):
+            self.ring.publish(reading(1, 1000 + 2 * i))
+            self.ring.publish(reading(1, 1001 + 2 * i))
+            distances += [r.distance_mm for r in self.ring.consume(limit=2)]
+        self.assertEqual(distances, list(range(1000, 1020)))
+
+    def test_oversized_reading_rejected(self):
+        ring = SharedReadingRing(capacity=1, slot_size=32)
+        try:
+            with self.assertRaises(ValueError):
+                ring.publish(reading(1, 1000, "a-very-long-controller-name"))
+        finally:
+            ring.close()
+
+    def test_readings_from_another_process(self):
+        ring = SharedReadingRing(capacity=256)
+        try:
+            process = multiprocessing.Process(target=produce, args=(ring, 100))
+            process.start()
+            process.join(10)
+            readings = ring.consume()
+        finally:
+            ring.close()
+        self.assertEqual(process.exitcode, 0)
+        self.assertEqual([r.distance_mm for r in readings], list(range(1000, 1100)))
+        self.assertEqual({r.host for r in readings}, {"child"})
+
+
+class TestPlanShards(unittest.TestCase):
+    """Test splitting an inventory into shards."""
+
+    def setUp(self):
+        self.hosts = [HostSpec(f"10.0.0.{i}", unit_ids=[1, 2, 3]) for i in range(1, 6)]
+
+    def test_by_host(self):
+        shards = plan_shards(self.hosts, 2)
+        self.assertEqual([[h.name for h in shard] for shard in shards],
+                         [["10.0.0.1", "10.0.0.3", "10.0.0.5"], ["10.0.0.2", "10.0.0.4"]])
+
+    def test_more_workers_than_hosts(self):
+        self.assertEqual(len(plan_shards(self.hosts[:2], 8)), 2)
+
+    def test_by_unit(self):
+        shards = plan_shards([HostSpec("10.0.0.1", name="a", unit_ids=list(range(1, 8)))],
+                             3, by='unit')
+        self.assertEqual([[(h.name, h.unit_ids) for h in shard] for shard in shards],
+                         [[("a", [1, 4, 7])], [("a", [2, 5])], [("a", [3, 6])]])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            plan_shards(self.hosts, 2, by='rack')
+        with self.assertRaises(ValueError):
+            plan_shards(self.hosts, 0)
+        with self.assertRaises(ValueError):
+            plan_shards([HostSpec("10.0.0.1")], 2, by='unit')
+
+
+class TestShardedPoller(unittest.TestCase):
+    """Test polling a simulator from worker processes."""
+
+    def setUp(self):
+        self.simulator = DXMSimulator(units=[UnitProfile(u) for u in range(1, 7)], port=0)
+        self._running = self.simulator.running()
+        self._running.__enter__()
+
+    def tearDown(self):
+        self._running.__exit__(None, None, None)
+
+    def test_units_spread_over_workers(self):
+        hosts = [HostSpec("127.0.0.1", self.simulator.port, "dxm", list(range(1, 7)))]
+        with ShardedPoller(hosts, workers=3, shard_by='unit', interval=0.1,
+                           timeout=1.0) as poller:
+            readings = list(poller.stream(duration=1.0))
+            info = poller.get_shard_info()
+
+        self.assertEqual({r.unit_id for r in readings}, set(range(1, 7)))
+        self.assertEqual({r.host for r in readings}, {"dxm"})
+        self.assertEqual(len({i['pid'] for i in info.values()}), 3)
+        self.assertTrue(all(i['readings'] > 0 for i in info.values()))
+
+    def test_dead_worker_is_restarted(self):
+        hosts = [HostSpec("127.0.0.1", self.simulator.port, f"dxm{i}", [1, 2]) for i in range(2)]
+        with ShardedPoller(hosts, workers=2, interval=0.1, timeout=1.0,
+                           restart_backoff=0.05) as poller:
+            list(poller.stream(duration=0.5))
+            os.kill(poller.get_shard_info()[1]['pid'], signal.SIGKILL)
+            time.sleep(0.2)
+            readings = list(poller.stream(duration=1.0))
+            info = poller.get_shard_info()
+
+        self.assertEqual(info[1]['restarts'], 1)
+        self.assertEqual(info[1]['last_exitcode'], -signal.SIGKILL)
+        self.assertEqual(info[0]['restarts'], 0)
+        self.assertIn("dxm1", {r.host for r in readings})
+
+    def test_stop_with_every_host_down(self):
+        with socket.socket() as unused:
+            unused.bind(("127.0.0.1", 0))
+            port = unused.getsockname()[1]
+        poller = ShardedPoller([HostSpec("127.0.0.1", port, "down", [1])], workers=1,
+                               interval=0.1, timeout=0.5)
+        poller.start()
+        time.sleep(0.5)
+        process = poller._workers[0].process
+        start = time.monotonic()
+        poller.stop(timeout=5.0)
+
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertEqual(process.exitcode, 0)
+
+    def test_long_host_name_rejected(self):
+        with self.assertRaises(ValueError):
+            ShardedPoller([HostSpec("127.0.0.1", name="x" * 200)], workers=1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the DXM/Q90R simulator.
+
+Waveforms are checked directly; the server tests run the simulator on a
+free local port and talk to it with the real DXMClient and AsyncDXMClient.
+
+Run tests with:
+    python -m pytest tests/test_simulator.py -v
+"""
+
+import asyncio
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.async_client import AsyncDXMClient
+from dxm_toolkit.dxm_client import DXMClient, DXMConnectionError
+from dxm_toolkit.sensor_decoder import SensorStatus
+from dxm_toolkit.simulator import DXMSimulator, UnitProfile, load_profiles
+
+
+class TestUnitProfile(unittest.TestCase):
+    """Test the scripted distance waveforms."""
+
+    def test_waveforms(self):
+        sine = UnitProfile(1, waveform='sine', center=1000, amplitude=200, period=4.0)
+        self.assertAlmostEqual(sine.distance_at(0.0), 1000)
+        self.assertAlmostEqual(sine.distance_at(1.0), 1200)
+
+        ramp = UnitProfile(1, waveform='ramp', center=1000, amplitude=200, period=4.0)
+        self.assertAlmostEqual(ramp.distance_at(0.0), 800)
+        self.assertAlmostEqual(ramp.distance_at(2.0), 1000)
+
+        square = UnitProfile(1, waveform='square', center=1000, amplitude=200, period=4.0)
+        self.assertEqual(square.distance_at(1.0), 1200)
+        self.assertEqual(square.distance_at(3.0), 800)
+
+    def test_noise_is_reproducible(self):
+        a = UnitProfile(1, waveform='noise', seed=7)
+        b = UnitProfile(1, waveform='noise', seed=7)
+        samples = [a.distance_at(t / 10) for t in range(20)]
+        self.assertEqual(samples, [b.distance_at(t / 10) for t in range(20)])
+        self.assertGreater(len(set(samples)), 1)
+        self.assertTrue(all(1000 <= s <= 2000 for s in samples))
+
+    def test_register_block(self):
+        self.assertEqual(UnitProfile(1, waveform='constant', center=1234, signal=42).registers_at(0),
+                         [303, 0, 1234, 42])
+        self.assertEqual(UnitProfile(1, waveform='constant', center=20000).registers_at(0),
+                         [271, 0, 65535, 0])
+        self.assertEqual(UnitProfile(1, connected=False).registers_at(0), [0, 0, 0, 0])
+
+    def test_invalid_profile(self):
+        with self.assertRaises(ValueError):
+            UnitProfile(1, waveform='triangle')
+        with self.assertRaises(ValueError):
+            DXMSimulator([UnitProfile(1), UnitProfile(1)])
+
+    def test_load_profiles(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'sim.yaml'
+            path.write_text("latency_ms: 5\n"
+                            "units:\n"
+                            "  - {unit_id: 1, waveform: constant, center: 900}\n"
+                            "  - {unit_id: 4, connected: false}\n")
+            settings = load_profiles(str(path))
+        self.assertEqual([u.unit_id for u in settings['units']], [1, 4])
+        self.assertEqual(settings['latency'], 0.005)
+        self.assertFalse(settings['units'][1].connected)
+
+
+class TestSimulatorServer(unittest.TestCase):
+    """Test the simulator over real Modbus TCP connections."""
+
+    def make_simulator(self, **kwargs):
+        units = [UnitProfile(1, waveform='constant', center=1250),
+                 UnitProfile(2, waveform='constant', center=50000),
+                 UnitProfile(3, connected=False)]
+        return DXMSimulator(units, port=0, **kwargs)
+
+    def test_sync_client_reads(self):
+        with self.make_simulator().running() as sim:
+            with DXMClient("127.0.0.1", port=sim.port, retry_attempts=1) as client:
+                readings = client.read_multiple_sensors([1, 2, 3, 9])
+
+        self.assertEqual(readings[1].distance_mm, 1250)
+        self.assertEqual(readings[2].status, SensorStatus.OUT_OF_RANGE)
+        self.assertFalse(readings[3].connected)
+        # Absent units get exception 0x0B at once instead of a timeout
+        self.assertIsNone(readings[9])
+
+    def test_latency_is_injected(self):
+        with self.make_simulator(latency=0.05).running() as sim:
+            with DXMClient("127.0.0.1", port=sim.port) as client:
+                start = time.perf_counter()
+                client.read_sensor(1)
+                elapsed = time.perf_counter() - start
+        self.assertGreaterEqual(elapsed, 0.05)
+
+    def test_async_client_sweep(self):
+        async def sweep(port):
+            client = AsyncDXMClient("127.0.0.1", port=port)
+            return await client.scan_units(range(1, 21), probe_timeout=1.0, concurrency=4)
+
+        with self.make_simulator().running() as sim:
+            found = asyncio.run(sweep(sim.port))
+        self.assertEqual(list(found), [1, 2, 3])
+
+    def test_connection_cap(self):
+        with self.make_simulator(max_connections=1).running() as sim:
+            with DXMClient("127.0.0.1", port=sim.port):
+                second = DXMClient("127.0.0.1", port=sim.port, timeout=1.0)
+                with self.assertRaises(DXMConnectionError):
+                    second.connect()
+                second.disconnect()
+            self.assertGreaterEqual(sim.stats()['connections_rejected'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Startup tests: importing the package and the CLI must stay lightweight.
+
+Each check runs in a fresh interpreter (the test process has already
+imported everything), using ``python -X importtime`` via the benchmark
+helpers.
+
+Run tests with:
+    python -m pytest tests/test_startup.py -v
+"""
+
+import subprocess
+import unittest
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks import stages
+
+ROOT = Path(__file__).parent.parent
+
+# Dependencies only the commands that need them may import
+HEAVY = ('pymodbus', 'asyncio', 'yaml', 'tabulate', 'colorama', 'numpy', 'http.server')
+
+
+class TestStartup(unittest.TestCase):
+    """Test that heavy dependencies are imported lazily."""
+
+    def assertNotLoaded(self, module):
+        loaded = stages.import_times(module)
+        self.assertIn(module, loaded)
+        for heavy in HEAVY:
+            self.assertNotIn(heavy, loaded, f"import {module} loads {heavy}")
+
+    def test_package_import_is_light(self):
+        self.assertNotLoaded('dxm_toolkit')
+
+    def test_cli_import_is_light(self):
+        self.assertNotLoaded('dxm_toolkit.cli')
+
+    def test_public_names_resolve_lazily(self):
+        code = ("import sys, dxm_toolkit; "
+                "assert 'pymodbus' not in sys.modules; "
+                "from dxm_toolkit import *; "
+                "assert DXMClient.__module__ == 'dxm_toolkit.dxm_client'; "
+                "from dxm_toolkit.dxm_client import DXMConnectionError as E; "
+                "assert E is dxm_toolkit.DXMConnectionError; "
+                "assert set(dxm_toolkit.__all__) <= set(dir(dxm_toolkit))")
+        subprocess.run([sys.executable, '-c', code], check=True, cwd=str(ROOT))
+
+    def test_async_client_skips_sync_client(self):
+        loaded = stages.import_times('dxm_toolkit.async_client')
+        for module in ('dxm_toolkit.dxm_client', 'dxm_toolkit.transport'):
+            self.assertNotIn(module, loaded)
+
+    def test_unknown_attribute(self):
+        import dxm_toolkit
+        with self.assertRaises(AttributeError):
+            dxm_toolkit.NoSuchThing
+
+    def test_help_runs(self):
+        result = subprocess.run([sys.executable, '-m', 'dxm_toolkit.cli', '--help'],
+                                capture_output=True, text=True, cwd=str(ROOT))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('monitor', result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
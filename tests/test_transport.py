@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the pipelined Modbus TCP transport.
+
+A small threaded fake Modbus server answers FC03 requests in reverse
+arrival order, so the tests prove that responses are matched by
+transaction ID rather than by position.
+
+Run tests with:
+    python -m pytest tests/test_transport.py -v
+"""
+
+import socket
+import struct
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.dxm_client import DXMClient, DXMCommunicationError, DXMUnitUnavailableError
+from dxm_toolkit.transport import (
+    FastReadTransport, PipelinedTransport, ModbusExceptionResponse,
+    build_read_request, parse_read_response
+)
+
+
+def sensor_registers(unit_id):
+    """Deterministic register block for a fake unit."""
+    return [303, 0, 1000 + unit_id, 40 + unit_id]
+
+
+class FakeModbusServer:
+    """
+    Threaded FC03-only Modbus TCP server.
+
+    Each recv() batch is answered in reverse order after a short delay.
+    Unit 9 answers with exception code 0x0B (gateway target failed).
+    Unit 13 answers with a malformed frame (function code 0x04).
+    A nonzero ``tid_offset`` answers with the wrong transaction IDs.
+    """
+
+    def __init__(self, tid_offset=0):
+        self.batch_sizes = []
+        self.tid_offset = tid_offset
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(8)
+        self.port = self._server.getsockname()[1]
+        self._running = True
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        buffer = b""
+        with conn:
+            while self._running:
+                time.sleep(0.02)  # Let the client fill its window
+                try:
+                    chunk = conn.recv(4096)
+                except OSError:
+                    return
+                if not chunk:
+                    return
+                buffer += chunk
+                frames = []
+                while len(buffer) >= 12:
+                    frames.append(buffer[:12])
+                    buffer = buffer[12:]
+                self.batch_sizes.append(len(frames))
+                for frame in reversed(frames):
+                    tid, _, _, unit_id, _, address, count = struct.unpack(">HHHBBHH", frame)
+                    if unit_id == 9:
+                        pdu = struct.pack(">BB", 0x83, 0x0B)
+                    elif unit_id == 13:
+                        pdu = struct.pack(">BBH", 0x04, 2, 0)
+                    else:
+                        values = sensor_registers(unit_id)[address:address + count]
+                        pdu = struct.pack(f">BB{len(values)}H", 0x03, 2 * len(values), *values)
+                    tid = (tid + self.tid_offset) & 0xFFFF
+                    conn.sendall(struct.pack(">HHHB", tid, 0, len(pdu) + 1, unit_id) + pdu)
+
+    def close(self):
+        self._running = False
+        self._server.close()
+
+
+class TestFrameCodec(unittest.TestCase):
+    """Test MBAP frame building and parsing."""
+
+    def test_build_read_request(self):
+        frame = build_read_request(0x1234, 5, 0, 4)
+        self.assertEqual(frame, bytes.fromhex("123400000006050300000004"))
+
+    def test_build_rejects_oversized_read(self):
+        with self.assertRaises(ValueError):
+            build_read_request(1, 1, 0, 126)
+
+    def test_parse_read_response(self):
+        frame = bytes.fromhex("0007000000070103040001012F")
+        self.assertEqual(parse_read_response(frame), (7, 1, [1, 303]))
+
+    def test_parse_truncated_response(self):
+        for frame in (bytes.fromhex("000700000007010308"), bytes.fromhex("0007000000")):
+            with self.assertRaises(ValueError):
+                parse_read_response(frame)
+
+    def test_parse_exception_response(self):
+        frame = bytes.fromhex("000800000003098302")
+        with self.assertRaises(ModbusExceptionResponse) as ctx:
+            parse_read_response(frame)
+        self.assertEqual(ctx.exception.unit_id, 9)
+        self.assertEqual(ctx.exception.exception_code, 2)
+
+
+class TestPipelinedTransport(unittest.TestCase):
+    """Test pipelined reads against the fake server."""
+
+    def setUp(self):
+        self.server = FakeModbusServer()
+        self.addCleanup(self.server.close)
+
+    def test_depth_validation(self):
+        with self.assertRaises(ValueError):
+            PipelinedTransport("127.0.0.1", depth=0)
+
+    def test_out_of_order_responses_matched_by_tid(self):
+        transport = PipelinedTransport("127.0.0.1", self.server.port, timeout=2.0, depth=4)
+        transport.connect()
+        self.addCleanup(transport.close)
+
+        units = list(range(1, 9)) + [10, 11]
+        results = transport.read_many([(u, 0, 4) for u in units])
+
+        self.assertEqual(results, [sensor_registers(u) for u in units])
+        self.assertLessEqual(max(self.server.batch_sizes), 4)
+        self.assertGreater(max(self.server.batch_sizes), 1)
+
+    def test_exception_response_isolated(self):
+        transport = PipelinedTransport("127.0.0.1", self.server.port, timeout=2.0, depth=4)
+        transport.connect()
+        self.addCleanup(transport.close)
+
+        results = transport.read_many([(1, 0, 4), (9, 0, 4), (2, 0, 4)])
+
+        self.assertEqual(results[0], sensor_registers(1))
+        self.assertIsInstance(results[1], ModbusExceptionResponse)
+        self.assertEqual(results[2], sensor_registers(2))
+
+    def test_malformed_frame_fails_pending_reads(self):
+        transport = PipelinedTransport("127.0.0.1", self.server.port, timeout=2.0, depth=4)
+        transport.connect()
+        self.addCleanup(transport.close)
+
+        results = transport.read_many([(1, 0, 4), (13, 0, 4), (2, 0, 4)])
+
+        # Unit 2 is answered first (reverse order); the malformed frame
+        # then fails every read still pending
+        self.assertEqual(results[2], sensor_registers(2))
+        self.assertIsInstance(results[0], ValueError)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertFalse(transport.connected)
+
+    def test_client_malformed_frame_resolves_probe(self):
+        client = DXMClient(host="127.0.0.1", port=self.server.port, timeout=2.0,
+                           retry_attempts=1, pipeline_depth=4, failure_threshold=1,
+                           probe_backoff=0.01)
+        with client:
+            readings = client.read_multiple_sensors([13])
+            self.assertIsNone(readings[13])
+            time.sleep(0.02)
+            # The unit is tripped; the next cycle probes it and the probe
+            # dies with the malformed stream
+            readings = client.read_multiple_sensors([13, 1])
+            breaker = client._breakers[13]
+            self.assertFalse(breaker.probing)
+            time.sleep(0.05)
+            self.assertTrue(breaker.allow())
+            self.assertEqual(client.read_multiple_sensors([1])[1].distance_mm, 1001)
+
+    def test_client_unexpected_error_releases_probe(self):
+        client = DXMClient(host="127.0.0.1", port=self.server.port, timeout=2.0,
+                           retry_attempts=1, pipeline_depth=4, failure_threshold=1,
+                           probe_backoff=0.01)
+        with client:
+            client.read_multiple_sensors([9])
+            time.sleep(0.02)
+            with patch.object(client._pipeline, 'read_many', side_effect=RuntimeError("bug")):
+                with self.assertRaises(RuntimeError):
+                    client.read_multiple_sensors([9])
+            breaker = client._breakers[9]
+            self.assertFalse(breaker.probing)
+            self.assertTrue(breaker.allow())
+
+    def test_client_read_multiple_sensors_pipelined(self):
+        client = DXMClient(host="127.0.0.1", port=self.server.port, timeout=2.0,
+                           retry_attempts=1, pipeline_depth=8)
+        with client:
+            readings = client.read_multiple_sensors([1, 2, 9, 3])
+
+        self.assertEqual(readings[1].distance_mm, 1001)
+        self.assertEqual(readings[3].signal_quality, 43)
+        self.assertIsNone(readings[9])
+
+    def test_client_read_registers_coalesced(self):
+        client = DXMClient(host="127.0.0.1", port=self.server.port, timeout=2.0,
+                           retry_attempts=1, pipeline_depth=4)
+        with client:
+            values, errors = client.read_registers([(1, 0), (1, 3), (2, 1), (9, 0), (9, 1)])
+
+        self.assertEqual(values, {(1, 0): 303, (1, 3): 41, (2, 1): 0})
+        self.assertEqual(set(errors), {(9, 0), (9, 1)})
+        self.assertIsInstance(errors[(9, 0)], ModbusExceptionResponse)
+
+    def test_client_read_registers_pipeline_down(self):
+        client = DXMClient(host="127.0.0.1", port=self.server.port, timeout=2.0,
+                           retry_attempts=1, pipeline_depth=4)
+        with client:
+            self.server.close()
+            client._pipeline.close()
+            values, errors = client.read_registers([(1, 0), (2, 0)], split_failed=False)
+
+        self.assertEqual(values, {})
+        self.assertIsInstance(errors[(1, 0)], OSError)
+        self.assertIsInstance(errors[(2, 0)], OSError)
+
+    def test_client_read_registers_pipelined_bookkeeping(self):
+        client = DXMClient(host="127.0.0.1", port=self.server.port, timeout=2.0,
+                           retry_attempts=1, pipeline_depth=4, failure_threshold=1,
+                           probe_backoff=30.0)
+        with client:
+            client.read_registers([(1, 0), (9, 0)], split_failed=False)
+            values, errors = client.read_registers([(1, 0), (9, 0)], split_failed=False)
+            units = client.get_connection_info()['metrics']['units']
+
+        self.assertEqual(values, {(1, 0): 303})
+        self.assertIsInstance(errors[(9, 0)], DXMUnitUnavailableError)
+        self.assertEqual(client._breakers[1].stats()['state'], 'closed')
+        self.assertEqual(client._breakers[9].stats()['state'], 'open')
+        self.assertEqual(units[1]['requests'], 2)
+        self.assertEqual(units[9]['requests'], 1)
+        self.assertEqual(units[9]['errors'], {'exception_0x0B': 1})
+        self.assertEqual(units[9]['skipped'], 1)
+
+
+class TestFastReadTransport(unittest.TestCase):
+    """Test preassembled-frame reads and the client's fallback to pymodbus."""
+
+    def setUp(self):
+        self.server = FakeModbusServer()
+        self.addCleanup(self.server.close)
+
+    def test_reads_reuse_frames(self):
+        transport = FastReadTransport("127.0.0.1", self.server.port, timeout=2.0)
+        transport.connect()
+        self.addCleanup(transport.close)
+
+        self.assertEqual(transport.read(1, 0, 4), sensor_registers(1))
+        self.assertEqual(transport.read(1, 0, 4), sensor_registers(1))
+        self.assertEqual(transport.read(2, 2, 2), sensor_registers(2)[2:])
+        self.assertEqual(len(transport._frames), 2)
+
+    def test_exception_response_keeps_stream_in_sync(self):
+        transport = FastReadTransport("127.0.0.1", self.server.port, timeout=2.0)
+        transport.connect()
+        self.addCleanup(transport.close)
+
+        with self.assertRaises(ModbusExceptionResponse) as ctx:
+            transport.read(9, 0, 4)
+        self.assertEqual(ctx.exception.exception_code, 0x0B)
+        self.assertEqual(transport.read(3, 0, 4), sensor_registers(3))
+
+    def test_unexpected_response_rejected(self):
+        server = FakeModbusServer(tid_offset=1)
+        self.addCleanup(server.close)
+        transport = FastReadTransport("127.0.0.1", server.port, timeout=2.0)
+        transport.connect()
+        self.addCleanup(transport.close)
+
+        with self.assertRaises(ValueError):
+            transport.read(1, 0, 4)
+
+    def test_silent_server_times_out(self):
+        silent = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        silent.bind(("127.0.0.1", 0))
+        silent.listen(1)
+        self.addCleanup(silent.close)
+        transport = FastReadTransport("127.0.0.1", silent.getsockname()[1], timeout=0.2)
+        transport.connect()
+        self.addCleanup(transport.close)
+
+        with self.assertRaises(TimeoutError):
+            transport.read(1, 0, 4)
+
+    def test_client_fast_path(self):
+        client = DXMClient(host="127.0.0.1", port=self.server.port, timeout=2.0,
+                           retry_attempts=1, fast_path=True)
+        with client:
+            reading = client.read_sensor(2)
+            with self.assertRaises(DXMCommunicationError):
+                client.read_sensor_registers(9)
+            info = client.get_connection_info()
+
+        self.assertEqual(reading.distance_mm, 1002)
+        self.assertTrue(info['fast_path'])
+        self.assertEqual(info['fast_path_fallbacks'], 0)
+        self.assertEqual(info['metrics']['units'][9]['errors'], {'exception_0x0B': 1})
+
+    def test_client_falls_back_to_pymodbus(self):
+        client = DXMClient(host="127.0.0.1", port=self.server.port, timeout=2.0,
+                           retry_attempts=1, fast_path=True)
+        with client:
+            def unusual(unit_id, address, count):
+                raise ValueError("unexpected frame")
+            client._fast.read = unusual
+            registers = client.read_sensor_registers(4)
+
+        self.assertEqual(registers, sensor_registers(4))
+        self.assertEqual(client.fast_path_fallbacks, 1)
+        self.assertFalse(client._fast.connected)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Unit tests for streaming per-unit reading statistics.
+
+Incremental results are compared with statistics computed over the whole
+data set, both for one accumulator and for merged shards.
+
+Run tests with:
+    python -m pytest tests/test_unit_stats.py -v
+"""
+
+import random
+import statistics
+import unittest
+from pathlib import Path
+
+import sys
+
+# Add parent directory to path to import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dxm_toolkit.sensor_decoder import SensorDecoder
+from dxm_toolkit.unit_stats import ReadingStatistics, RunningStats, UnitStatistics
+
+decoder = SensorDecoder()
+
+
+def reading(unit_id, distance, n, signal=40):
+    """A reading taken n seconds into a run (65535 = out of range, 0 = disconnected)."""
+    status = 271 if distance == 65535 else 303
+    return decoder.decode_registers(unit_id, [status, 0, distance, signal],
+                                    1_700_000_000_000_000_000 + n * 1_000_000_000)
+
+
+class TestRunningStats(unittest.TestCase):
+    """Test Welford accumulation and merging."""
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.values = [rng.gauss(1500, 120) for _ in range(1000)]
+
+    def test_matches_batch_statistics(self):
+        stats = RunningStats()
+        for value in self.values:
+            stats.add(value)
+
+        self.assertEqual(stats.count, 1000)
+        self.assertAlmostEqual(stats.mean, statistics.fmean(self.values), places=9)
+        self.assertAlmostEqual(stats.variance, statistics.pvariance(self.values), places=6)
+        self.assertAlmostEqual(stats.sample_variance, statistics.variance(self.values), places=6)
+        self.assertEqual(stats.min, min(self.values))
+        self.assertEqual(stats.max, max(self.values))
+
+    def test_large_offset_stays_accurate(self):
+        stats = RunningStats()
+        for value in (1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16):
+            stats.add(value)
+        self.assertAlmostEqual(stats.sample_variance, 30.0)
+
+    def test_merge_equals_single_pass(self):
+        whole = RunningStats()
+        for value in self.values:
+            whole.add(value)
+
+        shards = [RunningStats() for _ in range(3)]
+        for i, value in enumerate(self.values[:900]):
+            shards[i % 3].add(value)
+        merged = RunningStats()
+        for shard in shards + [RunningStats()]:
+            merged.merge(shard)
+        for value in self.values[900:]:
+            merged.add(value)
+
+        self.assertEqual(merged.count, whole.count)
+        self.assertAlmostEqual(merged.mean, whole.mean, places=9)
+        self.assertAlmostEqual(merged.variance, whole.variance, places=6)
+        self.assertEqual((merged.min, merged.max), (whole.min, whole.max))
+
+    def test_empty(self):
+        stats = RunningStats()
+        self.assertEqual(stats.snapshot(), {})
+        self.assertEqual(stats.variance, 0.0)
+
+
+class TestReadingStatistics(unittest.TestCase):
+    """Test per-unit reading statistics."""
+
+    def test_unit_statistics(self):
+        stats = UnitStatistics()
+        for n, distance in enumerate([1000, 1010, 65535, 0, 1020]):
+            stats.add(reading(1, distance, n, signal=40 + n))
+        stats.add_failure()
+
+        analysis = stats.analysis()
+        self.assertEqual(analysis['reading_count'], 5)
+        self.assertEqual(analysis['time_span'], 4.0)
+        self.assertEqual(analysis['status_distribution'], {'NORMAL': 4, 'OUT_OF_RANGE': 1})
+        self.assertEqual(analysis['distance_stats']['count'], 3)
+        self.assertEqual(analysis['distance_stats']['avg'], 1010.0)
+        self.assertEqual(analysis['signal_quality_stats']['max'], 44)
+        self.assertEqual(analysis['connection_stability'], 80.0)
+        self.assertAlmostEqual(analysis['success_rate'], 5 / 6 * 100)
+
+    def test_matches_analyze_register_pattern(self):
+        readings = [reading(2, 1200 + (n * 37) % 400, n) for n in range(50)]
+        stats = UnitStatistics()
+        for r in readings:
+            stats.add(r)
+
+        expected = decoder.analyze_register_pattern(readings)
+        analysis = stats.analysis()
+        for key in expected:
+            self.assertEqual(analysis[key], expected[key])
+
+    def test_cycles_and_shard_merge(self):
+        cycles = [{1: reading(1, 1000 + n, n), 2: None if n % 5 == 0 else reading(2, 2000 - n, n)}
+                  for n in range(40)]
+
+        whole = ReadingStatistics()
+        shards = [ReadingStatistics(), ReadingStatistics()]
+        for n, cycle in enumerate(cycles):
+            whole.add_cycle(cycle)
+            shards[n % 2].add_cycle(cycle)
+        merged = ReadingStatistics().merge(shards[0]).merge(shards[1])
+
+        self.assertEqual(len(merged), 2)
+        self.assertEqual(merged[2].failures, 8)
+        for unit_id, stats in whole.items():
+            a, b = stats.analysis(), merged[unit_id].analysis()
+            self.assertEqual(a['reading_count'], b['reading_count'])
+            self.assertEqual(a['time_span'], b['time_span'])
+            self.assertAlmostEqual(a['distance_stats']['avg'], b['distance_stats']['avg'])
+            self.assertAlmostEqual(a['distance_stats']['stddev'], b['distance_stats']['stddev'])
+
+    def test_merge_rejects_different_percentile_configurations(self):
+        plain = UnitStatistics()
+        plain.add(reading(1, 1000, 0))
+        tracked = UnitStatistics(quantiles=True)
+        tracked.add(reading(1, 1100, 1))
+
+        for target, source in ((plain, tracked), (tracked, plain),
+                               (tracked, UnitStatistics(quantiles=True, window=60.0))):
+            with self.assertRaises(ValueError):
+                target.merge(source)
+        self.assertEqual((plain.count, tracked.count), (1, 1))
+        self.assertEqual(tracked.merge(UnitStatistics(quantiles=True)).count, 1)
+
+    def test_snapshot(self):
+        stats = ReadingStatistics()
+        stats.add(3, reading(3, 900, 0))
+        stats.add(1, None)
+        self.assertEqual(list(stats.snapshot()), [1, 3])
+        self.assertEqual(stats.snapshot()[1]['success_rate'], 0.0)
+        stats.reset()
+        self.assertNotIn(3, stats)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)